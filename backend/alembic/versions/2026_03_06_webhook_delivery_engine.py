@@ -0,0 +1,55 @@
+"""Webhook delivery engine columns
+
+Revision ID: webhook_delivery_engine_202603
+Revises: embedding_columns_202603
+Create Date: 2026-03-06
+
+This migration:
+1. Makes webhook_deliveries.webhook_id nullable (Zapier deliveries have none)
+2. Adds zapier_subscription_id, source, target_url and max_attempts
+3. Adds an index on (status, next_retry_at) for the retry sweeper
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'webhook_delivery_engine_202603'
+down_revision = 'embedding_columns_202603'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add delivery engine columns to webhook_deliveries."""
+
+    with op.batch_alter_table('webhook_deliveries', schema=None) as batch_op:
+        batch_op.alter_column('webhook_id', existing_type=sa.Integer(), nullable=True)
+        batch_op.add_column(sa.Column('zapier_subscription_id', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('source', sa.String(20), nullable=True, server_default='webhook'))
+        batch_op.add_column(sa.Column('target_url', sa.String(1000), nullable=True))
+        batch_op.add_column(sa.Column('max_attempts', sa.Integer(), nullable=True))
+        batch_op.create_foreign_key(
+            'fk_webhook_delivery_zapier_subscription',
+            'zapier_subscriptions',
+            ['zapier_subscription_id'], ['id'],
+            ondelete='CASCADE'
+        )
+        batch_op.create_index('ix_webhook_delivery_zapier', ['zapier_subscription_id'])
+        batch_op.create_index('ix_webhook_delivery_due', ['status', 'next_retry_at'])
+
+
+def downgrade() -> None:
+    """Remove delivery engine columns from webhook_deliveries."""
+
+    op.execute("DELETE FROM webhook_deliveries WHERE webhook_id IS NULL")
+
+    with op.batch_alter_table('webhook_deliveries', schema=None) as batch_op:
+        batch_op.drop_index('ix_webhook_delivery_due')
+        batch_op.drop_index('ix_webhook_delivery_zapier')
+        batch_op.drop_constraint('fk_webhook_delivery_zapier_subscription', type_='foreignkey')
+        batch_op.drop_column('max_attempts')
+        batch_op.drop_column('target_url')
+        batch_op.drop_column('source')
+        batch_op.drop_column('zapier_subscription_id')
+        batch_op.alter_column('webhook_id', existing_type=sa.Integer(), nullable=False)
@@ -0,0 +1,54 @@
+"""Add data export jobs table
+
+Revision ID: data_export_jobs_202603
+Revises: webhook_delivery_engine_202603
+Create Date: 2026-03-07
+
+This migration adds:
+1. data_export_jobs table for background GDPR data exports
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'data_export_jobs_202603'
+down_revision = 'webhook_delivery_engine_202603'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create data_export_jobs table."""
+
+    op.create_table(
+        'data_export_jobs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('status', sa.String(20), nullable=True),
+        sa.Column('progress', sa.Integer(), nullable=True),
+        sa.Column('current_table', sa.String(50), nullable=True),
+        sa.Column('rows_exported', sa.Integer(), nullable=True),
+        sa.Column('error_message', sa.Text(), nullable=True),
+        sa.Column('file_path', sa.String(500), nullable=True),
+        sa.Column('file_size_bytes', sa.Integer(), nullable=True),
+        sa.Column('download_count', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('completed_at', sa.DateTime(), nullable=True),
+        sa.Column('expires_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_data_export_jobs_id', 'data_export_jobs', ['id'], unique=False)
+    op.create_index('ix_data_export_user', 'data_export_jobs', ['user_id'], unique=False)
+    op.create_index('ix_data_export_status_expires', 'data_export_jobs', ['status', 'expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop data_export_jobs table."""
+
+    op.drop_index('ix_data_export_status_expires', table_name='data_export_jobs')
+    op.drop_index('ix_data_export_user', table_name='data_export_jobs')
+    op.drop_index('ix_data_export_jobs_id', table_name='data_export_jobs')
+    op.drop_table('data_export_jobs')
@@ -0,0 +1,43 @@
+"""Add meeting rolling summaries table
+
+Revision ID: meeting_rolling_summaries_202603
+Revises: data_export_jobs_202603
+Create Date: 2026-03-08
+
+This migration adds:
+1. meeting_rolling_summaries table for incremental in-meeting summaries
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'meeting_rolling_summaries_202603'
+down_revision = 'data_export_jobs_202603'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create meeting_rolling_summaries table."""
+
+    op.create_table(
+        'meeting_rolling_summaries',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('meeting_id', sa.Integer(), nullable=False),
+        sa.Column('batches', sa.JSON(), nullable=True),
+        sa.Column('last_conversation_id', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['meeting_id'], ['meetings.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('meeting_id')
+    )
+    op.create_index('ix_meeting_rolling_summaries_id', 'meeting_rolling_summaries', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop meeting_rolling_summaries table."""
+
+    op.drop_index('ix_meeting_rolling_summaries_id', table_name='meeting_rolling_summaries')
+    op.drop_table('meeting_rolling_summaries')
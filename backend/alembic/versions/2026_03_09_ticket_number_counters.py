@@ -0,0 +1,37 @@
+"""Add ticket number counters table
+
+Revision ID: ticket_number_counters_202603
+Revises: meeting_rolling_summaries_202603
+Create Date: 2026-03-09
+
+This migration adds:
+1. ticket_number_counters table used to allocate ticket numbers on
+   databases without sequences (PostgreSQL uses one sequence per year,
+   created on first use)
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'ticket_number_counters_202603'
+down_revision = 'meeting_rolling_summaries_202603'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create ticket_number_counters table."""
+
+    op.create_table(
+        'ticket_number_counters',
+        sa.Column('year', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('last_value', sa.Integer(), nullable=False, server_default='0'),
+        sa.PrimaryKeyConstraint('year')
+    )
+
+
+def downgrade() -> None:
+    """Drop ticket_number_counters table."""
+
+    op.drop_table('ticket_number_counters')
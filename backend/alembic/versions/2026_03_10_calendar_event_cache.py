@@ -0,0 +1,73 @@
+"""Add calendar event cache and sync state tables
+
+Revision ID: calendar_event_cache_202603
+Revises: ticket_number_counters_202603
+Create Date: 2026-03-10
+
+This migration adds:
+1. calendar_sync_states table holding each user's Google sync token or
+   Microsoft Graph delta link per provider
+2. calendar_event_cache table with the synced events, read by meeting
+   detection and briefings instead of the provider APIs
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'calendar_event_cache_202603'
+down_revision = 'ticket_number_counters_202603'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create calendar_sync_states and calendar_event_cache tables."""
+
+    op.create_table(
+        'calendar_sync_states',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('provider', sa.String(length=50), nullable=False),
+        sa.Column('sync_token', sa.Text(), nullable=True),
+        sa.Column('window_start', sa.DateTime(), nullable=True),
+        sa.Column('window_end', sa.DateTime(), nullable=True),
+        sa.Column('last_full_sync_at', sa.DateTime(), nullable=True),
+        sa.Column('last_synced_at', sa.DateTime(), nullable=True),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('user_id', 'provider', name='uq_calendar_sync_user_provider')
+    )
+    op.create_index('ix_calendar_sync_states_id', 'calendar_sync_states', ['id'], unique=False)
+
+    op.create_table(
+        'calendar_event_cache',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('provider', sa.String(length=50), nullable=False),
+        sa.Column('event_id', sa.String(length=255), nullable=False),
+        sa.Column('title', sa.String(length=500), nullable=True),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('start_time', sa.DateTime(), nullable=False),
+        sa.Column('end_time', sa.DateTime(), nullable=False),
+        sa.Column('location', sa.String(length=500), nullable=True),
+        sa.Column('attendees', sa.JSON(), nullable=True),
+        sa.Column('meeting_link', sa.Text(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('user_id', 'provider', 'event_id', name='uq_calendar_event_cache_event')
+    )
+    op.create_index('ix_calendar_event_cache_id', 'calendar_event_cache', ['id'], unique=False)
+    op.create_index('ix_calendar_event_cache_user_start', 'calendar_event_cache', ['user_id', 'start_time'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop calendar_event_cache and calendar_sync_states tables."""
+
+    op.drop_index('ix_calendar_event_cache_user_start', table_name='calendar_event_cache')
+    op.drop_index('ix_calendar_event_cache_id', table_name='calendar_event_cache')
+    op.drop_table('calendar_event_cache')
+    op.drop_index('ix_calendar_sync_states_id', table_name='calendar_sync_states')
+    op.drop_table('calendar_sync_states')
@@ -0,0 +1,55 @@
+"""Add inbound project management webhook support
+
+Revision ID: pm_webhooks_202603
+Revises: calendar_event_cache_202603
+Create Date: 2026-03-11
+
+This migration adds:
+1. webhook_id, webhook_secret and last_webhook_at columns on
+   project_management_connections for webhooks registered per project
+2. pm_webhook_events table recording applied webhook events, so
+   redeliveries are only applied once
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'pm_webhooks_202603'
+down_revision = 'calendar_event_cache_202603'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add webhook columns and the pm_webhook_events table."""
+
+    with op.batch_alter_table('project_management_connections', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('webhook_id', sa.String(length=255), nullable=True))
+        batch_op.add_column(sa.Column('webhook_secret', sa.Text(), nullable=True))
+        batch_op.add_column(sa.Column('last_webhook_at', sa.DateTime(), nullable=True))
+
+    op.create_table(
+        'pm_webhook_events',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('provider', sa.String(length=50), nullable=False),
+        sa.Column('event_id', sa.String(length=255), nullable=False),
+        sa.Column('received_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('provider', 'event_id', name='uq_pm_webhook_event')
+    )
+    op.create_index('ix_pm_webhook_events_id', 'pm_webhook_events', ['id'], unique=False)
+    op.create_index('ix_pm_webhook_events_received', 'pm_webhook_events', ['received_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop pm_webhook_events and the webhook columns."""
+
+    op.drop_index('ix_pm_webhook_events_received', table_name='pm_webhook_events')
+    op.drop_index('ix_pm_webhook_events_id', table_name='pm_webhook_events')
+    op.drop_table('pm_webhook_events')
+
+    with op.batch_alter_table('project_management_connections', schema=None) as batch_op:
+        batch_op.drop_column('last_webhook_at')
+        batch_op.drop_column('webhook_secret')
+        batch_op.drop_column('webhook_id')
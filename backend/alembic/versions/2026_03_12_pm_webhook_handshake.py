@@ -0,0 +1,34 @@
+"""Add a handshake nonce for project management webhook registration
+
+Revision ID: pm_webhook_handshake_202603
+Revises: pm_webhooks_202603
+Create Date: 2026-03-12
+
+This migration adds:
+1. webhook_handshake_nonce column on project_management_connections,
+   set while a webhook registration waits for the provider's handshake so
+   only that registration can store a signing secret
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'pm_webhook_handshake_202603'
+down_revision = 'pm_webhooks_202603'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add the webhook_handshake_nonce column."""
+
+    with op.batch_alter_table('project_management_connections', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('webhook_handshake_nonce', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop the webhook_handshake_nonce column."""
+
+    with op.batch_alter_table('project_management_connections', schema=None) as batch_op:
+        batch_op.drop_column('webhook_handshake_nonce')
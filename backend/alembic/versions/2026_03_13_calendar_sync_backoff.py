@@ -0,0 +1,33 @@
+"""Add a retry time to calendar sync state
+
+Revision ID: calendar_sync_backoff_202603
+Revises: pm_webhook_handshake_202603
+Create Date: 2026-03-13
+
+This migration adds:
+1. retry_after column on calendar_sync_states, set when a sync stops at
+   the page limit so reads do not start another one until it passes
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'calendar_sync_backoff_202603'
+down_revision = 'pm_webhook_handshake_202603'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add the retry_after column."""
+
+    with op.batch_alter_table('calendar_sync_states', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('retry_after', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop the retry_after column."""
+
+    with op.batch_alter_table('calendar_sync_states', schema=None) as batch_op:
+        batch_op.drop_column('retry_after')
@@ -0,0 +1,42 @@
+"""Store webhook verification tokens instead of logging them
+
+Revision ID: pm_webhook_verification_202603
+Revises: calendar_sync_backoff_202603
+Create Date: 2026-03-14
+
+This migration adds:
+1. pm_webhook_verifications table holding the verification token a
+   provider-wide webhook subscription (Notion) sends, until a super admin
+   reads it
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'pm_webhook_verification_202603'
+down_revision = 'calendar_sync_backoff_202603'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add the pm_webhook_verifications table."""
+
+    op.create_table(
+        'pm_webhook_verifications',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('provider', sa.String(length=50), nullable=False),
+        sa.Column('token', sa.Text(), nullable=False),
+        sa.Column('received_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('provider')
+    )
+    op.create_index('ix_pm_webhook_verifications_id', 'pm_webhook_verifications', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop the pm_webhook_verifications table."""
+
+    op.drop_index('ix_pm_webhook_verifications_id', table_name='pm_webhook_verifications')
+    op.drop_table('pm_webhook_verifications')
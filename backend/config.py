@@ -234,6 +234,19 @@ APP_URL = os.getenv("APP_URL", "https://www.getreadin.us")
 TRIAL_DAYS = int(os.getenv("TRIAL_DAYS", "7"))
 TRIAL_DAILY_LIMIT = int(os.getenv("TRIAL_DAILY_LIMIT", "10"))
 
+# =============================================================================
+# EXPORT CONFIGURATION
+# =============================================================================
+
+# Directory for export files produced by background jobs (shared with workers)
+EXPORT_DIR = os.getenv("EXPORT_DIR", "/tmp/readin_exports")
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "100"))
+# Bulk exports larger than this many meetings run as background jobs
+EXPORT_STREAMING_MAX_MEETINGS = int(os.getenv("EXPORT_STREAMING_MAX_MEETINGS", "1000"))
+EXPORT_FILE_TTL_HOURS = int(os.getenv("EXPORT_FILE_TTL_HOURS", "24"))
+# GDPR data export archives stay downloadable for this many days
+GDPR_EXPORT_TTL_DAYS = int(os.getenv("GDPR_EXPORT_TTL_DAYS", "7"))
+
 # =============================================================================
 # FIREBASE CLOUD MESSAGING CONFIGURATION
 # =============================================================================
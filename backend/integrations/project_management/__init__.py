@@ -18,6 +18,7 @@ from integrations.project_management.base import (
     TaskPriority,
     SyncResult,
     TaskData,
+    WebhookEvent,
 )
 from integrations.project_management.notion import NotionIntegration
 from integrations.project_management.asana import AsanaIntegration
@@ -31,6 +32,7 @@ __all__ = [
     "TaskPriority",
     "SyncResult",
     "TaskData",
+    "WebhookEvent",
     "NotionIntegration",
     "AsanaIntegration",
     "LinearIntegration",
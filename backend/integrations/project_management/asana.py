@@ -12,10 +12,11 @@ Features:
 - Support for due dates, priorities, assignees, and tags
 """
 
+import asyncio
 import logging
 import os
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Mapping, Sequence
 from urllib.parse import urlencode
 
 from integrations.project_management.base import (
@@ -24,6 +25,9 @@ from integrations.project_management.base import (
     TaskStatus,
     TaskPriority,
     SyncResult,
+    WebhookEvent,
+    chunked,
+    signature_matches,
 )
 
 logger = logging.getLogger("asana")
@@ -73,6 +77,16 @@ class AsanaIntegration(ProjectManagementIntegration):
         "Completed": TaskStatus.COMPLETED,
     }
 
+    # The Batch API accepts at most 10 actions per request
+    STATUS_BATCH_SIZE = 10
+    STATUS_FIELDS = ["completed", "memberships.section.name"]
+
+    # Task changes a project webhook is registered for
+    WEBHOOK_FILTERS = [
+        {"resource_type": "task", "action": "changed", "fields": ["completed"]},
+        {"resource_type": "task", "action": "added"},  # Moved into a section
+    ]
+
     def __init__(
         self,
         db,
@@ -268,20 +282,75 @@ class AsanaIntegration(ProjectManagementIntegration):
         if not task_data:
             return None
 
-        # Check if completed
+        return self._status_from_task(task_data)
+
+    async def get_statuses(self, external_ids: Sequence[str]) -> Dict[str, TaskStatus]:
+        """
+        Get the status of many tasks through the Batch API.
+
+        Each batch request carries up to STATUS_BATCH_SIZE task reads, and
+        at most STATUS_FETCH_CONCURRENCY batches are in flight.
+        """
+        semaphore = asyncio.Semaphore(self.STATUS_FETCH_CONCURRENCY)
+
+        async def fetch_batch(batch: List[str]) -> Dict[str, TaskStatus]:
+            actions = [
+                {
+                    "method": "get",
+                    "relative_path": f"/tasks/{external_id}",
+                    "options": {"fields": self.STATUS_FIELDS},
+                }
+                for external_id in batch
+            ]
+            async with semaphore:
+                try:
+                    response = await self.client.post(
+                        f"{self.API_BASE_URL}/batch",
+                        json={"data": {"actions": actions}},
+                    )
+                except Exception as e:
+                    logger.error(f"Error in Asana batch request: {e}")
+                    return {}
+
+            if response.status_code != 200:
+                logger.error(f"Asana batch request failed: {response.text}")
+                return {}
+
+            # Results come back in the order of the actions
+            statuses = {}
+            for external_id, result in zip(batch, response.json().get("data", [])):
+                if result.get("status_code") == 200:
+                    task_data = (result.get("body") or {}).get("data") or {}
+                    statuses[external_id] = self._status_from_task(task_data)
+            return statuses
+
+        batches = chunked(list(dict.fromkeys(external_ids)), self.STATUS_BATCH_SIZE)
+        results = await asyncio.gather(*(fetch_batch(batch) for batch in batches))
+
+        statuses: Dict[str, TaskStatus] = {}
+        for batch_statuses in results:
+            statuses.update(batch_statuses)
+        return statuses
+
+    def _status_from_task(self, task_data: Dict[str, Any]) -> TaskStatus:
+        """Get the normalized status from the completed flag or section."""
         if task_data.get("completed"):
             return TaskStatus.COMPLETED
 
         # Check memberships for section-based status
         memberships = task_data.get("memberships", [])
         for membership in memberships:
-            section = membership.get("section", {})
+            section = membership.get("section") or {}
             section_name = section.get("name", "")
             if section_name in self.REVERSE_STATUS_MAPPING:
-                return self.REVERSE_STATUS_MAPPING[section_name]
+                return self.map_status_from_external(section_name)
 
         return TaskStatus.PENDING
 
+    def map_status_from_external(self, external_status: str) -> TaskStatus:
+        """Map an Asana section name to internal status."""
+        return self.REVERSE_STATUS_MAPPING.get(external_status, TaskStatus.PENDING)
+
     async def get_task(self, external_id: str) -> Optional[Dict[str, Any]]:
         """Get task details from Asana."""
         try:
@@ -305,6 +374,95 @@ class AsanaIntegration(ProjectManagementIntegration):
             logger.error(f"Error getting Asana task: {e}")
             return None
 
+    # =========================================================================
+    # WEBHOOK METHODS
+    # =========================================================================
+
+    @classmethod
+    def verify_webhook(
+        cls,
+        headers: Mapping[str, str],
+        body: bytes,
+        secret: Optional[str] = None,
+    ) -> bool:
+        """
+        Verify the X-Hook-Signature header of an Asana webhook.
+
+        Each Asana webhook has its own secret, sent once in the
+        X-Hook-Secret handshake, so it must be passed in.
+        """
+        return signature_matches(secret, body, headers.get("x-hook-signature"))
+
+    @classmethod
+    def parse_webhook(
+        cls,
+        headers: Mapping[str, str],
+        payload: Dict[str, Any],
+    ) -> List[WebhookEvent]:
+        """
+        Task events only name the task, so its status has to be fetched.
+
+        Asana events have no ID; the task, action, field and timestamp
+        identify a redelivered event.
+        """
+        events = []
+        for event in payload.get("events", []):
+            resource = event.get("resource") or {}
+            if resource.get("resource_type") != "task" or not resource.get("gid"):
+                continue
+            if event.get("action") not in ("changed", "added"):
+                continue
+
+            event_id = ":".join(str(part) for part in (
+                resource["gid"],
+                event.get("action"),
+                (event.get("change") or {}).get("field"),
+                (event.get("parent") or {}).get("gid"),
+                event.get("created_at"),
+            ))
+            events.append(WebhookEvent(event_id=event_id, external_id=resource["gid"]))
+
+        return events
+
+    async def create_webhook(self, target_url: str) -> Optional[str]:
+        """
+        Register a webhook for task changes in the connected project.
+
+        Asana sends the X-Hook-Secret handshake to target_url before this
+        call returns; the receiver stores the secret.
+        """
+        if not self.project_gid:
+            return None
+
+        try:
+            response = await self.client.post(
+                f"{self.API_BASE_URL}/webhooks",
+                json={"data": {
+                    "resource": self.project_gid,
+                    "target": target_url,
+                    "filters": self.WEBHOOK_FILTERS,
+                }},
+            )
+
+            if response.status_code not in (200, 201):
+                logger.error(f"Asana create webhook failed: {response.text}")
+                return None
+
+            return response.json().get("data", {}).get("gid")
+
+        except Exception as e:
+            logger.error(f"Error creating Asana webhook: {e}")
+            return None
+
+    async def delete_webhook(self, webhook_id: str) -> bool:
+        """Delete a webhook registered with create_webhook()."""
+        try:
+            response = await self.client.delete(f"{self.API_BASE_URL}/webhooks/{webhook_id}")
+            return response.status_code in (200, 204, 404)
+        except Exception as e:
+            logger.error(f"Error deleting Asana webhook: {e}")
+            return False
+
     # =========================================================================
     # WORKSPACE/PROJECT METHODS
     # =========================================================================
@@ -5,12 +5,15 @@ Provides a consistent interface for syncing action items with
 external project management tools like Notion, Asana, Linear, and Jira.
 """
 
+import asyncio
+import hashlib
+import hmac
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List, Mapping, Sequence
 
 import httpx
 from sqlalchemy.orm import Session
@@ -18,6 +21,26 @@ from sqlalchemy.orm import Session
 logger = logging.getLogger("project_management")
 
 
+def chunked(items: Sequence[str], size: int) -> Iterator[List[str]]:
+    """Split a sequence into lists of at most ``size`` items."""
+    for start in range(0, len(items), size):
+        yield list(items[start:start + size])
+
+
+def webhook_signature(secret: str, body: bytes) -> str:
+    """Hex HMAC-SHA256 of a webhook body, as Linear, Jira, Asana and Notion sign them."""
+    return hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+def signature_matches(secret: Optional[str], body: bytes, signature: Optional[str]) -> bool:
+    """Check a hex HMAC-SHA256 signature, with or without a ``sha256=`` prefix."""
+    if not secret or not signature:
+        return False
+    if signature.startswith("sha256="):
+        signature = signature[len("sha256="):]
+    return hmac.compare_digest(webhook_signature(secret, body), signature)
+
+
 class TaskStatus(str, Enum):
     """Normalized task statuses across all integrations."""
     PENDING = "pending"
@@ -111,6 +134,14 @@ class SyncResult:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class WebhookEvent:
+    """A task change delivered by a provider webhook."""
+    event_id: str  # Provider event/delivery ID, for dedup
+    external_id: str  # Task ID in the external system
+    external_status: Any = None  # Raw provider status; None if it has to be fetched
+
+
 class ProjectManagementIntegration(ABC):
     """
     Base class for project management integrations.
@@ -132,6 +163,13 @@ class ProjectManagementIntegration(ABC):
     OAUTH_TOKEN_URL: str = ""
     API_BASE_URL: str = ""
 
+    # Status lookups: tasks per bulk request, and requests in flight at once
+    STATUS_BATCH_SIZE: int = 100
+    STATUS_FETCH_CONCURRENCY: int = 5
+
+    # Secret that inbound webhooks are signed with (empty: webhooks disabled)
+    WEBHOOK_SECRET: str = ""
+
     def __init__(
         self,
         db: Session,
@@ -283,6 +321,41 @@ class ProjectManagementIntegration(ABC):
         """
         raise NotImplementedError
 
+    async def get_statuses(self, external_ids: Sequence[str]) -> Dict[str, TaskStatus]:
+        """
+        Get the current status of many tasks from the external system.
+
+        Providers with a bulk or GraphQL lookup override this. The default
+        calls sync_status() for each task, with at most
+        STATUS_FETCH_CONCURRENCY requests in flight.
+
+        Args:
+            external_ids: Task IDs in the external system
+
+        Returns:
+            Mapping of external ID to normalized TaskStatus. Tasks that were
+            not found or could not be fetched are left out.
+        """
+        semaphore = asyncio.Semaphore(self.STATUS_FETCH_CONCURRENCY)
+
+        async def fetch(external_id: str) -> Optional[TaskStatus]:
+            async with semaphore:
+                return await self.sync_status(external_id)
+
+        unique_ids = list(dict.fromkeys(external_ids))
+        results = await asyncio.gather(
+            *(fetch(external_id) for external_id in unique_ids),
+            return_exceptions=True,
+        )
+
+        statuses = {}
+        for external_id, result in zip(unique_ids, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error getting {self.PROVIDER_NAME} status for {external_id}: {result}")
+            elif result is not None:
+                statuses[external_id] = result
+        return statuses
+
     @abstractmethod
     async def get_task(self, external_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -386,6 +459,79 @@ class ProjectManagementIntegration(ABC):
         """
         return TaskStatus.PENDING
 
+    # =========================================================================
+    # WEBHOOK METHODS
+    # =========================================================================
+
+    @classmethod
+    def verify_webhook(
+        cls,
+        headers: Mapping[str, str],
+        body: bytes,
+        secret: Optional[str] = None,
+    ) -> bool:
+        """
+        Verify the signature of an inbound webhook request.
+
+        Override in subclasses that receive webhooks.
+
+        Args:
+            headers: Request headers (case-insensitive mapping)
+            body: Raw request body
+            secret: Signing secret, if not the provider-wide WEBHOOK_SECRET
+
+        Returns:
+            True if the request was signed by the provider
+        """
+        return False
+
+    @classmethod
+    def parse_webhook(
+        cls,
+        headers: Mapping[str, str],
+        payload: Dict[str, Any],
+    ) -> List[WebhookEvent]:
+        """
+        Extract task status changes from a verified webhook payload.
+
+        Override in subclasses that receive webhooks.
+
+        Args:
+            headers: Request headers (case-insensitive mapping)
+            payload: Decoded JSON body
+
+        Returns:
+            WebhookEvents for the tasks that changed; other events are ignored
+        """
+        return []
+
+    async def create_webhook(self, target_url: str) -> Optional[str]:
+        """
+        Register a webhook for the connected project.
+
+        Override in subclasses whose webhooks are registered per project
+        through the API rather than in the provider's app settings.
+
+        Args:
+            target_url: URL of the webhook receiver
+
+        Returns:
+            The provider's webhook ID, or None if not registered
+        """
+        return None
+
+    async def delete_webhook(self, webhook_id: str) -> bool:
+        """
+        Delete a webhook registered with create_webhook().
+
+        Args:
+            webhook_id: The provider's webhook ID
+
+        Returns:
+            True if the webhook was deleted
+        """
+        return False
+
     async def test_connection(self) -> bool:
         """
         Test if the integration connection is working.
@@ -15,7 +15,7 @@ Features:
 import logging
 import os
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Mapping, Sequence
 from urllib.parse import urlencode
 
 from integrations.project_management.base import (
@@ -24,6 +24,9 @@ from integrations.project_management.base import (
     TaskStatus,
     TaskPriority,
     SyncResult,
+    WebhookEvent,
+    chunked,
+    signature_matches,
 )
 
 logger = logging.getLogger("jira")
@@ -58,6 +61,7 @@ class JiraIntegration(ProjectManagementIntegration):
     OAUTH_AUTHORIZE_URL = "https://auth.atlassian.com/authorize"
     OAUTH_TOKEN_URL = "https://auth.atlassian.com/oauth/token"
     API_BASE_URL = "https://api.atlassian.com"
+    WEBHOOK_EVENTS = ("jira:issue_created", "jira:issue_updated")
 
     # Jira has configurable priorities, these are defaults
     # Priority IDs: 1=Highest, 2=High, 3=Medium, 4=Low, 5=Lowest
@@ -322,10 +326,54 @@ class JiraIntegration(ProjectManagementIntegration):
         if not task_data:
             return None
 
-        status = task_data.get("fields", {}).get("status", {})
-        status_category = status.get("statusCategory", {}).get("key", "")
+        return self._status_from_issue(task_data)
 
-        return self.STATUS_CATEGORY_MAPPING.get(status_category, TaskStatus.PENDING)
+    async def get_statuses(self, external_ids: Sequence[str]) -> Dict[str, TaskStatus]:
+        """
+        Get the status of many issues with one JQL search per batch.
+
+        Jira rejects the whole search if any issue in it no longer exists,
+        so a rejected batch falls back to fetching its issues one by one.
+        """
+        if not self.cloud_id:
+            return {}
+
+        statuses: Dict[str, TaskStatus] = {}
+        for batch in chunked(list(dict.fromkeys(external_ids)), self.STATUS_BATCH_SIZE):
+            try:
+                response = await self.client.post(
+                    f"{self.api_url}/search/jql",
+                    json={
+                        "jql": f"issuekey in ({', '.join(batch)})",
+                        "fields": ["status"],
+                        "maxResults": len(batch),
+                    },
+                )
+            except Exception as e:
+                logger.error(f"Error searching Jira issues: {e}")
+                continue
+
+            if response.status_code == 400:
+                statuses.update(await super().get_statuses(batch))
+                continue
+
+            if response.status_code != 200:
+                logger.error(f"Jira issue search failed: {response.text}")
+                continue
+
+            wanted = set(batch)
+            for issue in response.json().get("issues", []):
+                # Synced issues are stored by ID, but keys are accepted too
+                for external_id in (issue.get("id"), issue.get("key")):
+                    if external_id in wanted:
+                        statuses[external_id] = self._status_from_issue(issue)
+
+        return statuses
+
+    def _status_from_issue(self, issue: Dict[str, Any]) -> TaskStatus:
+        """Get the normalized status of an issue from its status category."""
+        status = issue.get("fields", {}).get("status") or {}
+        return self.map_status_from_external(status.get("statusCategory", {}).get("key", ""))
 
     async def get_task(self, external_id: str) -> Optional[Dict[str, Any]]:
         """Get issue details from Jira."""
@@ -353,6 +401,41 @@ class JiraIntegration(ProjectManagementIntegration):
             logger.error(f"Error getting Jira issue: {e}")
             return None
 
+    # =========================================================================
+    # WEBHOOK METHODS
+    # =========================================================================
+
+    @classmethod
+    def verify_webhook(
+        cls,
+        headers: Mapping[str, str],
+        body: bytes,
+        secret: Optional[str] = None,
+    ) -> bool:
+        """Verify the X-Hub-Signature header of a Jira webhook."""
+        return signature_matches(secret or cls.WEBHOOK_SECRET, body, headers.get("x-hub-signature"))
+
+    @classmethod
+    def parse_webhook(
+        cls,
+        headers: Mapping[str, str],
+        payload: Dict[str, Any],
+    ) -> List[WebhookEvent]:
+        """Issue events carry the issue's status category."""
+        if payload.get("webhookEvent") not in cls.WEBHOOK_EVENTS:
+            return []
+
+        issue = payload.get("issue") or {}
+        if not issue.get("id"):
+            return []
+
+        status = (issue.get("fields") or {}).get("status") or {}
+        category = (status.get("statusCategory") or {}).get("key")
+        event_id = headers.get("x-atlassian-webhook-identifier") or (
+            f"{issue['id']}:{payload.get('timestamp')}"
+        )
+        return [WebhookEvent(event_id=event_id, external_id=issue["id"], external_status=category)]
+
     # =========================================================================
     # WORKSPACE/PROJECT METHODS
     # =========================================================================
@@ -643,6 +726,10 @@ class JiraIntegration(ProjectManagementIntegration):
             logger.error(f"Error transitioning Jira issue: {e}")
             return False
 
+    def map_status_from_external(self, external_status: str) -> TaskStatus:
+        """Map a Jira status category key to internal status."""
+        return self.STATUS_CATEGORY_MAPPING.get(external_status, TaskStatus.PENDING)
+
     def map_priority_to_external(self, priority: TaskPriority) -> str:
         """Map internal priority to Jira priority ID."""
         return self.PRIORITY_MAPPING.get(priority, "3")
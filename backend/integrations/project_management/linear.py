@@ -12,10 +12,12 @@ Features:
 - Support for due dates, priorities, assignees, and labels
 """
 
+import json
 import logging
 import os
+import time
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Mapping, Sequence
 from urllib.parse import urlencode
 
 from integrations.project_management.base import (
@@ -24,6 +26,9 @@ from integrations.project_management.base import (
     TaskStatus,
     TaskPriority,
     SyncResult,
+    WebhookEvent,
+    chunked,
+    signature_matches,
 )
 
 logger = logging.getLogger("linear")
@@ -32,6 +37,7 @@ logger = logging.getLogger("linear")
 LINEAR_CLIENT_ID = os.getenv("LINEAR_CLIENT_ID", "")
 LINEAR_CLIENT_SECRET = os.getenv("LINEAR_CLIENT_SECRET", "")
 LINEAR_REDIRECT_URI = os.getenv("LINEAR_REDIRECT_URI", "")
+LINEAR_WEBHOOK_SECRET = os.getenv("LINEAR_WEBHOOK_SECRET", "")
 
 
 def is_linear_configured() -> bool:
@@ -58,6 +64,10 @@ class LinearIntegration(ProjectManagementIntegration):
     OAUTH_AUTHORIZE_URL = "https://linear.app/oauth/authorize"
     OAUTH_TOKEN_URL = "https://api.linear.app/oauth/token"
     API_BASE_URL = "https://api.linear.app/graphql"
+    WEBHOOK_SECRET = LINEAR_WEBHOOK_SECRET
+
+    # Deliveries older than this are rejected as replays
+    WEBHOOK_TOLERANCE_SECONDS = 60
 
     # Linear priorities: 0=None, 1=Urgent, 2=High, 3=Normal, 4=Low
     PRIORITY_MAPPING = {
@@ -349,15 +359,38 @@ class LinearIntegration(ProjectManagementIntegration):
         if not task_data:
             return None
 
-        state = task_data.get("state", {})
-        state_type = state.get("type", "")
+        state = task_data.get("state") or {}
+        return self.map_status_from_external(state.get("type", ""))
 
-        # Map state type to TaskStatus
-        for ts, st in self.STATUS_STATE_TYPES.items():
-            if state_type == st:
-                return ts
+    async def get_statuses(self, external_ids: Sequence[str]) -> Dict[str, TaskStatus]:
+        """Get the status of many issues with one GraphQL query per batch."""
+        query = """
+        query IssueStates($ids: [ID!], $first: Int) {
+            issues(filter: {id: {in: $ids}}, first: $first) {
+                nodes {
+                    id
+                    state {
+                        type
+                    }
+                }
+            }
+        }
+        """
 
-        return TaskStatus.PENDING
+        statuses: Dict[str, TaskStatus] = {}
+        for batch in chunked(list(dict.fromkeys(external_ids)), self.STATUS_BATCH_SIZE):
+            result = await self._graphql(query, {"ids": batch, "first": len(batch)})
+
+            if "errors" in result:
+                logger.error(f"Linear issue states query failed: {result['errors']}")
+                continue
+
+            issues = result.get("data", {}).get("issues", {}).get("nodes", [])
+            for issue in issues:
+                state = issue.get("state") or {}
+                statuses[issue["id"]] = self.map_status_from_external(state.get("type", ""))
+
+        return statuses
 
     async def get_task(self, external_id: str) -> Optional[Dict[str, Any]]:
         """Get issue details from Linear."""
@@ -403,6 +436,52 @@ class LinearIntegration(ProjectManagementIntegration):
             logger.error(f"Error getting Linear issue: {e}")
             return None
 
+    # =========================================================================
+    # WEBHOOK METHODS
+    # =========================================================================
+
+    @classmethod
+    def verify_webhook(
+        cls,
+        headers: Mapping[str, str],
+        body: bytes,
+        secret: Optional[str] = None,
+    ) -> bool:
+        """Verify the Linear-Signature header and the delivery timestamp."""
+        if not signature_matches(secret or cls.WEBHOOK_SECRET, body, headers.get("linear-signature")):
+            return False
+
+        try:
+            sent_at = json.loads(body).get("webhookTimestamp", 0) / 1000
+        except (ValueError, TypeError, AttributeError):
+            return False
+
+        return abs(time.time() - sent_at) <= cls.WEBHOOK_TOLERANCE_SECONDS
+
+    @classmethod
+    def parse_webhook(
+        cls,
+        headers: Mapping[str, str],
+        payload: Dict[str, Any],
+    ) -> List[WebhookEvent]:
+        """Issue create/update events carry the issue's workflow state type."""
+        if payload.get("type") != "Issue" or payload.get("action") not in ("create", "update"):
+            return []
+
+        issue = payload.get("data") or {}
+        if not issue.get("id"):
+            return []
+
+        state = issue.get("state") or {}
+        event_id = headers.get("linear-delivery") or (
+            f"{payload.get('webhookId')}:{payload.get('webhookTimestamp')}"
+        )
+        return [WebhookEvent(
+            event_id=event_id,
+            external_id=issue["id"],
+            external_status=state.get("type"),
+        )]
+
     # =========================================================================
     # WORKSPACE/TEAM METHODS
     # =========================================================================
@@ -563,6 +642,13 @@ class LinearIntegration(ProjectManagementIntegration):
 
         return "\n".join(parts)
 
+    def map_status_from_external(self, external_status: str) -> TaskStatus:
+        """Map a Linear workflow state type to internal status."""
+        for status, state_type in self.STATUS_STATE_TYPES.items():
+            if external_status == state_type:
+                return status
+        return TaskStatus.PENDING
+
     def map_priority_to_external(self, priority: TaskPriority) -> int:
         """Map internal priority to Linear priority (1-4)."""
         return self.PRIORITY_MAPPING.get(priority, 3)
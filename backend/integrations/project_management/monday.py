@@ -16,15 +16,19 @@ Features:
 import logging
 import os
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Mapping, Sequence
 from urllib.parse import urlencode
 
+from jose import JWTError, jwt
+
 from integrations.project_management.base import (
     ProjectManagementIntegration,
     TaskData,
     TaskStatus,
     TaskPriority,
     SyncResult,
+    WebhookEvent,
+    chunked,
 )
 
 logger = logging.getLogger("monday")
@@ -33,6 +37,7 @@ logger = logging.getLogger("monday")
 MONDAY_CLIENT_ID = os.getenv("MONDAY_CLIENT_ID", "")
 MONDAY_CLIENT_SECRET = os.getenv("MONDAY_CLIENT_SECRET", "")
 MONDAY_REDIRECT_URI = os.getenv("MONDAY_REDIRECT_URI", "")
+MONDAY_SIGNING_SECRET = os.getenv("MONDAY_SIGNING_SECRET", "")
 
 
 def is_monday_configured() -> bool:
@@ -60,6 +65,8 @@ class MondayIntegration(ProjectManagementIntegration):
     OAUTH_AUTHORIZE_URL = "https://auth.monday.com/oauth2/authorize"
     OAUTH_TOKEN_URL = "https://auth.monday.com/oauth2/token"
     API_BASE_URL = "https://api.monday.com/v2"
+    WEBHOOK_SECRET = MONDAY_SIGNING_SECRET
+    WEBHOOK_EVENTS = ("change_status_column_value", "change_column_value", "update_column_value")
 
     # Status mapping - Monday.com uses customizable status labels
     # These are common defaults, actual values depend on board configuration
@@ -378,12 +385,41 @@ class MondayIntegration(ProjectManagementIntegration):
         if not task_data:
             return None
 
-        # Find status column value
-        column_values = task_data.get("column_values", [])
-        for col in column_values:
+        return self._status_from_item(task_data)
+
+    async def get_statuses(self, external_ids: Sequence[str]) -> Dict[str, TaskStatus]:
+        """Get the status of many items with one GraphQL query per batch."""
+        query = """
+        query GetItemStatuses($itemIds: [ID!], $limit: Int) {
+            items(ids: $itemIds, limit: $limit) {
+                id
+                column_values {
+                    id
+                    type
+                    text
+                }
+            }
+        }
+        """
+
+        statuses: Dict[str, TaskStatus] = {}
+        for batch in chunked(list(dict.fromkeys(external_ids)), self.STATUS_BATCH_SIZE):
+            try:
+                data = await self._graphql_request(query, {"itemIds": batch, "limit": len(batch)})
+            except Exception as e:
+                logger.error(f"Error getting Monday.com item statuses: {e}")
+                continue
+
+            for item in data.get("items", []):
+                statuses[str(item.get("id"))] = self._status_from_item(item)
+
+        return statuses
+
+    def _status_from_item(self, item: Dict[str, Any]) -> TaskStatus:
+        """Get the normalized status from an item's status column."""
+        for col in item.get("column_values", []):
             if col.get("type") == "status":
-                status_text = col.get("text", "")
-                return self.REVERSE_STATUS_MAPPING.get(status_text, TaskStatus.PENDING)
+                return self.map_status_from_external(col.get("text") or "")
 
         return TaskStatus.PENDING
 
@@ -420,6 +456,102 @@ class MondayIntegration(ProjectManagementIntegration):
             logger.error(f"Error getting Monday.com item: {e}")
             return None
 
+    # =========================================================================
+    # WEBHOOK METHODS
+    # =========================================================================
+
+    @classmethod
+    def verify_webhook(
+        cls,
+        headers: Mapping[str, str],
+        body: bytes,
+        secret: Optional[str] = None,
+    ) -> bool:
+        """Verify the JWT monday.com signs webhooks with (app signing secret)."""
+        secret = secret or cls.WEBHOOK_SECRET
+        token = headers.get("authorization", "")
+        if token.lower().startswith("bearer "):
+            token = token[len("bearer "):]
+
+        if not secret or not token:
+            return False
+
+        try:
+            jwt.decode(token, secret, algorithms=["HS256"], options={"verify_aud": False})
+            return True
+        except JWTError:
+            return False
+
+    @classmethod
+    def parse_webhook(
+        cls,
+        headers: Mapping[str, str],
+        payload: Dict[str, Any],
+    ) -> List[WebhookEvent]:
+        """Status column events carry the new label."""
+        event = payload.get("event") or {}
+        if event.get("type") not in cls.WEBHOOK_EVENTS:
+            return []
+
+        # Status columns are "color" columns; so are priority columns
+        if event.get("columnType") not in ("color", "status"):
+            return []
+        if "priority" in (event.get("columnTitle") or "").lower():
+            return []
+
+        if not event.get("pulseId") or not event.get("triggerUuid"):
+            return []
+
+        label = ((event.get("value") or {}).get("label") or {}).get("text")
+        return [WebhookEvent(
+            event_id=event["triggerUuid"],
+            external_id=str(event["pulseId"]),
+            external_status=label,
+        )]
+
+    async def create_webhook(self, target_url: str) -> Optional[str]:
+        """
+        Register a webhook for status changes on the connected board.
+
+        monday.com first posts a challenge to target_url, which the
+        receiver echoes back.
+        """
+        if not self.board_id:
+            return None
+
+        query = """
+        mutation CreateWebhook($boardId: ID!, $url: String!) {
+            create_webhook(board_id: $boardId, url: $url, event: change_status_column_value) {
+                id
+            }
+        }
+        """
+
+        try:
+            data = await self._graphql_request(query, {"boardId": self.board_id, "url": target_url})
+            webhook_id = (data.get("create_webhook") or {}).get("id")
+            return str(webhook_id) if webhook_id else None
+        except Exception as e:
+            logger.error(f"Error creating Monday.com webhook: {e}")
+            return None
+
+    async def delete_webhook(self, webhook_id: str) -> bool:
+        """Delete a webhook registered with create_webhook()."""
+        query = """
+        mutation DeleteWebhook($id: ID!) {
+            delete_webhook(id: $id) {
+                id
+            }
+        }
+        """
+
+        try:
+            await self._graphql_request(query, {"id": webhook_id})
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting Monday.com webhook: {e}")
+            return False
+
     # =========================================================================
     # WORKSPACE/BOARD METHODS
     # =========================================================================
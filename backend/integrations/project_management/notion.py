@@ -15,7 +15,7 @@ Features:
 import logging
 import os
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Mapping, Sequence
 from urllib.parse import urlencode
 
 from integrations.project_management.base import (
@@ -24,6 +24,8 @@ from integrations.project_management.base import (
     TaskStatus,
     TaskPriority,
     SyncResult,
+    WebhookEvent,
+    signature_matches,
 )
 
 logger = logging.getLogger("notion")
@@ -32,6 +34,7 @@ logger = logging.getLogger("notion")
 NOTION_CLIENT_ID = os.getenv("NOTION_CLIENT_ID", "")
 NOTION_CLIENT_SECRET = os.getenv("NOTION_CLIENT_SECRET", "")
 NOTION_REDIRECT_URI = os.getenv("NOTION_REDIRECT_URI", "")
+NOTION_WEBHOOK_SECRET = os.getenv("NOTION_WEBHOOK_SECRET", "")
 
 
 def is_notion_configured() -> bool:
@@ -60,6 +63,14 @@ class NotionIntegration(ProjectManagementIntegration):
     API_BASE_URL = "https://api.notion.com/v1"
     NOTION_VERSION = "2022-06-28"
 
+    # The verification token of the webhook subscription signs its events
+    WEBHOOK_SECRET = NOTION_WEBHOOK_SECRET
+    WEBHOOK_EVENTS = ("page.created", "page.properties_updated")
+
+    # Fewer pages than this are fetched one by one instead of walking the
+    # database, e.g. the page or two named by a webhook event
+    DIRECT_LOOKUP_LIMIT = ProjectManagementIntegration.STATUS_BATCH_SIZE // 10
+
     # Property name mappings - can be customized per user
     DEFAULT_PROPERTY_NAMES = {
         "title": "Name",
@@ -298,16 +309,65 @@ class NotionIntegration(ProjectManagementIntegration):
         if not task_data:
             return None
 
-        # Extract status from properties
-        properties = task_data.get("properties", {})
+        return self._status_from_page(task_data)
+
+    async def get_statuses(self, external_ids: Sequence[str]) -> Dict[str, TaskStatus]:
+        """
+        Get the status of many pages by paging through the database.
+
+        Notion has no lookup by a list of page IDs, but a database query
+        returns 100 pages per request. Paging stops once every page was
+        seen; pages not in the database (moved or archived) are fetched
+        one by one. Fewer than DIRECT_LOOKUP_LIMIT pages are all fetched
+        one by one, which beats walking a large database for them.
+        """
+        # Page IDs may be stored with or without dashes
+        remaining = {external_id.replace("-", ""): external_id for external_id in external_ids}
+        statuses: Dict[str, TaskStatus] = {}
+        if len(remaining) < self.DIRECT_LOOKUP_LIMIT:
+            return await super().get_statuses(list(remaining.values()))
+
+        cursor = None
+        while self.database_id and remaining:
+            body: Dict[str, Any] = {"page_size": self.STATUS_BATCH_SIZE}
+            if cursor:
+                body["start_cursor"] = cursor
+
+            try:
+                response = await self.client.post(
+                    f"{self.API_BASE_URL}/databases/{self.database_id}/query",
+                    json=body,
+                )
+            except Exception as e:
+                logger.error(f"Error querying Notion database: {e}")
+                break
+
+            if response.status_code != 200:
+                logger.error(f"Notion database query failed: {response.text}")
+                break
+
+            data = response.json()
+            for page in data.get("results", []):
+                external_id = remaining.pop(page.get("id", "").replace("-", ""), None)
+                if external_id is not None:
+                    statuses[external_id] = self._status_from_page(page)
+
+            if not data.get("has_more"):
+                break
+            cursor = data.get("next_cursor")
+
+        if remaining:
+            statuses.update(await super().get_statuses(list(remaining.values())))
+        return statuses
+
+    def _status_from_page(self, page: Dict[str, Any]) -> TaskStatus:
+        """Get the normalized status from a page's status property."""
+        properties = page.get("properties", {})
         status_prop = properties.get(self.property_names["status"], {})
 
-        if status_prop.get("type") == "select":
-            status_name = status_prop.get("select", {}).get("name", "")
-            return self.REVERSE_STATUS_MAPPING.get(status_name, TaskStatus.PENDING)
-        elif status_prop.get("type") == "status":
-            status_name = status_prop.get("status", {}).get("name", "")
-            return self.REVERSE_STATUS_MAPPING.get(status_name, TaskStatus.PENDING)
+        if status_prop.get("type") in ("select", "status"):
+            option = status_prop.get(status_prop["type"]) or {}
+            return self.map_status_from_external(option.get("name", ""))
 
         return TaskStatus.PENDING
 
@@ -331,6 +391,36 @@ class NotionIntegration(ProjectManagementIntegration):
             logger.error(f"Error getting Notion task: {e}")
             return None
 
+    # =========================================================================
+    # WEBHOOK METHODS
+    # =========================================================================
+
+    @classmethod
+    def verify_webhook(
+        cls,
+        headers: Mapping[str, str],
+        body: bytes,
+        secret: Optional[str] = None,
+    ) -> bool:
+        """Verify the X-Notion-Signature header of a Notion webhook."""
+        return signature_matches(secret or cls.WEBHOOK_SECRET, body, headers.get("x-notion-signature"))
+
+    @classmethod
+    def parse_webhook(
+        cls,
+        headers: Mapping[str, str],
+        payload: Dict[str, Any],
+    ) -> List[WebhookEvent]:
+        """Page events only name the page, so its status has to be fetched."""
+        if payload.get("type") not in cls.WEBHOOK_EVENTS:
+            return []
+
+        entity = payload.get("entity") or {}
+        if entity.get("type") != "page" or not entity.get("id") or not payload.get("id"):
+            return []
+
+        return [WebhookEvent(event_id=payload["id"], external_id=entity["id"])]
+
     # =========================================================================
     # WORKSPACE/DATABASE METHODS
     # =========================================================================
@@ -11,18 +11,15 @@ https://platform.zapier.com/docs/triggers#rest-hook-trigger
 """
 
 import logging
-import json
-from datetime import datetime
 from enum import Enum
 from typing import Optional, Dict, Any, List
 
-import httpx
 from sqlalchemy.orm import Session
 
 from models import (
     Meeting, ActionItem, MeetingSummary, ZapierSubscription, User
 )
-from services.webhook_signing import sign_webhook_payload, SIGNATURE_HEADER, TIMESTAMP_HEADER
+from services.webhook_delivery import webhook_engine, DeliveryTarget, fire_user_webhooks
 
 logger = logging.getLogger("zapier.triggers")
 
@@ -123,8 +120,7 @@ class ZapierTriggerService:
 
     Handles:
     - REST Hook subscription management
-    - Webhook delivery to Zapier
-    - Retry logic for failed deliveries
+    - Queueing deliveries to Zapier via the webhook delivery engine
     """
 
     def __init__(self, db: Session):
@@ -135,25 +131,6 @@ class ZapierTriggerService:
             db: SQLAlchemy database session
         """
         self.db = db
-        self._client: Optional[httpx.AsyncClient] = None
-
-    @property
-    def client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                timeout=30.0,
-                headers={
-                    "Content-Type": "application/json",
-                    "User-Agent": "ReadIn-AI-Zapier/1.0",
-                }
-            )
-        return self._client
-
-    async def close(self):
-        """Close the HTTP client."""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
 
     # =========================================================================
     # SUBSCRIPTION MANAGEMENT
@@ -283,14 +260,18 @@ class ZapierTriggerService:
     # WEBHOOK DELIVERY
     # =========================================================================
 
-    async def fire_trigger(
+    def fire_trigger(
         self,
         trigger_type: TriggerType,
         user_id: int,
         payload: Dict[str, Any]
     ) -> Dict[str, Any]:
         """
-        Fire a trigger for all active subscriptions.
+        Queue a trigger for all active subscriptions.
+
+        Deliveries are persisted and sent by the webhook delivery engine on a
+        background worker, with retries, per-host concurrency limits and
+        automatic deactivation of failing subscriptions.
 
         Args:
             trigger_type: The type of trigger
@@ -298,7 +279,7 @@ class ZapierTriggerService:
             payload: The event payload
 
         Returns:
-            Dictionary with delivery results
+            Dictionary with queued delivery IDs
         """
         subscriptions = self.get_user_subscriptions(
             user_id=user_id,
@@ -308,112 +289,25 @@ class ZapierTriggerService:
 
         if not subscriptions:
             logger.debug(f"No active subscriptions for user {user_id}, trigger {trigger_type.value}")
-            return {"delivered": 0, "failed": 0, "results": []}
-
-        results = []
-        delivered = 0
-        failed = 0
-
-        for subscription in subscriptions:
-            success, error = await self._deliver_webhook(subscription, payload)
-            results.append({
-                "subscription_id": subscription.id,
-                "success": success,
-                "error": error
-            })
-
-            if success:
-                delivered += 1
-                # Update last successful delivery
-                subscription.last_triggered_at = datetime.utcnow()
-                subscription.consecutive_failures = 0
-            else:
-                failed += 1
-                # Track failures for circuit breaker
-                subscription.consecutive_failures = (subscription.consecutive_failures or 0) + 1
-                subscription.last_error = error
-
-                # Deactivate after too many failures
-                if subscription.consecutive_failures >= 10:
-                    subscription.is_active = False
-                    logger.warning(
-                        f"Deactivating subscription {subscription.id} "
-                        f"after {subscription.consecutive_failures} consecutive failures"
-                    )
+            return {"queued": 0, "delivery_ids": []}
 
-        self.db.commit()
+        delivery_ids = webhook_engine.queue_event(
+            self.db,
+            [DeliveryTarget.for_zapier(subscription) for subscription in subscriptions],
+            trigger_type.value,
+            payload
+        )
 
         logger.info(
-            f"Fired trigger {trigger_type.value} for user {user_id}: "
-            f"{delivered} delivered, {failed} failed"
+            f"Queued trigger {trigger_type.value} for user {user_id}: "
+            f"{len(delivery_ids)} deliveries"
         )
 
         return {
-            "delivered": delivered,
-            "failed": failed,
-            "results": results
+            "queued": len(delivery_ids),
+            "delivery_ids": delivery_ids
         }
 
-    async def _deliver_webhook(
-        self,
-        subscription: ZapierSubscription,
-        payload: Dict[str, Any]
-    ) -> tuple[bool, Optional[str]]:
-        """
-        Deliver a webhook to a single subscription.
-
-        Args:
-            subscription: The subscription to deliver to
-            payload: The event payload
-
-        Returns:
-            Tuple of (success, error_message)
-        """
-        try:
-            # Prepare headers
-            headers = {
-                "Content-Type": "application/json",
-                "X-Zapier-Event": subscription.trigger_type,
-                "X-ReadIn-Subscription-ID": str(subscription.id),
-            }
-
-            # Sign the payload if hook_secret is set
-            if subscription.hook_secret:
-                signature, timestamp = sign_webhook_payload(
-                    payload,
-                    subscription.hook_secret
-                )
-                headers[SIGNATURE_HEADER] = signature
-                headers[TIMESTAMP_HEADER] = str(timestamp)
-
-            # Send the webhook
-            response = await self.client.post(
-                subscription.target_url,
-                json=payload,
-                headers=headers
-            )
-
-            # Check response
-            if response.status_code in (200, 201, 202, 204):
-                return True, None
-            elif response.status_code == 410:
-                # Gone - Zapier has unsubscribed
-                logger.info(f"Subscription {subscription.id} returned 410 Gone, deactivating")
-                subscription.is_active = False
-                return False, "Subscription removed by Zapier"
-            else:
-                error = f"HTTP {response.status_code}: {response.text[:200]}"
-                logger.warning(f"Webhook delivery failed for subscription {subscription.id}: {error}")
-                return False, error
-
-        except httpx.TimeoutException:
-            return False, "Request timeout"
-        except httpx.RequestError as e:
-            return False, f"Request error: {str(e)}"
-        except Exception as e:
-            logger.error(f"Unexpected error delivering webhook: {e}")
-            return False, f"Unexpected error: {str(e)}"
-
     # =========================================================================
     # EVENT PAYLOAD BUILDERS
     # =========================================================================
@@ -528,13 +422,16 @@ class ZapierTriggerService:
 # CONVENIENCE FUNCTIONS
 # =========================================================================
 
-async def fire_meeting_ended(
+def fire_meeting_ended(
     db: Session,
     meeting: Meeting,
     user: User
 ) -> Dict[str, Any]:
     """
-    Fire the meeting_ended trigger.
+    Fire the meeting_ended trigger and the user's meeting.ended webhooks.
+
+    Only persists and dispatches deliveries; safe to call from request
+    handlers without awaiting network I/O.
 
     Args:
         db: Database session
@@ -542,28 +439,27 @@ async def fire_meeting_ended(
         user: The meeting owner
 
     Returns:
-        Delivery results
+        Queued delivery results
     """
     service = ZapierTriggerService(db)
-    try:
-        payload = service.build_meeting_ended_payload(meeting, user)
-        return await service.fire_trigger(
-            TriggerType.MEETING_ENDED,
-            user.id,
-            payload
-        )
-    finally:
-        await service.close()
+    payload = service.build_meeting_ended_payload(meeting, user)
+    result = service.fire_trigger(
+        TriggerType.MEETING_ENDED,
+        user.id,
+        payload
+    )
+    result["webhook_delivery_ids"] = fire_user_webhooks(db, user.id, "meeting.ended", payload)
+    return result
 
 
-async def fire_action_item_created(
+def fire_action_item_created(
     db: Session,
     action_item: ActionItem,
     meeting: Meeting,
     user: User
 ) -> Dict[str, Any]:
     """
-    Fire the action_item_created trigger.
+    Fire the action_item_created trigger and the user's action_item.created webhooks.
 
     Args:
         db: Database session
@@ -572,28 +468,27 @@ async def fire_action_item_created(
         user: The action item owner
 
     Returns:
-        Delivery results
+        Queued delivery results
     """
     service = ZapierTriggerService(db)
-    try:
-        payload = service.build_action_item_created_payload(action_item, meeting, user)
-        return await service.fire_trigger(
-            TriggerType.ACTION_ITEM_CREATED,
-            user.id,
-            payload
-        )
-    finally:
-        await service.close()
+    payload = service.build_action_item_created_payload(action_item, meeting, user)
+    result = service.fire_trigger(
+        TriggerType.ACTION_ITEM_CREATED,
+        user.id,
+        payload
+    )
+    result["webhook_delivery_ids"] = fire_user_webhooks(db, user.id, "action_item.created", payload)
+    return result
 
 
-async def fire_summary_generated(
+def fire_summary_generated(
     db: Session,
     summary: MeetingSummary,
     meeting: Meeting,
     user: User
 ) -> Dict[str, Any]:
     """
-    Fire the summary_generated trigger.
+    Fire the summary_generated trigger and the user's meeting.summary_ready webhooks.
 
     Args:
         db: Database session
@@ -602,15 +497,14 @@ async def fire_summary_generated(
         user: The meeting owner
 
     Returns:
-        Delivery results
+        Queued delivery results
     """
     service = ZapierTriggerService(db)
-    try:
-        payload = service.build_summary_generated_payload(summary, meeting, user)
-        return await service.fire_trigger(
-            TriggerType.SUMMARY_GENERATED,
-            user.id,
-            payload
-        )
-    finally:
-        await service.close()
+    payload = service.build_summary_generated_payload(summary, meeting, user)
+    result = service.fire_trigger(
+        TriggerType.SUMMARY_GENERATED,
+        user.id,
+        payload
+    )
+    result["webhook_delivery_ids"] = fire_user_webhooks(db, user.id, "meeting.summary_ready", payload)
+    return result
@@ -93,6 +93,9 @@ from middleware.slow_query_logger import setup_slow_query_logging
 from middleware.csrf import CSRFMiddleware
 from middleware.response_time import ResponseTimeMiddleware
 
+# Session hooks for cached meeting context
+from services.meeting_context import register_meeting_context_invalidation
+
 # Initialize Sentry for error tracking (production)
 if SENTRY_DSN:
     try:
@@ -288,6 +291,9 @@ def startup():
         # Set up slow query logging (100ms threshold to catch more issues)
         setup_slow_query_logging(engine, threshold_ms=100)
         logger.info("  [OK] Slow query logging enabled (>100ms)")
+
+        # Keep cached meeting context snapshots in step with writes
+        register_meeting_context_invalidation()
     except Exception as e:
         logger.error(f"  [ERROR] Database connection failed: {e}")
         raise
@@ -346,6 +352,17 @@ def startup():
     except Exception as e:
         logger.warning(f"  [WARNING] Cache warming failed: {e}")
 
+    # Build the Novah knowledge base index before the first chat message
+    try:
+        from database import SessionLocal
+        from services.knowledge_base_index import knowledge_base_index
+        db = SessionLocal()
+        knowledge_base_index.refresh(db)
+        db.close()
+        logger.info(f"  [OK] Knowledge base index built ({len(knowledge_base_index)} articles)")
+    except Exception as e:
+        logger.warning(f"  [WARNING] Knowledge base index failed: {e}")
+
     # Security status
     logger.info("")
     logger.info("  Security Configuration:")
@@ -372,6 +389,18 @@ def shutdown():
     except Exception as e:
         logger.warning(f"  [WARNING] Error stopping scheduler: {e}")
 
+    try:
+        from database import SessionLocal
+        from services.agent_router import agent_router
+        db = SessionLocal()
+        try:
+            flushed = agent_router.flush(db)
+        finally:
+            db.close()
+        logger.info(f"  [OK] Agent routing loads flushed ({flushed} agents)")
+    except Exception as e:
+        logger.warning(f"  [WARNING] Error flushing agent routing loads: {e}")
+
 
 # ============== Auth Endpoints ==============
 
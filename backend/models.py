@@ -297,6 +297,47 @@ class CalendarIntegration(Base):
     user = relationship("User", back_populates="calendar_integrations")
 
 
+class CalendarSyncState(Base):
+    """Incremental sync position of one user's calendar with one provider."""
+    __tablename__ = "calendar_sync_states"
+    __table_args__ = (
+        UniqueConstraint("user_id", "provider", name="uq_calendar_sync_user_provider"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    provider = Column(String(50), nullable=False)  # 'google' or 'microsoft'
+    sync_token = Column(Text, nullable=True)  # Google nextSyncToken or Graph deltaLink
+    window_start = Column(DateTime, nullable=True)  # Time range covered by the sync
+    window_end = Column(DateTime, nullable=True)
+    last_full_sync_at = Column(DateTime, nullable=True)
+    last_synced_at = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+    retry_after = Column(DateTime, nullable=True)  # Backoff after a sync ran out of pages
+
+
+class CachedCalendarEvent(Base):
+    """Local copy of a provider calendar event, kept current by delta sync."""
+    __tablename__ = "calendar_event_cache"
+    __table_args__ = (
+        UniqueConstraint("user_id", "provider", "event_id", name="uq_calendar_event_cache_event"),
+        Index("ix_calendar_event_cache_user_start", "user_id", "start_time"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    provider = Column(String(50), nullable=False)
+    event_id = Column(String(255), nullable=False)
+    title = Column(String(500), nullable=True)
+    description = Column(Text, nullable=True)
+    start_time = Column(DateTime, nullable=False)  # UTC
+    end_time = Column(DateTime, nullable=False)  # UTC
+    location = Column(String(500), nullable=True)
+    attendees = Column(JSON, default=list)
+    meeting_link = Column(Text, nullable=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
 # =============================================================================
 # MEETING & CONVERSATION MODELS
 # =============================================================================
@@ -341,6 +382,9 @@ class Meeting(Base):
     action_items = relationship("ActionItem", back_populates="meeting")
     commitments = relationship("Commitment", back_populates="meeting")
     summary = relationship("MeetingSummary", back_populates="meeting", uselist=False)
+    rolling_summary = relationship(
+        "MeetingRollingSummary", back_populates="meeting", uselist=False, cascade="all, delete-orphan"
+    )
 
 
 class Conversation(Base):
@@ -584,6 +628,30 @@ class MeetingSummary(Base):
     meeting = relationship("Meeting", back_populates="summary")
 
 
+class MeetingRollingSummary(Base):
+    """Running summary state folded in while a meeting is active.
+
+    Each batch covers the conversations up to last_conversation_id after the
+    previous batch, with its content hash and structured section notes, so
+    the end-of-meeting summary only needs a final reduce over the notes.
+    """
+    __tablename__ = "meeting_rolling_summaries"
+
+    id = Column(Integer, primary_key=True, index=True)
+    meeting_id = Column(Integer, ForeignKey("meetings.id", ondelete="CASCADE"), unique=True, nullable=False)
+
+    # List of {"last_conversation_id", "content_hash", "notes"} in meeting order
+    batches = Column(JSON, default=list)
+    last_conversation_id = Column(Integer, default=0)  # Watermark of folded conversations
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Relationships
+    meeting = relationship("Meeting", back_populates="rolling_summary")
+
+
 # =============================================================================
 # JOB INTERVIEW TRACKING
 # =============================================================================
@@ -1311,23 +1379,32 @@ class Webhook(Base):
 
 class WebhookDelivery(Base):
     """
-    Log of webhook delivery attempts.
+    Outbound webhook deliveries and their attempt history.
+
+    Covers both user webhooks (webhook_id) and Zapier REST hooks
+    (zapier_subscription_id). Rows are created before sending and drive the
+    retry schedule via next_retry_at.
     """
     __tablename__ = "webhook_deliveries"
     __table_args__ = (
         Index("ix_webhook_delivery_webhook", "webhook_id"),
         Index("ix_webhook_delivery_timestamp", "triggered_at"),
+        Index("ix_webhook_delivery_zapier", "zapier_subscription_id"),
+        Index("ix_webhook_delivery_due", "status", "next_retry_at"),
     )
 
     id = Column(Integer, primary_key=True, index=True)
-    webhook_id = Column(Integer, ForeignKey("webhooks.id"), nullable=False)
+    webhook_id = Column(Integer, ForeignKey("webhooks.id"), nullable=True)
+    zapier_subscription_id = Column(Integer, ForeignKey("zapier_subscriptions.id", ondelete="CASCADE"), nullable=True)
+    source = Column(String(20), default="webhook")  # webhook, zapier
+    target_url = Column(String(1000), nullable=True)
 
     # Event details
     event_type = Column(String(100), nullable=False)
     payload = Column(JSON, nullable=False)
 
     # Delivery status
-    status = Column(String(20), default="pending")  # pending, success, failed
+    status = Column(String(20), default="pending")  # pending, delivering, retrying, success, failed
 
     # Response
     response_status_code = Column(Integer, nullable=True)
@@ -1336,6 +1413,7 @@ class WebhookDelivery(Base):
 
     # Retry tracking
     attempt_count = Column(Integer, default=1)
+    max_attempts = Column(Integer, nullable=True)
     next_retry_at = Column(DateTime, nullable=True)
 
     # Error
@@ -1920,6 +1998,14 @@ class SLAConfig(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
 
+class TicketNumberCounter(Base):
+    """Last ticket number handed out per year (non-PostgreSQL databases)."""
+    __tablename__ = "ticket_number_counters"
+
+    year = Column(Integer, primary_key=True, autoincrement=False)
+    last_value = Column(Integer, nullable=False, default=0)
+
+
 class SupportTicket(Base):
     """Customer support tickets."""
     __tablename__ = "support_tickets"
@@ -2448,6 +2534,12 @@ class ProjectManagementConnection(Base):
     # Property mappings (for customizable field names)
     property_mappings = Column(JSON, default=dict)
 
+    # Inbound webhook registered for the project (Asana, Monday.com)
+    webhook_id = Column(String(255), nullable=True)
+    webhook_secret = Column(Text, nullable=True)  # Per-webhook signing secret (Asana handshake)
+    webhook_handshake_nonce = Column(String(64), nullable=True)  # Set while a registration awaits its handshake
+    last_webhook_at = Column(DateTime, nullable=True)
+
     # Status
     is_active = Column(Boolean, default=True)
     last_sync_at = Column(DateTime, nullable=True)
@@ -2505,6 +2597,41 @@ class ActionItemSync(Base):
     connection = relationship("ProjectManagementConnection", back_populates="synced_items")
 
 
+class PMWebhookEvent(Base):
+    """
+    Inbound project management webhook events already applied.
+
+    Providers redeliver events they are unsure were received; the unique
+    (provider, event_id) pair makes each one apply once. Rows are pruned
+    by the reconciliation sweep after a few days.
+    """
+    __tablename__ = "pm_webhook_events"
+    __table_args__ = (
+        UniqueConstraint("provider", "event_id", name="uq_pm_webhook_event"),
+        Index("ix_pm_webhook_events_received", "received_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    provider = Column(String(50), nullable=False)
+    event_id = Column(String(255), nullable=False)
+    received_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class PMWebhookVerification(Base):
+    """
+    Verification token sent when a provider-wide webhook subscription is set up.
+
+    Notion sends the token once and it then signs every event, so it is
+    kept here (never logged) until a super admin reads it, which deletes it.
+    """
+    __tablename__ = "pm_webhook_verifications"
+
+    id = Column(Integer, primary_key=True, index=True)
+    provider = Column(String(50), nullable=False, unique=True)
+    token = Column(Text, nullable=False)
+    received_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
 class IntegrationNotificationType:
     """Types of notifications that can be sent via integrations."""
     MEETING_SUMMARY = "meeting_summary"
@@ -2781,6 +2908,43 @@ class DataProcessingAgreement(Base):
     organization = relationship("Organization")
 
 
+class DataExportJob(Base):
+    """
+    GDPR data export jobs (Article 20, right to data portability).
+
+    The archive is built by a background worker and kept until expires_at.
+    """
+    __tablename__ = "data_export_jobs"
+    __table_args__ = (
+        Index("ix_data_export_user", "user_id"),
+        Index("ix_data_export_status_expires", "status", "expires_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+
+    # Status
+    status = Column(String(20), default="pending")  # pending, running, completed, failed, expired
+    progress = Column(Integer, default=0)  # 0-100
+    current_table = Column(String(50), nullable=True)
+    rows_exported = Column(Integer, default=0)
+    error_message = Column(Text, nullable=True)
+
+    # Result
+    file_path = Column(String(500), nullable=True)
+    file_size_bytes = Column(Integer, nullable=True)
+    download_count = Column(Integer, default=0)
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    completed_at = Column(DateTime, nullable=True)
+    expires_at = Column(DateTime, nullable=True)
+
+    # Relationships
+    user = relationship("User")
+
+
 # =============================================================================
 # SPEAKER DIARIZATION
 # =============================================================================
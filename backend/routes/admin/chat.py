@@ -5,7 +5,7 @@ Admin routes for live chat management.
 from datetime import datetime
 from typing import Optional, List
 from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect
-from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.orm import Session
 from sqlalchemy import func, and_
 
 from database import get_db
@@ -25,6 +25,8 @@ from schemas import (
 from services.ticket_service import ChatService
 from services.novah_service import novah_service
 from services.chat_websocket_manager import chat_manager, ChatWebSocketMessage, ChatEventType
+from services.chat_queue import chat_queue, session_responses
+from services.agent_router import agent_router
 
 router = APIRouter(prefix="/admin/chat", tags=["Admin - Chat"])
 
@@ -41,32 +43,7 @@ def require_staff(user: User):
 
 def enrich_session_response(db: Session, session: ChatSession) -> ChatSessionResponse:
     """Add related data to session response."""
-    user = db.query(User).filter(User.id == session.user_id).first()
-    team = db.query(SupportTeam).filter(SupportTeam.id == session.team_id).first() if session.team_id else None
-
-    agent_name = None
-    if session.agent_id:
-        member = db.query(TeamMember).filter(TeamMember.id == session.agent_id).first()
-        if member:
-            agent_user = db.query(User).filter(User.id == member.user_id).first()
-            agent_name = agent_user.full_name if agent_user else None
-
-    return ChatSessionResponse(
-        id=session.id,
-        session_token=session.session_token,
-        user_id=session.user_id,
-        agent_id=session.agent_id,
-        team_id=session.team_id,
-        status=session.status,
-        queue_position=session.queue_position,
-        started_at=session.started_at,
-        accepted_at=session.accepted_at,
-        ended_at=session.ended_at,
-        ticket_id=session.ticket_id,
-        user_name=user.full_name if user else None,
-        agent_name=agent_name,
-        team_name=team.name if team else None
-    )
+    return session_responses(db, ChatSession.id == session.id)[0]
 
 
 # =============================================================================
@@ -89,31 +66,18 @@ async def get_chat_queue(
     """
     require_staff(current_user)
 
-    # Use eager loading to avoid N+1 queries
-    query = db.query(ChatSession).options(
-        selectinload(ChatSession.messages)
-    ).filter(
-        ChatSession.status.in_(["waiting", "active"])
-    )
-
-    # If specific team requested, filter by it
-    if team_id:
-        query = query.filter(ChatSession.team_id == team_id)
+    # Served from the in-memory queue snapshot; the database is only read
+    # after a queue change. If a specific team is requested, filter by it.
     # All staff can see all waiting chats (general queue approach)
     # Chats with team_id=None are in general queue, visible to everyone
     # Agents can pick up any chat and redirect to their team if needed
-
-    # Get total count before pagination
-    total_count = query.count()
-
-    # Apply pagination
-    sessions = query.order_by(ChatSession.started_at).offset(offset).limit(limit).all()
+    sessions, total_count = chat_queue.page(db, team_id=team_id, offset=offset, limit=limit)
 
     waiting = sum(1 for s in sessions if s.status == "waiting")
     active = sum(1 for s in sessions if s.status == "active")
 
     return ChatSessionList(
-        sessions=[enrich_session_response(db, s) for s in sessions],
+        sessions=sessions,
         total=total_count,
         waiting=waiting,
         active=active
@@ -134,15 +98,14 @@ async def get_my_active_chats(
     ).all()
     member_ids = [m[0] for m in member_ids]
 
-    sessions = db.query(ChatSession).filter(
-        and_(
-            ChatSession.agent_id.in_(member_ids),
-            ChatSession.status == "active"
-        )
-    ).order_by(ChatSession.started_at).all()
+    sessions = session_responses(
+        db,
+        ChatSession.agent_id.in_(member_ids),
+        ChatSession.status == "active"
+    )
 
     return ChatSessionList(
-        sessions=[enrich_session_response(db, s) for s in sessions],
+        sessions=sessions,
         total=len(sessions),
         waiting=0,
         active=len(sessions)
@@ -253,11 +216,7 @@ async def transfer_chat(
     if not session:
         raise HTTPException(status_code=404, detail="Active session not found")
 
-    # Update agent status (decrease chat count)
-    if session.agent_id:
-        old_agent = db.query(TeamMember).filter(TeamMember.id == session.agent_id).first()
-        if old_agent and old_agent.agent_status:
-            old_agent.agent_status.current_chats = max(0, old_agent.agent_status.current_chats - 1)
+    old_agent_id = session.agent_id
 
     if target_agent_id:
         new_agent = db.query(TeamMember).filter(
@@ -269,10 +228,6 @@ async def transfer_chat(
         session.agent_id = target_agent_id
         if new_agent.team_id:
             session.team_id = new_agent.team_id
-
-        # Update new agent status
-        if new_agent.agent_status:
-            new_agent.agent_status.current_chats += 1
     elif target_team_id:
         session.team_id = target_team_id
         session.agent_id = None
@@ -287,6 +242,15 @@ async def transfer_chat(
         session.queue_position = queue_count + 1
 
     db.commit()
+
+    # Move the chat between agents' loads
+    if old_agent_id != session.agent_id:
+        if old_agent_id:
+            agent_router.release(db, old_agent_id)
+        if session.agent_id:
+            agent_router.acquire(db, session.agent_id)
+
+    chat_manager.queue_changed(session_id)
     return {"message": "Chat transferred successfully"}
 
 
@@ -433,7 +397,7 @@ async def get_my_status(
         id=status.id,
         team_member_id=status.team_member_id,
         status=status.status,
-        current_chats=status.current_chats,
+        current_chats=agent_router.current_load(status.team_member_id, status.current_chats),
         max_chats=status.max_chats,
         last_seen=status.last_seen,
         agent_name=current_user.full_name,
@@ -470,7 +434,7 @@ async def update_my_status(
         id=status.id,
         team_member_id=status.team_member_id,
         status=status.status,
-        current_chats=status.current_chats,
+        current_chats=agent_router.current_load(status.team_member_id, status.current_chats),
         max_chats=status.max_chats,
         last_seen=status.last_seen,
         agent_name=current_user.full_name,
@@ -505,7 +469,7 @@ async def get_online_agents(
                 id=status.id,
                 team_member_id=status.team_member_id,
                 status=status.status,
-                current_chats=status.current_chats,
+                current_chats=agent_router.current_load(status.team_member_id, status.current_chats),
                 max_chats=status.max_chats,
                 last_seen=status.last_seen,
                 agent_name=user.full_name if user else None,
@@ -550,6 +514,7 @@ async def start_chat(
     session.is_ai_handled = True
     session.status = "active"  # AI handles immediately
     db.commit()
+    chat_manager.queue_changed(session.id)
 
     # Send Novah's greeting message (personalized with user's name)
     greeting = novah_service.get_greeting(current_user.full_name)
@@ -5,6 +5,7 @@ Admin routes for Chat QA and review management.
 from datetime import datetime, timedelta
 from typing import Optional, List
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_
 from pydantic import BaseModel
@@ -460,6 +461,8 @@ class AIAnalysisRequest(BaseModel):
     """Request for AI analysis."""
     session_ids: Optional[List[int]] = None  # If None, analyze unreviewed sessions
     limit: int = 10  # Max sessions for batch analysis
+    min_messages: int = 3  # Skip shorter sessions when picking unreviewed ones
+    background: bool = False  # Run unreviewed-session analysis as a Celery job
 
 
 class AIAnalysisResponse(BaseModel):
@@ -579,42 +582,83 @@ async def ai_analyze_batch(
 
     if request.session_ids:
         # Analyze specific sessions
-        results = {
-            "analyzed": 0,
-            "failed": 0,
-            "already_reviewed": 0,
-            "sessions": []
+        session_ids = list(dict.fromkeys(request.session_ids))[:request.limit]
+        reviewed_ids = {
+            row.session_id for row in db.query(ChatQARecord.session_id).filter(
+                ChatQARecord.session_id.in_(session_ids)
+            )
         }
 
-        for session_id in request.session_ids[:request.limit]:
-            existing = db.query(ChatQARecord).filter(
-                ChatQARecord.session_id == session_id
-            ).first()
-            if existing:
-                results["already_reviewed"] += 1
-                continue
-
-            try:
-                record = await ai_service.analyze_session(session_id, current_user.id)
-                if record:
-                    results["analyzed"] += 1
-                    results["sessions"].append({
-                        "session_id": session_id,
-                        "score": record.overall_score
-                    })
-                else:
-                    results["failed"] += 1
-            except Exception as e:
-                results["failed"] += 1
-
+        results = await ai_service.analyze_sessions(
+            [sid for sid in session_ids if sid not in reviewed_ids],
+            current_user.id
+        )
+        results.pop("failed_ids")
+        results["already_reviewed"] = len(reviewed_ids)
         return results
-    else:
-        # Analyze unreviewed sessions
-        return await ai_service.batch_analyze(
-            reviewer_id=current_user.id,
-            limit=request.limit
+
+    if request.background:
+        from workers.tasks.qa_tasks import run_ai_qa_batch
+
+        try:
+            job = run_ai_qa_batch.delay(current_user.id, request.limit, request.min_messages)
+        except Exception:
+            raise HTTPException(
+                status_code=503,
+                detail="Background QA analysis is temporarily unavailable"
+            )
+
+        return JSONResponse(
+            status_code=202,
+            content={
+                "job_id": job.id,
+                "status": "pending",
+                "status_url": f"/api/v1/admin/qa/ai/analyze-batch/{job.id}",
+            },
         )
 
+    # Analyze unreviewed sessions
+    results = await ai_service.batch_analyze(
+        reviewer_id=current_user.id,
+        limit=request.limit,
+        min_messages=request.min_messages
+    )
+    results.pop("failed_ids", None)
+    return results
+
+
+@router.get("/ai/analyze-batch/{job_id}")
+async def get_ai_batch_job(
+    job_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """Get the progress of a background AI QA batch."""
+    require_admin(current_user)
+
+    from celery.result import AsyncResult
+    from workers.celery_app import celery_app
+
+    result = AsyncResult(job_id, app=celery_app)
+    info = result.info if isinstance(result.info, dict) else {}
+
+    if result.state == "FAILURE":
+        return {"job_id": job_id, "status": "failed"}
+    if result.state == "SUCCESS":
+        return {
+            "job_id": job_id,
+            "status": "completed",
+            "analyzed": info.get("analyzed", 0),
+            "failed": info.get("failed", 0),
+            "sessions": info.get("sessions", []),
+        }
+
+    return {
+        "job_id": job_id,
+        "status": "running" if result.state in ("PROGRESS", "RETRY") else "pending",
+        "analyzed": info.get("analyzed", 0),
+        "failed": info.get("failed", 0),
+    }
+
 
 @router.get("/ai/status")
 async def get_ai_qa_status(
@@ -25,6 +25,7 @@ from schemas import (
     TeamMemberCreate, TeamMemberInvite, TeamMemberResponse, TeamMemberList,
     TeamInviteResponse
 )
+from services.agent_router import agent_router
 
 router = APIRouter(prefix="/admin/teams", tags=["Admin - Teams"])
 
@@ -278,6 +279,7 @@ async def add_team_member(
         db.commit()
         db.refresh(existing)
         member = existing
+        agent_router.refresh_agent(db, member.id)
     else:
         member = TeamMember(
             user_id=member_data.user_id,
@@ -344,6 +346,7 @@ async def remove_team_member(
     member.is_active = False
     member.removed_at = datetime.utcnow()
     db.commit()
+    agent_router.refresh_agent(db, member.id)
 
     # Check if user is still on any team
     other_teams = db.query(TeamMember).filter(
@@ -650,6 +653,9 @@ async def accept_invite(
 
     db.commit()
 
+    if existing:
+        agent_router.refresh_agent(db, existing.id)
+
     log_activity(db, current_user.id, "accept_invite", "team_invite", invite.id)
 
     return {"message": "Successfully joined the team"}
@@ -17,6 +17,7 @@ from schemas import (
     ParticipantMemoryList, CommitmentResponse
 )
 from auth import get_current_user
+from services.calendar_sync import calendar_sync
 
 router = APIRouter(prefix="/briefings", tags=["Briefings"])
 
@@ -30,9 +31,22 @@ def generate_briefing(
     """
     Generate a pre-meeting briefing.
     Provides context, participant history, and suggested talking points.
+
+    Without participant names, the attendees of the next meeting in the
+    user's cached calendar (starting within the hour) are used.
     """
     participant_context = []
 
+    meeting_title = None
+    if not data.participant_names:
+        event = calendar_sync.next_cached_event(db, user.id)
+        if event:
+            meeting_title = event.title
+            data.participant_names = [
+                _attendee_name(email) for email in event.attendees
+                if email.lower() != (user.email or "").lower()
+            ] or None
+
     # Get participant memories if provided
     if data.participant_names:
         for name in data.participant_names:
@@ -109,10 +123,17 @@ def generate_briefing(
         topics_to_avoid=topics_to_avoid,
         past_commitments=[CommitmentResponse.model_validate(c) for c in past_commitments],
         key_points_to_follow_up=key_points_to_follow_up,
+        meeting_title=meeting_title,
         generated_at=datetime.utcnow()
     )
 
 
+def _attendee_name(email: str) -> str:
+    """Best-effort name from a calendar attendee address (jane.doe@x -> jane doe)."""
+    local_part = email.split("@", 1)[0]
+    return " ".join(part for part in local_part.replace("_", ".").split(".") if part)
+
+
 # ============== Participant Memory ==============
 
 @router.post("/participants", response_model=ParticipantMemoryResponse)
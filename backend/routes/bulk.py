@@ -1,17 +1,23 @@
 """Bulk operations API endpoints for efficient batch processing."""
 
+import os
 from datetime import datetime
 from typing import List, Optional
 from enum import Enum
 
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Query
+from fastapi.responses import StreamingResponse, FileResponse, JSONResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
-from database import get_db
+from config import EXPORT_STREAMING_MAX_MEETINGS
+from database import get_db, SessionLocal
 from models import User, Meeting, ActionItem, Conversation
 from auth import get_current_user
 from services.audit_logger import AuditLogger
+from services.export_service import (
+    ExportService, ExportFormat as ServiceExportFormat, BULK_EXPORT_FORMATS, gzip_stream
+)
 
 router = APIRouter(prefix="/bulk", tags=["Bulk Operations"])
 
@@ -67,7 +73,9 @@ class BulkActionResult(BaseModel):
 class ExportFormat(str, Enum):
     """Supported export formats."""
     JSON = "json"
+    NDJSON = "ndjson"
     CSV = "csv"
+    MARKDOWN = "markdown"
 
 
 class BulkExportRequest(BaseModel):
@@ -76,6 +84,8 @@ class BulkExportRequest(BaseModel):
     format: ExportFormat = Field(default=ExportFormat.JSON)
     include_conversations: bool = Field(default=True, description="Include meeting conversations")
     include_action_items: bool = Field(default=True, description="Include action items")
+    gzip: bool = Field(default=False, description="Gzip-compress the export file")
+    background: bool = Field(default=False, description="Run as a background job and download the file later")
 
 
 # =============================================================================
@@ -145,107 +155,155 @@ def bulk_delete_meetings(
 @router.post("/meetings/export")
 def bulk_export_meetings(
     request: BulkExportRequest,
-    limit: int = Query(50, ge=1, le=100, description="Max items to export (max 100)"),
+    limit: Optional[int] = Query(None, ge=1, description="Max items to export (all if not provided)"),
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """
     Export multiple meetings.
 
-    Returns meeting data in the requested format.
+    Streams meeting data in the requested format (json, ndjson, csv or
+    markdown), optionally gzip-compressed. Exports larger than
+    EXPORT_STREAMING_MAX_MEETINGS, or with background=true, run as a
+    background job; poll /bulk/exports/{job_id} and download the file when
+    it is ready.
     """
-    query = db.query(Meeting).filter(Meeting.user_id == user.id)
+    export_format = ServiceExportFormat(request.format.value)
 
+    query = db.query(Meeting.id).filter(Meeting.user_id == user.id)
     if request.ids:
         query = query.filter(Meeting.id.in_(request.ids))
+    total = query.count()
+    if limit is not None:
+        total = min(total, limit)
 
-    meetings = query.order_by(Meeting.started_at.desc()).limit(limit).all()
-
-    export_data = []
-    for meeting in meetings:
-        meeting_data = {
-            "id": meeting.id,
-            "title": meeting.title,
-            "meeting_type": meeting.meeting_type,
-            "meeting_app": meeting.meeting_app,
-            "started_at": meeting.started_at.isoformat() if meeting.started_at else None,
-            "ended_at": meeting.ended_at.isoformat() if meeting.ended_at else None,
-            "duration_seconds": meeting.duration_seconds,
-            "status": meeting.status,
-            "notes": meeting.notes,
-        }
-
-        if request.include_conversations:
-            meeting_data["conversations"] = [
-                {
-                    "id": c.id,
-                    "speaker": c.speaker,
-                    "heard_text": c.heard_text,
-                    "response_text": c.response_text,
-                    "timestamp": c.timestamp.isoformat() if c.timestamp else None,
-                }
-                for c in meeting.conversations
-            ]
-
-        if request.include_action_items:
-            meeting_data["action_items"] = [
-                {
-                    "id": a.id,
-                    "description": a.description,
-                    "assignee": a.assignee,
-                    "due_date": a.due_date.isoformat() if a.due_date else None,
-                    "status": a.status,
-                    "priority": a.priority,
-                }
-                for a in meeting.action_items
-            ]
-
-        export_data.append(meeting_data)
-
-    # Audit log
     AuditLogger.log(
         db=db,
         action="bulk_export_meetings",
         user_id=user.id,
         details={
-            "count": len(export_data),
+            "count": total,
             "format": request.format,
+            "background": request.background or total > EXPORT_STREAMING_MAX_MEETINGS,
         },
     )
 
-    if request.format == ExportFormat.CSV:
-        # Return CSV format
-        import csv
-        import io
-
-        output = io.StringIO()
-        if export_data:
-            writer = csv.DictWriter(output, fieldnames=["id", "title", "meeting_type", "started_at", "status"])
-            writer.writeheader()
-            for meeting in export_data:
-                writer.writerow({
-                    "id": meeting["id"],
-                    "title": meeting["title"],
-                    "meeting_type": meeting["meeting_type"],
-                    "started_at": meeting["started_at"],
-                    "status": meeting["status"],
-                })
+    if request.background or total > EXPORT_STREAMING_MAX_MEETINGS:
+        from workers.tasks.export_tasks import export_meetings_file
 
-        from fastapi.responses import StreamingResponse
-        output.seek(0)
-        return StreamingResponse(
-            iter([output.getvalue()]),
-            media_type="text/csv",
-            headers={"Content-Disposition": "attachment; filename=meetings.csv"},
+        try:
+            job = export_meetings_file.delay(
+                user.id,
+                export_format.value,
+                request.ids,
+                limit,
+                request.include_conversations,
+                request.include_action_items,
+                request.gzip,
+            )
+        except Exception:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Background exports are temporarily unavailable",
+            )
+
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content={
+                "job_id": job.id,
+                "status": "pending",
+                "count": total,
+                "status_url": f"/api/v1/bulk/exports/{job.id}",
+            },
         )
 
+    def stream_export():
+        # The request's session is closed once this endpoint returns, before
+        # the body is sent, so the export reads through its own session
+        export_db = SessionLocal(bind=db.get_bind())
+        try:
+            service = ExportService(export_db)
+            meeting_data = service.iter_meeting_data(
+                user.id,
+                meeting_ids=request.ids,
+                limit=limit,
+                include_conversations=request.include_conversations,
+                include_action_items=request.include_action_items,
+            )
+            chunks = service.render_bulk_export(meeting_data, export_format)
+            if request.gzip:
+                chunks = gzip_stream(chunks)
+            yield from chunks
+        finally:
+            export_db.close()
+
+    filename, content_type = ExportService.bulk_export_filename(export_format, request.gzip)
+    return StreamingResponse(
+        stream_export(),
+        media_type=content_type,
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
+
+
+@router.get("/exports/{job_id}")
+def get_export_job(
+    job_id: str,
+    user: User = Depends(get_current_user),
+):
+    """Get the status of a background export job."""
+    from workers.tasks.export_tasks import find_export_file
+
+    path = find_export_file(user.id, job_id)
+    if path:
+        return {
+            "job_id": job_id,
+            "status": "ready",
+            "size_bytes": os.path.getsize(path),
+            "download_url": f"/api/v1/bulk/exports/{job_id}/download",
+        }
+
+    from celery.result import AsyncResult
+    from workers.celery_app import celery_app
+
+    result = AsyncResult(job_id, app=celery_app)
+    info = result.info if isinstance(result.info, dict) else {}
+    if info.get("user_id") not in (None, user.id):
+        raise HTTPException(status_code=404, detail="Export job not found")
+
+    if result.state == "FAILURE":
+        return {"job_id": job_id, "status": "failed"}
+    if result.state == "SUCCESS":
+        # Finished but the file has since expired
+        raise HTTPException(status_code=404, detail="Export file has expired")
+
     return {
-        "meetings": export_data,
-        "count": len(export_data),
-        "exported_at": datetime.utcnow().isoformat(),
+        "job_id": job_id,
+        "status": "running" if result.state == "PROGRESS" else "pending",
+        "exported": info.get("exported", 0),
     }
 
 
+@router.get("/exports/{job_id}/download")
+def download_export(
+    job_id: str,
+    user: User = Depends(get_current_user),
+):
+    """Download the file produced by a background export job."""
+    from workers.tasks.export_tasks import find_export_file
+
+    path = find_export_file(user.id, job_id)
+    if not path:
+        raise HTTPException(status_code=404, detail="Export file not found")
+
+    compressed = path.endswith(".gz")
+    extension = (path[:-3] if compressed else path).rsplit(".", 1)[1]
+    export_format = next(
+        f for f, (ext, _) in BULK_EXPORT_FORMATS.items() if ext == extension
+    )
+    filename, content_type = ExportService.bulk_export_filename(export_format, compressed)
+    return FileResponse(path, media_type=content_type, filename=filename)
+
+
 # =============================================================================
 # ACTION ITEM BULK OPERATIONS
 # =============================================================================
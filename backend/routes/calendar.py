@@ -16,6 +16,7 @@ from database import get_db
 from models import User, CalendarIntegration
 from auth import get_current_user
 from services.calendar_service import calendar_service, CalendarEvent
+from services.calendar_sync import calendar_sync
 
 router = APIRouter(prefix="/calendar", tags=["Calendar"])
 
@@ -191,6 +192,8 @@ def calendar_oauth_callback(
         )
         db.add(integration)
 
+    # The account may have changed; start the event cache over
+    calendar_sync.clear(db, user.id, provider)
     db.commit()
 
     # Redirect to success page
@@ -216,6 +219,7 @@ def disconnect_calendar(
         )
 
     db.delete(integration)
+    calendar_sync.clear(db, user.id, provider)
     db.commit()
 
     return {"status": "success", "message": f"{provider.title()} Calendar disconnected"}
@@ -11,7 +11,7 @@ import io
 from database import get_db
 from models import User, Meeting
 from auth import get_current_user
-from services.export_service import ExportService, ExportFormat
+from services.export_service import ExportService, ExportFormat, BULK_EXPORT_FORMATS
 
 router = APIRouter(prefix="/export", tags=["Export"])
 
@@ -123,6 +123,11 @@ def export_meeting(
             include_action_items=include_action_items,
             include_summary=include_summary,
         )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -146,7 +151,7 @@ def export_multiple_meetings(
     Export multiple meetings.
 
     If meeting_ids is not provided, exports all meetings.
-    Bulk export supports: json, csv, markdown
+    Bulk export supports: json, ndjson, csv, markdown
     """
     try:
         export_format = ExportFormat(request.format)
@@ -156,15 +161,19 @@ def export_multiple_meetings(
             detail=f"Invalid format: {request.format}",
         )
 
-    # Get meetings
-    query = db.query(Meeting).filter(Meeting.user_id == user.id)
+    if export_format not in BULK_EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Bulk export not supported for format: {export_format}",
+        )
+
+    # Check there is something to export
+    query = db.query(Meeting.id).filter(Meeting.user_id == user.id)
 
     if request.meeting_ids:
         query = query.filter(Meeting.id.in_(request.meeting_ids))
 
-    meetings = query.order_by(Meeting.started_at.desc()).limit(500).all()
-
-    if not meetings:
+    if not query.first():
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No meetings found",
@@ -172,19 +181,19 @@ def export_multiple_meetings(
 
     service = ExportService(db)
 
-    try:
-        content, filename, content_type = service.export_multiple_meetings(
-            meetings,
-            export_format,
-        )
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e),
-        )
+    # Stream in batches rather than building the whole file in memory
+    meeting_data = service.iter_meeting_data(
+        user.id,
+        meeting_ids=request.meeting_ids,
+        limit=500,
+        include_conversations=request.include_conversations,
+        include_action_items=request.include_action_items,
+        include_summary=request.include_summary,
+    )
+    filename, content_type = service.bulk_export_filename(export_format)
 
     return StreamingResponse(
-        io.BytesIO(content) if isinstance(content, bytes) else io.BytesIO(content.encode("utf-8")),
+        service.render_meetings(meeting_data, export_format),
         media_type=content_type,
         headers={"Content-Disposition": f"attachment; filename={filename}"},
     )
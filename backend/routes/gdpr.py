@@ -9,22 +9,26 @@ Provides data subject rights:
 
 import asyncio
 import logging
+import os
 from datetime import datetime
 from typing import Optional, List
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
-import json
 
 logger = logging.getLogger(__name__)
 
 from database import get_db
 from models import (
-    User, Meeting, Conversation, MeetingSummary, ActionItem,
+    User, Meeting, Conversation, MeetingSummary, MeetingRollingSummary, ActionItem,
     Commitment, Topic, ParticipantMemory, UserLearningProfile,
-    PreMeetingBriefing, AuditLog
+    PreMeetingBriefing, AuditLog, DataExportJob
 )
 from auth import get_current_user
+from services.gdpr_export import (
+    JOB_PENDING, JOB_RUNNING, JOB_COMPLETED, JOB_FAILED, JOB_EXPIRED, fail_stale_export_jobs
+)
 
 router = APIRouter(prefix="/gdpr", tags=["GDPR"])
 
@@ -40,6 +44,8 @@ class ExportResponse(BaseModel):
     """Data export response."""
     status: str
     message: str
+    job_id: Optional[int] = None
+    progress: int = 0
     download_url: Optional[str] = None
     expires_at: Optional[datetime] = None
 
@@ -133,7 +139,6 @@ def update_consents(
 
 @router.post("/export", response_model=ExportResponse)
 def request_data_export(
-    background_tasks: BackgroundTasks,
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -141,24 +146,41 @@ def request_data_export(
     Request export of all user data.
 
     GDPR Article 20: Right to data portability
-    Returns all user data in JSON format.
+    The archive (a ZIP of JSON-lines files, one per table) is built in the
+    background; poll the job and download it once completed.
     """
-    # Log the export request
-    log_gdpr_action(db, user.id, "export_request", {})
-
-    # Collect all user data
-    export_data = _collect_user_data(db, user.id)
+    # Reuse an export that is already in progress, unless it was lost
+    fail_stale_export_jobs(db, user.id)
+    job = db.query(DataExportJob).filter(
+        DataExportJob.user_id == user.id,
+        DataExportJob.status.in_([JOB_PENDING, JOB_RUNNING]),
+    ).order_by(DataExportJob.created_at.desc()).first()
+
+    if job:
+        return _export_response(job)
+
+    job = DataExportJob(user_id=user.id, status=JOB_PENDING, progress=0)
+    db.add(job)
+    db.commit()
+    db.refresh(job)
 
-    # In production, this would be stored and a download link provided
-    # For now, we'll return the data directly (small datasets)
-    # TODO: For large datasets, use background task and email download link
+    # Log the export request
+    log_gdpr_action(db, user.id, "export_request", {"job_id": job.id})
+
+    try:
+        from workers.tasks.gdpr_tasks import build_data_export
+        build_data_export.delay(job.id)
+    except Exception as e:
+        logger.error(f"Failed to queue data export {job.id}: {e}")
+        job.status = JOB_FAILED
+        job.error_message = "Could not queue export"
+        db.commit()
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Data export is temporarily unavailable, please try again later"
+        )
 
-    return ExportResponse(
-        status="completed",
-        message="Your data export is ready. In production, a download link would be emailed.",
-        download_url=None,
-        expires_at=None
-    )
+    return _export_response(job)
 
 
 @router.get("/export/data")
@@ -167,145 +189,100 @@ def download_data_export(
     db: Session = Depends(get_db)
 ):
     """
-    Download user data export as JSON.
+    Download the most recent completed data export.
 
     GDPR Article 20: Data must be in structured, machine-readable format.
     """
-    export_data = _collect_user_data(db, user.id)
+    job = db.query(DataExportJob).filter(
+        DataExportJob.user_id == user.id,
+        DataExportJob.status == JOB_COMPLETED,
+        DataExportJob.expires_at > datetime.utcnow(),
+    ).order_by(DataExportJob.completed_at.desc()).first()
 
-    # Log the download
-    log_gdpr_action(db, user.id, "export_download", {"size_bytes": len(json.dumps(export_data))})
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No data export is ready. Request one with POST /gdpr/export"
+        )
 
-    return {
-        "export_date": datetime.utcnow().isoformat(),
-        "user_id": user.id,
-        "format": "JSON",
-        "data": export_data
-    }
+    return _serve_export_file(db, user, job)
 
 
-def _collect_user_data(db: Session, user_id: int) -> dict:
-    """Collect all user data for export."""
-    user = db.query(User).filter(User.id == user_id).first()
-
-    # User profile
-    profile = {
-        "id": user.id,
-        "email": user.email,
-        "full_name": user.full_name,
-        "profession_id": user.profession_id,
-        "specialization": user.specialization,
-        "years_experience": user.years_experience,
-        "created_at": user.created_at.isoformat() if user.created_at else None,
-        "subscription_status": user.subscription_status,
-        "trial_start": user.trial_start.isoformat() if user.trial_start else None,
-        "timezone": user.timezone,
-        "consents": {
-            "analytics": user.consent_analytics,
-            "marketing": user.consent_marketing,
-            "ai_training": user.consent_ai_training,
-            "updated_at": user.consent_updated_at.isoformat() if user.consent_updated_at else None
-        }
-    }
+@router.get("/export/{job_id}", response_model=ExportResponse)
+def get_data_export(
+    job_id: int,
+    user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get the status and progress of a data export."""
+    return _export_response(_get_user_export_job(db, user, job_id))
 
-    # Meetings
-    meetings = db.query(Meeting).filter(Meeting.user_id == user_id).all()
-    meetings_data = []
-    for m in meetings:
-        meeting_data = {
-            "id": m.id,
-            "meeting_type": m.meeting_type,
-            "title": m.title,
-            "meeting_app": m.meeting_app,
-            "started_at": m.started_at.isoformat() if m.started_at else None,
-            "ended_at": m.ended_at.isoformat() if m.ended_at else None,
-            "duration_seconds": m.duration_seconds,
-            "status": m.status,
-            "participant_count": m.participant_count,
-            "notes": m.notes,
-        }
 
-        # Conversations for this meeting
-        convs = db.query(Conversation).filter(Conversation.meeting_id == m.id).all()
-        meeting_data["conversations"] = [
-            {
-                "id": c.id,
-                "timestamp": c.timestamp.isoformat() if c.timestamp else None,
-                "speaker": c.speaker,
-                "content": c.content,
-                "ai_response": c.ai_response,
-            }
-            for c in convs
-        ]
-
-        meetings_data.append(meeting_data)
-
-    # Action items
-    action_items = db.query(ActionItem).filter(ActionItem.user_id == user_id).all()
-    action_items_data = [
-        {
-            "id": a.id,
-            "meeting_id": a.meeting_id,
-            "description": a.description,
-            "assignee": a.assignee,
-            "due_date": a.due_date.isoformat() if a.due_date else None,
-            "status": a.status,
-            "priority": a.priority,
-            "created_at": a.created_at.isoformat() if a.created_at else None,
-        }
-        for a in action_items
-    ]
-
-    # Learning profile
-    profile_data = db.query(UserLearningProfile).filter(UserLearningProfile.user_id == user_id).first()
-    learning_profile_data = None
-    if profile_data:
-        learning_profile_data = {
-            "id": profile_data.id,
-            "formality_level": profile_data.formality_level,
-            "verbosity": profile_data.verbosity,
-            "technical_depth": profile_data.technical_depth,
-            "frequent_topics": profile_data.frequent_topics,
-            "topic_expertise": profile_data.topic_expertise,
-            "preferred_response_length": profile_data.preferred_response_length,
-            "total_conversations_analyzed": profile_data.total_conversations_analyzed,
-            "confidence_score": profile_data.confidence_score,
-            "updated_at": profile_data.updated_at.isoformat() if profile_data.updated_at else None,
-        }
+@router.get("/export/{job_id}/download")
+def download_data_export_job(
+    job_id: int,
+    user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Download a completed data export archive.
 
-    # Participant memories
-    memories = db.query(ParticipantMemory).filter(ParticipantMemory.user_id == user_id).all()
-    participant_memories_data = [
-        {
-            "id": pm.id,
-            "participant_name": pm.participant_name,
-            "relationship": pm.relationship,
-            "notes": pm.notes,
-            "last_meeting": pm.last_meeting.isoformat() if pm.last_meeting else None,
-            "meeting_count": pm.meeting_count,
-        }
-        for pm in memories
-    ]
-
-    # Audit logs (actions user took)
-    audits = db.query(AuditLog).filter(AuditLog.user_id == user_id).all()
-    audit_data = [
-        {
-            "action": a.action,
-            "resource_type": a.resource_type,
-            "timestamp": a.timestamp.isoformat() if a.timestamp else None,
-        }
-        for a in audits
-    ]
+    Supports HTTP Range requests so large archives can be resumed.
+    """
+    job = _get_user_export_job(db, user, job_id)
 
-    return {
-        "profile": profile,
-        "meetings": meetings_data,
-        "action_items": action_items_data,
-        "learning_profile": learning_profile_data,
-        "participant_memories": participant_memories_data,
-        "audit_log": audit_data,
+    if job.status == JOB_EXPIRED or (job.expires_at and job.expires_at <= datetime.utcnow()):
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail="This data export has expired")
+    if job.status != JOB_COMPLETED:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Data export is not ready yet")
+
+    return _serve_export_file(db, user, job)
+
+
+def _get_user_export_job(db: Session, user: User, job_id: int) -> DataExportJob:
+    job = db.query(DataExportJob).filter(
+        DataExportJob.id == job_id,
+        DataExportJob.user_id == user.id,
+    ).first()
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Data export not found")
+    return job
+
+
+def _export_response(job: DataExportJob) -> ExportResponse:
+    messages = {
+        JOB_PENDING: "Your data export has been queued.",
+        JOB_RUNNING: "Your data export is being prepared.",
+        JOB_COMPLETED: "Your data export is ready to download.",
+        JOB_FAILED: "Your data export failed. Please request a new one.",
+        JOB_EXPIRED: "Your data export has expired. Please request a new one.",
     }
+    return ExportResponse(
+        status=job.status,
+        message=messages.get(job.status, job.status),
+        job_id=job.id,
+        progress=job.progress or 0,
+        download_url=f"/api/v1/gdpr/export/{job.id}/download" if job.status == JOB_COMPLETED else None,
+        expires_at=job.expires_at
+    )
+
+
+def _serve_export_file(db: Session, user: User, job: DataExportJob) -> FileResponse:
+    if not job.file_path or not os.path.exists(job.file_path):
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail="This data export is no longer available")
+
+    job.download_count = (job.download_count or 0) + 1
+    db.commit()
+
+    # Log the download
+    log_gdpr_action(db, user.id, "export_download", {"job_id": job.id, "size_bytes": job.file_size_bytes})
+
+    # FileResponse streams from disk and handles Range requests
+    return FileResponse(
+        job.file_path,
+        media_type="application/zip",
+        filename=f"readin_data_export_{job.completed_at.strftime('%Y%m%d')}.zip",
+    )
 
 
 @router.post("/delete", response_model=DeleteResponse)
@@ -415,6 +392,7 @@ def immediate_account_deletion(
     for meeting in meetings:
         db.query(Conversation).filter(Conversation.meeting_id == meeting.id).delete()
         db.query(MeetingSummary).filter(MeetingSummary.meeting_id == meeting.id).delete()
+        db.query(MeetingRollingSummary).filter(MeetingRollingSummary.meeting_id == meeting.id).delete()
         db.query(Commitment).filter(Commitment.meeting_id == meeting.id).delete()
         db.delete(meeting)
 
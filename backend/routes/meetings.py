@@ -142,8 +142,8 @@ def end_meeting(
     # Fire Zapier trigger for meeting_ended
     try:
         from integrations.zapier import fire_meeting_ended
-        asyncio.create_task(fire_meeting_ended(db, meeting, user))
-        logger.info(f"Triggered Zapier webhook for meeting {meeting_id}")
+        fire_meeting_ended(db, meeting, user)
+        logger.info(f"Queued webhooks for meeting {meeting_id}")
     except Exception as e:
         # Don't fail the request if Zapier integration fails
         logger.error(f"Failed to fire Zapier trigger: {e}")
@@ -9,11 +9,15 @@ Provides API endpoints for:
 All routes require authentication.
 """
 
+import hmac
+import json
 import logging
+import os
+import secrets
 from datetime import datetime, timedelta
 from typing import Optional, List
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, BackgroundTasks
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
@@ -24,6 +28,8 @@ from models import (
     IntegrationProvider,
     ProjectManagementConnection,
     ActionItemSync,
+    PMWebhookVerification,
+    StaffRole,
 )
 from auth import get_current_user
 from config import APP_URL
@@ -34,10 +40,15 @@ from integrations.project_management.linear import LinearIntegration, is_linear_
 from integrations.project_management.jira import JiraIntegration, is_jira_configured
 from integrations.project_management.monday import MondayIntegration, is_monday_configured
 from integrations.project_management.base import TaskData, SyncResult
+from middleware.rate_limiter import limiter
+from services.pm_sync_service import PMSyncService, WebhookEventsNotApplied, record_webhook_outcome
 
 logger = logging.getLogger("project_management_routes")
 router = APIRouter(prefix="/integrations/pm", tags=["Project Management"])
 
+# Public URL of this API, which providers deliver webhooks to
+BACKEND_URL = os.getenv("BACKEND_URL", APP_URL)
+
 
 # =============================================================================
 # REQUEST/RESPONSE SCHEMAS
@@ -176,6 +187,50 @@ def get_integration_instance(
         raise ValueError(f"Unknown provider: {provider}")
 
 
+def webhook_url(provider: str, connection: ProjectManagementConnection, handshake: Optional[str] = None) -> str:
+    """Receiver URL for a webhook registered for one connection's project."""
+    url = f"{BACKEND_URL}/api/v1/integrations/pm/{provider}/webhook?connection_id={connection.id}"
+    if handshake:
+        url += f"&handshake={handshake}"
+    return url
+
+
+async def register_project_webhook(
+    provider: str,
+    connection: ProjectManagementConnection,
+    db: Session,
+) -> None:
+    """
+    Replace the connection's project webhook after a project change.
+
+    Only providers that register webhooks per project (Asana, Monday.com)
+    create one. Failures are logged: the reconciliation sweep still picks
+    up status changes, just later.
+    """
+    integration = get_integration_instance(provider, connection, db)
+    try:
+        if connection.webhook_id:
+            await integration.delete_webhook(connection.webhook_id)
+
+        # Asana's handshake for the new webhook must find no old secret, and
+        # must present the nonce to prove it answers this registration
+        nonce = secrets.token_urlsafe(32)
+        connection.webhook_id = None
+        connection.webhook_secret = None
+        connection.webhook_handshake_nonce = nonce
+        db.commit()
+
+        webhook_id = await integration.create_webhook(webhook_url(provider, connection, nonce))
+        if webhook_id:
+            connection.webhook_id = webhook_id
+    except Exception as e:
+        logger.error(f"Error registering {provider} webhook: {e}")
+    finally:
+        await integration.close()
+        connection.webhook_handshake_nonce = None
+        db.commit()
+
+
 # =============================================================================
 # LIST AVAILABLE INTEGRATIONS
 # =============================================================================
@@ -559,6 +614,8 @@ async def select_asana_project(
     connection.updated_at = datetime.utcnow()
     db.commit()
 
+    await register_project_webhook(IntegrationProvider.ASANA, connection, db)
+
     return {"message": "Project selected", "project_id": request.project_id}
 
 
@@ -925,6 +982,38 @@ async def select_jira_project(
     return {"message": "Project selected", "project_key": request.project_id}
 
 
+@router.post("/jira/webhook-secret")
+async def create_jira_webhook_secret(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Create the signing secret for this connection's Jira webhook.
+
+    The URL and secret are entered in Jira's webhook settings. Each
+    connection has its own, so events from one Jira site can never touch
+    another site's issues. Calling this again replaces the secret.
+    """
+    connection = db.query(ProjectManagementConnection).filter(
+        ProjectManagementConnection.user_id == current_user.id,
+        ProjectManagementConnection.provider == IntegrationProvider.JIRA,
+        ProjectManagementConnection.is_active == True
+    ).first()
+
+    if not connection:
+        raise HTTPException(status_code=404, detail="Jira not connected")
+
+    connection.webhook_secret = secrets.token_urlsafe(32)
+    connection.updated_at = datetime.utcnow()
+    db.commit()
+
+    return {
+        "url": webhook_url(IntegrationProvider.JIRA, connection),
+        "secret": connection.webhook_secret,
+        "events": list(JiraIntegration.WEBHOOK_EVENTS),
+    }
+
+
 @router.delete("/jira")
 async def disconnect_jira(
     db: Session = Depends(get_db),
@@ -1128,6 +1217,8 @@ async def select_monday_board(
     connection.updated_at = datetime.utcnow()
     db.commit()
 
+    await register_project_webhook(IntegrationProvider.MONDAY, connection, db)
+
     return {"message": "Board selected", "board_id": request.project_id}
 
 
@@ -1412,6 +1503,144 @@ async def get_sync_status(
     }
 
 
+# =============================================================================
+# INBOUND WEBHOOKS
+# =============================================================================
+
+@router.post("/{provider}/webhook")
+@limiter.exempt
+async def receive_webhook(
+    provider: str,
+    request: Request,
+    response: Response,
+    connection_id: Optional[int] = Query(None),
+    handshake: Optional[str] = Query(None),
+    db: Session = Depends(get_db),
+):
+    """
+    Receive task change webhooks from a project management tool.
+
+    Not authenticated - every event is verified by the provider's
+    signature instead. Handles the subscription handshakes, then applies
+    the changed statuses to the linked action items.
+    """
+    if provider not in PM_PROVIDERS:
+        raise HTTPException(status_code=404, detail="Unknown provider")
+
+    integration_class = PM_PROVIDERS[provider]["integration_class"]
+    body = await request.body()
+
+    try:
+        payload = json.loads(body) if body else {}
+    except json.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+    if not isinstance(payload, dict):
+        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+
+    secret = None
+    connection = None
+    if provider == IntegrationProvider.JIRA:
+        # Jira issue IDs are only unique within a site, so each connection
+        # has its own receiver URL and secret (see /jira/webhook-secret)
+        connection = db.query(ProjectManagementConnection).filter(
+            ProjectManagementConnection.id == connection_id,
+            ProjectManagementConnection.provider == IntegrationProvider.JIRA,
+            ProjectManagementConnection.is_active == True,
+        ).first() if connection_id else None
+
+        if not connection:
+            raise HTTPException(status_code=404, detail="Connection not found")
+        secret = connection.webhook_secret
+
+    elif provider == IntegrationProvider.ASANA:
+        # Asana webhooks are per project, each with its own secret
+        connection = db.query(ProjectManagementConnection).filter(
+            ProjectManagementConnection.id == connection_id,
+            ProjectManagementConnection.provider == IntegrationProvider.ASANA,
+        ).first() if connection_id else None
+
+        if not connection or not connection.is_active:
+            # Asana deletes a webhook whose receiver answers 410
+            raise HTTPException(status_code=410, detail="Connection not found")
+
+        hook_secret = request.headers.get("X-Hook-Secret")
+        if hook_secret:
+            # Only the registration in progress may set the secret
+            pending = connection.webhook_handshake_nonce
+            if not (pending and handshake and hmac.compare_digest(pending, handshake)):
+                raise HTTPException(status_code=403, detail="No webhook registration pending")
+            connection.webhook_secret = hook_secret
+            connection.webhook_handshake_nonce = None
+            db.commit()
+            response.headers["X-Hook-Secret"] = hook_secret
+            return {"status": "handshake"}
+
+        secret = connection.webhook_secret
+
+    elif provider == IntegrationProvider.MONDAY and "challenge" in payload:
+        return {"challenge": payload["challenge"]}
+
+    elif provider == IntegrationProvider.NOTION and "verification_token" in payload:
+        # The token signs the events that follow, so it is stored for a
+        # super admin to read (see /notion/webhook-verification), not logged
+        verification = db.query(PMWebhookVerification).filter(
+            PMWebhookVerification.provider == IntegrationProvider.NOTION
+        ).first()
+        if not verification:
+            verification = PMWebhookVerification(provider=IntegrationProvider.NOTION)
+            db.add(verification)
+        verification.token = str(payload["verification_token"])
+        verification.received_at = datetime.utcnow()
+        db.commit()
+        logger.info("Notion webhook verification request received")
+        return {"status": "verification"}
+
+    if not (secret or integration_class.WEBHOOK_SECRET):
+        raise HTTPException(status_code=503, detail="Webhook not configured")
+
+    if not integration_class.verify_webhook(request.headers, body, secret):
+        record_webhook_outcome(provider, "invalid_signature")
+        raise HTTPException(status_code=401, detail="Invalid webhook signature")
+
+    events = integration_class.parse_webhook(request.headers, payload)
+    try:
+        updated = await PMSyncService(db).apply_webhook_events(
+            provider, events, connection_id=connection.id if connection else None
+        )
+    except WebhookEventsNotApplied as e:
+        # A non-2xx answer makes the provider redeliver
+        logger.warning(str(e))
+        raise HTTPException(status_code=503, detail="Webhook events could not be applied")
+
+    return {"status": "received", "events": len(events), "updated": len(updated)}
+
+
+@router.post("/notion/webhook-verification")
+async def read_notion_webhook_verification(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Hand out the Notion webhook verification token, once.
+
+    The token is pasted into Notion to confirm the subscription and set as
+    NOTION_WEBHOOK_SECRET. It is deleted when read.
+    """
+    if not current_user.is_staff or current_user.staff_role != StaffRole.SUPER_ADMIN:
+        raise HTTPException(status_code=403, detail="Super admin access required")
+
+    verification = db.query(PMWebhookVerification).filter(
+        PMWebhookVerification.provider == IntegrationProvider.NOTION
+    ).first()
+    if not verification:
+        raise HTTPException(status_code=404, detail="No verification request received")
+
+    result = {"verification_token": verification.token, "received_at": verification.received_at.isoformat()}
+    db.delete(verification)
+    db.commit()
+    return result
+
+
 # =============================================================================
 # INTEGRATION SETTINGS
 # =============================================================================
@@ -1,6 +1,5 @@
 """Tasks API routes - Action items and commitments management."""
 
-import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import Optional, List
@@ -72,8 +71,8 @@ async def create_action_item(
     # Fire Zapier trigger for action_item_created
     try:
         from integrations.zapier import fire_action_item_created
-        asyncio.create_task(fire_action_item_created(db, action_item, meeting, user))
-        logger.info(f"Triggered Zapier webhook for action item {action_item.id}")
+        fire_action_item_created(db, action_item, meeting, user)
+        logger.info(f"Queued webhooks for action item {action_item.id}")
     except Exception as e:
         logger.error(f"Failed to fire Zapier trigger: {e}")
         # Don't fail the request if Zapier integration fails
@@ -811,6 +811,7 @@ class BriefingResponse(BaseModel):
     topics_to_avoid: List[str]
     past_commitments: List[CommitmentResponse]
     key_points_to_follow_up: List[str]
+    meeting_title: Optional[str] = None  # Calendar meeting the briefing was prepared for
     generated_at: datetime
 
 
@@ -11,7 +11,9 @@ from .recommendation_service import RecommendationService
 from .business_hours_service import (
     BusinessHoursService,
     BusinessHoursConfig,
+    BusinessCalendar,
     create_business_hours_service,
+    get_business_calendar,
 )
 from .transcript_service import TranscriptService
 
@@ -26,6 +28,8 @@ __all__ = [
     "RecommendationService",
     "BusinessHoursService",
     "BusinessHoursConfig",
+    "BusinessCalendar",
     "create_business_hours_service",
+    "get_business_calendar",
     "TranscriptService",
 ]
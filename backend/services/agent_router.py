@@ -0,0 +1,434 @@
+"""
+Agent routing for support chats and tickets.
+
+Finding an agent used to run a join over TeamMember and AgentStatus ordered
+by current_chats for every assignment, then increment current_chats on the
+ORM row, which lets two concurrent chat starts pick the same agent.
+
+The router keeps each team's available agents ordered by load:
+
+- LocalAgentPool holds per-team min-heaps in process memory (lazy deletion,
+  O(log n) claim and release under a lock). Used when Redis is unavailable,
+  which is only race-free within a single API process.
+- RedisAgentPool keeps the same ordering in Redis sorted sets and claims
+  and releases with Lua scripts, so assignment is atomic across workers.
+
+Loads are the pool's to own; AgentStatus.current_chats is written behind
+by flush(), which the scheduler runs every AGENT_ROUTING_FLUSH_SECONDS.
+"""
+
+import heapq
+import itertools
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Union
+
+from sqlalchemy import bindparam, update
+from sqlalchemy.orm import Session
+
+from models import AgentStatus, TeamMember
+
+logger = logging.getLogger(__name__)
+
+
+AGENT_ROUTING_FLUSH_SECONDS = float(os.getenv("AGENT_ROUTING_FLUSH_SECONDS", "5"))
+
+# How long the Redis pool counts as seeded. Once it lapses the next worker to
+# start reloads agents from the database, which recovers from a Redis restart
+# or a worker dying mid-seed; loads already in Redis are kept.
+AGENT_ROUTING_SEED_TTL_SECONDS = int(os.getenv("AGENT_ROUTING_SEED_TTL_SECONDS", "3600"))
+
+# Pool key holding agents of every team (chats in the general queue)
+ALL_TEAMS = "all"
+
+
+@dataclass
+class AgentSlot:
+    """Routing state of one team member."""
+    member_id: int
+    team_id: Optional[int]
+    online: bool
+    max_chats: int
+    load: int = 0
+    version: int = 0
+
+    @property
+    def available(self) -> bool:
+        return self.online and self.load < self.max_chats
+
+
+class LocalAgentPool:
+    """Per-team min-heaps of available agents, keyed by load."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._agents: Dict[int, AgentSlot] = {}
+        self._heaps: Dict[Union[int, str], List[tuple]] = {}
+        self._seq = itertools.count()
+        self._dirty: set = set()
+
+    def should_seed(self) -> bool:
+        return True
+
+    def load_agents(self, slots: Iterable[AgentSlot]) -> None:
+        """Replace the pool contents (used once, from AgentStatus)."""
+        with self._lock:
+            self._agents = {}
+            self._heaps = {}
+            for slot in slots:
+                self._agents[slot.member_id] = slot
+                self._index(slot)
+
+    def upsert(self, member_id: int, team_id: Optional[int], online: bool, max_chats: int, load: int = 0) -> None:
+        """Add an agent or update its team, status and capacity (keeping its load)."""
+        with self._lock:
+            slot = self._agents.get(member_id)
+            if slot is None:
+                slot = AgentSlot(member_id, team_id, online, max_chats, load)
+                self._agents[member_id] = slot
+            else:
+                slot.team_id, slot.online, slot.max_chats = team_id, online, max_chats
+            self._index(slot)
+
+    def remove(self, member_id: int) -> None:
+        with self._lock:
+            # Heap entries become stale and are dropped when reached
+            self._agents.pop(member_id, None)
+
+    def claim(self, team_id: Optional[int]) -> Optional[int]:
+        """Take the least-loaded available agent and increment its load."""
+        with self._lock:
+            slot = self._top(team_id if team_id else ALL_TEAMS)
+            if slot is None:
+                return None
+            slot.load += 1
+            self._dirty.add(slot.member_id)
+            self._index(slot)
+            return slot.member_id
+
+    def peek(self, team_id: Optional[int]) -> Optional[int]:
+        """Least-loaded available agent, without claiming it."""
+        with self._lock:
+            slot = self._top(team_id if team_id else ALL_TEAMS)
+            return slot.member_id if slot else None
+
+    def adjust(self, member_id: int, delta: int) -> Optional[int]:
+        """Change an agent's load by delta (never below zero); returns the new load."""
+        with self._lock:
+            slot = self._agents.get(member_id)
+            if slot is None:
+                return None
+            slot.load = max(0, slot.load + delta)
+            self._dirty.add(member_id)
+            self._index(slot)
+            return slot.load
+
+    def load_of(self, member_id: int) -> Optional[int]:
+        slot = self._agents.get(member_id)
+        return slot.load if slot else None
+
+    def take_dirty(self) -> Dict[int, int]:
+        """Loads changed since the last call, by member id."""
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+            return {mid: self._agents[mid].load for mid in dirty if mid in self._agents}
+
+    def _index(self, slot: AgentSlot) -> None:
+        # Invalidate older heap entries for this agent and push fresh ones
+        slot.version += 1
+        if not slot.available:
+            return
+        for key in (slot.team_id, ALL_TEAMS):
+            if key is None:
+                continue
+            heap = self._heaps.setdefault(key, [])
+            heapq.heappush(heap, (slot.load, next(self._seq), slot.member_id, slot.version))
+            if len(heap) > 2 * len(self._agents) + 64:
+                self._compact(key)
+
+    def _top(self, key: Union[int, str]) -> Optional[AgentSlot]:
+        heap = self._heaps.get(key)
+        while heap:
+            _, _, member_id, version = heap[0]
+            slot = self._agents.get(member_id)
+            if slot is not None and slot.version == version and slot.available:
+                return slot
+            heapq.heappop(heap)
+        return None
+
+    def _compact(self, key: Union[int, str]) -> None:
+        heap = self._heaps[key]
+        live = []
+        for entry in heap:
+            slot = self._agents.get(entry[2])
+            if slot is not None and slot.version == entry[3]:
+                live.append(entry)
+        heapq.heapify(live)
+        self._heaps[key] = live
+
+
+# Lua helpers shared by the Redis scripts. Agent state lives in a hash per
+# member; available agents are in one sorted set per team plus one for all
+# teams, scored by load.
+_REDIS_REINDEX = """
+local function reindex(prefix, id)
+    local agent = prefix .. ':agent:' .. id
+    local load = tonumber(redis.call('HGET', agent, 'load') or '0')
+    local max = tonumber(redis.call('HGET', agent, 'max') or '0')
+    local team = redis.call('HGET', agent, 'team')
+    local available = redis.call('HGET', agent, 'online') == '1' and load < max
+    local keys = {prefix .. ':available:all'}
+    if team and team ~= '' then
+        table.insert(keys, prefix .. ':available:' .. team)
+    end
+    for _, key in ipairs(keys) do
+        if available then
+            redis.call('ZADD', key, load, id)
+        else
+            redis.call('ZREM', key, id)
+        end
+    end
+end
+"""
+
+_REDIS_CLAIM = _REDIS_REINDEX + """
+local picked = redis.call('ZRANGE', ARGV[1] .. ':available:' .. ARGV[2], 0, 0)
+if #picked == 0 then
+    return false
+end
+local id = picked[1]
+redis.call('HINCRBY', ARGV[1] .. ':agent:' .. id, 'load', 1)
+reindex(ARGV[1], id)
+redis.call('SADD', ARGV[1] .. ':dirty', id)
+return id
+"""
+
+_REDIS_ADJUST = _REDIS_REINDEX + """
+local agent = ARGV[1] .. ':agent:' .. ARGV[2]
+if redis.call('EXISTS', agent) == 0 then
+    return false
+end
+local load = tonumber(redis.call('HGET', agent, 'load') or '0') + tonumber(ARGV[3])
+if load < 0 then
+    load = 0
+end
+redis.call('HSET', agent, 'load', load)
+reindex(ARGV[1], ARGV[2])
+redis.call('SADD', ARGV[1] .. ':dirty', ARGV[2])
+return load
+"""
+
+_REDIS_UPSERT = _REDIS_REINDEX + """
+local agent = ARGV[1] .. ':agent:' .. ARGV[2]
+local old_team = redis.call('HGET', agent, 'team')
+if old_team and old_team ~= '' and old_team ~= ARGV[3] then
+    redis.call('ZREM', ARGV[1] .. ':available:' .. old_team, ARGV[2])
+end
+redis.call('HSET', agent, 'team', ARGV[3], 'online', ARGV[4], 'max', ARGV[5])
+redis.call('HSETNX', agent, 'load', ARGV[6])
+reindex(ARGV[1], ARGV[2])
+return 1
+"""
+
+_REDIS_REMOVE = """
+local agent = ARGV[1] .. ':agent:' .. ARGV[2]
+local team = redis.call('HGET', agent, 'team')
+if team and team ~= '' then
+    redis.call('ZREM', ARGV[1] .. ':available:' .. team, ARGV[2])
+end
+redis.call('ZREM', ARGV[1] .. ':available:all', ARGV[2])
+redis.call('DEL', agent)
+return 1
+"""
+
+
+class RedisAgentPool:
+    """Agent pool shared by all workers through Redis sorted sets."""
+
+    def __init__(self, client, prefix: str = "routing"):
+        self.client = client
+        self.prefix = prefix
+        self._claim = client.register_script(_REDIS_CLAIM)
+        self._adjust = client.register_script(_REDIS_ADJUST)
+        self._upsert = client.register_script(_REDIS_UPSERT)
+        self._remove = client.register_script(_REDIS_REMOVE)
+
+    def should_seed(self) -> bool:
+        # Only the first worker to set the flag seeds the pool from the database
+        return bool(self.client.set(
+            f"{self.prefix}:loaded", 1, nx=True, ex=AGENT_ROUTING_SEED_TTL_SECONDS
+        ))
+
+    def load_agents(self, slots: Iterable[AgentSlot]) -> None:
+        for slot in slots:
+            self.upsert(slot.member_id, slot.team_id, slot.online, slot.max_chats, slot.load)
+
+    def upsert(self, member_id: int, team_id: Optional[int], online: bool, max_chats: int, load: int = 0) -> None:
+        self._upsert(args=[
+            self.prefix, member_id, team_id if team_id is not None else "",
+            1 if online else 0, max_chats, load,
+        ])
+
+    def remove(self, member_id: int) -> None:
+        self._remove(args=[self.prefix, member_id])
+
+    def claim(self, team_id: Optional[int]) -> Optional[int]:
+        member_id = self._claim(args=[self.prefix, team_id if team_id else ALL_TEAMS])
+        return int(member_id) if member_id else None
+
+    def peek(self, team_id: Optional[int]) -> Optional[int]:
+        picked = self.client.zrange(f"{self.prefix}:available:{team_id if team_id else ALL_TEAMS}", 0, 0)
+        return int(picked[0]) if picked else None
+
+    def adjust(self, member_id: int, delta: int) -> Optional[int]:
+        load = self._adjust(args=[self.prefix, member_id, delta])
+        return int(load) if load is not None else None
+
+    def load_of(self, member_id: int) -> Optional[int]:
+        load = self.client.hget(f"{self.prefix}:agent:{member_id}", "load")
+        return int(load) if load is not None else None
+
+    def take_dirty(self) -> Dict[int, int]:
+        member_ids = self.client.spop(f"{self.prefix}:dirty", 1000) or []
+        loads = {}
+        for member_id in member_ids:
+            load = self.load_of(int(member_id))
+            if load is not None:
+                loads[int(member_id)] = load
+        return loads
+
+
+def _default_pool():
+    from services.cache_service import cache
+
+    if cache.enabled:
+        try:
+            return RedisAgentPool(cache.client)
+        except Exception as e:
+            logger.warning(f"Redis agent pool unavailable, routing in process memory: {e}")
+    return LocalAgentPool()
+
+
+class AgentRouter:
+    """Assigns chats and tickets to the least-loaded available agent."""
+
+    def __init__(self, pool=None):
+        self._pool = pool
+        self._lock = threading.Lock()
+        self._loaded = False
+
+    @property
+    def pool(self):
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = _default_pool()
+        return self._pool
+
+    def _ensure_loaded(self, db: Session) -> None:
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            if self.pool.should_seed():
+                rows = db.query(
+                    AgentStatus.team_member_id,
+                    AgentStatus.status,
+                    AgentStatus.current_chats,
+                    AgentStatus.max_chats,
+                    TeamMember.team_id,
+                ).join(
+                    TeamMember, TeamMember.id == AgentStatus.team_member_id
+                ).filter(TeamMember.is_active == True).all()
+                self.pool.load_agents(
+                    AgentSlot(
+                        member_id=row.team_member_id,
+                        team_id=row.team_id,
+                        online=row.status == "online",
+                        max_chats=row.max_chats or 0,
+                        load=row.current_chats or 0,
+                    )
+                    for row in rows
+                )
+                logger.info(f"Agent routing pool loaded with {len(rows)} agents")
+            self._loaded = True
+
+    def claim(self, db: Session, team_id: Optional[int] = None) -> Optional[int]:
+        """
+        Atomically pick the least-loaded available agent and count a chat
+        against it. Returns the TeamMember id, or None if nobody is free.
+        """
+        self._ensure_loaded(db)
+        return self.pool.claim(team_id)
+
+    def peek(self, db: Session, team_id: Optional[int] = None) -> Optional[int]:
+        """Least-loaded available agent, without counting anything against it."""
+        self._ensure_loaded(db)
+        return self.pool.peek(team_id)
+
+    def acquire(self, db: Session, member_id: int) -> None:
+        """Count a chat against a specific agent (manual accept or transfer)."""
+        self._ensure_loaded(db)
+        if self.pool.adjust(member_id, 1) is None:
+            self.refresh_agent(db, member_id)
+            self.pool.adjust(member_id, 1)
+
+    def release(self, db: Session, member_id: int) -> None:
+        """Release one chat from an agent."""
+        self._ensure_loaded(db)
+        self.pool.adjust(member_id, -1)
+
+    def refresh_agent(self, db: Session, member_id: int) -> None:
+        """Re-read an agent's status, capacity and team after they change."""
+        self._ensure_loaded(db)
+        row = db.query(
+            AgentStatus.status,
+            AgentStatus.current_chats,
+            AgentStatus.max_chats,
+            TeamMember.team_id,
+            TeamMember.is_active,
+        ).join(
+            TeamMember, TeamMember.id == AgentStatus.team_member_id
+        ).filter(AgentStatus.team_member_id == member_id).first()
+
+        if row is None or not row.is_active:
+            self.pool.remove(member_id)
+            return
+        self.pool.upsert(
+            member_id,
+            row.team_id,
+            row.status == "online",
+            row.max_chats or 0,
+            row.current_chats or 0,
+        )
+
+    def current_load(self, member_id: int, default: int = 0) -> int:
+        """Live chat count of an agent (AgentStatus may lag behind)."""
+        if not self._loaded:
+            return default
+        load = self.pool.load_of(member_id)
+        return default if load is None else load
+
+    def flush(self, db: Session) -> int:
+        """Write changed loads to AgentStatus.current_chats; returns rows written."""
+        if not self._loaded:
+            return 0
+        loads = self.pool.take_dirty()
+        if not loads:
+            return 0
+        table = AgentStatus.__table__
+        db.execute(
+            update(table)
+            .where(table.c.team_member_id == bindparam("member_id"))
+            .values(current_chats=bindparam("load")),
+            [{"member_id": member_id, "load": load} for member_id, load in loads.items()],
+        )
+        db.commit()
+        return len(loads)
+
+
+# Shared router used by the chat and ticket services
+agent_router = AgentRouter()
@@ -9,23 +9,51 @@ Uses Claude AI to analyze chat transcripts and provide:
 - Agent performance insights
 """
 
-import os
+import asyncio
 import json
 import logging
-from typing import Optional, Dict, Any, List
+import os
+from collections import defaultdict
+from typing import Optional, Dict, Any, List, Callable, Iterable
 from datetime import datetime, timedelta
 
-import anthropic
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, Integer
 
 from models import (
     ChatSession, ChatMessage, ChatQARecord, User, TeamMember, SupportTeam
 )
+from services.llm_gateway import llm_gateway
 
 logger = logging.getLogger(__name__)
 
 
+# Sessions analyzed at once during batch QA; the gateway's global limit still applies
+QA_BATCH_CONCURRENCY = int(os.getenv("AI_QA_BATCH_CONCURRENCY", "8"))
+
+# Sessions analyzed and committed per chunk, so an interrupted run loses at most one chunk
+QA_BATCH_CHUNK_SIZE = int(os.getenv("AI_QA_BATCH_CHUNK_SIZE", "25"))
+
+# Retries for a session rejected by the API rate limit
+QA_RATE_LIMIT_RETRIES = 4
+QA_RATE_LIMIT_BACKOFF_SECONDS = 2.0
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """Whether an LLM error is an API rate limit or overload response."""
+    return getattr(error, "status_code", None) in (429, 529)
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Server-suggested wait from a rate limit response, if any."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
 class AIQAService:
     """
     Service for AI-powered quality assurance of chat sessions.
@@ -34,13 +62,8 @@ class AIQAService:
     def __init__(self, db: Session):
         self.db = db
         self.client = None
-        api_key = os.getenv("ANTHROPIC_API_KEY")
-        if api_key:
-            try:
-                self.client = anthropic.Anthropic(api_key=api_key)
-            except Exception as e:
-                logger.error(f"Failed to initialize Anthropic client: {e}")
-                self.client = None
+        if llm_gateway.is_configured:
+            self.client = llm_gateway
         else:
             logger.warning("ANTHROPIC_API_KEY not configured. AI QA features disabled.")
 
@@ -103,8 +126,22 @@ class AIQAService:
             logger.error(f"Failed to get AI analysis for session {session_id}")
             return None
 
-        # Create QA record
-        qa_record = ChatQARecord(
+        qa_record = self._build_qa_record(session_id, reviewer_id, analysis)
+
+        self.db.add(qa_record)
+        self.db.commit()
+        self.db.refresh(qa_record)
+
+        return qa_record
+
+    @staticmethod
+    def _build_qa_record(
+        session_id: int,
+        reviewer_id: int,
+        analysis: Dict[str, Any]
+    ) -> ChatQARecord:
+        """Create an AI QA record from a parsed analysis."""
+        return ChatQARecord(
             session_id=session_id,
             reviewer_id=reviewer_id,
             overall_score=analysis.get("overall_score", 3),
@@ -118,12 +155,6 @@ class AIQAService:
             ai_confidence=analysis.get("confidence", 0.8)
         )
 
-        self.db.add(qa_record)
-        self.db.commit()
-        self.db.refresh(qa_record)
-
-        return qa_record
-
     def _build_transcript(
         self,
         session: ChatSession,
@@ -132,10 +163,10 @@ class AIQAService:
         """Build a formatted transcript for AI analysis."""
         # Get user info
         user = self.db.query(User).filter(User.id == session.user_id).first()
-        user_name = user.full_name if user else "Customer"
+        user_name = user.full_name if user else None
 
         # Get agent info
-        agent_name = "AI Bot (Novah)"
+        agent_name = None
         if session.agent_id:
             member = self.db.query(TeamMember).filter(
                 TeamMember.id == session.agent_id
@@ -147,12 +178,21 @@ class AIQAService:
                 if agent_user:
                     agent_name = agent_user.full_name
 
-        # Format transcript
+        return self._format_transcript(session, messages, user_name, agent_name)
+
+    @staticmethod
+    def _format_transcript(
+        session: ChatSession,
+        messages: List[ChatMessage],
+        user_name: Optional[str],
+        agent_name: Optional[str]
+    ) -> str:
+        """Format a session and its messages as a transcript."""
         lines = [
             f"=== Chat Session Transcript ===",
             f"Session ID: {session.id}",
-            f"Customer: {user_name}",
-            f"Agent: {agent_name}",
+            f"Customer: {user_name or 'Customer'}",
+            f"Agent: {agent_name or 'AI Bot (Novah)'}",
             f"Started: {session.started_at}",
             f"Ended: {session.ended_at or 'Ongoing'}",
             f"AI Handled: {session.is_ai_handled}",
@@ -178,7 +218,22 @@ class AIQAService:
     ) -> Optional[Dict[str, Any]]:
         """Get AI analysis of the chat transcript."""
         try:
-            system_prompt = """You are a Quality Assurance analyst for a customer support chat system.
+            return await self._request_analysis(transcript)
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse AI response as JSON: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Error getting AI analysis: {e}")
+            return None
+
+    async def _request_analysis(self, transcript: str) -> Optional[Dict[str, Any]]:
+        """
+        Ask the model for a QA assessment of a transcript.
+
+        Returns None if the response holds no JSON object; API and JSON
+        decoding errors are raised to the caller.
+        """
+        system_prompt = """You are a Quality Assurance analyst for a customer support chat system.
 Your task is to analyze chat transcripts and provide detailed quality assessments.
 
 Evaluate each chat on these criteria (score 1-5):
@@ -207,67 +262,227 @@ Respond ONLY with a valid JSON object in this exact format:
     "agent_feedback": "<specific feedback for the agent>"
 }"""
 
-            user_message = f"""Please analyze this customer support chat transcript and provide a quality assessment:
+        user_message = f"""Please analyze this customer support chat transcript and provide a quality assessment:
 
 {transcript}
 
 Respond with ONLY a valid JSON object, no additional text."""
 
-            response = self.client.messages.create(
-                model="claude-3-haiku-20240307",  # Use Haiku for cost-efficiency
-                max_tokens=1024,
-                system=system_prompt,
-                messages=[
-                    {"role": "user", "content": user_message}
-                ]
-            )
+        response = await self.client.complete(
+            user_message,
+            call_site="ai_qa.analysis",
+            model="claude-3-haiku-20240307",  # Use Haiku for cost-efficiency
+            max_tokens=1024,
+            system=system_prompt,
+        )
 
-            # Parse the response
-            content = response.content[0].text.strip()
+        # Parse the response
+        content = response.text.strip()
 
-            # Try to extract JSON from the response
-            if content.startswith("{"):
-                analysis = json.loads(content)
+        # Try to extract JSON from the response
+        if content.startswith("{"):
+            analysis = json.loads(content)
+        else:
+            # Try to find JSON in the response
+            import re
+            json_match = re.search(r'\{[\s\S]*\}', content)
+            if json_match:
+                analysis = json.loads(json_match.group())
             else:
-                # Try to find JSON in the response
-                import re
-                json_match = re.search(r'\{[\s\S]*\}', content)
-                if json_match:
-                    analysis = json.loads(json_match.group())
-                else:
-                    logger.error(f"Could not parse AI response: {content[:200]}")
-                    return None
+                logger.error(f"Could not parse AI response: {content[:200]}")
+                return None
 
-            # Validate and clamp scores
-            for key in ["overall_score", "response_time_score", "resolution_score", "professionalism_score"]:
-                if key in analysis:
-                    analysis[key] = max(1, min(5, int(analysis[key])))
+        # Validate and clamp scores
+        for key in ["overall_score", "response_time_score", "resolution_score", "professionalism_score"]:
+            if key in analysis:
+                analysis[key] = max(1, min(5, int(analysis[key])))
 
-            if "confidence" in analysis:
-                analysis["confidence"] = max(0.0, min(1.0, float(analysis["confidence"])))
+        if "confidence" in analysis:
+            analysis["confidence"] = max(0.0, min(1.0, float(analysis["confidence"])))
 
-            return analysis
+        return analysis
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse AI response as JSON: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Error getting AI analysis: {e}")
-            return None
+    def find_eligible_sessions(
+        self,
+        limit: int,
+        min_messages: int = 3,
+        exclude_ids: Iterable[int] = ()
+    ) -> List[int]:
+        """
+        Find ended, unreviewed sessions with enough messages for analysis.
+
+        Message counts are computed in a single grouped query rather than
+        one COUNT per candidate session.
+
+        Args:
+            limit: Maximum session IDs to return
+            min_messages: Minimum messages required for analysis
+            exclude_ids: Session IDs to leave out (e.g. already attempted)
+
+        Returns:
+            Session IDs, most recently ended first
+        """
+        reviewed = self.db.query(ChatQARecord.id).filter(
+            ChatQARecord.session_id == ChatSession.id
+        ).exists()
+
+        query = self.db.query(ChatSession.id).join(
+            ChatMessage, ChatMessage.session_id == ChatSession.id
+        ).filter(
+            ChatSession.status == "ended",
+            ~reviewed
+        )
+        exclude_ids = list(exclude_ids)
+        if exclude_ids:
+            query = query.filter(ChatSession.id.notin_(exclude_ids))
+
+        rows = query.group_by(
+            ChatSession.id, ChatSession.ended_at
+        ).having(
+            func.count(ChatMessage.id) >= min_messages
+        ).order_by(
+            ChatSession.ended_at.desc(), ChatSession.id.desc()
+        ).limit(limit).all()
+
+        return [row.id for row in rows]
+
+    def _load_transcripts(self, session_ids: List[int]) -> Dict[int, str]:
+        """Build transcripts for several sessions with a fixed number of queries."""
+        sessions = self.db.query(ChatSession).filter(
+            ChatSession.id.in_(session_ids)
+        ).all()
+        if not sessions:
+            return {}
+
+        messages_by_session = defaultdict(list)
+        for msg in self.db.query(ChatMessage).filter(
+            ChatMessage.session_id.in_(session_ids)
+        ).order_by(ChatMessage.session_id, ChatMessage.created_at):
+            messages_by_session[msg.session_id].append(msg)
+
+        user_names = dict(self.db.query(User.id, User.full_name).filter(
+            User.id.in_({s.user_id for s in sessions})
+        ).all())
+
+        agent_ids = {s.agent_id for s in sessions if s.agent_id}
+        agent_names = {}
+        if agent_ids:
+            agent_names = dict(self.db.query(TeamMember.id, User.full_name).join(
+                User, User.id == TeamMember.user_id
+            ).filter(TeamMember.id.in_(agent_ids)).all())
+
+        return {
+            session.id: self._format_transcript(
+                session,
+                messages_by_session[session.id],
+                user_names.get(session.user_id),
+                agent_names.get(session.agent_id)
+            )
+            for session in sessions
+            if messages_by_session[session.id]
+        }
+
+    async def _analyze_with_backoff(self, transcript: str) -> Optional[Dict[str, Any]]:
+        """Request an analysis, backing off and retrying when rate limited."""
+        for attempt in range(QA_RATE_LIMIT_RETRIES + 1):
+            try:
+                return await self._request_analysis(transcript)
+            except Exception as e:
+                if not _is_rate_limited(e) or attempt == QA_RATE_LIMIT_RETRIES:
+                    raise
+                delay = _retry_after(e) or QA_RATE_LIMIT_BACKOFF_SECONDS * (2 ** attempt)
+                logger.warning(f"AI QA rate limited, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+    async def analyze_sessions(
+        self,
+        session_ids: List[int],
+        reviewer_id: int,
+        concurrency: int = QA_BATCH_CONCURRENCY
+    ) -> Dict[str, Any]:
+        """
+        Analyze several sessions concurrently and save their QA records together.
+
+        Sessions without messages, or whose analysis fails, are counted as
+        failed. Callers are expected to pass unreviewed sessions.
+
+        Args:
+            session_ids: IDs of the chat sessions to analyze
+            reviewer_id: ID of user requesting the analysis
+            concurrency: Maximum analyses in flight at once
+
+        Returns:
+            Counts of analyzed and failed sessions, with per-session scores
+        """
+        results = {
+            "analyzed": 0,
+            "failed": 0,
+            "sessions": [],
+            "failed_ids": []
+        }
+        if not session_ids:
+            return results
+
+        transcripts = self._load_transcripts(session_ids)
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def analyze(session_id: int) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                try:
+                    return await self._analyze_with_backoff(transcripts[session_id])
+                except Exception as e:
+                    logger.error(f"Error analyzing session {session_id}: {e}")
+                    return None
+
+        analyzed_ids = [sid for sid in session_ids if sid in transcripts]
+        analyses = await asyncio.gather(*(analyze(sid) for sid in analyzed_ids))
+
+        records = []
+        for session_id, analysis in zip(analyzed_ids, analyses):
+            if analysis:
+                records.append(self._build_qa_record(session_id, reviewer_id, analysis))
+        if records:
+            self.db.add_all(records)
+            self.db.commit()
+
+        scored = {record.session_id: record.overall_score for record in records}
+        for session_id in session_ids:
+            if session_id in scored:
+                results["analyzed"] += 1
+                results["sessions"].append({
+                    "session_id": session_id,
+                    "score": scored[session_id]
+                })
+            else:
+                results["failed"] += 1
+                results["failed_ids"].append(session_id)
+
+        return results
 
     async def batch_analyze(
         self,
         reviewer_id: int,
         limit: int = 10,
-        min_messages: int = 3
+        min_messages: int = 3,
+        chunk_size: int = QA_BATCH_CHUNK_SIZE,
+        exclude_ids: Iterable[int] = (),
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None
     ) -> Dict[str, Any]:
         """
         Analyze multiple unreviewed sessions in batch.
 
+        Sessions are picked and analyzed chunk by chunk, and each chunk's
+        records are committed before the next one starts. Because reviewed
+        sessions are never picked again, re-running an interrupted batch
+        continues where it stopped.
+
         Args:
             reviewer_id: ID of user requesting the analysis
             limit: Maximum sessions to analyze
             min_messages: Minimum messages required for analysis
+            chunk_size: Sessions analyzed and committed together
+            exclude_ids: Session IDs to skip (e.g. failures from an earlier run)
+            on_progress: Called with the running results after each chunk
 
         Returns:
             Summary of batch analysis results
@@ -275,46 +490,32 @@ Respond with ONLY a valid JSON object, no additional text."""
         if not self.client:
             return {"error": "AI QA service not available"}
 
-        # Find unreviewed, ended sessions
-        reviewed_ids = self.db.query(ChatQARecord.session_id).subquery()
-
-        sessions = self.db.query(ChatSession).filter(
-            ChatSession.status == "ended",
-            ~ChatSession.id.in_(reviewed_ids)
-        ).order_by(ChatSession.ended_at.desc()).limit(limit * 2).all()
-
-        # Filter by message count
-        eligible_sessions = []
-        for session in sessions:
-            msg_count = self.db.query(func.count(ChatMessage.id)).filter(
-                ChatMessage.session_id == session.id
-            ).scalar()
-            if msg_count >= min_messages:
-                eligible_sessions.append(session)
-            if len(eligible_sessions) >= limit:
-                break
-
         results = {
             "analyzed": 0,
             "failed": 0,
             "skipped": 0,
-            "sessions": []
+            "sessions": [],
+            "failed_ids": []
         }
+        attempted = set(exclude_ids)
 
-        for session in eligible_sessions:
-            try:
-                record = await self.analyze_session(session.id, reviewer_id)
-                if record:
-                    results["analyzed"] += 1
-                    results["sessions"].append({
-                        "session_id": session.id,
-                        "score": record.overall_score
-                    })
-                else:
-                    results["failed"] += 1
-            except Exception as e:
-                logger.error(f"Error analyzing session {session.id}: {e}")
-                results["failed"] += 1
+        while results["analyzed"] + results["failed"] < limit:
+            remaining = limit - results["analyzed"] - results["failed"]
+            session_ids = self.find_eligible_sessions(
+                min(chunk_size, remaining), min_messages, exclude_ids=attempted
+            )
+            if not session_ids:
+                break
+            attempted.update(session_ids)
+
+            chunk = await self.analyze_sessions(session_ids, reviewer_id)
+            for key in ("analyzed", "failed"):
+                results[key] += chunk[key]
+            results["sessions"].extend(chunk["sessions"])
+            results["failed_ids"].extend(chunk["failed_ids"])
+
+            if on_progress:
+                on_progress(results)
 
         return results
 
@@ -383,7 +584,3 @@ Respond with ONLY a valid JSON object, no additional text."""
             })
 
         return sorted(ratings, key=lambda x: x["avg_overall"], reverse=True)
-
-
-# Import for Integer cast
-from sqlalchemy import Integer
@@ -4,7 +4,6 @@ import os
 import json
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
-import anthropic
 from sqlalchemy.orm import Session
 from sqlalchemy import or_
 
@@ -18,6 +17,7 @@ from models import (
     ActionItem,
 )
 from services.language_service import get_localized_prompt_suffix, get_fallback_message
+from services.llm_gateway import llm_gateway
 
 
 class BriefingGenerator:
@@ -25,7 +25,7 @@ class BriefingGenerator:
 
     def __init__(self, db: Session):
         self.db = db
-        self.client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+        self.client = llm_gateway
         self.model = os.getenv(
             "SUMMARY_GENERATION_MODEL", "claude-sonnet-4-20250514"
         )
@@ -234,13 +234,15 @@ Generate a briefing in this JSON format:
 }}{language_instruction}"""
 
         try:
-            response = self.client.messages.create(
+            response = await self.client.complete(
+                prompt,
+                call_site="briefings.generate",
                 model=self.model,
                 max_tokens=2048,
-                messages=[{"role": "user", "content": prompt}],
+                user_id=user.id,
             )
 
-            content = response.content[0].text
+            content = response.text
             if "```json" in content:
                 content = content.split("```json")[1].split("```")[0]
             elif "```" in content:
@@ -302,13 +304,15 @@ For each participant (other than the user), provide:
 }}"""
 
         try:
-            response = self.client.messages.create(
+            response = await self.client.complete(
+                prompt,
+                call_site="briefings.extract_participants",
                 model=self.model,
                 max_tokens=1024,
-                messages=[{"role": "user", "content": prompt}],
+                user_id=user_id,
             )
 
-            content = response.content[0].text
+            content = response.text
             if "```" in content:
                 content = content.split("```")[1].split("```")[0]
                 if content.startswith("json"):
@@ -424,13 +428,15 @@ Return as JSON:
 }}{language_instruction}"""
 
         try:
-            response = self.client.messages.create(
+            response = await self.client.complete(
+                prompt,
+                call_site="briefings.variety_suggestions",
                 model=self.model,
                 max_tokens=1024,
-                messages=[{"role": "user", "content": prompt}],
+                user_id=user_id,
             )
 
-            content = response.content[0].text
+            content = response.text
             if "```" in content:
                 content = content.split("```")[1].split("```")[0]
                 if content.startswith("json"):
@@ -4,13 +4,30 @@ Business hours calculation service for SLA tracking.
 Provides functionality to calculate business hours between dates,
 add business hours to a datetime, and check if a datetime falls
 within business hours.
+
+Durations and deadlines are answered from a precomputed BusinessCalendar
+per configuration: the UTC opening and closing instant of every working
+day, with the cumulative business time before each one. Both questions
+become a binary search instead of a walk through the days in between.
 """
 
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
 from datetime import datetime, timedelta, time, date
 from typing import Optional, List, Dict, Any, Tuple
 from dataclasses import dataclass, field
 import pytz
 
+# Days of calendar built around a query, and how many calendars are kept
+CALENDAR_SPAN_DAYS = 2 * 366
+CALENDAR_CACHE_SIZE = 256
+# Deadlines further out than this many years are not searched for
+CALENDAR_MAX_YEARS = 10
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROS_PER_MINUTE = 60_000_000
+
 
 @dataclass
 class BusinessHoursConfig:
@@ -53,6 +70,16 @@ class BusinessHoursConfig:
         """Get timezone object."""
         return pytz.timezone(self.timezone)
 
+    @property
+    def cache_key(self) -> Tuple:
+        """Hashable identity of the schedule, for sharing calendars."""
+        return (
+            self.start_hour, self.start_minute, self.end_hour, self.end_minute,
+            tuple(sorted(set(self.working_days))),
+            tuple(sorted(set(self.holidays))),
+            self.timezone,
+        )
+
     @classmethod
     def from_organization(cls, org: Any) -> "BusinessHoursConfig":
         """Create config from organization model."""
@@ -98,6 +125,149 @@ class BusinessHoursConfig:
         )
 
 
+def _to_micros(dt: datetime) -> int:
+    """Microseconds since the epoch; naive datetimes are taken as UTC."""
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(pytz.UTC).replace(tzinfo=None)
+    delta = dt - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _from_micros(micros: int) -> datetime:
+    """Naive UTC datetime for microseconds since the epoch."""
+    return _EPOCH + timedelta(microseconds=micros)
+
+
+class BusinessCalendar:
+    """
+    Working periods of one business hours configuration.
+
+    Holds, for each working day in a range of local dates, the UTC instant
+    business opens and closes and the business time accumulated before it
+    opens. Business time up to any instant is then one bisect, so durations
+    are a subtraction and deadlines a bisect on the cumulative totals. The
+    range grows when a query falls outside it.
+    """
+
+    def __init__(self, config: BusinessHoursConfig):
+        self.config = config
+        self._tz = config.tz
+        self._lock = threading.Lock()
+        self._holidays = set()
+        for holiday_str in config.holidays:
+            try:
+                self._holidays.add(datetime.strptime(holiday_str, "%Y-%m-%d").date())
+            except ValueError:
+                continue
+        self._working_days = frozenset(config.working_days)
+        self._has_hours = config.start_time < config.end_time and bool(self._working_days)
+        # (first_date, last_date, opens, closes, cumulative) swapped as one
+        self._data = None
+
+    def _build(self, first: date, last: date) -> Tuple:
+        opens: List[int] = []
+        closes: List[int] = []
+        # Business time elapsed when each day opens, and when it closes
+        at_open: List[int] = []
+        at_close: List[int] = []
+        total = 0
+        day = first
+        one_day = timedelta(days=1)
+        while day <= last:
+            if day.weekday() in self._working_days and day not in self._holidays:
+                opened = _to_micros(self._tz.localize(datetime.combine(day, self.config.start_time)))
+                closed = _to_micros(self._tz.localize(datetime.combine(day, self.config.end_time)))
+                if opened < closed:
+                    opens.append(opened)
+                    closes.append(closed)
+                    at_open.append(total)
+                    total += closed - opened
+                    at_close.append(total)
+            day += one_day
+        return first, last, opens, closes, at_open, at_close
+
+    def _covering(self, *instants: int) -> Tuple:
+        """Calendar data whose date range covers every given instant."""
+        dates = [_from_micros(i).date() for i in instants]
+        # Local dates may be a day either side of the UTC date
+        low, high = min(dates) - timedelta(days=2), max(dates) + timedelta(days=2)
+        data = self._data
+        if data is not None and data[0] <= low and high <= data[1]:
+            return data
+
+        with self._lock:
+            data = self._data
+            if data is None:
+                first, last = low, max(high, low + timedelta(days=CALENDAR_SPAN_DAYS))
+            else:
+                first = data[0] if low >= data[0] else low - timedelta(days=CALENDAR_SPAN_DAYS // 2)
+                last = data[1] if high <= data[1] else high + timedelta(days=CALENDAR_SPAN_DAYS)
+            if data is None or (first, last) != (data[0], data[1]):
+                data = self._build(first, last)
+                self._data = data
+            return data
+
+    @staticmethod
+    def _elapsed(data: Tuple, instant: int) -> int:
+        """Business microseconds from the start of the calendar to an instant."""
+        _, _, opens, closes, at_open, _ = data
+        i = bisect_right(opens, instant) - 1
+        if i < 0:
+            return 0
+        return at_open[i] + min(instant, closes[i]) - opens[i]
+
+    def business_minutes(self, start: datetime, end: datetime) -> float:
+        """Business minutes between two datetimes (naive values are UTC)."""
+        start_us, end_us = _to_micros(start), _to_micros(end)
+        if end_us <= start_us or not self._has_hours:
+            return 0.0
+        data = self._covering(start_us, end_us)
+        return (self._elapsed(data, end_us) - self._elapsed(data, start_us)) / _MICROS_PER_MINUTE
+
+    def add_minutes(self, start: datetime, minutes: float) -> datetime:
+        """
+        Earliest instant at which the given business minutes have passed
+        since start, as a naive UTC datetime.
+
+        Raises:
+            ValueError: If there is not enough business time in the next
+                CALENDAR_MAX_YEARS years.
+        """
+        start_us = _to_micros(start)
+        amount = round(minutes * _MICROS_PER_MINUTE)
+        horizon = start_us
+        if self._has_hours:
+            for _ in range(CALENDAR_MAX_YEARS):
+                horizon += 366 * 86400 * 1_000_000
+                data = self._covering(start_us, horizon)
+                _, _, opens, _, at_open, at_close = data
+                target = self._elapsed(data, start_us) + amount
+                # First working day that closes at or after the target
+                i = bisect_left(at_close, target)
+                if i < len(at_close):
+                    return _from_micros(opens[i] + target - at_open[i])
+        raise ValueError("Business hours configuration has no working time to schedule in")
+
+
+_calendars: "OrderedDict[Tuple, BusinessCalendar]" = OrderedDict()
+_calendars_lock = threading.Lock()
+
+
+def get_business_calendar(config: BusinessHoursConfig) -> BusinessCalendar:
+    """Shared calendar for a configuration, built once per schedule."""
+    key = config.cache_key
+    with _calendars_lock:
+        calendar = _calendars.get(key)
+        if calendar is None:
+            calendar = BusinessCalendar(config)
+            _calendars[key] = calendar
+            if len(_calendars) > CALENDAR_CACHE_SIZE:
+                _calendars.popitem(last=False)
+        else:
+            _calendars.move_to_end(key)
+        return calendar
+
+
 class BusinessHoursService:
     """Service for calculating business hours for SLA tracking."""
 
@@ -111,6 +281,7 @@ class BusinessHoursService:
         self.config = config or BusinessHoursConfig()
         self._holidays_cache: set = set()
         self._parse_holidays()
+        self.calendar = get_business_calendar(self.config)
 
     def _parse_holidays(self) -> None:
         """Parse holiday strings into date objects for faster lookup."""
@@ -279,36 +450,7 @@ class BusinessHoursService:
         if end <= start:
             return 0.0
 
-        # Convert to local timezone
-        start_local = self._to_local(start)
-        end_local = self._to_local(end)
-
-        total_minutes = 0.0
-        current = start_local
-
-        while current < end_local:
-            if self.is_working_day(current):
-                # Get business hours boundaries for this day
-                day_start = self._get_business_start(current)
-                day_end = self._get_business_end(current)
-
-                # Determine effective start and end for this day
-                effective_start = max(current, day_start)
-                effective_end = min(end_local, day_end)
-
-                if effective_start < effective_end:
-                    # Only count time within business hours
-                    if effective_start.time() >= self.config.start_time and \
-                       effective_end.time() <= self.config.end_time:
-                        minutes = (effective_end - effective_start).total_seconds() / 60
-                        total_minutes += minutes
-
-            # Move to start of next day
-            current = (current + timedelta(days=1)).replace(
-                hour=0, minute=0, second=0, microsecond=0
-            )
-
-        return total_minutes / 60.0
+        return self.calendar.business_minutes(start, end) / 60.0
 
     def add_business_hours(
         self,
@@ -328,51 +470,7 @@ class BusinessHoursService:
         if hours <= 0:
             return start
 
-        remaining_minutes = hours * 60
-        current = self.get_next_business_hour(start)
-        current_local = self._to_local(current)
-
-        max_iterations = 365 * 24  # Safety limit
-        iterations = 0
-
-        while remaining_minutes > 0 and iterations < max_iterations:
-            iterations += 1
-
-            if self.is_working_day(current_local):
-                # Get end of business hours for current day
-                day_end = self._get_business_end(current_local)
-
-                # Calculate minutes remaining in current business day
-                minutes_left_today = (day_end - current_local).total_seconds() / 60
-
-                if minutes_left_today > 0:
-                    if remaining_minutes <= minutes_left_today:
-                        # We can finish within today
-                        result = current_local + timedelta(minutes=remaining_minutes)
-                        return self._to_utc(result).replace(tzinfo=None)
-                    else:
-                        # Use all remaining time today
-                        remaining_minutes -= minutes_left_today
-
-            # Move to next working day
-            next_day = current_local.date() + timedelta(days=1)
-            current_local = datetime.combine(
-                next_day,
-                time(self.config.start_hour, self.config.start_minute)
-            )
-            current_local = self.config.tz.localize(current_local)
-
-            # Skip non-working days
-            while not self.is_working_day(current_local):
-                next_day += timedelta(days=1)
-                current_local = datetime.combine(
-                    next_day,
-                    time(self.config.start_hour, self.config.start_minute)
-                )
-                current_local = self.config.tz.localize(current_local)
-
-        # Return result
-        return self._to_utc(current_local).replace(tzinfo=None)
+        return self.calendar.add_minutes(start, hours * 60)
 
     def get_sla_deadline(
         self,
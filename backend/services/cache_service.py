@@ -98,6 +98,20 @@ class CacheService:
             logger.error(f"Cache delete error: {e}")
             return False
 
+    def incr(self, key: str, ttl_seconds: Optional[int] = None) -> Optional[int]:
+        """Atomically increment an integer counter, optionally refreshing its TTL."""
+        if not self.enabled:
+            return None
+
+        try:
+            value = self.client.incr(key)
+            if ttl_seconds:
+                self.client.expire(key, ttl_seconds)
+            return value
+        except Exception as e:
+            logger.error(f"Cache incr error: {e}")
+            return None
+
     def delete_pattern(self, pattern: str) -> int:
         """Delete all keys matching a pattern."""
         if not self.enabled:
@@ -355,6 +369,25 @@ class CacheKeys:
     def semantic_search_status(user_id: int) -> str:
         return f"semantic:status:{user_id}"
 
+    # Summarization cache keys
+    @staticmethod
+    def summary_section(content_hash: str) -> str:
+        return f"summary:section:{content_hash}"
+
+    # Meeting context snapshot keys
+    @staticmethod
+    def meeting_context(meeting_id: int, version: int) -> str:
+        return f"meeting:{meeting_id}:context:v{version}"
+
+    @staticmethod
+    def meeting_context_version(meeting_id: int) -> str:
+        return f"meeting:{meeting_id}:context:version"
+
+    # LLM gateway cache keys
+    @staticmethod
+    def llm_response(request_hash: str) -> str:
+        return f"llm:response:{request_hash}"
+
 
 # =============================================================================
 # CACHE TTL CONSTANTS
@@ -392,6 +425,14 @@ class CacheTTL:
     SIMILAR_ITEMS = MEDIUM        # 5 minutes for similar meetings/conversations
     SEMANTIC_STATUS = MEDIUM      # 5 minutes for status info
 
+    # Summarization TTLs
+    SUMMARY_SECTION = DAY * 7     # 7 days for section notes (keyed by content hash)
+    MEETING_CONTEXT = VERY_LONG   # 1 hour for versioned meeting context snapshots
+    MEETING_CONTEXT_VERSION = DAY  # Outlives every snapshot keyed by it
+
+    # LLM gateway TTLs
+    LLM_RESPONSE = VERY_LONG      # 1 hour for memoized identical LLM requests
+
 
 # =============================================================================
 # SESSION CACHING
@@ -4,19 +4,37 @@ Calendar Integration Service
 Provides functionality to read calendar events from:
 - Google Calendar
 - Microsoft Outlook
+
+Access tokens are cached until shortly before they expire, so repeated
+reads do not refresh them on every call. For cached, incrementally synced
+events see services.calendar_sync.
 """
 
+import asyncio
+import hashlib
+import logging
 import os
+import time
 import httpx
-from datetime import datetime, timedelta
-from typing import Optional, List
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, List, Tuple
 from dataclasses import dataclass
 
+logger = logging.getLogger("calendar")
+
 GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID", "")
 GOOGLE_CLIENT_SECRET = os.getenv("GOOGLE_CLIENT_SECRET", "")
 MICROSOFT_CLIENT_ID = os.getenv("MICROSOFT_CLIENT_ID", "")
 MICROSOFT_CLIENT_SECRET = os.getenv("MICROSOFT_CLIENT_SECRET", "")
 
+GOOGLE_TOKEN_URL = "https://oauth2.googleapis.com/token"
+MICROSOFT_TOKEN_URL = "https://login.microsoftonline.com/common/oauth2/v2.0/token"
+
+# Cached tokens are dropped this long before the provider expires them
+TOKEN_EXPIRY_MARGIN_SECONDS = 120
+# Lifetime assumed when a token response has no expires_in
+DEFAULT_TOKEN_LIFETIME_SECONDS = 3600
+
 
 @dataclass
 class CalendarEvent:
@@ -33,52 +51,240 @@ class CalendarEvent:
     raw_data: dict
 
 
+class TokenCache:
+    """
+    In-process cache of OAuth access tokens, keyed by refresh token.
+
+    Refresh tokens are stored hashed. Concurrent callers needing the same
+    token share one refresh request.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self._tokens: Dict[Tuple[str, str], Tuple[str, float]] = {}
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        self._locks_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @staticmethod
+    def _key(provider: str, refresh_token: str) -> Tuple[str, str]:
+        return provider, hashlib.sha256(refresh_token.encode()).hexdigest()
+
+    def get(self, provider: str, refresh_token: str) -> Optional[str]:
+        """A cached access token that is still valid, if any."""
+        cached = self._tokens.get(self._key(provider, refresh_token))
+        if cached and cached[1] > self._clock():
+            return cached[0]
+        return None
+
+    def put(self, provider: str, refresh_token: str, access_token: str, expires_in: Optional[int]):
+        lifetime = int(expires_in or DEFAULT_TOKEN_LIFETIME_SECONDS) - TOKEN_EXPIRY_MARGIN_SECONDS
+        if lifetime > 0:
+            self._tokens[self._key(provider, refresh_token)] = (access_token, self._clock() + lifetime)
+
+    def invalidate(self, provider: str, refresh_token: str):
+        """Forget a token the provider rejected."""
+        self._tokens.pop(self._key(provider, refresh_token), None)
+
+    def lock(self, provider: str, refresh_token: str) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._locks_loop is not loop:
+            # Locks are bound to the loop they were created on
+            self._locks = {}
+            self._locks_loop = loop
+        return self._locks.setdefault(self._key(provider, refresh_token), asyncio.Lock())
+
+    def clear(self):
+        self._tokens.clear()
+
+
+token_cache = TokenCache()
+
+
+def _to_utc_naive(value: datetime) -> datetime:
+    """Datetimes are compared and stored as naive UTC."""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def parse_google_event(item: dict) -> CalendarEvent:
+    """Convert a Google Calendar API event into a CalendarEvent."""
+    # Parse start/end times
+    start = item.get("start", {})
+    end = item.get("end", {})
+
+    start_time = start.get("dateTime") or start.get("date")
+    end_time = end.get("dateTime") or end.get("date")
+
+    # Parse datetime
+    if "T" in (start_time or ""):
+        start_dt = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
+    else:
+        start_dt = datetime.fromisoformat(start_time) if start_time else datetime.utcnow()
+
+    if "T" in (end_time or ""):
+        end_dt = datetime.fromisoformat(end_time.replace("Z", "+00:00"))
+    else:
+        end_dt = datetime.fromisoformat(end_time) if end_time else start_dt + timedelta(hours=1)
+
+    # Extract attendees
+    attendees = [
+        a.get("email", "")
+        for a in item.get("attendees", [])
+        if a.get("email")
+    ]
+
+    # Extract meeting link
+    meeting_link = None
+    if item.get("hangoutLink"):
+        meeting_link = item["hangoutLink"]
+    elif item.get("conferenceData", {}).get("entryPoints"):
+        for ep in item["conferenceData"]["entryPoints"]:
+            if ep.get("entryPointType") == "video":
+                meeting_link = ep.get("uri")
+                break
+
+    return CalendarEvent(
+        id=item.get("id", ""),
+        title=item.get("summary", "Untitled"),
+        description=item.get("description"),
+        start_time=_to_utc_naive(start_dt),
+        end_time=_to_utc_naive(end_dt),
+        location=item.get("location"),
+        attendees=attendees,
+        meeting_link=meeting_link,
+        calendar_provider="google",
+        raw_data=item
+    )
+
+
+def parse_microsoft_event(item: dict) -> CalendarEvent:
+    """Convert a Microsoft Graph event (times in UTC) into a CalendarEvent."""
+    # Parse start/end times
+    start_str = (item.get("start") or {}).get("dateTime", "")
+    end_str = (item.get("end") or {}).get("dateTime", "")
+
+    start_dt = datetime.fromisoformat(start_str.replace("Z", "+00:00")) if start_str else datetime.utcnow()
+    end_dt = datetime.fromisoformat(end_str.replace("Z", "+00:00")) if end_str else start_dt + timedelta(hours=1)
+
+    # Extract attendees
+    attendees = [
+        a.get("emailAddress", {}).get("address", "")
+        for a in item.get("attendees", [])
+        if a.get("emailAddress", {}).get("address")
+    ]
+
+    # Extract meeting link
+    meeting_link = item.get("onlineMeetingUrl")
+    if not meeting_link and item.get("onlineMeeting"):
+        meeting_link = item["onlineMeeting"].get("joinUrl")
+
+    # Extract location
+    location = None
+    loc_data = item.get("location")
+    if loc_data:
+        location = loc_data.get("displayName")
+
+    return CalendarEvent(
+        id=item.get("id", ""),
+        title=item.get("subject", "Untitled"),
+        description=(item.get("body") or {}).get("content"),
+        start_time=_to_utc_naive(start_dt),
+        end_time=_to_utc_naive(end_dt),
+        location=location,
+        attendees=attendees,
+        meeting_link=meeting_link,
+        calendar_provider="microsoft",
+        raw_data=item
+    )
+
+
+async def _request_access_token(
+    client: httpx.AsyncClient,
+    url: str,
+    client_id: str,
+    client_secret: str,
+    refresh_token: str
+) -> Tuple[Optional[str], Optional[int]]:
+    """Exchange a refresh token; returns (access_token, expires_in)."""
+    response = await client.post(
+        url,
+        data={
+            "client_id": client_id,
+            "client_secret": client_secret,
+            "refresh_token": refresh_token,
+            "grant_type": "refresh_token"
+        }
+    )
+
+    if response.status_code == 200:
+        data = response.json()
+        return data.get("access_token"), data.get("expires_in")
+    logger.warning(f"Token refresh failed with {response.status_code} at {url}")
+    return None, None
+
+
+async def get_access_token(
+    provider: str,
+    refresh_token: str,
+    client: Optional[httpx.AsyncClient] = None
+) -> Optional[str]:
+    """
+    Get an access token for a calendar provider, refreshing only when the
+    cached one is missing or about to expire.
+
+    Args:
+        provider: "google" or "microsoft"
+        refresh_token: The user's refresh token
+        client: HTTP client to use (default: a short-lived one)
+    """
+    if provider == "google":
+        url, client_id, client_secret = GOOGLE_TOKEN_URL, GOOGLE_CLIENT_ID, GOOGLE_CLIENT_SECRET
+    elif provider == "microsoft":
+        url, client_id, client_secret = MICROSOFT_TOKEN_URL, MICROSOFT_CLIENT_ID, MICROSOFT_CLIENT_SECRET
+    else:
+        raise ValueError(f"Unknown provider: {provider}")
+
+    if not client_id or not client_secret:
+        return None
+
+    cached = token_cache.get(provider, refresh_token)
+    if cached:
+        return cached
+
+    async with token_cache.lock(provider, refresh_token):
+        # Another caller may have refreshed while we waited
+        cached = token_cache.get(provider, refresh_token)
+        if cached:
+            return cached
+
+        if client is not None:
+            access_token, expires_in = await _request_access_token(
+                client, url, client_id, client_secret, refresh_token
+            )
+        else:
+            async with httpx.AsyncClient() as own_client:
+                access_token, expires_in = await _request_access_token(
+                    own_client, url, client_id, client_secret, refresh_token
+                )
+
+        if access_token:
+            token_cache.put(provider, refresh_token, access_token, expires_in)
+        return access_token
+
+
 class CalendarService:
     """Service for reading calendar events from various providers."""
 
     @staticmethod
     async def refresh_google_token(refresh_token: str) -> Optional[str]:
-        """Refresh Google access token using refresh token."""
-        if not GOOGLE_CLIENT_ID or not GOOGLE_CLIENT_SECRET:
-            return None
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://oauth2.googleapis.com/token",
-                data={
-                    "client_id": GOOGLE_CLIENT_ID,
-                    "client_secret": GOOGLE_CLIENT_SECRET,
-                    "refresh_token": refresh_token,
-                    "grant_type": "refresh_token"
-                }
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                return data.get("access_token")
-            return None
+        """Get a Google access token, refreshed only if the cached one expired."""
+        return await get_access_token("google", refresh_token)
 
     @staticmethod
     async def refresh_microsoft_token(refresh_token: str) -> Optional[str]:
-        """Refresh Microsoft access token using refresh token."""
-        if not MICROSOFT_CLIENT_ID or not MICROSOFT_CLIENT_SECRET:
-            return None
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://login.microsoftonline.com/common/oauth2/v2.0/token",
-                data={
-                    "client_id": MICROSOFT_CLIENT_ID,
-                    "client_secret": MICROSOFT_CLIENT_SECRET,
-                    "refresh_token": refresh_token,
-                    "grant_type": "refresh_token"
-                }
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                return data.get("access_token")
-            return None
+        """Get a Microsoft access token, refreshed only if the cached one expired."""
+        return await get_access_token("microsoft", refresh_token)
 
     @staticmethod
     async def get_google_events(
@@ -125,53 +331,7 @@ class CalendarService:
 
             data = response.json()
             for item in data.get("items", []):
-                # Parse start/end times
-                start = item.get("start", {})
-                end = item.get("end", {})
-
-                start_time = start.get("dateTime") or start.get("date")
-                end_time = end.get("dateTime") or end.get("date")
-
-                # Parse datetime
-                if "T" in (start_time or ""):
-                    start_dt = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
-                else:
-                    start_dt = datetime.fromisoformat(start_time) if start_time else datetime.utcnow()
-
-                if "T" in (end_time or ""):
-                    end_dt = datetime.fromisoformat(end_time.replace("Z", "+00:00"))
-                else:
-                    end_dt = datetime.fromisoformat(end_time) if end_time else start_dt + timedelta(hours=1)
-
-                # Extract attendees
-                attendees = [
-                    a.get("email", "")
-                    for a in item.get("attendees", [])
-                    if a.get("email")
-                ]
-
-                # Extract meeting link
-                meeting_link = None
-                if item.get("hangoutLink"):
-                    meeting_link = item["hangoutLink"]
-                elif item.get("conferenceData", {}).get("entryPoints"):
-                    for ep in item["conferenceData"]["entryPoints"]:
-                        if ep.get("entryPointType") == "video":
-                            meeting_link = ep.get("uri")
-                            break
-
-                events.append(CalendarEvent(
-                    id=item.get("id", ""),
-                    title=item.get("summary", "Untitled"),
-                    description=item.get("description"),
-                    start_time=start_dt,
-                    end_time=end_dt,
-                    location=item.get("location"),
-                    attendees=attendees,
-                    meeting_link=meeting_link,
-                    calendar_provider="google",
-                    raw_data=item
-                ))
+                events.append(parse_google_event(item))
 
         return events
 
@@ -203,7 +363,10 @@ class CalendarService:
         async with httpx.AsyncClient() as client:
             response = await client.get(
                 "https://graph.microsoft.com/v1.0/me/calendarView",
-                headers={"Authorization": f"Bearer {access_token}"},
+                headers={
+                    "Authorization": f"Bearer {access_token}",
+                    "Prefer": 'outlook.timezone="UTC"',
+                },
                 params={
                     "startDateTime": start_date.isoformat() + "Z",
                     "endDateTime": end_date.isoformat() + "Z",
@@ -218,82 +381,56 @@ class CalendarService:
 
             data = response.json()
             for item in data.get("value", []):
-                # Parse start/end times
-                start_str = item.get("start", {}).get("dateTime", "")
-                end_str = item.get("end", {}).get("dateTime", "")
-
-                start_dt = datetime.fromisoformat(start_str.replace("Z", "+00:00")) if start_str else datetime.utcnow()
-                end_dt = datetime.fromisoformat(end_str.replace("Z", "+00:00")) if end_str else start_dt + timedelta(hours=1)
-
-                # Extract attendees
-                attendees = [
-                    a.get("emailAddress", {}).get("address", "")
-                    for a in item.get("attendees", [])
-                    if a.get("emailAddress", {}).get("address")
-                ]
-
-                # Extract meeting link
-                meeting_link = item.get("onlineMeetingUrl")
-                if not meeting_link and item.get("onlineMeeting"):
-                    meeting_link = item["onlineMeeting"].get("joinUrl")
-
-                # Extract location
-                location = None
-                loc_data = item.get("location")
-                if loc_data:
-                    location = loc_data.get("displayName")
-
-                events.append(CalendarEvent(
-                    id=item.get("id", ""),
-                    title=item.get("subject", "Untitled"),
-                    description=item.get("body", {}).get("content"),
-                    start_time=start_dt,
-                    end_time=end_dt,
-                    location=location,
-                    attendees=attendees,
-                    meeting_link=meeting_link,
-                    calendar_provider="microsoft",
-                    raw_data=item
-                ))
+                events.append(parse_microsoft_event(item))
 
         return events
 
     @staticmethod
     async def get_upcoming_meetings(
         user,
-        hours_ahead: int = 24
+        hours_ahead: int = 24,
+        db=None
     ) -> List[CalendarEvent]:
         """
         Get upcoming meetings from all connected calendars.
 
+        With a database session, events are read from the local event cache
+        (synced incrementally when stale, see services.calendar_sync).
+        Without one, the providers are queried live, concurrently.
+
         Args:
             user: User object with calendar tokens
             hours_ahead: How many hours ahead to look
+            db: Optional database session for cached reads
 
         Returns:
             List of CalendarEvent objects sorted by start time
         """
-        events = []
         now = datetime.utcnow()
         end = now + timedelta(hours=hours_ahead)
 
-        # Get Google events
-        if user.google_refresh_token:
-            access_token = await CalendarService.refresh_google_token(user.google_refresh_token)
-            if access_token:
-                google_events = await CalendarService.get_google_events(
-                    access_token, now, end
-                )
-                events.extend(google_events)
+        if db is not None:
+            from services.calendar_sync import calendar_sync
+            return await calendar_sync.get_upcoming_events(db, user, now, end)
+
+        async def fetch(provider: str, refresh_token: str, fetch_events) -> List[CalendarEvent]:
+            access_token = await get_access_token(provider, refresh_token)
+            if not access_token:
+                return []
+            return await fetch_events(access_token, now, end)
 
-        # Get Microsoft events
+        fetches = []
+        if user.google_refresh_token:
+            fetches.append(fetch("google", user.google_refresh_token, CalendarService.get_google_events))
         if user.microsoft_refresh_token:
-            access_token = await CalendarService.refresh_microsoft_token(user.microsoft_refresh_token)
-            if access_token:
-                ms_events = await CalendarService.get_microsoft_events(
-                    access_token, now, end
-                )
-                events.extend(ms_events)
+            fetches.append(fetch("microsoft", user.microsoft_refresh_token, CalendarService.get_microsoft_events))
+
+        events = []
+        for result in await asyncio.gather(*fetches, return_exceptions=True):
+            if isinstance(result, BaseException):
+                logger.error(f"Calendar fetch failed: {result}")
+                continue
+            events.extend(result)
 
         # Sort by start time
         events.sort(key=lambda e: e.start_time)
@@ -0,0 +1,603 @@
+"""
+Incremental calendar sync into a local event cache.
+
+Google Calendar and Microsoft Outlook events are pulled with each
+provider's delta mechanism (Google syncToken, Microsoft Graph
+calendarView delta) into the calendar_event_cache table, so meeting
+detection and briefings read the database instead of calling the
+provider APIs on every request:
+- Access tokens come from the shared token cache and are only refreshed
+  when they are about to expire
+- All of a user's providers are synced concurrently over one pooled client
+- A full sync runs on first use, when the provider invalidates the sync
+  token, and once a day to move the sync window forward
+- A sync that runs out of pages keeps the previous sync token and is not
+  retried for PAGE_CAP_BACKOFF
+- Every provider request is counted and timed as Prometheus metrics
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from models import CachedCalendarEvent, CalendarIntegration, CalendarSyncState, User
+from services.calendar_integration import (
+    CalendarEvent, get_access_token, parse_google_event, parse_microsoft_event, token_cache,
+)
+
+logger = logging.getLogger("calendar.sync")
+
+try:
+    from prometheus_client import Counter, Histogram
+    PROMETHEUS_AVAILABLE = True
+
+    CALENDAR_FETCH_DURATION_SECONDS = Histogram(
+        'calendar_fetch_duration_seconds',
+        'Calendar provider request latency in seconds',
+        ['provider', 'kind'],
+        buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    )
+
+    CALENDAR_FETCHES_TOTAL = Counter(
+        'calendar_fetches_total',
+        'Calendar provider requests by outcome',
+        ['provider', 'kind', 'outcome']
+    )
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+    CALENDAR_FETCH_DURATION_SECONDS = None
+    CALENDAR_FETCHES_TOTAL = None
+
+
+PROVIDER_GOOGLE = "google"
+PROVIDER_MICROSOFT = "microsoft"
+PROVIDERS = (PROVIDER_GOOGLE, PROVIDER_MICROSOFT)
+
+# Fetch kinds (metric label)
+KIND_TOKEN = "token"
+KIND_FULL = "full"
+KIND_DELTA = "delta"
+
+GOOGLE_EVENTS_URL = "https://www.googleapis.com/calendar/v3/calendars/primary/events"
+GRAPH_DELTA_URL = "https://graph.microsoft.com/v1.0/me/calendarView/delta"
+
+# Tuning
+SYNC_PAST_DAYS = 1  # Window start, so meetings in progress stay visible
+SYNC_AHEAD_DAYS = 30  # Window end; later events are not cached
+FULL_SYNC_INTERVAL = timedelta(hours=24)
+STALE_AFTER_SECONDS = 120  # Reads sync first when the cache is older than this
+GOOGLE_PAGE_SIZE = 250
+GRAPH_PAGE_SIZE = 100
+MAX_PAGES = 50
+PAGE_CAP_BACKOFF = timedelta(hours=1)  # Before retrying a sync that hit MAX_PAGES
+REQUEST_TIMEOUT_SECONDS = 15.0
+CONNECT_TIMEOUT_SECONDS = 5.0
+
+
+class SyncTokenExpired(Exception):
+    """The provider no longer accepts the stored sync token; resync fully."""
+
+
+class ProviderUnauthorized(Exception):
+    """The provider rejected the access token."""
+
+
+def record_fetch(provider: str, kind: str, outcome: str, seconds: Optional[float] = None):
+    """Count (and time) one request to a calendar or meeting provider."""
+    if not PROMETHEUS_AVAILABLE:
+        return
+    CALENDAR_FETCHES_TOTAL.labels(provider=provider, kind=kind, outcome=outcome).inc()
+    if seconds is not None:
+        CALENDAR_FETCH_DURATION_SECONDS.labels(provider=provider, kind=kind).observe(seconds)
+
+
+def _iso_z(value: datetime) -> str:
+    return value.replace(microsecond=0).isoformat() + "Z"
+
+
+@dataclass
+class SyncResult:
+    """Changes fetched from one provider."""
+    provider: str
+    full: bool = False
+    events: List[CalendarEvent] = field(default_factory=list)  # Created or changed
+    removed_ids: List[str] = field(default_factory=list)
+    sync_token: Optional[str] = None
+    window_start: Optional[datetime] = None
+    window_end: Optional[datetime] = None
+    requests: int = 0
+    truncated: bool = False  # Stopped at MAX_PAGES; sync_token is unset
+    error: Optional[str] = None
+
+
+class CalendarSyncService:
+    """
+    Syncs provider calendars into the local event cache and reads from it.
+
+    A single instance is shared per process (see `calendar_sync`) so the
+    HTTP connection pool is reused across users.
+    """
+
+    def __init__(
+        self,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        clock=datetime.utcnow,
+    ):
+        self._transport = transport
+        self._clock = clock
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    # =========================================================================
+    # HTTP CLIENT
+    # =========================================================================
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(REQUEST_TIMEOUT_SECONDS, connect=CONNECT_TIMEOUT_SECONDS),
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+                transport=self._transport,
+            )
+            self._client_loop = loop
+        return self._client
+
+    async def close(self):
+        """Close the HTTP client."""
+        if self._client and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
+
+    async def _get(self, provider: str, kind: str, url: str, access_token: str, **kwargs) -> dict:
+        """GET a provider endpoint, counting and timing the request."""
+        headers = {"Authorization": f"Bearer {access_token}", **kwargs.pop("headers", {})}
+        started = time.perf_counter()
+        try:
+            response = await self.client.get(url, headers=headers, **kwargs)
+        except httpx.HTTPError:
+            record_fetch(provider, kind, "error", time.perf_counter() - started)
+            raise
+        seconds = time.perf_counter() - started
+
+        if response.status_code == 401:
+            record_fetch(provider, kind, "unauthorized", seconds)
+            raise ProviderUnauthorized(f"{provider} rejected the access token")
+        if response.status_code == 410 or _graph_resync_required(response):
+            record_fetch(provider, kind, "expired", seconds)
+            raise SyncTokenExpired(f"{provider} sync token expired")
+        if response.status_code != 200:
+            record_fetch(provider, kind, "error", seconds)
+            raise httpx.HTTPStatusError(
+                f"{provider} returned {response.status_code}", request=response.request, response=response
+            )
+
+        record_fetch(provider, kind, "success", seconds)
+        return response.json()
+
+    async def _access_token(self, provider: str, refresh_token: str) -> Optional[str]:
+        cached = token_cache.get(provider, refresh_token)
+        if cached:
+            record_fetch(provider, KIND_TOKEN, "cached")
+            return cached
+
+        started = time.perf_counter()
+        access_token = await get_access_token(provider, refresh_token, client=self.client)
+        record_fetch(provider, KIND_TOKEN, "success" if access_token else "error", time.perf_counter() - started)
+        return access_token
+
+    # =========================================================================
+    # PROVIDER SYNC
+    # =========================================================================
+
+    async def _sync_google(
+        self, access_token: str, sync_token: Optional[str], window: Tuple[datetime, datetime]
+    ) -> SyncResult:
+        """
+        Full or incremental sync of the primary Google calendar.
+
+        The full sync is bounded by timeMin and timeMax, which also stops
+        recurring events from being expanded past the window; incremental
+        syncs pass only the sync token (Google rejects time filters with it)
+        and return every change since, which may include events outside the
+        window.
+        """
+        full = sync_token is None
+        result = SyncResult(provider=PROVIDER_GOOGLE, full=full, window_start=window[0], window_end=window[1])
+        params: Dict[str, Any] = {"singleEvents": "true", "maxResults": GOOGLE_PAGE_SIZE}
+        if full:
+            params["timeMin"] = _iso_z(window[0])
+            params["timeMax"] = _iso_z(window[1])
+        else:
+            params["syncToken"] = sync_token
+
+        page_token = None
+        for _ in range(MAX_PAGES):
+            page_params = dict(params, pageToken=page_token) if page_token else params
+            data = await self._get(
+                PROVIDER_GOOGLE, KIND_FULL if full else KIND_DELTA, GOOGLE_EVENTS_URL, access_token,
+                params=page_params,
+            )
+            result.requests += 1
+
+            for item in data.get("items", []):
+                if item.get("status") == "cancelled":
+                    result.removed_ids.append(item.get("id", ""))
+                elif item.get("start"):
+                    result.events.append(parse_google_event(item))
+
+            page_token = data.get("nextPageToken")
+            if not page_token:
+                result.sync_token = data.get("nextSyncToken")
+                break
+        else:
+            result.truncated = True
+            logger.warning("Google calendar sync stopped after %d pages", MAX_PAGES)
+
+        return result
+
+    async def _sync_microsoft(
+        self, access_token: str, delta_link: Optional[str], window: Tuple[datetime, datetime]
+    ) -> SyncResult:
+        """
+        Full or incremental sync of the Outlook calendar view.
+
+        The window is fixed by the initial delta request and carried in the
+        delta link, so moving it forward needs a full sync.
+        """
+        full = delta_link is None
+        result = SyncResult(provider=PROVIDER_MICROSOFT, full=full, window_start=window[0], window_end=window[1])
+        headers = {"Prefer": f'odata.maxpagesize={GRAPH_PAGE_SIZE}, outlook.timezone="UTC"'}
+
+        url = delta_link or GRAPH_DELTA_URL
+        params = None
+        if full:
+            params = {"startDateTime": _iso_z(window[0]), "endDateTime": _iso_z(window[1])}
+
+        for _ in range(MAX_PAGES):
+            data = await self._get(
+                PROVIDER_MICROSOFT, KIND_FULL if full else KIND_DELTA, url, access_token,
+                params=params, headers=headers,
+            )
+            result.requests += 1
+
+            for item in data.get("value", []):
+                if "@removed" in item:
+                    result.removed_ids.append(item.get("id", ""))
+                elif item.get("start"):
+                    result.events.append(parse_microsoft_event(item))
+
+            # Next links already carry the query
+            url, params = data.get("@odata.nextLink"), None
+            if not url:
+                result.sync_token = data.get("@odata.deltaLink")
+                break
+        else:
+            result.truncated = True
+            logger.warning("Microsoft calendar sync stopped after %d pages", MAX_PAGES)
+
+        return result
+
+    def _needs_full_sync(self, state: Dict[str, Any], now: datetime) -> bool:
+        if not state.get("sync_token"):
+            return True
+        last_full = state.get("last_full_sync_at")
+        return last_full is None or now - last_full >= FULL_SYNC_INTERVAL
+
+    async def _sync_provider(
+        self, provider: str, refresh_token: str, state: Dict[str, Any], force_full: bool
+    ) -> SyncResult:
+        """Fetch one provider's changes; never raises."""
+        now = self._clock()
+        full = force_full or self._needs_full_sync(state, now)
+        if full:
+            window = (now - timedelta(days=SYNC_PAST_DAYS), now + timedelta(days=SYNC_AHEAD_DAYS))
+        else:
+            window = (state["window_start"], state["window_end"])
+        sync = self._sync_google if provider == PROVIDER_GOOGLE else self._sync_microsoft
+
+        try:
+            for attempt in range(2):
+                access_token = await self._access_token(provider, refresh_token)
+                if not access_token:
+                    return SyncResult(provider=provider, error="Could not get an access token")
+                try:
+                    try:
+                        return await sync(access_token, None if full else state["sync_token"], window)
+                    except SyncTokenExpired:
+                        logger.info(f"{provider} sync token expired, running a full sync")
+                        full = True
+                        window = (now - timedelta(days=SYNC_PAST_DAYS), now + timedelta(days=SYNC_AHEAD_DAYS))
+                        return await sync(access_token, None, window)
+                except ProviderUnauthorized:
+                    # The cached token was revoked early; refresh once
+                    token_cache.invalidate(provider, refresh_token)
+                    if attempt:
+                        raise
+        except Exception as e:
+            logger.error(f"{provider} calendar sync failed: {e}")
+            return SyncResult(provider=provider, error=str(e))
+
+    # =========================================================================
+    # CACHE UPDATES
+    # =========================================================================
+
+    @staticmethod
+    def calendar_accounts(db: Session, user: User) -> Dict[str, str]:
+        """Refresh token per connected calendar provider."""
+        accounts: Dict[str, str] = {}
+        integrations = db.query(CalendarIntegration).filter(
+            CalendarIntegration.user_id == user.id,
+            CalendarIntegration.is_active == True,
+            CalendarIntegration.provider.in_(PROVIDERS),
+            CalendarIntegration.refresh_token.isnot(None),
+        ).all()
+        for integration in integrations:
+            accounts[integration.provider] = integration.refresh_token
+        if user.google_refresh_token:
+            accounts.setdefault(PROVIDER_GOOGLE, user.google_refresh_token)
+        if user.microsoft_refresh_token:
+            accounts.setdefault(PROVIDER_MICROSOFT, user.microsoft_refresh_token)
+        return accounts
+
+    def _states(self, db: Session, user_id: int, providers) -> Dict[str, CalendarSyncState]:
+        states = {
+            state.provider: state
+            for state in db.query(CalendarSyncState).filter(
+                CalendarSyncState.user_id == user_id,
+                CalendarSyncState.provider.in_(list(providers)),
+            )
+        }
+        for provider in providers:
+            if provider not in states:
+                states[provider] = CalendarSyncState(user_id=user_id, provider=provider)
+                db.add(states[provider])
+        return states
+
+    def _apply(self, db: Session, user_id: int, state: CalendarSyncState, result: SyncResult):
+        """
+        Write one provider's changes to the cache and advance its state.
+
+        A truncated sync only adds what it fetched: the cache is not replaced,
+        the previous sync token is kept and the next attempt waits for
+        PAGE_CAP_BACKOFF instead of running again on the next read.
+        """
+        now = self._clock()
+        state.last_synced_at = now
+        if result.error:
+            state.last_error = result.error[:1000]
+            return
+
+        events = db.query(CachedCalendarEvent).filter(
+            CachedCalendarEvent.user_id == user_id,
+            CachedCalendarEvent.provider == result.provider,
+        )
+        if result.full and not result.truncated:
+            events.delete(synchronize_session=False)
+            existing = {}
+            state.last_full_sync_at = now
+        else:
+            changed_ids = [event.id for event in result.events] + result.removed_ids
+            existing = {
+                row.event_id: row
+                for row in events.filter(CachedCalendarEvent.event_id.in_(changed_ids))
+            } if changed_ids else {}
+
+        for event_id in result.removed_ids:
+            row = existing.pop(event_id, None)
+            if row is not None:
+                db.delete(row)
+
+        for event in result.events:
+            row = existing.get(event.id)
+            if row is None:
+                row = CachedCalendarEvent(user_id=user_id, provider=result.provider, event_id=event.id)
+                db.add(row)
+                existing[event.id] = row
+            row.title = (event.title or "")[:500]
+            row.description = event.description
+            row.start_time = event.start_time
+            row.end_time = event.end_time
+            row.location = (event.location or "")[:500] or None
+            row.attendees = event.attendees
+            row.meeting_link = event.meeting_link
+
+        if result.truncated:
+            state.last_error = f"Stopped after {MAX_PAGES} pages"
+            state.retry_after = now + PAGE_CAP_BACKOFF
+            if state.window_start is None:
+                state.window_start, state.window_end = result.window_start, result.window_end
+        else:
+            state.sync_token = result.sync_token
+            state.window_start = result.window_start
+            state.window_end = result.window_end
+            state.last_error = None
+            state.retry_after = None
+
+        # Delta changes can include events far outside the window; keep the
+        # cache bounded to it. Flush first so the bulk deletes see new rows
+        db.flush()
+        if state.window_start:
+            events.filter(CachedCalendarEvent.end_time < state.window_start).delete(synchronize_session=False)
+        if state.window_end:
+            events.filter(CachedCalendarEvent.start_time >= state.window_end).delete(synchronize_session=False)
+
+    async def sync_user(self, db: Session, user: User, force_full: bool = False) -> Dict[str, Any]:
+        """
+        Sync all of a user's calendars concurrently.
+
+        Returns:
+            Stats per provider (changed, removed, requests, full, error)
+        """
+        accounts = self.calendar_accounts(db, user)
+        if not accounts:
+            return {}
+
+        states = self._states(db, user.id, accounts)
+        snapshots = {
+            provider: {
+                "sync_token": state.sync_token,
+                "window_start": state.window_start,
+                "window_end": state.window_end,
+                "last_full_sync_at": state.last_full_sync_at,
+            }
+            for provider, state in states.items()
+        }
+
+        results = await asyncio.gather(*(
+            self._sync_provider(provider, refresh_token, snapshots[provider], force_full)
+            for provider, refresh_token in accounts.items()
+        ))
+
+        # Database writes stay on this coroutine, after all fetches finished
+        stats = {}
+        for result in results:
+            self._apply(db, user.id, states[result.provider], result)
+            stats[result.provider] = {
+                "full": result.full,
+                "changed": len(result.events),
+                "removed": len(result.removed_ids),
+                "requests": result.requests,
+                "error": result.error,
+            }
+        try:
+            db.commit()
+        except IntegrityError:
+            # Another worker synced the same user concurrently; its data wins
+            db.rollback()
+            logger.info(f"Concurrent calendar sync for user {user.id}, skipped")
+        return stats
+
+    async def refresh_if_stale(
+        self, db: Session, user: User, max_age_seconds: float = STALE_AFTER_SECONDS
+    ) -> bool:
+        """
+        Sync the user's calendars if any was last synced too long ago.
+
+        Returns:
+            True if a sync ran
+        """
+        accounts = self.calendar_accounts(db, user)
+        if not accounts:
+            return False
+
+        now = self._clock()
+        cutoff = now - timedelta(seconds=max_age_seconds)
+        fresh = {
+            provider
+            for provider, last_synced_at, retry_after in db.query(
+                CalendarSyncState.provider, CalendarSyncState.last_synced_at, CalendarSyncState.retry_after
+            ).filter(CalendarSyncState.user_id == user.id)
+            if (last_synced_at and last_synced_at >= cutoff) or (retry_after and retry_after > now)
+        }
+        if all(provider in fresh for provider in accounts):
+            return False
+
+        await self.sync_user(db, user)
+        return True
+
+    # =========================================================================
+    # CACHE READS
+    # =========================================================================
+
+    @staticmethod
+    def cached_events(
+        db: Session,
+        user_id: int,
+        from_date: datetime,
+        to_date: datetime,
+    ) -> List[CalendarEvent]:
+        """Cached events overlapping [from_date, to_date], by start time."""
+        rows = db.query(CachedCalendarEvent).filter(
+            CachedCalendarEvent.user_id == user_id,
+            CachedCalendarEvent.start_time < to_date,
+            CachedCalendarEvent.end_time > from_date,
+        ).order_by(CachedCalendarEvent.start_time).all()
+
+        return [
+            CalendarEvent(
+                id=row.event_id,
+                title=row.title or "Untitled",
+                description=row.description,
+                start_time=row.start_time,
+                end_time=row.end_time,
+                location=row.location,
+                attendees=row.attendees or [],
+                meeting_link=row.meeting_link,
+                calendar_provider=row.provider,
+                raw_data={},
+            )
+            for row in rows
+        ]
+
+    async def get_upcoming_events(
+        self,
+        db: Session,
+        user: User,
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None,
+    ) -> List[CalendarEvent]:
+        """Events in the range from the cache, synced first if stale."""
+        if not from_date:
+            from_date = self._clock()
+        if not to_date:
+            to_date = from_date + timedelta(days=7)
+
+        try:
+            await self.refresh_if_stale(db, user)
+        except Exception as e:
+            # Serve what is cached rather than nothing
+            logger.error(f"Calendar refresh failed for user {user.id}: {e}")
+            db.rollback()
+        return self.cached_events(db, user.id, from_date, to_date)
+
+    def next_cached_event(
+        self,
+        db: Session,
+        user_id: int,
+        within: timedelta = timedelta(hours=1),
+    ) -> Optional[CalendarEvent]:
+        """The cached meeting in progress or starting soonest within the period."""
+        now = self._clock()
+        for event in self.cached_events(db, user_id, now, now + within):
+            # Skip all-day blocks, which are rarely the meeting being prepared for
+            if event.end_time - event.start_time < timedelta(hours=23):
+                return event
+        return None
+
+    @staticmethod
+    def clear(db: Session, user_id: int, provider: str):
+        """Drop a provider's cached events and sync state (on disconnect)."""
+        db.query(CachedCalendarEvent).filter(
+            CachedCalendarEvent.user_id == user_id,
+            CachedCalendarEvent.provider == provider,
+        ).delete(synchronize_session=False)
+        db.query(CalendarSyncState).filter(
+            CalendarSyncState.user_id == user_id,
+            CalendarSyncState.provider == provider,
+        ).delete(synchronize_session=False)
+
+
+def _graph_resync_required(response: httpx.Response) -> bool:
+    """Graph reports an unusable delta link as a 400 with a resync code."""
+    if response.status_code != 400:
+        return False
+    try:
+        code = (response.json().get("error") or {}).get("code", "")
+    except ValueError:
+        return False
+    return code in ("syncStateNotFound", "syncStateInvalid", "resyncRequired")
+
+
+# Process-wide sync service
+calendar_sync = CalendarSyncService()
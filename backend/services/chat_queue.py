@@ -0,0 +1,123 @@
+"""
+Read model for the support chat queue.
+
+Agents poll the queue constantly. Session rows are read together with the
+customer, team and agent names in one joined query that selects only the
+columns the response needs, and the open queue is held in memory. The
+snapshot is reloaded only after ChatConnectionManager reports a queue
+change (new, accepted, transferred or ended chats), or once it is older
+than CHAT_QUEUE_MAX_AGE_SECONDS as a safety net for changes made by other
+processes. Polls in between do not touch the database.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from sqlalchemy.orm import Session, aliased
+
+from models import ChatSession, SupportTeam, TeamMember, User
+from schemas import ChatSessionResponse
+from services.chat_websocket_manager import chat_manager
+
+logger = logging.getLogger(__name__)
+
+
+CHAT_QUEUE_MAX_AGE_SECONDS = float(os.getenv("CHAT_QUEUE_MAX_AGE_SECONDS", "30"))
+
+OPEN_STATUSES = ("waiting", "active")
+
+
+def session_responses(db: Session, *criteria) -> List[ChatSessionResponse]:
+    """Load enriched chat sessions matching the criteria, oldest first."""
+    agent_user = aliased(User)
+    rows = db.query(
+        ChatSession.id,
+        ChatSession.session_token,
+        ChatSession.user_id,
+        ChatSession.agent_id,
+        ChatSession.team_id,
+        ChatSession.status,
+        ChatSession.queue_position,
+        ChatSession.started_at,
+        ChatSession.accepted_at,
+        ChatSession.ended_at,
+        ChatSession.ticket_id,
+        User.full_name.label("user_name"),
+        agent_user.full_name.label("agent_name"),
+        SupportTeam.name.label("team_name"),
+    ).outerjoin(
+        User, User.id == ChatSession.user_id
+    ).outerjoin(
+        SupportTeam, SupportTeam.id == ChatSession.team_id
+    ).outerjoin(
+        TeamMember, TeamMember.id == ChatSession.agent_id
+    ).outerjoin(
+        agent_user, agent_user.id == TeamMember.user_id
+    ).filter(
+        *criteria
+    ).order_by(
+        ChatSession.started_at, ChatSession.id
+    ).all()
+
+    return [ChatSessionResponse.model_validate(row._mapping) for row in rows]
+
+
+class ChatQueueSnapshot:
+    """In-memory copy of the open chat queue."""
+
+    def __init__(self, max_age_seconds: float = CHAT_QUEUE_MAX_AGE_SECONDS):
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+        self._sessions: List[ChatSessionResponse] = []
+        self._loaded_at: Optional[float] = None
+        # Bumped by every queue event; a load is current while it matches
+        self._generation = 0
+        self._loaded_generation = -1
+        self.loads = 0
+
+    def invalidate(self, session_id: Optional[int] = None) -> None:
+        """Mark the snapshot stale; the next read reloads it."""
+        self._generation += 1
+
+    def _is_fresh(self, generation: int) -> bool:
+        return (
+            self._loaded_at is not None
+            and generation == self._loaded_generation
+            and time.monotonic() - self._loaded_at < self.max_age_seconds
+        )
+
+    def sessions(self, db: Session) -> List[ChatSessionResponse]:
+        """All open sessions, oldest first, reloading if stale."""
+        generation = self._generation
+        if self._is_fresh(generation):
+            return self._sessions
+
+        with self._lock:
+            generation = self._generation
+            if not self._is_fresh(generation):
+                self._sessions = session_responses(db, ChatSession.status.in_(OPEN_STATUSES))
+                self._loaded_generation = generation
+                self._loaded_at = time.monotonic()
+                self.loads += 1
+            return self._sessions
+
+    def page(
+        self,
+        db: Session,
+        team_id: Optional[int] = None,
+        offset: int = 0,
+        limit: int = 50
+    ) -> Tuple[List[ChatSessionResponse], int]:
+        """A page of the queue, optionally for one team, and the total count."""
+        sessions = self.sessions(db)
+        if team_id:
+            sessions = [s for s in sessions if s.team_id == team_id]
+        return sessions[offset:offset + limit], len(sessions)
+
+
+# Shared queue snapshot, kept current by chat connection manager events
+chat_queue = ChatQueueSnapshot()
+chat_manager.add_queue_listener(chat_queue.invalidate)
@@ -11,7 +11,7 @@ Provides real-time messaging for the support chat system:
 import json
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Set, Any
+from typing import Callable, Dict, List, Optional, Set, Any
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -105,6 +105,27 @@ class ChatConnectionManager:
         # All active connections for management
         self.all_connections: Dict[WebSocket, ChatConnection] = {}
 
+        # Callbacks run when a session enters, moves in or leaves the queue
+        self.queue_listeners: List[Callable[[Optional[int]], None]] = []
+
+    def add_queue_listener(self, listener: Callable[[Optional[int]], None]):
+        """Register a callback for queue changes (e.g. the queue read model)."""
+        if listener not in self.queue_listeners:
+            self.queue_listeners.append(listener)
+
+    def queue_changed(self, session_id: Optional[int] = None):
+        """
+        Report that a chat session entered, moved in or left the queue.
+
+        Called by the notify helpers below; routes that change a session
+        without notifying anyone call it directly.
+        """
+        for listener in self.queue_listeners:
+            try:
+                listener(session_id)
+            except Exception as e:
+                logger.error(f"Queue listener failed: {e}")
+
     async def connect_customer(
         self,
         websocket: WebSocket,
@@ -431,6 +452,7 @@ class ChatConnectionManager:
         additional_data: Optional[Dict[str, Any]] = None,
     ):
         """Notify all participants about session status change."""
+        self.queue_changed(session_id)
         data = {
             "session_id": session_id,
             "status": new_status,
@@ -451,6 +473,7 @@ class ChatConnectionManager:
         reason: Optional[str] = None,
     ):
         """Notify all participants that the chat session has ended."""
+        self.queue_changed(session_id)
         await self.broadcast_to_session(
             session_id,
             ChatWebSocketMessage(
@@ -487,6 +510,7 @@ class ChatConnectionManager:
         session_data: Dict[str, Any],
     ):
         """Notify agents about a new chat in their team's queue."""
+        self.queue_changed(session_data.get("session_id"))
         await self.broadcast_to_team_agents(
             team_id,
             ChatWebSocketMessage(
@@ -13,7 +13,6 @@ import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
-import anthropic
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
 
@@ -27,6 +26,7 @@ from models import (
     EmailNotification,
 )
 from services.email_service import EmailService
+from services.llm_gateway import llm_gateway
 from config import APP_URL
 
 logger = logging.getLogger(__name__)
@@ -46,7 +46,7 @@ class EmailIntegrationService:
     def __init__(self, db: Session):
         self.db = db
         self.email_service = EmailService(db)
-        self.ai_client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+        self.ai_client = llm_gateway
         self.model = os.getenv("TASK_EXTRACTION_MODEL", "claude-sonnet-4-20250514")
 
     async def link_email_to_meeting(
@@ -488,13 +488,14 @@ Rules:
 - Be conservative - don't create tasks from casual conversation"""
 
         try:
-            response = self.ai_client.messages.create(
+            response = await self.ai_client.complete(
+                prompt,
+                call_site="email_integration.extract_tasks",
                 model=self.model,
                 max_tokens=2048,
-                messages=[{"role": "user", "content": prompt}]
             )
 
-            content = response.content[0].text
+            content = response.text
 
             # Parse JSON from response
             if "```json" in content:
@@ -544,12 +545,13 @@ Generate a 2-3 sentence summary highlighting:
 Keep it concise and actionable."""
 
         try:
-            response = self.ai_client.messages.create(
+            response = await self.ai_client.complete(
+                prompt,
+                call_site="email_integration.context_summary",
                 model=self.model,
                 max_tokens=500,
-                messages=[{"role": "user", "content": prompt}]
             )
-            return response.content[0].text.strip()
+            return response.text.strip()
 
         except Exception as e:
             logger.error(f"Email context summary error: {e}")
@@ -6,18 +6,25 @@ Supports:
 - Word (.docx)
 - Markdown
 - JSON
+- NDJSON (bulk only)
 - CSV
+
+Bulk exports are streamed: meetings are fetched in keyset-paginated batches
+with their relationships eager loaded, and rendered chunk by chunk so memory
+stays flat regardless of how many meetings are exported.
 """
 
 import io
 import csv
 import json
+import zlib
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterable, Iterator
 from enum import Enum
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
+from config import EXPORT_BATCH_SIZE
 from models import Meeting, Conversation, ActionItem, MeetingSummary
 
 
@@ -27,10 +34,34 @@ class ExportFormat(str, Enum):
     DOCX = "docx"
     MARKDOWN = "markdown"
     JSON = "json"
+    NDJSON = "ndjson"
     CSV = "csv"
     HTML = "html"
 
 
+BULK_EXPORT_FORMATS = {
+    ExportFormat.JSON: ("json", "application/json"),
+    ExportFormat.NDJSON: ("ndjson", "application/x-ndjson"),
+    ExportFormat.CSV: ("csv", "text/csv"),
+    ExportFormat.MARKDOWN: ("md", "text/markdown"),
+}
+
+MEETINGS_CSV_HEADER = [
+    "ID", "Title", "Type", "App", "Date", "Duration (min)",
+    "Status", "Conversations", "Action Items"
+]
+
+
+def gzip_stream(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """Gzip-compress a byte stream incrementally."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # 31 = gzip container
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
 class ExportService:
     """
     Service for exporting meetings and data in various formats.
@@ -87,22 +118,162 @@ class ExportService:
         Returns:
             Tuple of (content, filename, content_type)
         """
-        all_data = [self._gather_meeting_data(m) for m in meetings]
+        if format not in BULK_EXPORT_FORMATS:
+            raise ValueError(f"Bulk export not supported for format: {format}")
 
-        if format == ExportFormat.JSON:
-            content = json.dumps(all_data, indent=2, default=str)
-            return (
-                content.encode("utf-8"),
-                f"meetings_export_{datetime.utcnow().strftime('%Y%m%d')}.json",
-                "application/json",
+        meeting_data = (self._gather_meeting_data(m) for m in meetings)
+        content = b"".join(self.render_meetings(meeting_data, format))
+        filename, content_type = self.bulk_export_filename(format)
+        return (content, filename, content_type)
+
+    # =========================================================================
+    # STREAMING BULK EXPORT
+    # =========================================================================
+
+    def iter_meetings(
+        self,
+        user_id: int,
+        meeting_ids: Optional[List[int]] = None,
+        limit: Optional[int] = None,
+        batch_size: int = EXPORT_BATCH_SIZE,
+        include_conversations: bool = True,
+        include_action_items: bool = True,
+        include_summary: bool = True,
+    ) -> Iterator[Meeting]:
+        """
+        Yield a user's meetings, newest first, in keyset-paginated batches.
+
+        Each batch loads its conversations, action items and summaries with
+        one query per relationship instead of one per meeting.
+        """
+        options = []
+        if include_conversations:
+            options.append(selectinload(Meeting.conversations))
+        if include_action_items:
+            options.append(selectinload(Meeting.action_items))
+        if include_summary:
+            options.append(selectinload(Meeting.summary))
+
+        remaining = limit
+        last_id = None
+        while remaining is None or remaining > 0:
+            query = self.db.query(Meeting).filter(Meeting.user_id == user_id)
+            if meeting_ids:
+                query = query.filter(Meeting.id.in_(meeting_ids))
+            if last_id is not None:
+                query = query.filter(Meeting.id < last_id)
+
+            size = batch_size if remaining is None else min(batch_size, remaining)
+            batch = query.options(*options).order_by(Meeting.id.desc()).limit(size).all()
+            if not batch:
+                return
+
+            for meeting in batch:
+                yield meeting
+
+            last_id = batch[-1].id
+            if remaining is not None:
+                remaining -= len(batch)
+            if len(batch) < size:
+                return
+            # The session's identity map holds weak references, so finished
+            # batches are released once the caller drops them
+
+    def iter_meeting_data(
+        self,
+        user_id: int,
+        meeting_ids: Optional[List[int]] = None,
+        limit: Optional[int] = None,
+        include_conversations: bool = True,
+        include_action_items: bool = True,
+        include_summary: bool = True,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield export dicts for a user's meetings, batch by batch."""
+        meetings = self.iter_meetings(
+            user_id,
+            meeting_ids=meeting_ids,
+            limit=limit,
+            include_conversations=include_conversations,
+            include_action_items=include_action_items,
+            include_summary=include_summary,
+        )
+        for meeting in meetings:
+            yield self._gather_meeting_data(
+                meeting,
+                include_conversations,
+                include_action_items,
+                include_summary,
             )
+
+    def render_meetings(
+        self,
+        meeting_data: Iterable[Dict[str, Any]],
+        format: ExportFormat,
+    ) -> Iterator[bytes]:
+        """
+        Render meetings as a byte stream.
+
+        JSON is a single array, NDJSON is one meeting object per line, CSV is
+        one summary row per meeting and Markdown is one section per meeting.
+        """
+        if format == ExportFormat.JSON:
+            yield b"["
+            for index, data in enumerate(meeting_data):
+                prefix = "," if index else ""
+                yield (prefix + json.dumps(data, default=str)).encode("utf-8")
+            yield b"]"
+        elif format == ExportFormat.NDJSON:
+            for data in meeting_data:
+                yield (json.dumps(data, default=str) + "\n").encode("utf-8")
         elif format == ExportFormat.CSV:
-            return self._export_meetings_csv(all_data)
+            yield from self._stream_meetings_csv(meeting_data)
         elif format == ExportFormat.MARKDOWN:
-            return self._export_meetings_markdown(all_data)
+            yield from self._stream_meetings_markdown(meeting_data)
         else:
             raise ValueError(f"Bulk export not supported for format: {format}")
 
+    def render_bulk_export(
+        self,
+        meeting_data: Iterable[Dict[str, Any]],
+        format: ExportFormat,
+    ) -> Iterator[bytes]:
+        """
+        Render a bulk export.
+
+        JSON is wrapped as {"meetings": [...], "count": N, "exported_at": ...},
+        with the count written after the last meeting so nothing is buffered.
+        """
+        if format != ExportFormat.JSON:
+            yield from self.render_meetings(meeting_data, format)
+            return
+
+        exported_at = datetime.utcnow().isoformat()
+        count = 0
+
+        def counted():
+            nonlocal count
+            for data in meeting_data:
+                count += 1
+                yield data
+
+        yield b'{"meetings":'
+        yield from self.render_meetings(counted(), ExportFormat.JSON)
+        yield f',"count":{count},"exported_at":{json.dumps(exported_at)}}}'.encode("utf-8")
+
+    @staticmethod
+    def bulk_export_filename(format: ExportFormat, compressed: bool = False) -> tuple:
+        """
+        Get the download filename and content type for a bulk export.
+
+        Returns:
+            Tuple of (filename, content_type)
+        """
+        extension, content_type = BULK_EXPORT_FORMATS[format]
+        filename = f"meetings_export_{datetime.utcnow().strftime('%Y%m%d')}.{extension}"
+        if compressed:
+            return (f"{filename}.gz", "application/gzip")
+        return (filename, content_type)
+
     def _gather_meeting_data(
         self,
         meeting: Meeting,
@@ -118,6 +289,7 @@ class ExportService:
             "meeting_app": meeting.meeting_app,
             "started_at": meeting.started_at.isoformat() if meeting.started_at else None,
             "ended_at": meeting.ended_at.isoformat() if meeting.ended_at else None,
+            "duration_seconds": meeting.duration_seconds,
             "duration_minutes": meeting.duration_seconds // 60 if meeting.duration_seconds else 0,
             "status": meeting.status,
             "notes": meeting.notes,
@@ -126,6 +298,7 @@ class ExportService:
         if include_conversations:
             data["conversations"] = [
                 {
+                    "id": c.id,
                     "speaker": c.speaker,
                     "heard_text": c.heard_text,
                     "response_text": c.response_text,
@@ -137,6 +310,7 @@ class ExportService:
         if include_action_items:
             data["action_items"] = [
                 {
+                    "id": a.id,
                     "description": a.description,
                     "assignee": a.assignee,
                     "due_date": a.due_date.isoformat() if a.due_date else None,
@@ -390,18 +564,20 @@ class ExportService:
             # Fallback to Markdown
             return self._export_markdown(data)
 
-    def _export_meetings_csv(self, meetings_data: List[Dict]) -> tuple:
-        """Export multiple meetings as CSV summary."""
+    def _stream_meetings_csv(self, meetings_data: Iterable[Dict]) -> Iterator[bytes]:
+        """Stream multiple meetings as CSV summary rows."""
         output = io.StringIO()
         writer = csv.writer(output)
 
-        # Header
-        writer.writerow([
-            "ID", "Title", "Type", "App", "Date", "Duration (min)",
-            "Status", "Conversations", "Action Items"
-        ])
+        def flush() -> bytes:
+            chunk = output.getvalue().encode("utf-8")
+            output.seek(0)
+            output.truncate(0)
+            return chunk
+
+        writer.writerow(MEETINGS_CSV_HEADER)
+        yield flush()
 
-        # Rows
         for data in meetings_data:
             writer.writerow([
                 data["id"],
@@ -414,19 +590,19 @@ class ExportService:
                 len(data.get("conversations", [])),
                 len(data.get("action_items", [])),
             ])
+            yield flush()
 
-        content = output.getvalue()
-        filename = f"meetings_export_{datetime.utcnow().strftime('%Y%m%d')}.csv"
-        return (content.encode("utf-8"), filename, "text/csv")
-
-    def _export_meetings_markdown(self, meetings_data: List[Dict]) -> tuple:
-        """Export multiple meetings as Markdown."""
-        lines = ["# Meeting Export", "", f"*Exported on {datetime.utcnow().strftime('%Y-%m-%d')}*", ""]
+    def _stream_meetings_markdown(self, meetings_data: Iterable[Dict]) -> Iterator[bytes]:
+        """Stream multiple meetings as Markdown sections."""
+        header = ["# Meeting Export", "", f"*Exported on {datetime.utcnow().strftime('%Y-%m-%d')}*", ""]
+        yield ("\n".join(header) + "\n").encode("utf-8")
 
         for data in meetings_data:
-            lines.append(f"## {data['title']}")
-            lines.append(f"**Date:** {data['started_at']} | **Duration:** {data['duration_minutes']} min")
-            lines.append("")
+            lines = [
+                f"## {data['title']}",
+                f"**Date:** {data['started_at']} | **Duration:** {data['duration_minutes']} min",
+                "",
+            ]
 
             if data.get("summary"):
                 lines.append(data["summary"]["text"] or "No summary available")
@@ -434,7 +610,4 @@ class ExportService:
 
             lines.append("---")
             lines.append("")
-
-        content = "\n".join(lines)
-        filename = f"meetings_export_{datetime.utcnow().strftime('%Y%m%d')}.md"
-        return (content.encode("utf-8"), filename, "text/markdown")
+            yield ("\n".join(lines) + "\n").encode("utf-8")
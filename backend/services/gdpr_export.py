@@ -0,0 +1,257 @@
+"""
+GDPR data export archive builder for ReadIn AI.
+
+Builds a ZIP archive with one JSON-lines file per table:
+- Rows are read in keyset-paginated batches, so memory does not grow with
+  the amount of data a user owns
+- Each table is streamed straight into its compressed ZIP member
+- Progress is written back to the DataExportJob row as tables complete
+"""
+
+import base64
+import json
+import logging
+import os
+import zipfile
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import Query, Session
+
+from config import EXPORT_DIR, GDPR_EXPORT_TTL_DAYS
+from models import (
+    User, Meeting, Conversation, MeetingSummary, ActionItem, Commitment,
+    Topic, ParticipantMemory, UserLearningProfile, PreMeetingBriefing,
+    AuditLog, ConsentRecord, DataExportJob
+)
+
+logger = logging.getLogger(__name__)
+
+EXPORT_BATCH_SIZE = 500
+ARCHIVE_FORMAT_VERSION = 1
+# Archives live under EXPORT_DIR/<ARCHIVE_SUBDIR>; expire_export_jobs owns
+# their cleanup, so the bulk export file cleanup skips this directory
+ARCHIVE_SUBDIR = "gdpr"
+
+# Job statuses
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+JOB_EXPIRED = "expired"
+
+# A pending or running job that has not started or finished within this
+# time was lost (dropped message, crashed worker) and is not reused
+STALE_JOB_AFTER = timedelta(hours=6)
+
+# Credentials and derived data that are not personal data of the subject
+SECRET_COLUMNS = frozenset({
+    "hashed_password", "totp_secret", "totp_backup_codes",
+    "email_verification_token", "password_reset_token", "password_reset_expires",
+    "google_refresh_token", "microsoft_refresh_token",
+    "paystack_authorization_code", "embedding",
+})
+
+
+@dataclass(frozen=True)
+class ExportTable:
+    """A table included in the export archive."""
+    name: str
+    model: Any
+    query: Callable[[Session, int], Query]
+    exclude: FrozenSet[str] = SECRET_COLUMNS
+
+
+EXPORT_TABLES: List[ExportTable] = [
+    ExportTable("profile", User, lambda db, uid: db.query(User).filter(User.id == uid)),
+    ExportTable("meetings", Meeting, lambda db, uid: db.query(Meeting).filter(Meeting.user_id == uid)),
+    ExportTable(
+        "conversations", Conversation,
+        lambda db, uid: db.query(Conversation).join(Meeting).filter(Meeting.user_id == uid),
+    ),
+    ExportTable(
+        "meeting_summaries", MeetingSummary,
+        lambda db, uid: db.query(MeetingSummary).filter(MeetingSummary.user_id == uid),
+    ),
+    ExportTable("action_items", ActionItem, lambda db, uid: db.query(ActionItem).filter(ActionItem.user_id == uid)),
+    ExportTable("commitments", Commitment, lambda db, uid: db.query(Commitment).filter(Commitment.user_id == uid)),
+    ExportTable("topics", Topic, lambda db, uid: db.query(Topic).filter(Topic.user_id == uid)),
+    ExportTable(
+        "participant_memories", ParticipantMemory,
+        lambda db, uid: db.query(ParticipantMemory).filter(ParticipantMemory.user_id == uid),
+    ),
+    ExportTable(
+        "learning_profile", UserLearningProfile,
+        lambda db, uid: db.query(UserLearningProfile).filter(UserLearningProfile.user_id == uid),
+    ),
+    ExportTable(
+        "pre_meeting_briefings", PreMeetingBriefing,
+        lambda db, uid: db.query(PreMeetingBriefing).filter(PreMeetingBriefing.user_id == uid),
+    ),
+    ExportTable(
+        "consent_records", ConsentRecord,
+        lambda db, uid: db.query(ConsentRecord).filter(ConsentRecord.user_id == uid),
+    ),
+    ExportTable("audit_log", AuditLog, lambda db, uid: db.query(AuditLog).filter(AuditLog.user_id == uid)),
+]
+
+
+def serialize_value(value: Any) -> Any:
+    """Convert a column value to a JSON-compatible value."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode("ascii")
+    return value
+
+
+def row_to_dict(row: Any, exclude: FrozenSet[str] = SECRET_COLUMNS) -> Dict[str, Any]:
+    """Serialize all mapped columns of a row."""
+    return {
+        column.key: serialize_value(getattr(row, column.key))
+        for column in inspect(row).mapper.column_attrs
+        if column.key not in exclude
+    }
+
+
+def iter_table_rows(
+    db: Session,
+    table: ExportTable,
+    user_id: int,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> Iterator[Dict[str, Any]]:
+    """Yield a user's rows for one table in keyset-paginated batches."""
+    last_id = None
+    while True:
+        query = table.query(db, user_id)
+        if last_id is not None:
+            query = query.filter(table.model.id > last_id)
+        batch = query.order_by(table.model.id).limit(batch_size).all()
+        if not batch:
+            return
+
+        for row in batch:
+            yield row_to_dict(row, table.exclude)
+
+        last_id = batch[-1].id
+        if len(batch) < batch_size:
+            return
+        # The session's identity map holds weak references, so finished
+        # batches are released once they go out of scope
+
+
+def export_archive_path(job: DataExportJob) -> str:
+    """Where the archive for a job is stored."""
+    return os.path.join(EXPORT_DIR, ARCHIVE_SUBDIR, str(job.user_id), f"readin_data_export_{job.id}.zip")
+
+
+def build_export_archive(
+    db: Session,
+    job: DataExportJob,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> str:
+    """
+    Build the export archive for a job and mark it completed.
+
+    Returns:
+        Path of the finished archive
+    """
+    path = export_archive_path(job)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    partial_path = f"{path}.part"
+
+    job.status = JOB_RUNNING
+    job.started_at = datetime.utcnow()
+    job.progress = 0
+    job.rows_exported = 0
+    db.commit()
+
+    # Row counts give a progress estimate without loading anything
+    totals = {table.name: table.query(db, job.user_id).count() for table in EXPORT_TABLES}
+    grand_total = max(sum(totals.values()), 1)
+    exported = 0
+
+    try:
+        with zipfile.ZipFile(partial_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for table in EXPORT_TABLES:
+                job.current_table = table.name
+                db.commit()
+
+                with archive.open(f"{table.name}.jsonl", "w", force_zip64=True) as member:
+                    for row in iter_table_rows(db, table, job.user_id, batch_size):
+                        member.write(json.dumps(row, default=str).encode("utf-8"))
+                        member.write(b"\n")
+                        exported += 1
+
+                job.rows_exported = exported
+                job.progress = min(99, int(exported * 100 / grand_total))
+                db.commit()
+
+            manifest = {
+                "format_version": ARCHIVE_FORMAT_VERSION,
+                "user_id": job.user_id,
+                "exported_at": datetime.utcnow().isoformat(),
+                "tables": {table.name: f"{table.name}.jsonl" for table in EXPORT_TABLES},
+                "row_counts": totals,
+            }
+            archive.writestr("manifest.json", json.dumps(manifest, indent=2))
+
+        os.replace(partial_path, path)
+    finally:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+
+    now = datetime.utcnow()
+    job.status = JOB_COMPLETED
+    job.progress = 100
+    job.current_table = None
+    job.file_path = path
+    job.file_size_bytes = os.path.getsize(path)
+    job.completed_at = now
+    job.expires_at = now + timedelta(days=GDPR_EXPORT_TTL_DAYS)
+    db.commit()
+
+    logger.info(f"Built data export {job.id} for user {job.user_id}: {exported} rows, {job.file_size_bytes} bytes")
+    return path
+
+
+def fail_stale_export_jobs(db: Session, user_id: int, now: Optional[datetime] = None) -> int:
+    """Mark a user's lost pending or running jobs as failed."""
+    now = now or datetime.utcnow()
+    jobs = db.query(DataExportJob).filter(
+        DataExportJob.user_id == user_id,
+        DataExportJob.status.in_([JOB_PENDING, JOB_RUNNING]),
+    ).all()
+
+    stale = [job for job in jobs if (job.started_at or job.created_at) <= now - STALE_JOB_AFTER]
+    for job in stale:
+        job.status = JOB_FAILED
+        job.error_message = "Export did not finish in time"
+
+    if stale:
+        db.commit()
+    return len(stale)
+
+
+def expire_export_jobs(db: Session, now: Optional[datetime] = None) -> int:
+    """Delete archives past their expiry and mark the jobs expired."""
+    now = now or datetime.utcnow()
+    jobs = db.query(DataExportJob).filter(
+        DataExportJob.status == JOB_COMPLETED,
+        DataExportJob.expires_at <= now,
+    ).all()
+
+    for job in jobs:
+        if job.file_path and os.path.exists(job.file_path):
+            try:
+                os.remove(job.file_path)
+            except OSError as e:
+                logger.warning(f"Could not remove data export {job.file_path}: {e}")
+                continue
+        job.status = JOB_EXPIRED
+        job.file_path = None
+
+    db.commit()
+    return len(jobs)
@@ -4,7 +4,6 @@ import os
 import json
 from typing import Dict, Any, List, Optional
 from datetime import datetime
-import anthropic
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
@@ -17,6 +16,7 @@ from models import (
     UserLearningProfile,
 )
 from services.language_service import get_localized_prompt_suffix, get_fallback_message
+from services.llm_gateway import llm_gateway
 
 
 class InterviewCoach:
@@ -24,7 +24,7 @@ class InterviewCoach:
 
     def __init__(self, db: Session):
         self.db = db
-        self.client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+        self.client = llm_gateway
         self.model = os.getenv(
             "SUMMARY_GENERATION_MODEL", "claude-sonnet-4-20250514"
         )
@@ -162,13 +162,14 @@ Provide comprehensive analysis in this JSON format:
 }}{language_instruction}"""
 
         try:
-            response = self.client.messages.create(
+            response = await self.client.complete(
+                prompt,
+                call_site="interview_coach.analyze",
                 model=self.model,
                 max_tokens=2048,
-                messages=[{"role": "user", "content": prompt}],
             )
 
-            content = response.content[0].text
+            content = response.text
             if "```json" in content:
                 content = content.split("```json")[1].split("```")[0]
             elif "```" in content:
@@ -270,13 +271,15 @@ Create a prioritized improvement plan in this JSON format:
 }}{language_instruction}"""
 
         try:
-            response = self.client.messages.create(
+            response = await self.client.complete(
+                prompt,
+                call_site="interview_coach.improvement_plan",
                 model=self.model,
                 max_tokens=2048,
-                messages=[{"role": "user", "content": prompt}],
+                user_id=user_id,
             )
 
-            content = response.content[0].text
+            content = response.text
             if "```" in content:
                 content = content.split("```")[1].split("```")[0]
                 if content.startswith("json"):
@@ -349,13 +352,15 @@ Provide improvements in this JSON format:
 }}{language_instruction}"""
 
         try:
-            response = self.client.messages.create(
+            response = await self.client.complete(
+                prompt,
+                call_site="interview_coach.polish_response",
                 model=self.model,
                 max_tokens=1024,
-                messages=[{"role": "user", "content": prompt}],
+                user_id=user_id,
             )
 
-            content = response.content[0].text
+            content = response.text
             if "```" in content:
                 content = content.split("```")[1].split("```")[0]
                 if content.startswith("json"):
@@ -399,13 +404,14 @@ Provide questions in this JSON format:
 Include 10 questions across different types.{language_instruction}"""
 
         try:
-            response = self.client.messages.create(
+            response = await self.client.complete(
+                prompt,
+                call_site="interview_coach.common_questions",
                 model=self.model,
                 max_tokens=2048,
-                messages=[{"role": "user", "content": prompt}],
             )
 
-            content = response.content[0].text
+            content = response.text
             if "```" in content:
                 content = content.split("```")[1].split("```")[0]
                 if content.startswith("json"):
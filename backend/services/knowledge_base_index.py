@@ -0,0 +1,203 @@
+"""
+In-memory BM25 index over published knowledge base articles.
+
+Novah searches the knowledge base on every customer message. Instead of
+ILIKE scans, articles are tokenized once into an inverted index and ranked
+with BM25. The index checks a cheap signature of the published articles
+(count, last update, highest id) at most every KB_INDEX_REFRESH_SECONDS and
+rebuilds itself when articles change.
+"""
+
+import heapq
+import logging
+import math
+import os
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from models import KnowledgeBaseArticle
+
+logger = logging.getLogger(__name__)
+
+
+KB_INDEX_REFRESH_SECONDS = float(os.getenv("KB_INDEX_REFRESH_SECONDS", "30"))
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Field weights: a term in the title counts as three occurrences in the body
+FIELD_WEIGHTS = {
+    "title": 3,
+    "tags": 2,
+    "summary": 2,
+    "content": 1,
+}
+
+STOPWORDS = frozenset("""
+    a an and are can could did does for from has have how i in is it its me my
+    not of on or our please that the this to was what when where which who why
+    will with would you your
+""".split())
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def _stem(token: str) -> str:
+    """Strip common English suffixes so 'cancelling' matches 'cancel'."""
+    for suffix in ("ations", "ation", "ings", "ing", "ies", "ed", "s"):
+        if suffix == "s" and token.endswith("ss"):
+            break
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            token = token[:-len(suffix)]
+            if suffix == "ies":
+                token += "y"
+            break
+    # Collapse doubled final consonants left by stemming ("cancell" -> "cancel")
+    if len(token) > 3 and token[-1] == token[-2] and token[-1] not in "aeiou":
+        token = token[:-1]
+    return token
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lowercase, split, drop stopwords and short words, and stem."""
+    if not text:
+        return []
+    return [
+        _stem(token)
+        for token in _TOKEN_RE.findall(text.lower())
+        if len(token) > 2 and token not in STOPWORDS
+    ]
+
+
+@dataclass(frozen=True)
+class KBArticle:
+    """Fields of a knowledge base article needed to answer a customer."""
+    id: int
+    title: str
+    summary: Optional[str]
+    url: Optional[str]
+    category: str
+
+
+class KnowledgeBaseIndex:
+    """BM25 index over published knowledge base articles."""
+
+    def __init__(self, refresh_seconds: float = KB_INDEX_REFRESH_SECONDS):
+        self.refresh_seconds = refresh_seconds
+        self._lock = threading.Lock()
+        self._signature: Optional[Tuple] = None
+        self._checked_at = 0.0
+        # (articles, postings, lengths, average length), replaced as a whole on rebuild
+        self._data: Tuple[List[KBArticle], Dict[str, List[Tuple[int, int]]], List[int], float] = ([], {}, [], 1.0)
+
+    def __len__(self) -> int:
+        return len(self._data[0])
+
+    def invalidate(self) -> None:
+        """Force the next search to check for changed articles."""
+        self._checked_at = 0.0
+
+    def search(self, db: Session, query: str, limit: int = 5) -> List[KBArticle]:
+        """Return the best matching published articles for a query."""
+        self.refresh(db)
+        return self.rank(query, limit)
+
+    def rank(self, query: str, limit: int = 5) -> List[KBArticle]:
+        """Rank indexed articles against a query without checking for changes."""
+        articles, postings, lengths, avg_length = self._data
+        if not articles:
+            return []
+
+        count = len(articles)
+        scores: Dict[int, float] = defaultdict(float)
+        for term in set(tokenize(query)):
+            entries = postings.get(term)
+            if not entries:
+                continue
+            idf = math.log(1 + (count - len(entries) + 0.5) / (len(entries) + 0.5))
+            for doc, tf in entries:
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[doc] / avg_length)
+                scores[doc] += idf * tf * (BM25_K1 + 1) / (tf + norm)
+
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [articles[doc] for doc, _ in best]
+
+    def refresh(self, db: Session) -> None:
+        """Rebuild the index if published articles changed since the last check."""
+        now = time.monotonic()
+        if now - self._checked_at < self.refresh_seconds:
+            return
+
+        with self._lock:
+            if now - self._checked_at < self.refresh_seconds:
+                return
+            signature = tuple(db.query(
+                func.count(KnowledgeBaseArticle.id),
+                func.max(KnowledgeBaseArticle.updated_at),
+                func.max(KnowledgeBaseArticle.id),
+            ).filter(KnowledgeBaseArticle.is_published == True).one())
+
+            if signature != self._signature:
+                self._build(db)
+                self._signature = signature
+            self._checked_at = time.monotonic()
+
+    def _build(self, db: Session) -> None:
+        started = time.perf_counter()
+        rows = db.query(
+            KnowledgeBaseArticle.id,
+            KnowledgeBaseArticle.title,
+            KnowledgeBaseArticle.summary,
+            KnowledgeBaseArticle.content,
+            KnowledgeBaseArticle.tags,
+            KnowledgeBaseArticle.url,
+            KnowledgeBaseArticle.category,
+        ).filter(
+            KnowledgeBaseArticle.is_published == True
+        ).order_by(KnowledgeBaseArticle.id).all()
+
+        articles = []
+        postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        lengths = []
+        for doc, row in enumerate(rows):
+            fields = {
+                "title": row.title,
+                "summary": row.summary,
+                "content": row.content,
+                "tags": " ".join(str(tag) for tag in (row.tags or [])),
+            }
+            terms = Counter()
+            for name, text in fields.items():
+                for token in tokenize(text):
+                    terms[token] += FIELD_WEIGHTS[name]
+            for term, tf in terms.items():
+                postings[term].append((doc, tf))
+            lengths.append(sum(terms.values()))
+            articles.append(KBArticle(
+                id=row.id,
+                title=row.title,
+                summary=row.summary,
+                url=row.url,
+                category=row.category,
+            ))
+
+        total_length = sum(lengths)
+        avg_length = total_length / len(lengths) if total_length else 1.0
+        self._data = (articles, dict(postings), lengths, avg_length)
+
+        logger.info(
+            f"Built knowledge base index: {len(articles)} articles, {len(postings)} terms "
+            f"in {(time.perf_counter() - started) * 1000:.1f}ms"
+        )
+
+
+# Shared index used by Novah
+knowledge_base_index = KnowledgeBaseIndex()
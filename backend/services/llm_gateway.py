@@ -0,0 +1,361 @@
+"""
+Shared LLM gateway for ReadIn AI.
+
+Every Claude call in the backend goes through one gateway:
+- One pooled AsyncAnthropic client per event loop instead of a client per service
+- Shared context (typically a meeting transcript) is sent as a cached prompt
+  prefix, so several analyses of the same meeting pay for it once
+- Identical requests are memoized by prompt hash with a TTL, and concurrent
+  identical requests share one in-flight call
+- Global and per-user concurrency limits
+- Latency, token and cost metrics per call site (Prometheus when available)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, Optional
+
+import anthropic
+
+from services.cache_service import cache, CacheKeys, CacheTTL
+
+logger = logging.getLogger(__name__)
+
+try:
+    from prometheus_client import Counter, Histogram
+    PROMETHEUS_AVAILABLE = True
+
+    LLM_REQUEST_DURATION_SECONDS = Histogram(
+        'llm_request_duration_seconds',
+        'Claude API call latency in seconds',
+        ['call_site'],
+        buckets=(0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 40.0, 80.0)
+    )
+
+    LLM_REQUESTS_TOTAL = Counter(
+        'llm_requests_total',
+        'LLM gateway requests by outcome',
+        ['call_site', 'outcome']
+    )
+
+    LLM_TOKENS_TOTAL = Counter(
+        'llm_tokens_total',
+        'Tokens billed by Claude API calls',
+        ['call_site', 'kind']
+    )
+
+    LLM_COST_USD_TOTAL = Counter(
+        'llm_cost_usd_total',
+        'Estimated Claude API spend in USD',
+        ['call_site']
+    )
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+    LLM_REQUEST_DURATION_SECONDS = None
+    LLM_REQUESTS_TOTAL = None
+    LLM_TOKENS_TOTAL = None
+    LLM_COST_USD_TOTAL = None
+
+
+DEFAULT_MODEL = os.getenv("SUMMARY_GENERATION_MODEL", "claude-sonnet-4-20250514")
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "16"))
+LLM_MAX_CONCURRENCY_PER_USER = int(os.getenv("LLM_MAX_CONCURRENCY_PER_USER", "4"))
+LLM_TIMEOUT_SECONDS = float(os.getenv("LLM_TIMEOUT_SECONDS", "120"))
+LLM_MAX_RETRIES = 2
+
+# USD per million tokens: input, output, cache write, cache read
+MODEL_PRICING = {
+    "opus": (15.0, 75.0, 18.75, 1.50),
+    "sonnet": (3.0, 15.0, 3.75, 0.30),
+    "haiku": (0.80, 4.0, 1.0, 0.08),
+}
+DEFAULT_PRICING = MODEL_PRICING["sonnet"]
+
+
+@dataclass
+class LLMResult:
+    """Text and usage of one gateway completion."""
+    text: str
+    model: str
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_write_tokens: int = 0
+    cache_read_tokens: int = 0
+    cached: bool = False  # Served from the response cache
+
+    @property
+    def cost_usd(self) -> float:
+        if self.cached:
+            return 0.0
+        return estimate_cost(
+            self.model, self.input_tokens, self.output_tokens,
+            self.cache_write_tokens, self.cache_read_tokens,
+        )
+
+
+def estimate_cost(
+    model: str,
+    input_tokens: int,
+    output_tokens: int,
+    cache_write_tokens: int = 0,
+    cache_read_tokens: int = 0,
+) -> float:
+    """Estimate the USD cost of a call from its token usage."""
+    prices = next((p for family, p in MODEL_PRICING.items() if family in model), DEFAULT_PRICING)
+    return (
+        input_tokens * prices[0]
+        + output_tokens * prices[1]
+        + cache_write_tokens * prices[2]
+        + cache_read_tokens * prices[3]
+    ) / 1_000_000
+
+
+class _LoopState:
+    """Client, semaphores and in-flight calls bound to one event loop."""
+
+    def __init__(self, client: Any, max_concurrency: int):
+        self.client = client
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.user_semaphores: "weakref.WeakValueDictionary[int, asyncio.Semaphore]" = weakref.WeakValueDictionary()
+        self.inflight: Dict[str, asyncio.Future] = {}
+
+
+class LLMGateway:
+    """
+    Single entry point for Claude completions.
+
+    Callers pass the prompt plus an optional shared_context; the context is
+    sent first with cache_control so Anthropic prompt caching applies to it
+    across calls. Raises the underlying API error on failure so callers keep
+    their existing fallback handling.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = LLM_MAX_CONCURRENCY,
+        max_concurrency_per_user: int = LLM_MAX_CONCURRENCY_PER_USER,
+        client_factory: Optional[Callable[[], Any]] = None,
+    ):
+        self.max_concurrency = max_concurrency
+        self.max_concurrency_per_user = max_concurrency_per_user
+        self._client_factory = client_factory or self._default_client
+        self._states: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    @property
+    def is_configured(self) -> bool:
+        """Whether an API key is available."""
+        return bool(os.getenv("ANTHROPIC_API_KEY"))
+
+    @staticmethod
+    def _default_client() -> anthropic.AsyncAnthropic:
+        return anthropic.AsyncAnthropic(
+            api_key=os.getenv("ANTHROPIC_API_KEY"),
+            timeout=LLM_TIMEOUT_SECONDS,
+            max_retries=LLM_MAX_RETRIES,
+        )
+
+    def _state(self) -> _LoopState:
+        # Clients and semaphores are bound to the loop they were created on
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            state = self._states.get(loop)
+            if state is None:
+                state = _LoopState(self._client_factory(), self.max_concurrency)
+                self._states[loop] = state
+            return state
+
+    def _user_semaphore(self, state: _LoopState, user_id: Optional[int]) -> Optional[asyncio.Semaphore]:
+        if user_id is None:
+            return None
+        semaphore = state.user_semaphores.get(user_id)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency_per_user)
+            state.user_semaphores[user_id] = semaphore
+        return semaphore
+
+    @staticmethod
+    def request_key(
+        model: str,
+        prompt: str,
+        max_tokens: int,
+        system: Optional[str] = None,
+        shared_context: Optional[str] = None,
+        temperature: Optional[float] = None,
+    ) -> str:
+        """Hash identifying a request for memoization."""
+        payload = json.dumps(
+            [model, max_tokens, temperature, system, shared_context, prompt],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def complete(
+        self,
+        prompt: str,
+        *,
+        call_site: str,
+        model: Optional[str] = None,
+        max_tokens: int = 1024,
+        system: Optional[str] = None,
+        shared_context: Optional[str] = None,
+        temperature: Optional[float] = None,
+        user_id: Optional[int] = None,
+        cache_ttl: Optional[int] = CacheTTL.LLM_RESPONSE,
+    ) -> LLMResult:
+        """
+        Run a single-turn completion.
+
+        Args:
+            prompt: The request-specific part of the user message
+            call_site: Metric label identifying the caller (e.g. "recommendations.next_steps")
+            model: Model name (defaults to SUMMARY_GENERATION_MODEL)
+            max_tokens: Output token limit
+            system: Optional system prompt
+            shared_context: Context reused across calls (e.g. a meeting transcript),
+                sent before the prompt as a cached prefix
+            temperature: Optional sampling temperature
+            user_id: User the call is made for, for per-user concurrency limits
+            cache_ttl: Seconds to memoize the response; 0 or None disables it
+
+        Returns:
+            LLMResult with the response text and token usage
+        """
+        model = model or DEFAULT_MODEL
+        key = self.request_key(model, prompt, max_tokens, system, shared_context, temperature)
+
+        if cache_ttl:
+            cached_result = cache.get(CacheKeys.llm_response(key))
+            if cached_result is not None:
+                self._record(call_site, "cache_hit", 0.0, None)
+                return LLMResult(**{**cached_result, "cached": True})
+
+        state = self._state()
+        pending = state.inflight.get(key)
+        if pending is not None:
+            # An identical request is already running on this loop; share its result
+            result = await asyncio.shield(pending)
+            self._record(call_site, "cache_hit", 0.0, None)
+            return LLMResult(**{**asdict(result), "cached": True})
+
+        future = asyncio.get_running_loop().create_future()
+        state.inflight[key] = future
+        try:
+            result = await self._call(
+                state, call_site, model, prompt, max_tokens,
+                system, shared_context, temperature, user_id,
+            )
+            future.set_result(result)
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when nobody else is waiting
+            raise
+        finally:
+            state.inflight.pop(key, None)
+
+        if cache_ttl:
+            cache.set(CacheKeys.llm_response(key), {**asdict(result), "cached": False}, cache_ttl)
+        return result
+
+    async def _call(
+        self,
+        state: _LoopState,
+        call_site: str,
+        model: str,
+        prompt: str,
+        max_tokens: int,
+        system: Optional[str],
+        shared_context: Optional[str],
+        temperature: Optional[float],
+        user_id: Optional[int],
+    ) -> LLMResult:
+        if shared_context:
+            content: Any = [
+                {"type": "text", "text": shared_context, "cache_control": {"type": "ephemeral"}},
+                {"type": "text", "text": prompt},
+            ]
+        else:
+            content = prompt
+
+        kwargs: Dict[str, Any] = {
+            "model": model,
+            "max_tokens": max_tokens,
+            "messages": [{"role": "user", "content": content}],
+        }
+        if system:
+            kwargs["system"] = system
+        if temperature is not None:
+            kwargs["temperature"] = temperature
+
+        user_semaphore = self._user_semaphore(state, user_id)
+        start = time.perf_counter()
+        try:
+            if user_semaphore is not None:
+                async with user_semaphore, state.semaphore:
+                    response = await state.client.messages.create(**kwargs)
+            else:
+                async with state.semaphore:
+                    response = await state.client.messages.create(**kwargs)
+        except Exception:
+            self._record(call_site, "error", time.perf_counter() - start, None)
+            raise
+
+        usage = getattr(response, "usage", None)
+        result = LLMResult(
+            text="".join(getattr(block, "text", "") for block in response.content),
+            model=model,
+            input_tokens=getattr(usage, "input_tokens", 0) or 0,
+            output_tokens=getattr(usage, "output_tokens", 0) or 0,
+            cache_write_tokens=getattr(usage, "cache_creation_input_tokens", 0) or 0,
+            cache_read_tokens=getattr(usage, "cache_read_input_tokens", 0) or 0,
+        )
+        self._record(call_site, "ok", time.perf_counter() - start, result)
+        return result
+
+    def _record(self, call_site: str, outcome: str, duration: float, result: Optional[LLMResult]) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(call_site, {
+                "requests": 0, "cache_hits": 0, "errors": 0, "latency_seconds": 0.0,
+                "input_tokens": 0, "output_tokens": 0,
+                "cache_write_tokens": 0, "cache_read_tokens": 0, "cost_usd": 0.0,
+            })
+            stats["requests"] += 1
+            if outcome == "cache_hit":
+                stats["cache_hits"] += 1
+            elif outcome == "error":
+                stats["errors"] += 1
+            stats["latency_seconds"] += duration
+            if result is not None:
+                stats["input_tokens"] += result.input_tokens
+                stats["output_tokens"] += result.output_tokens
+                stats["cache_write_tokens"] += result.cache_write_tokens
+                stats["cache_read_tokens"] += result.cache_read_tokens
+                stats["cost_usd"] += result.cost_usd
+
+        if PROMETHEUS_AVAILABLE and LLM_REQUESTS_TOTAL:
+            LLM_REQUESTS_TOTAL.labels(call_site=call_site, outcome=outcome).inc()
+            if outcome != "cache_hit":
+                LLM_REQUEST_DURATION_SECONDS.labels(call_site=call_site).observe(duration)
+            if result is not None:
+                for kind in ("input", "output", "cache_write", "cache_read"):
+                    tokens = getattr(result, f"{kind}_tokens")
+                    if tokens:
+                        LLM_TOKENS_TOTAL.labels(call_site=call_site, kind=kind).inc(tokens)
+                LLM_COST_USD_TOTAL.labels(call_site=call_site).inc(result.cost_usd)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-call-site totals since process start."""
+        with self._lock:
+            return {site: dict(values) for site, values in self._stats.items()}
+
+
+# Global gateway instance
+llm_gateway = LLMGateway()
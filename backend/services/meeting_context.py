@@ -0,0 +1,257 @@
+"""
+Versioned per-meeting context snapshots.
+
+Recommendation and summary services all need the same view of a meeting:
+its metadata, summary, action items, commitments and transcript. A snapshot
+is built once with eager loading, cached in Redis as a compressed blob under
+a per-meeting version number, and reused until the meeting changes.
+
+Writes to conversations, summaries, action items or commitments bump the
+version after commit (see register_meeting_context_invalidation), so stale
+snapshots are never read again and simply expire.
+"""
+
+import base64
+import json
+import logging
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import cached_property
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, selectinload
+
+from models import Meeting, Conversation, MeetingSummary, ActionItem, Commitment
+from services.cache_service import cache, CacheKeys, CacheTTL
+from services.summary_engine import transcript_lines
+
+logger = logging.getLogger(__name__)
+
+
+# Bump when the snapshot layout changes
+SNAPSHOT_FORMAT = 1
+
+# Models whose changes invalidate their meeting's snapshot
+TRACKED_MODELS = (Meeting, Conversation, MeetingSummary, ActionItem, Commitment)
+
+
+@dataclass(frozen=True)
+class ConversationRow:
+    """Transcript-relevant fields of a Conversation."""
+    id: int
+    timestamp: Optional[datetime]
+    speaker: Optional[str]
+    heard_text: str
+    response_text: Optional[str]
+
+
+@dataclass
+class MeetingSnapshot:
+    """Read-only view of a meeting shared by AI services."""
+    meeting_id: int
+    user_id: int
+    version: int
+    context: Dict[str, Any]
+    conversations: List[ConversationRow] = field(default_factory=list)
+
+    @cached_property
+    def transcript(self) -> str:
+        return "\n".join(transcript_lines(self.conversations))
+
+    def to_blob(self) -> str:
+        """Serialize to a compact, compressed string."""
+        payload = {
+            "f": SNAPSHOT_FORMAT,
+            "m": self.meeting_id,
+            "u": self.user_id,
+            "v": self.version,
+            "c": self.context,
+            "t": [
+                [c.id, c.timestamp.isoformat() if c.timestamp else None, c.speaker, c.heard_text, c.response_text]
+                for c in self.conversations
+            ],
+        }
+        raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False, default=str)
+        return base64.b64encode(zlib.compress(raw.encode("utf-8"), 6)).decode("ascii")
+
+    @classmethod
+    def from_blob(cls, blob: str) -> Optional["MeetingSnapshot"]:
+        """Deserialize a blob, or return None if it is unreadable or outdated."""
+        try:
+            payload = json.loads(zlib.decompress(base64.b64decode(blob)))
+        except (ValueError, zlib.error):
+            return None
+        if payload.get("f") != SNAPSHOT_FORMAT:
+            return None
+        return cls(
+            meeting_id=payload["m"],
+            user_id=payload["u"],
+            version=payload["v"],
+            context=payload["c"],
+            conversations=[
+                ConversationRow(
+                    id=row[0],
+                    timestamp=datetime.fromisoformat(row[1]) if row[1] else None,
+                    speaker=row[2],
+                    heard_text=row[3],
+                    response_text=row[4],
+                )
+                for row in payload["t"]
+            ],
+        )
+
+
+def meeting_context_version(meeting_id: int) -> int:
+    """Current snapshot version of a meeting (0 until it first changes)."""
+    return cache.get(CacheKeys.meeting_context_version(meeting_id)) or 0
+
+
+def invalidate_meeting_context(meeting_id: int) -> None:
+    """Make cached snapshots of a meeting stale."""
+    cache.incr(CacheKeys.meeting_context_version(meeting_id), CacheTTL.MEETING_CONTEXT_VERSION)
+
+
+def build_meeting_snapshot(db: Session, meeting_id: int, version: int = 0) -> Optional[MeetingSnapshot]:
+    """Load a meeting and everything the AI services read about it in one pass."""
+    meeting = (
+        db.query(Meeting)
+        .options(
+            selectinload(Meeting.summary),
+            selectinload(Meeting.action_items),
+            selectinload(Meeting.commitments),
+            selectinload(Meeting.conversations),
+        )
+        .filter(Meeting.id == meeting_id)
+        .first()
+    )
+    if not meeting:
+        return None
+
+    summary = meeting.summary
+    conversations = sorted(
+        meeting.conversations,
+        key=lambda c: (c.timestamp is None, c.timestamp or datetime.min, c.id),
+    )
+
+    context = {
+        "meeting_id": meeting.id,
+        "meeting_type": meeting.meeting_type,
+        "title": meeting.title,
+        "started_at": meeting.started_at.isoformat() if meeting.started_at else None,
+        "ended_at": meeting.ended_at.isoformat() if meeting.ended_at else None,
+        "duration_seconds": meeting.duration_seconds,
+        "participant_count": meeting.participant_count,
+        "status": meeting.status,
+        "notes": meeting.notes,
+        "summary": {
+            "text": summary.summary_text if summary else None,
+            "key_points": summary.key_points if summary else [],
+            "sentiment": summary.sentiment if summary else None,
+            "topics_discussed": summary.topics_discussed if summary else [],
+            "decisions_made": summary.decisions_made if summary else [],
+        },
+        "action_items": [
+            {
+                "assignee": ai.assignee,
+                "description": ai.description,
+                "due_date": ai.due_date.isoformat() if ai.due_date else None,
+                "priority": ai.priority,
+                "status": ai.status,
+            }
+            for ai in meeting.action_items
+        ],
+        "commitments": [
+            {
+                "description": c.description,
+                "due_date": c.due_date.isoformat() if c.due_date else None,
+                "status": c.status,
+            }
+            for c in meeting.commitments
+        ],
+    }
+
+    return MeetingSnapshot(
+        meeting_id=meeting.id,
+        user_id=meeting.user_id,
+        version=version,
+        context=context,
+        conversations=[
+            ConversationRow(
+                id=c.id,
+                timestamp=c.timestamp,
+                speaker=c.speaker,
+                heard_text=c.heard_text,
+                response_text=c.response_text,
+            )
+            for c in conversations
+        ],
+    )
+
+
+def get_meeting_snapshot(db: Session, meeting_id: int) -> Optional[MeetingSnapshot]:
+    """Get the current snapshot of a meeting, building and caching it if needed."""
+    version = meeting_context_version(meeting_id)
+    key = CacheKeys.meeting_context(meeting_id, version)
+
+    blob = cache.get(key)
+    if blob:
+        snapshot = MeetingSnapshot.from_blob(blob)
+        if snapshot is not None:
+            return snapshot
+
+    snapshot = build_meeting_snapshot(db, meeting_id, version)
+    if snapshot is not None:
+        # Written under the version read before building, so a concurrent
+        # invalidation leaves this entry orphaned rather than current
+        cache.set(key, snapshot.to_blob(), CacheTTL.MEETING_CONTEXT)
+    return snapshot
+
+
+# =============================================================================
+# INVALIDATION
+# =============================================================================
+
+_SESSION_INFO_KEY = "meeting_context_dirty"
+
+
+def _changed_meeting_id(obj: Any) -> Optional[int]:
+    if isinstance(obj, Meeting):
+        return obj.id
+    return getattr(obj, "meeting_id", None)
+
+
+def _collect_changed_meetings(session: Session, flush_context) -> None:
+    dirty = session.info.setdefault(_SESSION_INFO_KEY, set())
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, TRACKED_MODELS):
+            meeting_id = _changed_meeting_id(obj)
+            if meeting_id is not None:
+                dirty.add(meeting_id)
+
+
+def _invalidate_committed_meetings(session: Session) -> None:
+    for meeting_id in session.info.pop(_SESSION_INFO_KEY, ()):
+        invalidate_meeting_context(meeting_id)
+
+
+def _discard_changed_meetings(session: Session) -> None:
+    session.info.pop(_SESSION_INFO_KEY, None)
+
+
+def register_meeting_context_invalidation() -> None:
+    """
+    Invalidate meeting snapshots whenever tracked rows change.
+
+    Meeting ids touched in a flush are remembered on the session and their
+    snapshot version is bumped once the transaction commits. Bulk
+    query().update()/delete() bypass this and must call
+    invalidate_meeting_context themselves.
+    """
+    if event.contains(Session, "after_flush", _collect_changed_meetings):
+        return
+    # after_flush still sees the flushed objects in new/dirty/deleted, with ids assigned
+    event.listen(Session, "after_flush", _collect_changed_meetings)
+    event.listen(Session, "after_commit", _invalidate_committed_meetings)
+    event.listen(Session, "after_rollback", _discard_changed_meetings)
@@ -11,7 +11,8 @@ PRIVACY-FIRST DESIGN - ALL PLATFORMS:
 
 This service provides:
 - Unified interface for all video platforms
-- Meeting schedule aggregation
+- Meeting schedule aggregation (platforms fetched concurrently, Google and
+  Outlook calendars read from the local event cache)
 - Active meeting detection
 - Desktop app coordination
 
@@ -25,14 +26,16 @@ SUPPORTED PLATFORMS:
 - Generic (calendar-based detection)
 """
 
+import asyncio
 import logging
+import time
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List
 from enum import Enum
 
 from sqlalchemy.orm import Session
 
-from models import UserIntegration
+from models import User, UserIntegration
 
 logger = logging.getLogger("meeting_detector")
 
@@ -72,6 +75,9 @@ class MeetingDetector:
         """
         Get all upcoming meetings across all connected platforms.
 
+        Platforms are queried concurrently; connected Google and Outlook
+        calendars are read from the local event cache.
+
         Returns unified list sorted by start time.
         """
         if not from_date:
@@ -91,20 +97,81 @@ class MeetingDetector:
             ])
         ).all()
 
-        for integration in integrations:
-            try:
-                meetings = await self._get_meetings_for_platform(
-                    integration, from_date, to_date
-                )
-                all_meetings.extend(meetings)
-            except Exception as e:
-                logger.error(f"Error getting meetings for {integration.provider}: {e}")
+        results = await asyncio.gather(*(
+            self._timed_meetings_for_platform(integration, from_date, to_date)
+            for integration in integrations
+        ), return_exceptions=True)
+
+        for integration, result in zip(integrations, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error getting meetings for {integration.provider}: {result}")
+                continue
+            all_meetings.extend(result)
+
+        # Calendar events not already known from a platform
+        known_links = {m.get("join_url") for m in all_meetings if m.get("join_url")}
+        for meeting in await self._get_calendar_meetings(user_id, from_date, to_date):
+            if meeting["join_url"] and meeting["join_url"] in known_links:
+                continue
+            all_meetings.append(meeting)
 
         # Sort by start time
         all_meetings.sort(key=lambda m: m.get("start_time") or "")
 
         return all_meetings
 
+    async def _timed_meetings_for_platform(
+        self,
+        integration: UserIntegration,
+        from_date: datetime,
+        to_date: datetime,
+    ) -> List[Dict]:
+        """Get a platform's meetings, counting and timing the fetch."""
+        from services.calendar_sync import record_fetch
+
+        started = time.perf_counter()
+        try:
+            meetings = await self._get_meetings_for_platform(integration, from_date, to_date)
+        except Exception:
+            record_fetch(integration.provider, "meetings", "error", time.perf_counter() - started)
+            raise
+        record_fetch(integration.provider, "meetings", "success", time.perf_counter() - started)
+        return meetings
+
+    async def _get_calendar_meetings(
+        self,
+        user_id: int,
+        from_date: datetime,
+        to_date: datetime,
+    ) -> List[Dict]:
+        """Meetings from the user's cached Google and Outlook calendars."""
+        from services.calendar_sync import calendar_sync
+
+        user = self.db.query(User).filter(User.id == user_id).first()
+        if not user:
+            return []
+
+        meetings = []
+        for event in await calendar_sync.get_upcoming_events(self.db, user, from_date, to_date):
+            # Only real meetings: something to join or someone to meet
+            if not event.meeting_link and not event.attendees:
+                continue
+            platform = (
+                self.detect_platform_from_url(event.meeting_link)
+                if event.meeting_link else MeetingPlatform.GENERIC
+            )
+            meetings.append({
+                "id": event.id,
+                "topic": event.title,
+                "start_time": event.start_time.isoformat() + "Z",
+                "duration": int((event.end_time - event.start_time).total_seconds() / 60),
+                "join_url": event.meeting_link,
+                "attendees": event.attendees,
+                "platform": platform.value,
+                "calendar_provider": event.calendar_provider,
+            })
+        return meetings
+
     async def _get_meetings_for_platform(
         self,
         integration: UserIntegration,
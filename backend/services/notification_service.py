@@ -301,45 +301,37 @@ class NotificationService:
             return {"success": False, "error": "In-app notifications not configured"}
 
     async def _send_webhook(self, notification: Notification, user: User) -> Dict:
-        """Deliver notification via user's configured webhooks."""
+        """Queue notification delivery to the user's configured webhooks."""
         from models import Webhook
-        import httpx
+        from services.webhook_delivery import webhook_engine, DeliveryTarget
 
         webhooks = self.db.query(Webhook).filter(
             Webhook.user_id == user.id,
             Webhook.is_active == True,
-            Webhook.events.contains([notification.type.value]),
         ).all()
+        targets = [
+            DeliveryTarget.for_webhook(webhook)
+            for webhook in webhooks
+            if notification.type.value in (webhook.events or [])
+        ]
+        if not targets:
+            return {"webhooks": []}
+
+        payload = {
+            "event": notification.type.value,
+            "title": notification.title,
+            "message": notification.message,
+            "data": notification.data,
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+        delivery_ids = webhook_engine.queue_event(self.db, targets, notification.type.value, payload)
 
-        results = []
-        for webhook in webhooks:
-            try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(
-                        webhook.url,
-                        json={
-                            "event": notification.type.value,
-                            "title": notification.title,
-                            "message": notification.message,
-                            "data": notification.data,
-                            "timestamp": datetime.utcnow().isoformat(),
-                        },
-                        headers=webhook.custom_headers or {},
-                        timeout=10.0,
-                    )
-                    results.append({
-                        "webhook_id": webhook.id,
-                        "success": response.status_code < 400,
-                        "status_code": response.status_code,
-                    })
-            except Exception as e:
-                results.append({
-                    "webhook_id": webhook.id,
-                    "success": False,
-                    "error": str(e),
-                })
-
-        return {"webhooks": results}
+        return {
+            "webhooks": [
+                {"webhook_id": target.webhook_id, "delivery_id": delivery_id, "queued": True}
+                for target, delivery_id in zip(targets, delivery_ids)
+            ]
+        }
 
     def _build_email_html(self, notification: Notification) -> str:
         """Build HTML email content."""
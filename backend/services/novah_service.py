@@ -11,9 +11,54 @@ import re
 from datetime import datetime
 from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import func, or_, String
 
-from models import ChatSession, ChatMessage, KnowledgeBaseArticle, User
+from models import ChatSession, ChatMessage, User
+from services.knowledge_base_index import KBArticle, knowledge_base_index
+
+
+class KeywordMatcher:
+    """
+    Substring matcher for many keywords, compiled into a single regex.
+
+    Keywords are grouped under labels in priority order. first() returns
+    the highest-priority label with any keyword in the text, which is what
+    checking each label's keywords in turn with `in` would return, but in
+    one scan of the text.
+    """
+
+    def __init__(self, groups: Dict[str, List[str]]):
+        self._priority: Dict[str, int] = {}
+        alternatives = []
+        for label in groups:
+            # Longest first so the alternation prefers "talk to sales" over "sales"
+            for keyword in sorted(groups[label], key=len, reverse=True):
+                keyword = keyword.lower()
+                if keyword not in self._priority:
+                    self._priority[keyword] = len(alternatives)
+                    alternatives.append((label, keyword))
+        self._labels = [label for label, _ in alternatives]
+        self._label_rank = {label: rank for rank, label in enumerate(groups)}
+        # The lookahead reports a match at every start position, so keywords
+        # overlapping an earlier match are still found
+        pattern = "|".join(re.escape(keyword) for _, keyword in alternatives)
+        self._pattern = re.compile(f"(?=({pattern}))") if alternatives else None
+
+    def first(self, text_lower: str) -> Optional[str]:
+        """Highest-priority label with a keyword in the (lowercased) text."""
+        if self._pattern is None:
+            return None
+        best = None
+        for match in self._pattern.finditer(text_lower):
+            label = self._labels[self._priority[match.group(1)]]
+            if best is None or self._label_rank[label] < self._label_rank[best]:
+                best = label
+                if self._label_rank[best] == 0:
+                    break
+        return best
+
+    def search(self, text_lower: str) -> bool:
+        """Whether any keyword occurs in the (lowercased) text."""
+        return self._pattern is not None and self._pattern.search(text_lower) is not None
 
 
 class NovahService:
@@ -173,6 +218,14 @@ Just sign up at **getreadin.us/signup** to start your free trial!"""
     def __init__(self):
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
 
+        # Compiled once; every chat message is checked against these
+        self._direct_answer_matcher = KeywordMatcher({
+            topic: data["keywords"] for topic, data in self.DIRECT_ANSWERS.items()
+        })
+        self._transfer_matcher = KeywordMatcher({"transfer": self.TRANSFER_KEYWORDS})
+        self._transfer_category_matcher = KeywordMatcher(self.TRANSFER_CATEGORY_KEYWORDS)
+        self._category_matcher = KeywordMatcher(self.CATEGORY_MAPPINGS)
+
     def get_greeting(self, user_name: Optional[str] = None) -> str:
         """Get a random greeting message, personalized with user's name if available."""
         import random
@@ -183,69 +236,26 @@ Just sign up at **getreadin.us/signup** to start your free trial!"""
 
     def get_direct_answer(self, message: str) -> Optional[str]:
         """Check if message matches a direct answer topic."""
-        message_lower = message.lower()
-
-        for topic, data in self.DIRECT_ANSWERS.items():
-            for keyword in data["keywords"]:
-                if keyword in message_lower:
-                    return data["response"]
-
-        return None
+        topic = self._direct_answer_matcher.first(message.lower())
+        return self.DIRECT_ANSWERS[topic]["response"] if topic else None
 
     def search_knowledge_base(
         self, query: str, db: Session, limit: int = 5
-    ) -> List[KnowledgeBaseArticle]:
-        """Search the knowledge base for relevant articles."""
-        query_lower = query.lower()
-        words = query_lower.split()
-
-        # Build search conditions
-        conditions = []
-        for word in words:
-            if len(word) > 2:  # Skip short words
-                conditions.append(KnowledgeBaseArticle.title.ilike(f"%{word}%"))
-                conditions.append(KnowledgeBaseArticle.content.ilike(f"%{word}%"))
-                conditions.append(KnowledgeBaseArticle.summary.ilike(f"%{word}%"))
-                # Also search tags
-                conditions.append(KnowledgeBaseArticle.tags.cast(String).ilike(f"%{word}%"))
-
-        if not conditions:
-            return []
-
-        articles = db.query(KnowledgeBaseArticle).filter(
-            KnowledgeBaseArticle.is_published == True,
-            or_(*conditions)
-        ).limit(limit).all()
-
-        return articles
+    ) -> List[KBArticle]:
+        """Search the knowledge base for relevant articles, best match first."""
+        return knowledge_base_index.search(db, query, limit)
 
     def detect_category(self, message: str) -> str:
         """Detect the category of the user's message."""
-        message_lower = message.lower()
-
-        for category, keywords in self.CATEGORY_MAPPINGS.items():
-            for keyword in keywords:
-                if keyword in message_lower:
-                    return category
-
-        return "general"
+        return self._category_matcher.first(message.lower()) or "general"
 
     def detect_transfer_category(self, message: str) -> Optional[str]:
         """Detect if message contains a transfer category (sales/billing/technical)."""
-        message_lower = message.lower()
-        for category, keywords in self.TRANSFER_CATEGORY_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword in message_lower:
-                    return category
-        return None
+        return self._transfer_category_matcher.first(message.lower())
 
     def wants_to_transfer(self, message: str) -> bool:
         """Check if user explicitly wants to talk to a human."""
-        message_lower = message.lower()
-        for keyword in self.TRANSFER_KEYWORDS:
-            if keyword in message_lower:
-                return True
-        return False
+        return self._transfer_matcher.search(message.lower())
 
     def generate_response(
         self,
@@ -316,7 +326,6 @@ Just sign up at **getreadin.us/signup** to start your free trial!"""
             }
 
         # Search knowledge base
-        from sqlalchemy import String
         articles = self.search_knowledge_base(message, db)
 
         # Generate response based on articles found
@@ -347,7 +356,7 @@ Just sign up at **getreadin.us/signup** to start your free trial!"""
         }
 
     def _format_article_response(
-        self, message: str, articles: List[KnowledgeBaseArticle]
+        self, message: str, articles: List[KBArticle]
     ) -> str:
         """Format a response based on found articles."""
         if len(articles) == 1:
@@ -4,11 +4,11 @@ import os
 import json
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
-import anthropic
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
 from models import Conversation, UserLearningProfile, Meeting, User
+from services.llm_gateway import llm_gateway
 
 
 class PatternAnalyzer:
@@ -16,7 +16,7 @@ class PatternAnalyzer:
 
     def __init__(self, db: Session):
         self.db = db
-        self.client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+        self.client = llm_gateway
         self.model = os.getenv("TOPIC_EXTRACTION_MODEL", "claude-3-haiku-20240307")
 
     async def analyze_user_patterns(
@@ -77,13 +77,15 @@ Provide analysis in this JSON format:
 }}"""
 
         try:
-            response = self.client.messages.create(
+            response = await self.client.complete(
+                prompt,
+                call_site="patterns.analyze",
                 model=self.model,
                 max_tokens=1024,
-                messages=[{"role": "user", "content": prompt}],
+                user_id=user_id,
             )
 
-            content = response.content[0].text
+            content = response.text
             if "```json" in content:
                 content = content.split("```json")[1].split("```")[0]
             elif "```" in content:
@@ -194,13 +196,14 @@ Format as JSON:
 }}"""
 
         try:
-            response = self.client.messages.create(
+            response = await self.client.complete(
+                prompt,
+                call_site="patterns.generate_suggestion",
                 model=self.model,
                 max_tokens=512,
-                messages=[{"role": "user", "content": prompt}],
             )
 
-            content = response.content[0].text
+            content = response.text
             if "```" in content:
                 content = content.split("```")[1].split("```")[0]
                 if content.startswith("json"):
@@ -250,13 +253,15 @@ Provide a comparison in JSON:
 }}"""
 
         try:
-            response = self.client.messages.create(
+            response = await self.client.complete(
+                prompt,
+                call_site="patterns.compare_with_profession",
                 model=self.model,
                 max_tokens=1024,
-                messages=[{"role": "user", "content": prompt}],
+                user_id=user_id,
             )
 
-            content = response.content[0].text
+            content = response.text
             if "```" in content:
                 content = content.split("```")[1].split("```")[0]
                 if content.startswith("json"):
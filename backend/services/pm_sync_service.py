@@ -7,13 +7,15 @@ project management tools like Notion, Asana, Linear, and Jira.
 This service is called when:
 - Action items are created
 - Action items are updated
-- Status changes in external systems need to be synced back
+- A provider webhook reports a task change (applied incrementally)
+- The periodic reconciliation sweep pulls statuses for anything missed
 """
 
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from models import (
@@ -21,16 +23,43 @@ from models import (
     ProjectManagementConnection,
     ActionItemSync,
     IntegrationProvider,
+    PMWebhookEvent,
 )
-from integrations.project_management.base import TaskData, TaskStatus, SyncResult
+from integrations.project_management.base import TaskData, TaskStatus, SyncResult, WebhookEvent
 from integrations.project_management.notion import NotionIntegration
 from integrations.project_management.asana import AsanaIntegration
 from integrations.project_management.linear import LinearIntegration
 from integrations.project_management.jira import JiraIntegration
 from integrations.project_management.monday import MondayIntegration
+from services.meeting_context import invalidate_meeting_context
 
 logger = logging.getLogger("pm_sync_service")
 
+# How long applied webhook event IDs are kept for dedup
+WEBHOOK_EVENT_RETENTION = timedelta(days=7)
+
+try:
+    from prometheus_client import Counter
+
+    PM_WEBHOOK_EVENTS = Counter(
+        "pm_webhook_events_total",
+        "Inbound project management webhook events",
+        ["provider", "outcome"],  # accepted, duplicate, invalid_signature, failed
+    )
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
+
+class WebhookEventsNotApplied(Exception):
+    """Some webhook events could not be applied and should be redelivered."""
+
+
+def record_webhook_outcome(provider: str, outcome: str, count: int = 1) -> None:
+    """Count inbound webhook events by outcome."""
+    if PROMETHEUS_AVAILABLE and count:
+        PM_WEBHOOK_EVENTS.labels(provider=provider, outcome=outcome).inc(count)
+
 
 class PMSyncService:
     """
@@ -263,8 +292,9 @@ class PMSyncService:
         """
         Sync status changes from external PM tool back to ReadIn.
 
-        This checks the status of all synced items and updates
-        the local ActionItem status if it has changed.
+        Fetches the status of all synced items in bulk through the
+        integration's get_statuses() and updates the local ActionItem
+        status of those that have changed.
 
         Args:
             user_id: The user's ID
@@ -284,7 +314,6 @@ class PMSyncService:
         if not connection:
             return updated_items
 
-        # Get all syncs for this connection
         syncs = self.db.query(ActionItemSync).filter(
             ActionItemSync.connection_id == connection.id
         ).all()
@@ -295,48 +324,263 @@ class PMSyncService:
         integration = self._get_integration(provider, connection)
 
         try:
+            external_statuses = await integration.get_statuses(
+                [sync.external_id for sync in syncs]
+            )
+        except Exception as e:
+            logger.error(f"Error fetching statuses from {provider}: {e}")
             for sync in syncs:
-                action_item = self.db.query(ActionItem).filter(
-                    ActionItem.id == sync.action_item_id
-                ).first()
+                sync.sync_errors += 1
+                sync.last_error = str(e)
+            self.db.commit()
+            return updated_items
+        finally:
+            await integration.close()
 
-                if not action_item:
-                    continue
+        updated_items = self._apply_external_statuses(connection, syncs, external_statuses)
+        self.db.commit()
+        self._invalidate_meeting_contexts(updated_items)
+        return updated_items
 
-                try:
-                    external_status = await integration.sync_status(sync.external_id)
-                    if external_status:
-                        # Map external status to internal status
-                        internal_status = self._map_external_status(external_status)
+    async def apply_webhook_events(
+        self,
+        provider: str,
+        events: List[WebhookEvent],
+        connection_id: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Apply task changes delivered by a provider webhook.
 
-                        if internal_status != action_item.status:
-                            old_status = action_item.status
-                            action_item.status = internal_status
+        Events seen before are skipped. A status carried in the event is
+        mapped through the integration's map_status_from_external(); tasks
+        whose events only name them are looked up with one get_statuses()
+        call per connection.
 
-                            if internal_status == "completed":
-                                action_item.completed_at = datetime.utcnow()
+        Args:
+            provider: The PM provider the webhook came from
+            events: Verified events from the provider's parse_webhook()
+            connection_id: The connection the webhook belongs to, for
+                providers that register one per connection; only its
+                tasks are updated
 
-                            sync.last_synced_at = datetime.utcnow()
-                            sync.last_external_status = external_status.value
+        Returns:
+            List of items that were updated
 
-                            updated_items.append({
-                                "action_item_id": action_item.id,
-                                "old_status": old_status,
-                                "new_status": internal_status,
-                                "external_status": external_status.value,
-                            })
+        Raises:
+            WebhookEventsNotApplied: A connection's statuses could not be
+                fetched. Changes for the other connections are committed
+                and the failed events are forgotten, so a redelivery
+                applies them.
+        """
+        updated_items = []
+        failed_event_ids = set()
 
-                except Exception as e:
-                    logger.error(f"Error syncing item {sync.external_id}: {e}")
-                    sync.sync_errors += 1
-                    sync.last_error = str(e)
+        events = self._record_webhook_events(provider, events)
+        if not events:
+            return updated_items
 
-        finally:
-            await integration.close()
+        syncs = self.db.query(ActionItemSync).join(ProjectManagementConnection).filter(
+            ProjectManagementConnection.provider == provider,
+            ProjectManagementConnection.is_active == True,
+            ActionItemSync.external_id.in_({event.external_id for event in events}),
+        )
+        if connection_id is not None:
+            syncs = syncs.filter(ActionItemSync.connection_id == connection_id)
+        syncs = syncs.all()
+
+        syncs_by_connection: Dict[int, List[ActionItemSync]] = {}
+        for sync in syncs:
+            syncs_by_connection.setdefault(sync.connection_id, []).append(sync)
+
+        for connection_syncs in syncs_by_connection.values():
+            connection = connection_syncs[0].connection
+            linked_ids = {sync.external_id for sync in connection_syncs}
+            integration = self._get_integration(provider, connection)
+
+            try:
+                # Later events for the same task win
+                external_statuses: Dict[str, TaskStatus] = {}
+                to_fetch = []
+                for event in events:
+                    if event.external_id not in linked_ids:
+                        continue
+                    if event.external_status is None:
+                        to_fetch.append(event.external_id)
+                    else:
+                        external_statuses[event.external_id] = (
+                            integration.map_status_from_external(event.external_status)
+                        )
+
+                to_fetch = [i for i in dict.fromkeys(to_fetch) if i not in external_statuses]
+                if to_fetch:
+                    external_statuses.update(await integration.get_statuses(to_fetch))
+
+            except Exception as e:
+                logger.error(f"Error applying {provider} webhook events: {e}")
+                connection.error_count += 1
+                connection.last_error = str(e)
+                failed_event_ids.update(
+                    event.event_id for event in events if event.external_id in linked_ids
+                )
+                continue
+            finally:
+                await integration.close()
+
+            updated_items.extend(
+                self._apply_external_statuses(connection, connection_syncs, external_statuses)
+            )
+            connection.last_webhook_at = datetime.utcnow()
+
+        if failed_event_ids:
+            self.db.query(PMWebhookEvent).filter(
+                PMWebhookEvent.provider == provider,
+                PMWebhookEvent.event_id.in_(failed_event_ids),
+            ).delete(synchronize_session=False)
 
         self.db.commit()
+        self._invalidate_meeting_contexts(updated_items)
+
+        if failed_event_ids:
+            record_webhook_outcome(provider, "failed", len(failed_event_ids))
+            raise WebhookEventsNotApplied(
+                f"{len(failed_event_ids)} {provider} webhook event(s) could not be applied"
+            )
         return updated_items
 
+    def _record_webhook_events(
+        self,
+        provider: str,
+        events: List[WebhookEvent],
+    ) -> List[WebhookEvent]:
+        """
+        Record webhook events as seen and return the ones that are new.
+
+        The records are committed together with the changes the events
+        make, so a failed delivery is applied again when it is retried.
+        """
+        unique_events = {event.event_id: event for event in events}
+        if not unique_events:
+            return []
+
+        seen = {
+            event_id for (event_id,) in self.db.query(PMWebhookEvent.event_id).filter(
+                PMWebhookEvent.provider == provider,
+                PMWebhookEvent.event_id.in_(unique_events),
+            ).all()
+        }
+
+        new_events = [event for event_id, event in unique_events.items() if event_id not in seen]
+        for event in new_events:
+            self.db.add(PMWebhookEvent(provider=provider, event_id=event.event_id))
+
+        try:
+            self.db.flush()
+        except IntegrityError:
+            # A concurrent delivery of the same events got there first
+            self.db.rollback()
+            new_events = []
+
+        record_webhook_outcome(provider, "duplicate", len(events) - len(new_events))
+        record_webhook_outcome(provider, "accepted", len(new_events))
+        return new_events
+
+    def prune_webhook_events(self, older_than: timedelta = WEBHOOK_EVENT_RETENTION) -> int:
+        """
+        Delete dedup records of webhook events older than ``older_than``.
+
+        Providers stop redelivering long before then.
+
+        Returns:
+            Number of records deleted
+        """
+        deleted = self.db.query(PMWebhookEvent).filter(
+            PMWebhookEvent.received_at < datetime.utcnow() - older_than
+        ).delete(synchronize_session=False)
+        self.db.commit()
+        return deleted
+
+    def _apply_external_statuses(
+        self,
+        connection: ProjectManagementConnection,
+        syncs: List[ActionItemSync],
+        external_statuses: Dict[str, TaskStatus],
+    ) -> List[Dict[str, Any]]:
+        """
+        Apply fetched external statuses to the linked action items.
+
+        The action items are loaded with one query and the changes are
+        grouped by value, so each group is a single UPDATE. Does not commit;
+        the caller passes the result to _invalidate_meeting_contexts() after
+        committing, as bulk UPDATEs bypass the session's snapshot hooks.
+
+        Returns:
+            List of items that were updated
+        """
+        updated_items = []
+
+        current_statuses = {}
+        meeting_ids = {}
+        for item_id, status, meeting_id in self.db.query(
+            ActionItem.id, ActionItem.status, ActionItem.meeting_id
+        ).filter(
+            ActionItem.id.in_({sync.action_item_id for sync in syncs}),
+            ActionItem.user_id == connection.user_id,
+        ):
+            current_statuses[item_id] = status
+            meeting_ids[item_id] = meeting_id
+
+        now = datetime.utcnow()
+        items_by_status: Dict[str, List[int]] = {}
+        syncs_by_status: Dict[str, List[int]] = {}
+
+        for sync in syncs:
+            external_status = external_statuses.get(sync.external_id)
+            if not external_status or sync.action_item_id not in current_statuses:
+                continue
+
+            syncs_by_status.setdefault(external_status.value, []).append(sync.id)
+
+            old_status = current_statuses[sync.action_item_id]
+            internal_status = self._map_external_status(external_status)
+            if internal_status == old_status:
+                continue
+
+            # An item linked twice on the same connection changes once
+            current_statuses[sync.action_item_id] = internal_status
+            items_by_status.setdefault(internal_status, []).append(sync.action_item_id)
+            updated_items.append({
+                "action_item_id": sync.action_item_id,
+                "meeting_id": meeting_ids[sync.action_item_id],
+                "old_status": old_status,
+                "new_status": internal_status,
+                "external_status": external_status.value,
+            })
+
+        for internal_status, item_ids in items_by_status.items():
+            values = {"status": internal_status, "updated_at": now}
+            if internal_status == "completed":
+                values["completed_at"] = now
+            self.db.query(ActionItem).filter(
+                ActionItem.id.in_(item_ids)
+            ).update(values, synchronize_session=False)
+
+        for external_status, sync_ids in syncs_by_status.items():
+            self.db.query(ActionItemSync).filter(
+                ActionItemSync.id.in_(sync_ids)
+            ).update(
+                {"last_synced_at": now, "last_external_status": external_status},
+                synchronize_session=False,
+            )
+
+        connection.last_sync_at = now
+        return updated_items
+
+    @staticmethod
+    def _invalidate_meeting_contexts(updated_items: List[Dict[str, Any]]) -> None:
+        """Make snapshots of meetings whose action items changed stale."""
+        for meeting_id in {item["meeting_id"] for item in updated_items}:
+            invalidate_meeting_context(meeting_id)
+
     def _map_external_status(self, external_status: TaskStatus) -> str:
         """Map external TaskStatus to internal status string."""
         mapping = {
@@ -18,13 +18,11 @@ import hashlib
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 
-import anthropic
 from sqlalchemy.orm import Session
 from sqlalchemy import desc, func
 
 from models import (
     Meeting,
-    Conversation,
     MeetingSummary,
     ActionItem,
     Commitment,
@@ -34,6 +32,8 @@ from models import (
 )
 from services.cache_service import cache, CacheKeys, CacheTTL
 from services.language_service import get_localized_prompt_suffix, get_fallback_message
+from services.llm_gateway import llm_gateway
+from services.meeting_context import MeetingSnapshot, get_meeting_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -53,9 +53,13 @@ class RecommendationService:
     CACHE_TTL_TOPIC_SUGGESTIONS = CacheTTL.VERY_LONG  # 1 hour
     CACHE_TTL_RISKS = CacheTTL.MEDIUM  # 5 minutes
 
+    # Transcript excerpt shared by per-meeting analyses (cached prompt prefix)
+    TRANSCRIPT_EXCERPT_CHARS = 8000
+
     def __init__(self, db: Session):
         self.db = db
-        self.client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+        self.client = llm_gateway
+        self._snapshots: Dict[int, Optional[MeetingSnapshot]] = {}
         self.model = os.getenv(
             "RECOMMENDATION_MODEL",
             os.getenv("SUMMARY_GENERATION_MODEL", "claude-sonnet-4-20250514")
@@ -71,90 +75,34 @@ class RecommendationService:
         user = self.db.query(User).filter(User.id == user_id).first()
         return getattr(user, 'preferred_language', 'en') or 'en' if user else 'en'
 
+    def _get_snapshot(self, meeting_id: int) -> Optional[MeetingSnapshot]:
+        """Get the shared meeting snapshot, memoized for this service instance."""
+        if meeting_id not in self._snapshots:
+            self._snapshots[meeting_id] = get_meeting_snapshot(self.db, meeting_id)
+        return self._snapshots[meeting_id]
+
     def _get_meeting_transcript(self, meeting_id: int) -> str:
-        """Build transcript from meeting conversations."""
-        conversations = (
-            self.db.query(Conversation)
-            .filter(Conversation.meeting_id == meeting_id)
-            .order_by(Conversation.timestamp)
-            .all()
-        )
+        """Get the meeting transcript from the shared snapshot."""
+        snapshot = self._get_snapshot(meeting_id)
+        return snapshot.transcript if snapshot else ""
+
+    def _meeting_prompt_context(self, context: Dict[str, Any], transcript: str) -> str:
+        """
+        Render meeting context and transcript as a shared prompt prefix.
 
-        if not conversations:
-            return ""
+        Analyses of the same meeting send an identical prefix so the LLM
+        gateway's prompt caching bills the transcript once across them.
+        """
+        return f"""Meeting Context:
+{json.dumps(context, indent=2)}
 
-        lines = []
-        for conv in conversations:
-            time_str = conv.timestamp.strftime("%H:%M") if conv.timestamp else ""
-            speaker = conv.speaker or "Unknown"
-            lines.append(f"[{time_str}] {speaker}: {conv.heard_text}")
-            if conv.response_text:
-                lines.append(f"[{time_str}] AI Response: {conv.response_text}")
-        return "\n".join(lines)
+Meeting Transcript (excerpt):
+{transcript[:self.TRANSCRIPT_EXCERPT_CHARS] if transcript else 'No transcript available'}"""
 
     def _get_meeting_context(self, meeting_id: int) -> Dict[str, Any]:
         """Get comprehensive meeting context for AI analysis."""
-        meeting = self.db.query(Meeting).filter(Meeting.id == meeting_id).first()
-        if not meeting:
-            return {}
-
-        # Get summary if available
-        summary = (
-            self.db.query(MeetingSummary)
-            .filter(MeetingSummary.meeting_id == meeting_id)
-            .first()
-        )
-
-        # Get action items
-        action_items = (
-            self.db.query(ActionItem)
-            .filter(ActionItem.meeting_id == meeting_id)
-            .all()
-        )
-
-        # Get commitments
-        commitments = (
-            self.db.query(Commitment)
-            .filter(Commitment.meeting_id == meeting_id)
-            .all()
-        )
-
-        return {
-            "meeting_id": meeting.id,
-            "meeting_type": meeting.meeting_type,
-            "title": meeting.title,
-            "started_at": meeting.started_at.isoformat() if meeting.started_at else None,
-            "ended_at": meeting.ended_at.isoformat() if meeting.ended_at else None,
-            "duration_seconds": meeting.duration_seconds,
-            "participant_count": meeting.participant_count,
-            "status": meeting.status,
-            "notes": meeting.notes,
-            "summary": {
-                "text": summary.summary_text if summary else None,
-                "key_points": summary.key_points if summary else [],
-                "sentiment": summary.sentiment if summary else None,
-                "topics_discussed": summary.topics_discussed if summary else [],
-                "decisions_made": summary.decisions_made if summary else [],
-            },
-            "action_items": [
-                {
-                    "assignee": ai.assignee,
-                    "description": ai.description,
-                    "due_date": ai.due_date.isoformat() if ai.due_date else None,
-                    "priority": ai.priority,
-                    "status": ai.status,
-                }
-                for ai in action_items
-            ],
-            "commitments": [
-                {
-                    "description": c.description,
-                    "due_date": c.due_date.isoformat() if c.due_date else None,
-                    "status": c.status,
-                }
-                for c in commitments
-            ],
-        }
+        snapshot = self._get_snapshot(meeting_id)
+        return snapshot.context if snapshot else {}
 
     async def get_next_steps(
         self,
@@ -182,18 +130,17 @@ class RecommendationService:
         if cached is not None:
             return cached
 
-        # Get meeting and verify ownership
-        meeting = self.db.query(Meeting).filter(Meeting.id == meeting_id).first()
-        if not meeting:
+        # Get meeting snapshot (context and transcript in one cached read)
+        snapshot = self._get_snapshot(meeting_id)
+        if not snapshot:
             return []
 
         # Get language preference
         if language is None:
-            language = self._get_user_language(meeting.user_id)
+            language = self._get_user_language(snapshot.user_id)
 
-        # Get meeting context
-        context = self._get_meeting_context(meeting_id)
-        transcript = self._get_meeting_transcript(meeting_id)
+        context = snapshot.context
+        transcript = snapshot.transcript
 
         if not context and not transcript:
             return []
@@ -201,13 +148,7 @@ class RecommendationService:
         # Generate next steps with Claude
         language_instruction = get_localized_prompt_suffix(language)
 
-        prompt = f"""Based on this meeting, suggest {max_steps} specific, actionable next steps.
-
-Meeting Context:
-{json.dumps(context, indent=2)}
-
-Meeting Transcript (excerpt):
-{transcript[:3000] if transcript else 'No transcript available'}
+        prompt = f"""Based on the meeting above, suggest {max_steps} specific, actionable next steps.
 
 Consider:
 1. Action items already identified
@@ -223,13 +164,16 @@ Order by priority (most important first).
 Format: ["Step 1", "Step 2", ...]{language_instruction}"""
 
         try:
-            response = self.client.messages.create(
+            response = await self.client.complete(
+                prompt,
+                call_site="recommendations.next_steps",
+                shared_context=self._meeting_prompt_context(context, transcript),
                 model=self.model,
                 max_tokens=1024,
-                messages=[{"role": "user", "content": prompt}],
+                user_id=snapshot.user_id,
             )
 
-            content = response.content[0].text
+            content = response.text
             if "```json" in content:
                 content = content.split("```json")[1].split("```")[0]
             elif "```" in content:
@@ -366,7 +310,7 @@ Format: ["Step 1", "Step 2", ...]{language_instruction}"""
             "frequent_topics": [t.name for t in user_topics],
         }
 
-        prompt = f"""Generate comprehensive meeting preparation hints based on this context.
+        prompt = f"""Generate comprehensive meeting preparation hints for the meeting above, based on this context.
 
 Meeting to prepare for:
 - Type: {meeting.meeting_type}
@@ -389,13 +333,18 @@ Generate preparation hints in this JSON format:
 }}{language_instruction}"""
 
         try:
-            response = self.client.messages.create(
+            response = await self.client.complete(
+                prompt,
+                call_site="recommendations.meeting_prep",
+                shared_context=self._meeting_prompt_context(
+                    self._get_meeting_context(meeting_id), self._get_meeting_transcript(meeting_id)
+                ),
                 model=self.model,
                 max_tokens=2048,
-                messages=[{"role": "user", "content": prompt}],
+                user_id=meeting.user_id,
             )
 
-            content = response.content[0].text
+            content = response.text
             if "```json" in content:
                 content = content.split("```json")[1].split("```")[0]
             elif "```" in content:
@@ -519,13 +468,15 @@ Generate insights in this JSON format:
 }}{language_instruction}"""
 
         try:
-            response = self.client.messages.create(
+            response = await self.client.complete(
+                prompt,
+                call_site="recommendations.participant_insights",
                 model=self.model,
                 max_tokens=1536,
-                messages=[{"role": "user", "content": prompt}],
+                user_id=user_id,
             )
 
-            content = response.content[0].text
+            content = response.text
             if "```json" in content:
                 content = content.split("```json")[1].split("```")[0]
             elif "```" in content:
@@ -647,13 +598,15 @@ Each topic should be specific and relevant to professional discussions.
 Format: ["Topic 1", "Topic 2", ...]{language_instruction}"""
 
         try:
-            response = self.client.messages.create(
+            response = await self.client.complete(
+                prompt,
+                call_site="recommendations.topic_suggestions",
                 model=self.model,
                 max_tokens=1024,
-                messages=[{"role": "user", "content": prompt}],
+                user_id=user_id,
             )
 
-            content = response.content[0].text
+            content = response.text
             if "```json" in content:
                 content = content.split("```json")[1].split("```")[0]
             elif "```" in content:
@@ -698,16 +651,16 @@ Format: ["Topic 1", "Topic 2", ...]{language_instruction}"""
         if cached is not None:
             return cached
 
-        meeting = self.db.query(Meeting).filter(Meeting.id == meeting_id).first()
-        if not meeting:
+        snapshot = self._get_snapshot(meeting_id)
+        if not snapshot:
             return []
 
         if language is None:
-            language = self._get_user_language(meeting.user_id)
+            language = self._get_user_language(snapshot.user_id)
 
         # Get meeting context and transcript
-        context = self._get_meeting_context(meeting_id)
-        transcript = self._get_meeting_transcript(meeting_id)
+        context = snapshot.context
+        transcript = snapshot.transcript
 
         if not context and not transcript:
             return []
@@ -715,13 +668,7 @@ Format: ["Topic 1", "Topic 2", ...]{language_instruction}"""
         # Generate risk analysis with Claude
         language_instruction = get_localized_prompt_suffix(language)
 
-        prompt = f"""Analyze this meeting for potential risks and concerns that need attention.
-
-Meeting Context:
-{json.dumps(context, indent=2)}
-
-Meeting Transcript (excerpt):
-{transcript[:4000] if transcript else 'No transcript available'}
+        prompt = f"""Analyze the meeting above for potential risks and concerns that need attention.
 
 Identify risks in these categories:
 1. Deadlines - Unrealistic timelines, missed deadlines mentioned
@@ -754,13 +701,16 @@ Return as JSON array:
 If no significant risks are identified, return an empty array [].{language_instruction}"""
 
         try:
-            response = self.client.messages.create(
+            response = await self.client.complete(
+                prompt,
+                call_site="recommendations.detect_risks",
+                shared_context=self._meeting_prompt_context(context, transcript),
                 model=self.model,
                 max_tokens=2048,
-                messages=[{"role": "user", "content": prompt}],
+                user_id=snapshot.user_id,
             )
 
-            content = response.content[0].text
+            content = response.text
             if "```json" in content:
                 content = content.split("```json")[1].split("```")[0]
             elif "```" in content:
@@ -806,21 +756,20 @@ If no significant risks are identified, return an empty array [].{language_instr
         if cached is not None:
             return cached
 
-        meeting = self.db.query(Meeting).filter(Meeting.id == meeting_id).first()
-        if not meeting:
+        snapshot = self._get_snapshot(meeting_id)
+        if not snapshot:
             return {"error": "Meeting not found"}
 
         # Get individual recommendations (leveraging their individual caches)
         next_steps = await self.get_next_steps(meeting_id, language=language)
         risks = await self.detect_risks(meeting_id, language=language)
 
-        # Get meeting context
-        context = self._get_meeting_context(meeting_id)
+        context = snapshot.context
 
         result = {
             "meeting_id": meeting_id,
-            "meeting_title": meeting.title,
-            "meeting_type": meeting.meeting_type,
+            "meeting_title": context.get("title"),
+            "meeting_type": context.get("meeting_type"),
             "next_steps": next_steps,
             "risks": risks,
             "action_items": context.get("action_items", []),
@@ -0,0 +1,194 @@
+"""Rolling in-meeting summaries.
+
+While a meeting is active, newly stored conversations are folded into
+structured batch notes by a periodic worker sweep. When the meeting ends,
+the summary only has to reduce those notes: batches whose transcript is
+unchanged are reused as-is, and only edited batches plus the unfolded tail
+are summarized again.
+"""
+
+import logging
+import os
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from models import Meeting, Conversation, MeetingRollingSummary
+from services.summary_engine import (
+    CHARS_PER_TOKEN,
+    SectionSummarizer,
+    TranscriptSection,
+    estimate_tokens,
+    transcript_lines,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# New content is folded once at least this much has accumulated
+ROLLING_BATCH_MIN_TOKENS = int(os.getenv("ROLLING_SUMMARY_BATCH_TOKENS", "1500"))
+
+
+def meetings_pending_fold(db: Session, min_tokens: int = ROLLING_BATCH_MIN_TOKENS) -> List[int]:
+    """Return ids of active meetings with enough unfolded transcript to fold."""
+    watermark = func.coalesce(MeetingRollingSummary.last_conversation_id, 0)
+    pending_chars = func.sum(
+        func.length(Conversation.heard_text) + func.coalesce(func.length(Conversation.response_text), 0)
+    )
+
+    rows = (
+        db.query(Conversation.meeting_id)
+        .join(Meeting, Meeting.id == Conversation.meeting_id)
+        .outerjoin(MeetingRollingSummary, MeetingRollingSummary.meeting_id == Meeting.id)
+        .filter(Meeting.status == "active", Conversation.id > watermark)
+        .group_by(Conversation.meeting_id)
+        .having(pending_chars >= min_tokens * CHARS_PER_TOKEN)
+        .all()
+    )
+    return [row.meeting_id for row in rows]
+
+
+class RollingSummarizer:
+    """Maintain and consume the rolling summary state of a meeting."""
+
+    def __init__(self, db: Session, summarizer: Optional[SectionSummarizer] = None):
+        self.db = db
+        self.summarizer = summarizer or SectionSummarizer()
+
+    async def fold(
+        self,
+        meeting: Meeting,
+        language: str = "en",
+        min_tokens: int = ROLLING_BATCH_MIN_TOKENS,
+    ) -> int:
+        """
+        Fold conversations stored since the last fold into a new batch.
+
+        Does nothing until at least min_tokens of new transcript exist. The
+        state row is advanced with a conditional update on the watermark,
+        so concurrent folds of the same meeting cannot both append.
+
+        Returns:
+            Number of conversations folded
+        """
+        state = self._get_or_create_state(meeting.id)
+        if state is None:
+            return 0
+
+        watermark = state.last_conversation_id or 0
+        conversations = (
+            self.db.query(Conversation)
+            .filter(Conversation.meeting_id == meeting.id, Conversation.id > watermark)
+            .order_by(Conversation.id)
+            .all()
+        )
+        lines = transcript_lines(conversations)
+        if not conversations or estimate_tokens("\n".join(lines)) < min_tokens:
+            return 0
+
+        batches = list(state.batches or [])
+        section = TranscriptSection(index=len(batches), lines=lines)
+
+        failures = self.summarizer.failures
+        notes = (await self.summarizer.summarize_sections([section], meeting.meeting_type, language))[0]
+        if self.summarizer.failures > failures:
+            # Leave the content unfolded; the next sweep retries it
+            return 0
+
+        batches.append({
+            "last_conversation_id": conversations[-1].id,
+            "content_hash": section.content_hash,
+            "notes": notes,
+        })
+        updated = (
+            self.db.query(MeetingRollingSummary)
+            .filter(
+                MeetingRollingSummary.id == state.id,
+                MeetingRollingSummary.last_conversation_id == watermark,
+            )
+            .update(
+                {"batches": batches, "last_conversation_id": conversations[-1].id},
+                synchronize_session=False,
+            )
+        )
+        self.db.commit()
+        return len(conversations) if updated else 0
+
+    async def final_notes(
+        self,
+        meeting: Meeting,
+        conversations: List[Conversation],
+        language: str = "en",
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Build ordered section notes for the whole meeting from the rolling state.
+
+        Stored batches are reused when their transcript is unchanged; edited
+        batches and conversations after the last fold are summarized now.
+
+        Returns:
+            Notes in meeting order, or None if nothing was folded during the meeting
+        """
+        state = (
+            self.db.query(MeetingRollingSummary)
+            .filter(MeetingRollingSummary.meeting_id == meeting.id)
+            .first()
+        )
+        if not state or not state.batches:
+            return None
+
+        ordered = sorted(conversations, key=lambda c: c.id)
+        notes: List[Optional[Dict[str, Any]]] = []
+        stale: List[TranscriptSection] = []
+        slots: List[int] = []
+
+        start = 0
+        boundaries = [b["last_conversation_id"] for b in state.batches] + [None]
+        for batch, boundary in zip(list(state.batches) + [None], boundaries):
+            end = start
+            while end < len(ordered) and (boundary is None or ordered[end].id <= boundary):
+                end += 1
+            lines = transcript_lines(ordered[start:end])
+            start = end
+            if not lines:
+                continue
+
+            section = TranscriptSection(index=len(notes), lines=lines)
+            if batch is not None and batch["content_hash"] == section.content_hash:
+                notes.append(batch["notes"])
+            else:
+                slots.append(len(notes))
+                stale.append(section)
+                notes.append(None)
+
+        if stale:
+            fresh = await self.summarizer.summarize_sections(stale, meeting.meeting_type, language)
+            for slot, section_notes in zip(slots, fresh):
+                notes[slot] = section_notes
+
+        logger.info(
+            f"Rolling summary for meeting {meeting.id}: reused {len(notes) - len(stale)} batches, "
+            f"summarized {len(stale)}"
+        )
+        return notes
+
+    def _get_or_create_state(self, meeting_id: int) -> Optional[MeetingRollingSummary]:
+        state = (
+            self.db.query(MeetingRollingSummary)
+            .filter(MeetingRollingSummary.meeting_id == meeting_id)
+            .first()
+        )
+        if state:
+            return state
+
+        state = MeetingRollingSummary(meeting_id=meeting_id, batches=[], last_conversation_id=0)
+        self.db.add(state)
+        try:
+            self.db.commit()
+        except IntegrityError:
+            # Created concurrently by another fold
+            self.db.rollback()
+            return None
+        return state
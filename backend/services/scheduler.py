@@ -88,6 +88,16 @@ class SchedulerService:
             replace_existing=True,
         )
 
+        # Write agent chat loads back to the database every few seconds
+        from services.agent_router import AGENT_ROUTING_FLUSH_SECONDS
+
+        self.scheduler.add_job(
+            self._flush_agent_routing,
+            IntervalTrigger(seconds=AGENT_ROUTING_FLUSH_SECONDS),
+            id="agent_routing_flush",
+            replace_existing=True,
+        )
+
         self.scheduler.start()
         self._is_running = True
         print("Scheduler started with all jobs")
@@ -362,6 +372,20 @@ class SchedulerService:
         finally:
             db.close()
 
+    async def _flush_agent_routing(self):
+        """Persist agent chat loads from the routing pool to AgentStatus."""
+        db = SessionLocal()
+        try:
+            from services.agent_router import agent_router
+
+            agent_router.flush(db)
+
+        except Exception as e:
+            print(f"Error flushing agent routing loads: {e}")
+            db.rollback()
+        finally:
+            db.close()
+
     async def _send_slack_daily_digests(self):
         """Send daily digests to all Slack-connected users."""
         try:
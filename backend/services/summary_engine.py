@@ -0,0 +1,348 @@
+"""Hierarchical map-reduce summarization for long meeting transcripts.
+
+Long transcripts are split into token-sized sections at content-defined
+boundaries, each section is condensed into structured notes concurrently
+(map), and the notes are merged level by level until they fit in a single
+final reduce call. Section notes are cached by content hash, so after a
+transcript edit only the sections whose text changed are re-summarized.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from services.cache_service import cache, CacheKeys, CacheTTL
+from services.language_service import get_localized_prompt_suffix
+from services.llm_gateway import LLMGateway, llm_gateway
+
+logger = logging.getLogger(__name__)
+
+
+# Rough token estimate used for budgeting (Claude averages ~4 chars/token)
+CHARS_PER_TOKEN = 4
+
+# Transcripts up to this size are summarized in one call
+SINGLE_PASS_MAX_TOKENS = int(os.getenv("SUMMARY_SINGLE_PASS_MAX_TOKENS", "24000"))
+
+# Sections are cut at content-defined boundaries between these sizes
+SECTION_TARGET_TOKENS = int(os.getenv("SUMMARY_SECTION_TOKENS", "6000"))
+SECTION_MIN_RATIO = 0.5
+SECTION_MAX_RATIO = 1.5
+BOUNDARY_MODULUS = 8  # ~1 in 8 lines past the minimum size ends a section
+
+# Notes are merged in groups until they fit into one reduce call
+REDUCE_INPUT_MAX_TOKENS = int(os.getenv("SUMMARY_REDUCE_INPUT_TOKENS", "24000"))
+
+SECTION_CONCURRENCY = int(os.getenv("SUMMARY_SECTION_CONCURRENCY", "4"))
+SECTION_MAX_OUTPUT_TOKENS = 2048
+
+# Bump when prompts change so cached notes are not reused
+SECTION_PROMPT_VERSION = "2"
+
+
+SECTION_NOTES_FORMAT = """{{
+    "summary": "One paragraph describing what happened in this part of the meeting",
+    "key_points": [{{"point": "...", "context": "...", "speaker": "..."}}],
+    "decisions_made": [{{"decision": "...", "rationale": "...", "owner": "...", "timeline": "..."}}],
+    "action_items": [{{"assignee": "...", "description": "...", "due_date": "YYYY-MM-DD or null", "priority": "high/medium/low", "context": "..."}}],
+    "commitments": [{{"description": "...", "due_date": "YYYY-MM-DD or null", "to_whom": "..."}}],
+    "risks_identified": [{{"risk": "...", "severity": "high/medium/low", "mitigation": "..."}}],
+    "topics_discussed": ["topic"],
+    "participant_contributions": {{"topic_name": ["participant"]}},
+    "key_quotes": [{{"quote": "...", "speaker": "...", "significance": "..."}}],
+    "sentiment": "positive/neutral/negative/mixed"
+}}"""
+
+SECTION_PROMPT = """You are an expert meeting analyst. Below is one section (part {number}) of a longer {meeting_type} meeting transcript.
+
+Condense it into structured notes. Capture every decision, action item, commitment and risk in this section; later steps only see your notes, not the transcript.
+
+Transcript section:
+{transcript}
+
+Respond with JSON only, in this format:
+""" + SECTION_NOTES_FORMAT + """{language_instruction}"""
+
+MERGE_PROMPT = """You are an expert meeting analyst. Below are structured notes for consecutive sections of a {meeting_type} meeting, in order.
+
+Merge them into a single set of notes covering all of these sections. Keep every distinct decision, action item, commitment and risk; remove duplicates.
+
+Section notes:
+{notes}
+
+Respond with JSON only, in this format:
+""" + SECTION_NOTES_FORMAT + """{language_instruction}"""
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a text."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def parse_json_response(content: str) -> Any:
+    """Parse a JSON model response, tolerating markdown code fences."""
+    if "```json" in content:
+        content = content.split("```json")[1].split("```")[0]
+    elif "```" in content:
+        content = content.split("```")[1].split("```")[0]
+    return json.loads(content.strip())
+
+
+def transcript_lines(conversations) -> List[str]:
+    """Build transcript lines from conversations, one per utterance or AI response."""
+    lines = []
+    for conv in conversations:
+        time_str = conv.timestamp.strftime("%H:%M") if conv.timestamp else ""
+        speaker = conv.speaker or "Unknown"
+        lines.append(f"[{time_str}] {speaker}: {conv.heard_text}")
+        if conv.response_text:
+            lines.append(f"[{time_str}] AI Response: {conv.response_text}")
+    return lines
+
+
+@dataclass
+class TranscriptSection:
+    """A contiguous run of transcript lines."""
+    index: int
+    lines: List[str]
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self.lines)
+
+    @property
+    def content_hash(self) -> str:
+        return hashlib.sha256(self.text.encode("utf-8")).hexdigest()
+
+
+def _is_boundary_line(line: str) -> bool:
+    digest = hashlib.md5(line.encode("utf-8"), usedforsecurity=False).digest()
+    return digest[0] % BOUNDARY_MODULUS == 0
+
+
+def split_transcript(lines: List[str], target_tokens: int = SECTION_TARGET_TOKENS) -> List[TranscriptSection]:
+    """
+    Split transcript lines into sections of roughly target_tokens.
+
+    Boundaries depend on line content rather than absolute position: once a
+    section reaches the minimum size it ends at the next line whose hash
+    selects it (or at the maximum size). An edit therefore changes only the
+    section containing it, and later sections keep their boundaries and
+    cache keys.
+    """
+    min_tokens = int(target_tokens * SECTION_MIN_RATIO)
+    max_tokens = int(target_tokens * SECTION_MAX_RATIO)
+
+    sections: List[TranscriptSection] = []
+    current: List[str] = []
+    current_tokens = 0
+
+    def close():
+        nonlocal current, current_tokens
+        if current:
+            sections.append(TranscriptSection(index=len(sections), lines=current))
+        current = []
+        current_tokens = 0
+
+    for line in lines:
+        line_tokens = estimate_tokens(line)
+
+        # Hard-split single lines that exceed a whole section on their own
+        if line_tokens > max_tokens:
+            close()
+            step = max_tokens * CHARS_PER_TOKEN
+            for start in range(0, len(line), step):
+                sections.append(TranscriptSection(index=len(sections), lines=[line[start:start + step]]))
+            continue
+
+        if current and current_tokens + line_tokens > max_tokens:
+            close()
+
+        current.append(line)
+        current_tokens += line_tokens
+
+        if current_tokens >= min_tokens and _is_boundary_line(line):
+            close()
+
+    close()
+    return sections
+
+
+class SectionSummarizer:
+    """
+    Map and intermediate-reduce steps of hierarchical summarization.
+
+    Section calls run concurrently, bounded by a semaphore. Notes are cached
+    by section content hash (plus model, prompt version, meeting type and
+    language) so unchanged sections are never summarized twice.
+    """
+
+    def __init__(
+        self,
+        client: Optional[LLMGateway] = None,
+        model: Optional[str] = None,
+        concurrency: int = SECTION_CONCURRENCY,
+    ):
+        self.client = client or llm_gateway
+        self.model = model or os.getenv("SUMMARY_GENERATION_MODEL", "claude-sonnet-4-20250514")
+        self.concurrency = concurrency
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.failures = 0
+
+    def _cache_key(self, section: TranscriptSection, meeting_type: str, language: str) -> str:
+        fingerprint = hashlib.sha256(
+            f"{SECTION_PROMPT_VERSION}:{self.model}:{meeting_type}:{language}:{section.content_hash}".encode("utf-8")
+        ).hexdigest()
+        return CacheKeys.summary_section(fingerprint)
+
+    async def summarize_sections(
+        self,
+        sections: List[TranscriptSection],
+        meeting_type: Optional[str],
+        language: str = "en",
+    ) -> List[Dict[str, Any]]:
+        """Condense each section into structured notes, in order."""
+        meeting_type = meeting_type or "general"
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def summarize(section: TranscriptSection) -> Dict[str, Any]:
+            key = self._cache_key(section, meeting_type, language)
+            cached_notes = cache.get(key)
+            if cached_notes is not None:
+                self.cache_hits += 1
+                return cached_notes
+
+            self.cache_misses += 1
+            prompt = SECTION_PROMPT.format(
+                meeting_type=meeting_type,
+                number=section.index + 1,
+                transcript=section.text,
+                language_instruction=get_localized_prompt_suffix(language),
+            )
+            async with semaphore:
+                # Notes have their own content-hash cache above
+                notes = await self._complete_notes(prompt, "summaries.section", cache_ttl=None)
+
+            if notes is not None:
+                cache.set(key, notes, CacheTTL.SUMMARY_SECTION)
+                return notes
+            self.failures += 1
+            return self._empty_notes()
+
+        return list(await asyncio.gather(*(summarize(section) for section in sections)))
+
+    async def condense(
+        self,
+        notes: List[Dict[str, Any]],
+        meeting_type: Optional[str],
+        language: str = "en",
+        max_tokens: int = REDUCE_INPUT_MAX_TOKENS,
+    ) -> List[Dict[str, Any]]:
+        """
+        Merge consecutive notes level by level until they fit in max_tokens.
+
+        Returns notes (possibly unchanged) that can go into one final reduce.
+        """
+        meeting_type = meeting_type or "general"
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        while len(notes) > 1 and estimate_tokens(self.render_notes(notes)) > max_tokens:
+            groups = self._group_notes(notes, max_tokens)
+            if len(groups) == len(notes):
+                # Every note is already at the budget on its own; pair them up
+                groups = [notes[i:i + 2] for i in range(0, len(notes), 2)]
+
+            async def merge(group: List[Dict[str, Any]]) -> Dict[str, Any]:
+                if len(group) == 1:
+                    return group[0]
+                prompt = MERGE_PROMPT.format(
+                    meeting_type=meeting_type,
+                    notes=self.render_notes(group),
+                    language_instruction=get_localized_prompt_suffix(language),
+                )
+                async with semaphore:
+                    merged = await self._complete_notes(prompt, "summaries.merge")
+                return merged if merged is not None else self._concatenate(group)
+
+            notes = list(await asyncio.gather(*(merge(group) for group in groups)))
+
+        return notes
+
+    @staticmethod
+    def render_notes(notes: List[Dict[str, Any]]) -> str:
+        """Render notes for inclusion in a prompt."""
+        return "\n\n".join(
+            f"Section {i + 1}:\n{json.dumps(n, ensure_ascii=False)}" for i, n in enumerate(notes)
+        )
+
+    def _group_notes(self, notes: List[Dict[str, Any]], max_tokens: int) -> List[List[Dict[str, Any]]]:
+        groups: List[List[Dict[str, Any]]] = []
+        current: List[Dict[str, Any]] = []
+        current_tokens = 0
+        for note in notes:
+            note_tokens = estimate_tokens(json.dumps(note, ensure_ascii=False))
+            if current and current_tokens + note_tokens > max_tokens:
+                groups.append(current)
+                current, current_tokens = [], 0
+            current.append(note)
+            current_tokens += note_tokens
+        if current:
+            groups.append(current)
+        return groups
+
+    async def _complete_notes(
+        self, prompt: str, call_site: str, cache_ttl: Optional[int] = CacheTTL.LLM_RESPONSE
+    ) -> Optional[Dict[str, Any]]:
+        try:
+            response = await self.client.complete(
+                prompt,
+                call_site=call_site,
+                model=self.model,
+                max_tokens=SECTION_MAX_OUTPUT_TOKENS,
+                cache_ttl=cache_ttl,
+            )
+            notes = parse_json_response(response.text)
+            return notes if isinstance(notes, dict) else None
+        except json.JSONDecodeError as e:
+            logger.warning(f"Section notes JSON parsing error: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Section summarization error: {e}")
+            return None
+
+    @staticmethod
+    def _empty_notes() -> Dict[str, Any]:
+        return {
+            "summary": "",
+            "key_points": [],
+            "decisions_made": [],
+            "action_items": [],
+            "commitments": [],
+            "risks_identified": [],
+            "topics_discussed": [],
+            "participant_contributions": {},
+            "key_quotes": [],
+            "sentiment": "neutral",
+        }
+
+    @classmethod
+    def _concatenate(cls, group: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Mechanically combine notes when a merge call fails."""
+        merged = cls._empty_notes()
+        merged["summary"] = " ".join(n.get("summary", "") for n in group if n.get("summary"))
+        for note in group:
+            for field in ("key_points", "decisions_made", "action_items", "commitments",
+                          "risks_identified", "key_quotes"):
+                merged[field].extend(note.get(field) or [])
+            for topic in note.get("topics_discussed") or []:
+                if topic not in merged["topics_discussed"]:
+                    merged["topics_discussed"].append(topic)
+            for topic, people in (note.get("participant_contributions") or {}).items():
+                existing = merged["participant_contributions"].setdefault(topic, [])
+                existing.extend(p for p in people if p not in existing)
+        return merged
@@ -15,7 +15,6 @@ import os
 import json
 from typing import Dict, Any, List, Optional
 from datetime import datetime
-import anthropic
 from sqlalchemy.orm import Session
 
 from models import (
@@ -27,6 +26,17 @@ from models import (
     User,
 )
 from services.language_service import get_localized_prompt_suffix, get_fallback_message
+from services.llm_gateway import llm_gateway
+from services.meeting_context import get_meeting_snapshot
+from services.rolling_summary import RollingSummarizer
+from services.summary_engine import (
+    SectionSummarizer,
+    SINGLE_PASS_MAX_TOKENS,
+    estimate_tokens,
+    parse_json_response,
+    split_transcript,
+    transcript_lines,
+)
 
 
 # Enhanced prompts for comprehensive meeting analysis
@@ -178,6 +188,12 @@ MEETING_TYPE_PROMPTS = {
 }
 
 
+# Stands in for the transcript when a meeting is summarized from section notes
+SECTION_NOTES_PREAMBLE = """(The transcript of this meeting has been condensed into structured notes for each consecutive section, in order. Treat them as the transcript.)
+
+"""
+
+
 class SummaryGenerator:
     """Generate comprehensive AI-powered meeting summaries.
 
@@ -193,7 +209,7 @@ class SummaryGenerator:
 
     def __init__(self, db: Session):
         self.db = db
-        self.client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+        self.client = llm_gateway
         self.model = os.getenv(
             "SUMMARY_GENERATION_MODEL", "claude-sonnet-4-20250514"
         )
@@ -227,19 +243,30 @@ class SummaryGenerator:
             user = self.db.query(User).filter(User.id == meeting.user_id).first()
             language = getattr(user, 'preferred_language', 'en') or 'en' if user else 'en'
 
-        # Get all conversations from meeting
-        conversations = (
-            self.db.query(Conversation)
-            .filter(Conversation.meeting_id == meeting_id)
-            .order_by(Conversation.timestamp)
-            .all()
-        )
+        # Get all conversations from the shared meeting snapshot
+        snapshot = get_meeting_snapshot(self.db, meeting_id)
+        conversations = snapshot.conversations if snapshot else []
 
         if not conversations:
             raise ValueError("No conversations in meeting")
 
         # Build conversation transcript
-        transcript = self._build_transcript(conversations)
+        lines = self._transcript_lines(conversations)
+        transcript = "\n".join(lines)
+
+        # Reduce the rolling notes folded during the meeting when there are any;
+        # otherwise condense long meetings section by section first
+        summarizer = SectionSummarizer(model=self.model)
+        rolling_notes = await RollingSummarizer(self.db, summarizer).final_notes(
+            meeting, conversations, language
+        )
+        if rolling_notes is not None:
+            if summarizer.failures:
+                raise RuntimeError(f"{summarizer.failures} transcript section(s) could not be summarized")
+            notes = await summarizer.condense(rolling_notes, meeting.meeting_type, language)
+            transcript = SECTION_NOTES_PREAMBLE + summarizer.render_notes(notes)
+        elif estimate_tokens(transcript) > SINGLE_PASS_MAX_TOKENS:
+            transcript = await self._condense_transcript(lines, meeting.meeting_type, language, summarizer)
 
         # Generate comprehensive summary with Claude
         summary_data = await self._generate_with_claude(
@@ -309,8 +336,7 @@ class SummaryGenerator:
             from integrations.zapier import fire_summary_generated
             user = self.db.query(User).filter(User.id == meeting.user_id).first()
             if user:
-                import asyncio
-                asyncio.create_task(fire_summary_generated(self.db, summary, meeting, user))
+                fire_summary_generated(self.db, summary, meeting, user)
         except Exception as e:
             # Don't fail if Zapier integration fails
             pass
@@ -319,14 +345,37 @@ class SummaryGenerator:
 
     def _build_transcript(self, conversations: List[Conversation]) -> str:
         """Build transcript from conversations."""
-        lines = []
-        for conv in conversations:
-            time_str = conv.timestamp.strftime("%H:%M") if conv.timestamp else ""
-            speaker = conv.speaker or "Unknown"
-            lines.append(f"[{time_str}] {speaker}: {conv.heard_text}")
-            if conv.response_text:
-                lines.append(f"[{time_str}] AI Response: {conv.response_text}")
-        return "\n".join(lines)
+        return "\n".join(self._transcript_lines(conversations))
+
+    def _transcript_lines(self, conversations: List[Conversation]) -> List[str]:
+        """Build transcript lines, one per utterance or AI response."""
+        return transcript_lines(conversations)
+
+    async def _condense_transcript(
+        self,
+        lines: List[str],
+        meeting_type: Optional[str],
+        language: str = "en",
+        summarizer: Optional[SectionSummarizer] = None,
+    ) -> str:
+        """Condense a long transcript into ordered section notes (map + partial reduce).
+
+        Sections are summarized concurrently and cached by content hash, so
+        re-summarizing after a transcript edit only re-runs changed sections.
+        The returned text replaces the transcript in the final summary prompt.
+        Raises if any section could not be summarized, so the summary is retried
+        rather than silently missing that part of the meeting.
+        """
+        summarizer = summarizer or SectionSummarizer(model=self.model)
+        sections = split_transcript(lines)
+        failures = summarizer.failures
+        notes = await summarizer.summarize_sections(sections, meeting_type, language)
+        if summarizer.failures > failures:
+            raise RuntimeError(
+                f"{summarizer.failures - failures} transcript section(s) could not be summarized"
+            )
+        notes = await summarizer.condense(notes, meeting_type, language)
+        return SECTION_NOTES_PREAMBLE + summarizer.render_notes(notes)
 
     async def _generate_with_claude(
         self, transcript: str, meeting_type: str, title: Optional[str], language: str = "en", duration_seconds: Optional[int] = None
@@ -370,19 +419,15 @@ class SummaryGenerator:
             prompt += f"\n\n{MEETING_TYPE_PROMPTS[meeting_type]}"
 
         try:
-            response = self.client.messages.create(
+            response = await self.client.complete(
+                prompt,
+                call_site="summaries.generate",
                 model=self.model,
                 max_tokens=4096,  # Increased for comprehensive analysis
-                messages=[{"role": "user", "content": prompt}],
+                cache_ttl=None,  # Regenerating a summary should produce a fresh one
             )
 
-            content = response.content[0].text
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0]
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0]
-
-            data = json.loads(content.strip())
+            data = parse_json_response(response.text)
 
             # Post-process and normalize the response
             return self._normalize_summary_response(data)
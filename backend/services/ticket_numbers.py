@@ -0,0 +1,141 @@
+"""
+Ticket number allocation.
+
+Ticket numbers look like TKT-YYYY-NNNNN and restart every year. They come
+from a per-year counter rather than from counting the tickets created so
+far. Allocation therefore costs the same all year, and two concurrent
+creates never get the same number:
+
+- PostgreSQL: one sequence per year (ticket_number_seq_YYYY), created on
+  first use and started after the highest number already issued.
+- Other databases: the year's row in ticket_number_counters, incremented
+  under a row lock in the creating transaction.
+- Redis INCR when TICKET_NUMBER_BACKEND=redis, for deployments whose
+  database can do neither.
+
+Sequence and Redis numbers are not handed back if the ticket insert
+fails. Numbers can therefore have gaps, but they are never reused.
+"""
+
+import logging
+import os
+from datetime import datetime
+from typing import Optional, Set
+
+from sqlalchemy import Integer, cast, func, insert, select, text, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from models import SupportTicket, TicketNumberCounter
+
+logger = logging.getLogger(__name__)
+
+
+# auto (sequence on PostgreSQL, counter row elsewhere), sequence, row or redis
+TICKET_NUMBER_BACKEND = os.getenv("TICKET_NUMBER_BACKEND", "auto").lower()
+
+TICKET_PREFIX = "TKT"
+
+
+def format_ticket_number(year: int, value: int) -> str:
+    """Format a ticket number: TKT-YYYY-XXXXX"""
+    return f"{TICKET_PREFIX}-{year}-{str(value).zfill(5)}"
+
+
+def highest_issued(db: Session, year: int) -> int:
+    """Highest ticket number already issued for a year, 0 if none."""
+    prefix = f"{TICKET_PREFIX}-{year}-"
+    value = db.query(
+        func.max(cast(func.substr(SupportTicket.ticket_number, len(prefix) + 1), Integer))
+    ).filter(
+        SupportTicket.ticket_number.like(f"{prefix}%")
+    ).scalar()
+    return value or 0
+
+
+class TicketNumberAllocator:
+    """Hands out ticket numbers from a per-year counter."""
+
+    def __init__(self, backend: str = TICKET_NUMBER_BACKEND):
+        self.backend = backend
+        # Years whose PostgreSQL sequence is known to exist
+        self._sequences: Set[int] = set()
+
+    def _backend_for(self, db: Session) -> str:
+        if self.backend != "auto":
+            return self.backend
+        if db.get_bind().dialect.name == "postgresql":
+            return "sequence"
+        return "row"
+
+    def allocate(self, db: Session, year: Optional[int] = None) -> str:
+        """Allocate the next ticket number for the year (default: this year)."""
+        year = int(year or datetime.utcnow().year)
+        backend = self._backend_for(db)
+
+        if backend == "sequence":
+            value = self._next_from_sequence(db, year)
+        elif backend == "redis":
+            value = self._next_from_redis(db, year)
+        else:
+            value = self._next_from_row(db, year)
+
+        return format_ticket_number(year, value)
+
+    def _next_from_sequence(self, db: Session, year: int) -> int:
+        name = f"ticket_number_seq_{year}"
+        if year not in self._sequences:
+            self._create_sequence(db, name, year)
+        return db.execute(
+            text("SELECT nextval(CAST(:name AS regclass))"), {"name": name}
+        ).scalar()
+
+    def _create_sequence(self, db: Session, name: str, year: int) -> None:
+        start = highest_issued(db, year) + 1
+        # Own short transaction, so the DDL lock is not held until the ticket commits
+        with db.get_bind().engine.connect() as conn:
+            try:
+                conn.execute(text(f"CREATE SEQUENCE IF NOT EXISTS {name} START WITH {start}"))
+                conn.commit()
+            except SQLAlchemyError as e:
+                # Another process created it between the check and the create
+                conn.rollback()
+                logger.debug(f"Ticket number sequence {name} not created: {e}")
+        self._sequences.add(year)
+
+    def _next_from_row(self, db: Session, year: int) -> int:
+        table = TicketNumberCounter.__table__
+        # Incrementing first takes the row lock, so concurrent creates queue
+        # here (SQLite has no FOR UPDATE; its write lock does the same job)
+        bump = update(table).where(table.c.year == year).values(
+            last_value=table.c.last_value + 1
+        )
+
+        if db.execute(bump).rowcount == 0:
+            try:
+                with db.begin_nested():
+                    db.execute(insert(table).values(year=year, last_value=highest_issued(db, year)))
+            except IntegrityError:
+                pass  # Created by a concurrent transaction
+            db.execute(bump)
+
+        return db.execute(
+            select(table.c.last_value).where(table.c.year == year).with_for_update()
+        ).scalar_one()
+
+    def _next_from_redis(self, db: Session, year: int) -> int:
+        from services.cache_service import cache
+
+        if not cache.enabled:
+            logger.warning("Redis unavailable for ticket numbers, using the counter table")
+            return self._next_from_row(db, year)
+
+        key = f"ticket_number:{year}"
+        if not cache.client.exists(key):
+            # Start after what the database already has (first use, or a lost key)
+            cache.client.set(key, highest_issued(db, year), nx=True)
+        return int(cache.client.incr(key))
+
+
+# Shared allocator used by TicketService
+ticket_numbers = TicketNumberAllocator()
@@ -11,6 +11,8 @@ from models import (
     SupportTeam, TeamMember, SupportTicket, TicketMessage,
     SLAConfig, AgentStatus, ChatSession, User, Organization, CATEGORY_TEAM_MAP
 )
+from services.agent_router import agent_router
+from services.ticket_numbers import ticket_numbers
 from services.business_hours_service import (
     BusinessHoursService, BusinessHoursConfig, create_business_hours_service
 )
@@ -24,14 +26,7 @@ class TicketService:
 
     def generate_ticket_number(self) -> str:
         """Generate unique ticket number: TKT-YYYY-XXXXX"""
-        year = datetime.utcnow().year
-
-        # Get the count of tickets this year
-        count = self.db.query(func.count(SupportTicket.id)).filter(
-            SupportTicket.ticket_number.like(f"TKT-{year}-%")
-        ).scalar() or 0
-
-        return f"TKT-{year}-{str(count + 1).zfill(5)}"
+        return ticket_numbers.allocate(self.db)
 
     def get_team_for_category(self, category: str) -> Optional[SupportTeam]:
         """Get the appropriate team for a ticket category."""
@@ -132,21 +127,11 @@ class TicketService:
 
     def find_available_agent(self, team_id: int) -> Optional[TeamMember]:
         """Find an available agent from a team for ticket assignment."""
-        # Get online agents with capacity
-        available_agents = self.db.query(TeamMember).join(
-            AgentStatus, TeamMember.id == AgentStatus.team_member_id
-        ).filter(
-            and_(
-                TeamMember.team_id == team_id,
-                TeamMember.is_active == True,
-                AgentStatus.status == "online",
-                AgentStatus.current_chats < AgentStatus.max_chats
-            )
-        ).order_by(
-            AgentStatus.current_chats  # Assign to agent with least chats
-        ).first()
-
-        return available_agents
+        # Online agent with the fewest chats, from the routing pool
+        member_id = agent_router.peek(self.db, team_id)
+        if member_id is None:
+            return None
+        return self.db.get(TeamMember, member_id)
 
     def assign_ticket(
         self,
@@ -408,35 +393,23 @@ class ChatService:
         if session.agent_id:
             return True
 
-        # Find available agent
-        query = self.db.query(TeamMember).join(
-            AgentStatus, TeamMember.id == AgentStatus.team_member_id
-        ).filter(
-            and_(
-                TeamMember.is_active == True,
-                AgentStatus.status == "online",
-                AgentStatus.current_chats < AgentStatus.max_chats
-            )
-        )
-
-        if session.team_id:
-            query = query.filter(TeamMember.team_id == session.team_id)
-
-        agent = query.order_by(AgentStatus.current_chats).first()
-
-        if agent:
-            session.agent_id = agent.id
-            session.status = "active"
-            session.accepted_at = datetime.utcnow()
-            session.queue_position = None
+        # Atomically claim the least-loaded available agent
+        member_id = agent_router.claim(self.db, session.team_id)
+        if member_id is None:
+            return False
 
-            # Update agent's chat count
-            agent.agent_status.current_chats += 1
+        session.agent_id = member_id
+        session.status = "active"
+        session.accepted_at = datetime.utcnow()
+        session.queue_position = None
 
+        try:
             self.db.commit()
-            return True
-
-        return False
+        except Exception:
+            self.db.rollback()
+            agent_router.release(self.db, member_id)
+            raise
+        return True
 
     def accept_chat(self, session_id: int, agent_member_id: int) -> ChatSession:
         """Agent accepts a chat from the queue."""
@@ -465,10 +438,6 @@ class ChatService:
         session.accepted_at = datetime.utcnow()
         session.queue_position = None
 
-        # Update agent status
-        if agent.agent_status:
-            agent.agent_status.current_chats += 1
-
         # Update queue positions for other waiting sessions
         self.db.query(ChatSession).filter(
             and_(
@@ -481,6 +450,9 @@ class ChatService:
 
         self.db.commit()
         self.db.refresh(session)
+
+        # Count the chat against the agent
+        agent_router.acquire(self.db, agent_member_id)
         return session
 
     def end_chat(
@@ -497,17 +469,10 @@ class ChatService:
         if not session:
             raise ValueError("Chat session not found")
 
+        was_open = session.status in ("waiting", "active")
         session.status = "ended"
         session.ended_at = datetime.utcnow()
 
-        # Update agent's chat count
-        if session.agent_id:
-            agent = self.db.query(TeamMember).filter(
-                TeamMember.id == session.agent_id
-            ).first()
-            if agent and agent.agent_status:
-                agent.agent_status.current_chats = max(0, agent.agent_status.current_chats - 1)
-
         # Create ticket from chat if requested
         if create_ticket and ticket_subject:
             ticket_service = TicketService(self.db)
@@ -534,6 +499,10 @@ class ChatService:
 
         self.db.commit()
         self.db.refresh(session)
+
+        # Free the agent's slot
+        if was_open and session.agent_id:
+            agent_router.release(self.db, session.agent_id)
         return session
 
     def update_agent_status(
@@ -570,6 +539,8 @@ class ChatService:
 
         self.db.commit()
         self.db.refresh(agent_status)
+
+        agent_router.refresh_agent(self.db, team_member_id)
         return agent_status
 
     def get_queue_stats(self, team_id: Optional[int] = None) -> Dict[str, Any]:
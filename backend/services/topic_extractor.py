@@ -4,10 +4,10 @@ import os
 import json
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-import anthropic
 from sqlalchemy.orm import Session
 
 from models import Topic, ConversationTopic, Conversation, UserLearningProfile
+from services.llm_gateway import llm_gateway
 
 
 class TopicExtractor:
@@ -15,7 +15,7 @@ class TopicExtractor:
 
     def __init__(self, db: Session):
         self.db = db
-        self.client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+        self.client = llm_gateway
         self.model = os.getenv("TOPIC_EXTRACTION_MODEL", "claude-3-haiku-20240307")
 
     async def extract_topics(
@@ -45,13 +45,15 @@ Respond in JSON format:
 }}"""
 
         try:
-            response = self.client.messages.create(
+            response = await self.client.complete(
+                prompt,
+                call_site="topics.extract_topics",
                 model=self.model,
                 max_tokens=1024,
-                messages=[{"role": "user", "content": prompt}],
+                user_id=user_id,
             )
 
-            content = response.content[0].text
+            content = response.text
             # Parse JSON from response
             if "```json" in content:
                 content = content.split("```json")[1].split("```")[0]
@@ -178,13 +180,15 @@ Return the top {limit} most related topics in order of relevance.
 Respond as a JSON array of topic names: ["topic1", "topic2", ...]"""
 
         try:
-            response = self.client.messages.create(
+            response = await self.client.complete(
+                prompt,
+                call_site="topics.find_related_topics",
                 model=self.model,
                 max_tokens=256,
-                messages=[{"role": "user", "content": prompt}],
+                user_id=user_id,
             )
 
-            content = response.content[0].text
+            content = response.text
             if "```" in content:
                 content = content.split("```")[1].split("```")[0]
                 if content.startswith("json"):
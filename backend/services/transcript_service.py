@@ -13,11 +13,11 @@ import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
-import anthropic
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
 
 from models import Conversation, Meeting, User
+from services.llm_gateway import llm_gateway
 
 
 logger = logging.getLogger(__name__)
@@ -73,7 +73,7 @@ class TranscriptService:
 
     def __init__(self, db: Session):
         self.db = db
-        self.client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+        self.client = llm_gateway
         self.model = os.getenv("TRANSCRIPT_CORRECTION_MODEL", "claude-sonnet-4-20250514")
 
     def edit_transcript(
@@ -282,13 +282,15 @@ class TranscriptService:
             prompt += f"\n\nAdditional context from user: {additional_context}"
 
         try:
-            response = self.client.messages.create(
+            response = await self.client.complete(
+                prompt,
+                call_site="transcripts.suggest_correction",
                 model=self.model,
                 max_tokens=2048,
-                messages=[{"role": "user", "content": prompt}],
+                user_id=user_id,
             )
 
-            content = response.content[0].text
+            content = response.text
 
             # Parse JSON from response
             if "```json" in content:
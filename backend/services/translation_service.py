@@ -15,10 +15,10 @@ import logging
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
-import anthropic
 from sqlalchemy.orm import Session
 
 from services.cache_service import cache, CacheTTL
+from services.llm_gateway import llm_gateway
 
 logger = logging.getLogger("translation_service")
 
@@ -134,7 +134,7 @@ class TranslationService:
             db: SQLAlchemy database session
         """
         self.db = db
-        self.client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+        self.client = llm_gateway
         self.model = os.getenv("TRANSLATION_MODEL", "claude-sonnet-4-20250514")
         self.cache_ttl = CacheTTL.DAY  # Cache translations for 24 hours
 
@@ -265,13 +265,15 @@ Text to translate:
 Translated text:"""
 
         try:
-            response = self.client.messages.create(
+            response = await self.client.complete(
+                prompt,
+                call_site="translation.translate_text",
                 model=self.model,
+                cache_ttl=CacheTTL.LLM_RESPONSE if use_cache else None,
                 max_tokens=4096,
-                messages=[{"role": "user", "content": prompt}],
             )
 
-            translated_text = response.content[0].text.strip()
+            translated_text = response.text.strip()
 
             # Cache the translation
             if use_cache:
@@ -375,13 +377,15 @@ Texts to translate:
 Translated texts:"""
 
         try:
-            response = self.client.messages.create(
+            response = await self.client.complete(
+                prompt,
+                call_site="translation.translate_batch",
                 model=self.model,
+                cache_ttl=CacheTTL.LLM_RESPONSE if use_cache else None,
                 max_tokens=8192,  # Larger limit for batch
-                messages=[{"role": "user", "content": prompt}],
             )
 
-            response_text = response.content[0].text.strip()
+            response_text = response.text.strip()
 
             # Parse the numbered responses
             translations = self._parse_numbered_translations(response_text, len(texts_to_translate))
@@ -563,13 +567,14 @@ Text to analyze:
 {text[:1000]}"""  # Limit text length for detection
 
         try:
-            response = self.client.messages.create(
+            response = await self.client.complete(
+                prompt,
+                call_site="translation.detect_language",
                 model=self.model,
                 max_tokens=256,
-                messages=[{"role": "user", "content": prompt}],
             )
 
-            response_text = response.content[0].text.strip()
+            response_text = response.text.strip()
 
             # Parse JSON response
             if "```json" in response_text:
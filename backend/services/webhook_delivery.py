@@ -0,0 +1,646 @@
+"""
+Outbound webhook delivery engine for ReadIn AI.
+
+One delivery path shared by Zapier REST hooks, user-configured webhooks and
+notification webhooks:
+- Every delivery is persisted as a WebhookDelivery row before it is sent
+- Sending happens on a Celery worker, never on the request path
+- One pooled httpx.AsyncClient per process with bounded concurrency per host
+- Per-endpoint circuit breakers stop hammering endpoints that are down
+- Failed attempts are retried with exponential backoff by a beat task
+- Delivery latency and outcomes are exported as Prometheus metrics
+"""
+
+import asyncio
+import json
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from models import Webhook, WebhookDelivery, ZapierSubscription
+from services.webhook_signing import sign_webhook_payload, SIGNATURE_HEADER, TIMESTAMP_HEADER
+
+logger = logging.getLogger("webhooks.delivery")
+
+try:
+    from prometheus_client import Counter, Histogram
+    PROMETHEUS_AVAILABLE = True
+
+    WEBHOOK_DELIVERY_DURATION_SECONDS = Histogram(
+        'webhook_delivery_duration_seconds',
+        'Outbound webhook delivery latency in seconds',
+        ['source'],
+        buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    )
+
+    WEBHOOK_DELIVERIES_TOTAL = Counter(
+        'webhook_deliveries_total',
+        'Outbound webhook delivery attempts by outcome',
+        ['source', 'outcome']
+    )
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+    WEBHOOK_DELIVERY_DURATION_SECONDS = None
+    WEBHOOK_DELIVERIES_TOTAL = None
+
+
+# Delivery sources
+SOURCE_ZAPIER = "zapier"
+SOURCE_WEBHOOK = "webhook"
+
+# Delivery statuses
+STATUS_PENDING = "pending"
+STATUS_DELIVERING = "delivering"
+STATUS_RETRYING = "retrying"
+STATUS_SUCCESS = "success"
+STATUS_FAILED = "failed"
+
+# Tuning
+MAX_CONCURRENCY_PER_HOST = 4
+REQUEST_TIMEOUT_SECONDS = 10.0
+CONNECT_TIMEOUT_SECONDS = 5.0
+DEFAULT_MAX_ATTEMPTS = 6
+BASE_RETRY_DELAY_SECONDS = 30
+MAX_RETRY_DELAY_SECONDS = 6 * 3600
+CLAIM_LEASE_SECONDS = 300  # Rows stuck in "delivering" longer than this are re-sent
+DISPATCH_GRACE_SECONDS = 120  # Sweeper picks up pending rows the worker never received
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RESET_SECONDS = 300
+ZAPIER_MAX_CONSECUTIVE_FAILURES = 10
+RESPONSE_BODY_LIMIT = 1000
+
+
+@dataclass
+class DeliveryTarget:
+    """A destination for one event."""
+    url: str
+    source: str
+    secret: Optional[str] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    webhook_id: Optional[int] = None
+    zapier_subscription_id: Optional[int] = None
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    base_retry_delay: int = BASE_RETRY_DELAY_SECONDS
+
+    @classmethod
+    def for_webhook(cls, webhook: Webhook) -> "DeliveryTarget":
+        return cls(
+            url=webhook.url,
+            source=SOURCE_WEBHOOK,
+            secret=webhook.secret,
+            headers=webhook.custom_headers or {},
+            webhook_id=webhook.id,
+            max_attempts=(webhook.max_retries or 0) + 1,
+            base_retry_delay=webhook.retry_delay_seconds or BASE_RETRY_DELAY_SECONDS,
+        )
+
+    @classmethod
+    def for_zapier(cls, subscription: ZapierSubscription) -> "DeliveryTarget":
+        return cls(
+            url=subscription.target_url,
+            source=SOURCE_ZAPIER,
+            secret=subscription.hook_secret,
+            headers={
+                "X-Zapier-Event": subscription.trigger_type,
+                "X-ReadIn-Subscription-ID": str(subscription.id),
+            },
+            zapier_subscription_id=subscription.id,
+        )
+
+
+class CircuitBreaker:
+    """
+    Per-endpoint circuit breaker.
+
+    Opens after CIRCUIT_FAILURE_THRESHOLD consecutive failures; while open,
+    deliveries are deferred without a request. After CIRCUIT_RESET_SECONDS a
+    single half-open probe is allowed through; whoever gets the probe must
+    call `release` once it is done.
+    """
+
+    def __init__(self, threshold: int = CIRCUIT_FAILURE_THRESHOLD, reset_seconds: float = CIRCUIT_RESET_SECONDS):
+        self.threshold = threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probe_in_flight = False
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def allow(self) -> bool:
+        if self.opened_at is None:
+            return True
+        if self._probe_in_flight or time.monotonic() - self.opened_at < self.reset_seconds:
+            return False
+        self._probe_in_flight = True
+        return True
+
+    def retry_in(self) -> float:
+        """Seconds until the breaker will let a probe through."""
+        if self.opened_at is None:
+            return 0.0
+        return max(self.reset_seconds - (time.monotonic() - self.opened_at), 0.0)
+
+    def release(self):
+        """End a probe whose outcome says nothing about endpoint health."""
+        self._probe_in_flight = False
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self._probe_in_flight = False
+
+    def record_failure(self):
+        self.failures += 1
+        self._probe_in_flight = False
+        if self.failures >= self.threshold:
+            self.opened_at = time.monotonic()
+
+
+@dataclass
+class AttemptResult:
+    """Outcome of a single HTTP attempt."""
+    success: bool
+    status_code: Optional[int] = None
+    response_body: Optional[str] = None
+    error: Optional[str] = None
+    elapsed_ms: Optional[int] = None
+    retryable: bool = True
+    gone: bool = False
+    deferred_seconds: Optional[float] = None  # Not sent: the endpoint's circuit is open
+
+
+def _endpoint_key(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}{parts.path}"
+
+
+def _host_key(url: str) -> str:
+    return urlsplit(url).netloc.lower()
+
+
+def compute_retry_delay(attempt_count: int, base_delay: int = BASE_RETRY_DELAY_SECONDS) -> float:
+    """Exponential backoff with full jitter, capped at MAX_RETRY_DELAY_SECONDS."""
+    ceiling = min(base_delay * (2 ** max(attempt_count - 1, 0)), MAX_RETRY_DELAY_SECONDS)
+    return random.uniform(ceiling / 2, ceiling)
+
+
+class WebhookDeliveryEngine:
+    """
+    Persists, sends and retries outbound webhook deliveries.
+
+    A single instance is shared per process (see `webhook_engine`) so the
+    HTTP connection pool, host semaphores and circuit breakers are reused
+    across events.
+    """
+
+    def __init__(
+        self,
+        max_concurrency_per_host: int = MAX_CONCURRENCY_PER_HOST,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.max_concurrency_per_host = max_concurrency_per_host
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    # =========================================================================
+    # HTTP CLIENT
+    # =========================================================================
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            # Clients and semaphores are bound to the loop they were created on
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(REQUEST_TIMEOUT_SECONDS, connect=CONNECT_TIMEOUT_SECONDS),
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                headers={"User-Agent": "ReadIn-Webhook/1.0"},
+                transport=self._transport,
+            )
+            self._client_loop = loop
+            self._host_semaphores = {}
+        return self._client
+
+    async def close(self):
+        """Close the HTTP client."""
+        if self._client and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
+
+    def _semaphore_for(self, url: str) -> asyncio.Semaphore:
+        host = _host_key(url)
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency_per_host)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    def _breaker_for(self, url: str) -> CircuitBreaker:
+        key = _endpoint_key(url)
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker()
+            self._breakers[key] = breaker
+        return breaker
+
+    # =========================================================================
+    # ENQUEUE
+    # =========================================================================
+
+    def enqueue(
+        self,
+        db: Session,
+        targets: List[DeliveryTarget],
+        event_type: str,
+        payload: Dict[str, Any],
+    ) -> List[int]:
+        """
+        Persist one pending delivery per target.
+
+        Returns:
+            IDs of the created WebhookDelivery rows
+        """
+        now = datetime.utcnow()
+        deliveries = []
+        for target in targets:
+            delivery = WebhookDelivery(
+                webhook_id=target.webhook_id,
+                zapier_subscription_id=target.zapier_subscription_id,
+                source=target.source,
+                target_url=target.url,
+                event_type=event_type,
+                payload=payload,
+                status=STATUS_PENDING,
+                attempt_count=0,
+                max_attempts=target.max_attempts,
+                next_retry_at=now + timedelta(seconds=DISPATCH_GRACE_SECONDS),
+                triggered_at=now,
+            )
+            db.add(delivery)
+            deliveries.append(delivery)
+
+        if not deliveries:
+            return []
+
+        db.commit()
+        return [delivery.id for delivery in deliveries]
+
+    def dispatch(self, delivery_ids: List[int]) -> bool:
+        """
+        Hand deliveries to a Celery worker.
+
+        If the broker is unavailable the rows stay pending and the retry
+        sweeper picks them up after DISPATCH_GRACE_SECONDS.
+        """
+        if not delivery_ids:
+            return True
+        try:
+            from workers.tasks.webhook_tasks import deliver_webhooks
+            deliver_webhooks.delay(delivery_ids)
+            return True
+        except Exception as e:
+            logger.warning(f"Could not dispatch webhook deliveries {delivery_ids}: {e}")
+            return False
+
+    def queue_event(
+        self,
+        db: Session,
+        targets: List[DeliveryTarget],
+        event_type: str,
+        payload: Dict[str, Any],
+    ) -> List[int]:
+        """Persist deliveries for an event and dispatch them to a worker."""
+        delivery_ids = self.enqueue(db, targets, event_type, payload)
+        self.dispatch(delivery_ids)
+        return delivery_ids
+
+    # =========================================================================
+    # DELIVERY (worker side)
+    # =========================================================================
+
+    def _claim(self, db: Session, delivery_ids: List[int], due_only: bool) -> List[WebhookDelivery]:
+        """
+        Atomically mark deliveries as in flight so concurrent workers never
+        send the same row twice.
+        """
+        now = datetime.utcnow()
+        lease_until = now + timedelta(seconds=CLAIM_LEASE_SECONDS)
+        claimed_ids = []
+        for delivery_id in delivery_ids:
+            query = db.query(WebhookDelivery).filter(WebhookDelivery.id == delivery_id)
+            if due_only:
+                query = query.filter(
+                    WebhookDelivery.status.in_([STATUS_PENDING, STATUS_RETRYING, STATUS_DELIVERING]),
+                    WebhookDelivery.next_retry_at <= now,
+                )
+            else:
+                query = query.filter(WebhookDelivery.status == STATUS_PENDING)
+            updated = query.update(
+                {"status": STATUS_DELIVERING, "next_retry_at": lease_until},
+                synchronize_session=False,
+            )
+            if updated:
+                claimed_ids.append(delivery_id)
+        db.commit()
+
+        if not claimed_ids:
+            return []
+        return db.query(WebhookDelivery).filter(WebhookDelivery.id.in_(claimed_ids)).all()
+
+    def _load_targets(
+        self,
+        db: Session,
+        deliveries: List[WebhookDelivery],
+    ) -> Tuple[Dict[int, Webhook], Dict[int, ZapierSubscription]]:
+        webhook_ids = {d.webhook_id for d in deliveries if d.webhook_id}
+        subscription_ids = {d.zapier_subscription_id for d in deliveries if d.zapier_subscription_id}
+        webhooks = {}
+        subscriptions = {}
+        if webhook_ids:
+            webhooks = {w.id: w for w in db.query(Webhook).filter(Webhook.id.in_(webhook_ids)).all()}
+        if subscription_ids:
+            subscriptions = {
+                s.id: s for s in db.query(ZapierSubscription).filter(
+                    ZapierSubscription.id.in_(subscription_ids)
+                ).all()
+            }
+        return webhooks, subscriptions
+
+    async def deliver(self, db: Session, delivery_ids: List[int], due_only: bool = False) -> Dict[str, int]:
+        """
+        Send a batch of deliveries concurrently and record the outcomes.
+
+        Args:
+            db: Database session
+            delivery_ids: WebhookDelivery IDs to send
+            due_only: Only send rows whose retry time has passed (sweeper mode)
+
+        Returns:
+            Counts of delivered, retrying, failed and skipped deliveries
+        """
+        deliveries = self._claim(db, delivery_ids, due_only)
+        stats = {"delivered": 0, "retrying": 0, "failed": 0, "skipped": len(delivery_ids) - len(deliveries)}
+        if not deliveries:
+            return stats
+
+        webhooks, subscriptions = self._load_targets(db, deliveries)
+        client = self.client  # Bind the pool and host semaphores to this loop
+
+        jobs = []
+        for delivery in deliveries:
+            webhook = webhooks.get(delivery.webhook_id)
+            subscription = subscriptions.get(delivery.zapier_subscription_id)
+            if webhook is not None:
+                target = DeliveryTarget.for_webhook(webhook)
+                active = webhook.is_active
+            elif subscription is not None:
+                target = DeliveryTarget.for_zapier(subscription)
+                active = subscription.is_active
+            else:
+                target, active = None, False
+
+            if not active:
+                delivery.status = STATUS_FAILED
+                delivery.error_message = "Target removed or deactivated"
+                delivery.next_retry_at = None
+                stats["failed"] += 1
+                continue
+            jobs.append((delivery, target, webhook, subscription))
+
+        results = await asyncio.gather(*(
+            self._attempt(client, target, delivery.event_type, delivery.payload)
+            for delivery, target, _, _ in jobs
+        ))
+
+        now = datetime.utcnow()
+        for (delivery, target, webhook, subscription), result in zip(jobs, results):
+            if result.deferred_seconds is not None:
+                # Nothing was sent, so neither the attempt nor the target's
+                # failure counters move
+                delivery.status = STATUS_RETRYING
+                delivery.error_message = result.error
+                delivery.next_retry_at = now + timedelta(seconds=result.deferred_seconds)
+                stats["retrying"] += 1
+                continue
+            outcome = self._record_result(delivery, target, result, now)
+            stats[outcome] += 1
+            if webhook is not None:
+                self._update_webhook_stats(webhook, delivery, result, now)
+            if subscription is not None:
+                self._update_subscription_stats(subscription, result, now)
+
+        db.commit()
+        return stats
+
+    async def _attempt(
+        self,
+        client: httpx.AsyncClient,
+        target: DeliveryTarget,
+        event_type: str,
+        payload: Dict[str, Any],
+    ) -> AttemptResult:
+        """Send one HTTP request, respecting the circuit breaker and host limit."""
+        breaker = self._breaker_for(target.url)
+        if not breaker.allow():
+            self._observe(target.source, "circuit_open")
+            # Jitter so deferred deliveries don't all queue up behind the probe
+            return AttemptResult(
+                success=False,
+                error="Circuit open for endpoint",
+                deferred_seconds=breaker.retry_in() + random.uniform(1, BASE_RETRY_DELAY_SECONDS),
+            )
+
+        try:
+            return await self._send(client, target, event_type, payload, breaker)
+        finally:
+            breaker.release()
+
+    async def _send(
+        self,
+        client: httpx.AsyncClient,
+        target: DeliveryTarget,
+        event_type: str,
+        payload: Dict[str, Any],
+        breaker: CircuitBreaker,
+    ) -> AttemptResult:
+        """POST the signed payload and feed the outcome to the breaker."""
+
+        # Send exactly the bytes that were signed
+        body = json.dumps(payload, separators=(',', ':'), sort_keys=True)
+        headers = {"Content-Type": "application/json", "X-ReadIn-Event": event_type}
+        headers.update(target.headers)
+        if target.secret:
+            signature, timestamp = sign_webhook_payload(payload, target.secret)
+            headers[SIGNATURE_HEADER] = signature
+            headers[TIMESTAMP_HEADER] = str(timestamp)
+
+        async with self._semaphore_for(target.url):
+            start = time.perf_counter()
+            try:
+                response = await client.post(target.url, content=body, headers=headers)
+            except httpx.TimeoutException:
+                result = AttemptResult(success=False, error="Request timeout")
+            except httpx.RequestError as e:
+                result = AttemptResult(success=False, error=f"Request error: {str(e)}")
+            else:
+                result = AttemptResult(
+                    success=200 <= response.status_code < 300,
+                    status_code=response.status_code,
+                    response_body=response.text[:RESPONSE_BODY_LIMIT],
+                )
+                if not result.success:
+                    result.error = f"HTTP {response.status_code}: {response.text[:200]}"
+                    # 410 Gone means the subscriber unsubscribed; other 4xx won't
+                    # succeed on retry except 408/429
+                    result.gone = response.status_code == 410
+                    result.retryable = response.status_code >= 500 or response.status_code in (408, 429)
+            elapsed = time.perf_counter() - start
+
+        result.elapsed_ms = int(elapsed * 1000)
+        if result.success:
+            breaker.record_success()
+        elif result.retryable:
+            breaker.record_failure()
+
+        if PROMETHEUS_AVAILABLE:
+            WEBHOOK_DELIVERY_DURATION_SECONDS.labels(source=target.source).observe(elapsed)
+        self._observe(target.source, "success" if result.success else "failure")
+        return result
+
+    @staticmethod
+    def _observe(source: str, outcome: str):
+        if PROMETHEUS_AVAILABLE:
+            WEBHOOK_DELIVERIES_TOTAL.labels(source=source, outcome=outcome).inc()
+
+    @staticmethod
+    def _record_result(delivery: WebhookDelivery, target: DeliveryTarget, result: AttemptResult, now: datetime) -> str:
+        """Update a delivery row from an attempt result; returns the stats bucket."""
+        delivery.attempt_count = (delivery.attempt_count or 0) + 1
+        delivery.response_status_code = result.status_code
+        delivery.response_body = result.response_body
+        delivery.response_time_ms = result.elapsed_ms
+        delivery.error_message = result.error
+
+        if result.success:
+            delivery.status = STATUS_SUCCESS
+            delivery.delivered_at = now
+            delivery.next_retry_at = None
+            return "delivered"
+
+        max_attempts = delivery.max_attempts or target.max_attempts
+        if result.retryable and delivery.attempt_count < max_attempts:
+            delay = compute_retry_delay(delivery.attempt_count, target.base_retry_delay)
+            delivery.status = STATUS_RETRYING
+            delivery.next_retry_at = now + timedelta(seconds=delay)
+            return "retrying"
+
+        delivery.status = STATUS_FAILED
+        delivery.next_retry_at = None
+        logger.warning(
+            f"Webhook delivery {delivery.id} to {target.url} failed permanently "
+            f"after {delivery.attempt_count} attempt(s): {result.error}"
+        )
+        return "failed"
+
+    @staticmethod
+    def _update_webhook_stats(webhook: Webhook, delivery: WebhookDelivery, result: AttemptResult, now: datetime):
+        webhook.last_triggered_at = now
+        if delivery.attempt_count == 1:
+            webhook.total_deliveries = (webhook.total_deliveries or 0) + 1
+        if result.success:
+            webhook.successful_deliveries = (webhook.successful_deliveries or 0) + 1
+            webhook.last_success_at = now
+        elif delivery.status == STATUS_FAILED:
+            webhook.failed_deliveries = (webhook.failed_deliveries or 0) + 1
+            webhook.last_failure_at = now
+            webhook.last_error = result.error
+
+    @staticmethod
+    def _update_subscription_stats(subscription: ZapierSubscription, result: AttemptResult, now: datetime):
+        if result.success:
+            subscription.last_triggered_at = now
+            subscription.consecutive_failures = 0
+            return
+
+        subscription.last_error = result.error
+        if result.gone:
+            logger.info(f"Subscription {subscription.id} returned 410 Gone, deactivating")
+            subscription.is_active = False
+            return
+
+        subscription.consecutive_failures = (subscription.consecutive_failures or 0) + 1
+        if subscription.consecutive_failures >= ZAPIER_MAX_CONSECUTIVE_FAILURES:
+            subscription.is_active = False
+            logger.warning(
+                f"Deactivating subscription {subscription.id} "
+                f"after {subscription.consecutive_failures} consecutive failures"
+            )
+
+    # =========================================================================
+    # RETRIES
+    # =========================================================================
+
+    def due_delivery_ids(self, db: Session, limit: int = 500) -> List[int]:
+        """IDs of deliveries whose retry time has passed, including stale pending/in-flight rows."""
+        now = datetime.utcnow()
+        rows = db.query(WebhookDelivery.id).filter(
+            or_(
+                WebhookDelivery.status == STATUS_RETRYING,
+                WebhookDelivery.status == STATUS_PENDING,
+                WebhookDelivery.status == STATUS_DELIVERING,
+            ),
+            WebhookDelivery.next_retry_at <= now,
+        ).order_by(WebhookDelivery.next_retry_at).limit(limit).all()
+        return [row.id for row in rows]
+
+
+# Shared engine instance
+webhook_engine = WebhookDeliveryEngine()
+
+
+def fire_user_webhooks(
+    db: Session,
+    user_id: int,
+    event: str,
+    data: Dict[str, Any],
+) -> List[int]:
+    """
+    Queue an event for a user's active webhooks subscribed to it.
+
+    Payload structure matches the documented user webhook format:
+    {"event": ..., "timestamp": ..., "data": {...}}
+    """
+    webhooks = db.query(Webhook).filter(
+        Webhook.user_id == user_id,
+        Webhook.is_active == True,
+    ).all()
+    targets = [
+        DeliveryTarget.for_webhook(webhook)
+        for webhook in webhooks
+        if event in (webhook.events or [])
+    ]
+    if not targets:
+        return []
+
+    payload = {
+        "event": event,
+        "timestamp": datetime.utcnow().isoformat(),
+        "data": data,
+    }
+    return webhook_engine.queue_event(db, targets, event, payload)
@@ -8,11 +8,15 @@ Provides:
 - Authentication helpers
 """
 
+import asyncio
+import json
 import os
 import pytest
 from datetime import datetime, timedelta
-from typing import Generator, Dict, Any
+from pathlib import Path
+from typing import Generator, Dict, Any, Optional
 
+import httpx
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
@@ -25,7 +29,10 @@ os.environ["DATABASE_URL"] = "sqlite:///:memory:"
 
 from database import Base, get_db
 from main import app
-from models import User, Profession, Organization, Meeting, Conversation, UserLearningProfile
+from models import (
+    User, Profession, Organization, Meeting, Conversation, UserLearningProfile,
+    ActionItem, ActionItemSync, ProjectManagementConnection,
+)
 from auth import hash_password, create_access_token
 
 
@@ -264,6 +271,87 @@ def completed_meeting(test_db, test_user) -> Meeting:
     return meeting
 
 
+# =============================================================================
+# PROJECT MANAGEMENT FIXTURES
+# =============================================================================
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def recorded(name: str) -> Any:
+    """Load a recorded JSON response, e.g. recorded("pm_status/monday_items")."""
+    return json.loads((FIXTURES_DIR / f"{name}.json").read_text())
+
+
+class RecordedAPI:
+    """Serves recorded responses by method and path; anything else is a 404."""
+
+    def __init__(self):
+        self.routes = {}  # (method, path) -> [(status, fixture name), ...]
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.delay = 0.0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            responses = self.routes.get((request.method, request.url.path))
+            if not responses:
+                return httpx.Response(404, json={"errors": [{"message": "Not found"}]})
+            # The last response repeats once the others are used up
+            status, name = responses.pop(0) if len(responses) > 1 else responses[0]
+            return httpx.Response(status, json=recorded(name))
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def pm_api(monkeypatch) -> RecordedAPI:
+    """Route the project management integrations' HTTP clients to a RecordedAPI."""
+    server = RecordedAPI()
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        httpx, "AsyncClient",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(server), **kwargs),
+    )
+    return server
+
+
+@pytest.fixture
+def link_pm_items(test_db, test_user):
+    """Factory linking new pending action items to tasks in a PM tool."""
+    def link(provider: str, external_ids, user: Optional[User] = None, **connection_fields):
+        user = user or test_user
+        meeting = Meeting(user_id=user.id, title="Planning", status="ended", started_at=datetime.utcnow())
+        test_db.add(meeting)
+        connection = ProjectManagementConnection(
+            user_id=user.id, provider=provider, access_token="token",
+            **{"workspace_id": "cloud-1", "project_id": "RA", **connection_fields},
+        )
+        test_db.add(connection)
+        test_db.flush()
+
+        items = []
+        for n, external_id in enumerate(external_ids):
+            item = ActionItem(
+                meeting_id=meeting.id, user_id=user.id, assignee="Jane",
+                description=f"Task {n}", status="pending",
+            )
+            test_db.add(item)
+            test_db.flush()
+            test_db.add(ActionItemSync(action_item_id=item.id, connection_id=connection.id, external_id=external_id))
+            items.append(item)
+
+        test_db.commit()
+        return connection, items
+    return link
+
+
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
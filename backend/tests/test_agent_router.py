@@ -0,0 +1,106 @@
+"""Tests for the in-memory agent routing dispatcher."""
+
+import threading
+import uuid
+
+from models import AgentStatus, ChatSession, SupportTeam, TeamMember
+from services.agent_router import AgentRouter, AgentSlot, LocalAgentPool
+from services.ticket_service import ChatService
+
+
+def make_pool(*slots):
+    pool = LocalAgentPool()
+    pool.load_agents(AgentSlot(*slot) for slot in slots)
+    return pool
+
+
+def test_claim_picks_least_loaded_and_respects_capacity():
+    # member_id, team_id, online, max_chats, load
+    pool = make_pool((1, 10, True, 2, 1), (2, 10, True, 2, 0), (3, 10, False, 5, 0))
+
+    assert pool.claim(10) == 2
+    assert pool.claim(10) in (1, 2)
+    assert pool.claim(10) in (1, 2)
+    assert pool.claim(10) is None
+    assert pool.load_of(1) == 2 and pool.load_of(2) == 2
+
+    pool.adjust(1, -1)
+    assert pool.peek(10) == 1
+    assert pool.take_dirty() == {1: 1, 2: 2}
+    assert pool.take_dirty() == {}
+
+
+def test_claim_by_team_and_across_teams():
+    pool = make_pool((1, 10, True, 3, 2), (2, 20, True, 3, 0))
+
+    assert pool.claim(10) == 1
+    assert pool.claim(None) == 2
+
+    # Going offline or changing team takes effect on the next claim
+    pool.upsert(2, 10, False, 3)
+    assert pool.peek(None) is None
+    pool.upsert(2, 10, True, 3)
+    assert pool.peek(10) == 2
+    assert pool.peek(20) is None
+    assert pool.load_of(2) == 1
+
+    pool.remove(2)
+    assert pool.peek(10) is None
+
+
+def test_concurrent_claims_never_exceed_capacity():
+    pool = make_pool(*[(member_id, 1, True, 3, 0) for member_id in range(1, 11)])
+    claimed = []
+
+    def worker():
+        for _ in range(10):
+            member_id = pool.claim(1)
+            if member_id is not None:
+                claimed.append(member_id)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(claimed) == 30
+    assert all(claimed.count(member_id) == 3 for member_id in range(1, 11))
+
+
+def make_agent(db, user, team, status="online", max_chats=2):
+    member = TeamMember(user_id=user.id, team_id=team.id)
+    db.add(member)
+    db.flush()
+    db.add(AgentStatus(team_member_id=member.id, status=status, max_chats=max_chats))
+    db.commit()
+    return member
+
+
+def test_chat_assignment_routes_and_flushes_loads(test_db, test_user, monkeypatch):
+    team = SupportTeam(name="Support", slug="support")
+    test_db.add(team)
+    test_db.flush()
+    agent = make_agent(test_db, test_user, team, max_chats=1)
+
+    router = AgentRouter(pool=LocalAgentPool())
+    monkeypatch.setattr("services.ticket_service.agent_router", router)
+    service = ChatService(test_db)
+
+    first = ChatSession(session_token=uuid.uuid4().hex, user_id=test_user.id, team_id=team.id)
+    second = ChatSession(session_token=uuid.uuid4().hex, user_id=test_user.id, team_id=team.id)
+    test_db.add_all([first, second])
+    test_db.commit()
+
+    assert service.try_assign_agent(first) is True
+    assert first.agent_id == agent.id
+    assert service.try_assign_agent(second) is False
+
+    assert router.flush(test_db) == 1
+    test_db.expire_all()
+    assert test_db.get(AgentStatus, agent.agent_status.id).current_chats == 1
+
+    service.end_chat(first.id)
+    assert router.current_load(agent.id) == 0
+    assert service.try_assign_agent(second) is True
+    assert router.flush(test_db) == 1
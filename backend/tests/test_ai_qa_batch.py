@@ -0,0 +1,175 @@
+"""Tests for batch AI QA analysis of chat sessions."""
+
+import asyncio
+import json
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import database
+import services.ai_qa_service as ai_qa_module
+from models import ChatSession, ChatMessage, ChatQARecord
+from services.ai_qa_service import AIQAService
+from workers.tasks.qa_tasks import run_ai_qa_batch
+
+
+ANALYSIS = {
+    "overall_score": 4,
+    "response_time_score": 5,
+    "resolution_score": 4,
+    "professionalism_score": 5,
+    "confidence": 0.9,
+    "summary": "Resolved quickly.",
+    "tags": ["resolved_first_contact"],
+}
+
+
+class FakeGateway:
+    """Stands in for the LLM gateway and tracks concurrent calls."""
+
+    def __init__(self, fail_first=None):
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+        self.fail_first = fail_first
+
+    async def complete(self, prompt, **kwargs):
+        self.calls += 1
+        if self.fail_first is not None and self.calls == 1:
+            raise self.fail_first
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return SimpleNamespace(text=json.dumps(ANALYSIS))
+
+
+def make_session(db, user, message_count, status="ended", ended_minutes_ago=0):
+    session = ChatSession(
+        session_token=uuid.uuid4().hex,
+        user_id=user.id,
+        status=status,
+        ended_at=datetime.utcnow() - timedelta(minutes=ended_minutes_ago),
+    )
+    db.add(session)
+    db.flush()
+    for i in range(message_count):
+        db.add(ChatMessage(
+            session_id=session.id,
+            sender_type="customer" if i % 2 == 0 else "bot",
+            message=f"message {i}",
+        ))
+    db.commit()
+    return session
+
+
+def make_service(db, gateway):
+    service = AIQAService(db)
+    service.client = gateway
+    return service
+
+
+def test_eligible_sessions_use_message_counts_and_skip_reviewed(test_db, test_user):
+    short = make_session(test_db, test_user, 2)
+    older = make_session(test_db, test_user, 3, ended_minutes_ago=10)
+    newer = make_session(test_db, test_user, 5, ended_minutes_ago=1)
+    reviewed = make_session(test_db, test_user, 4)
+    active = make_session(test_db, test_user, 4, status="active")
+    test_db.add(ChatQARecord(session_id=reviewed.id, reviewer_id=test_user.id, overall_score=3))
+    test_db.commit()
+
+    service = make_service(test_db, FakeGateway())
+
+    assert service.find_eligible_sessions(10, min_messages=3) == [newer.id, older.id]
+    assert service.find_eligible_sessions(10, min_messages=3, exclude_ids=[newer.id]) == [older.id]
+    loose = service.find_eligible_sessions(10, min_messages=1)
+    assert short.id in loose
+    assert active.id not in loose and reviewed.id not in loose
+
+
+def test_batch_analyzes_concurrently_and_commits_per_chunk(test_db, test_user):
+    sessions = [make_session(test_db, test_user, 3, ended_minutes_ago=i) for i in range(5)]
+    gateway = FakeGateway()
+    service = make_service(test_db, gateway)
+    progress = []
+
+    results = asyncio.run(service.batch_analyze(
+        reviewer_id=test_user.id,
+        limit=5,
+        chunk_size=3,
+        on_progress=lambda r: progress.append(r["analyzed"]),
+    ))
+
+    assert results["analyzed"] == 5
+    assert results["failed"] == 0
+    assert progress == [3, 5]
+    assert 1 < gateway.peak <= 3
+    records = test_db.query(ChatQARecord).all()
+    assert {r.session_id for r in records} == {s.id for s in sessions}
+    assert all(r.is_ai_review and r.overall_score == 4 for r in records)
+
+    # A second run finds nothing left to review
+    again = asyncio.run(service.batch_analyze(reviewer_id=test_user.id, limit=5))
+    assert again["analyzed"] == 0
+
+
+def test_rate_limited_requests_are_retried(test_db, test_user, monkeypatch):
+    monkeypatch.setattr(ai_qa_module, "QA_RATE_LIMIT_BACKOFF_SECONDS", 0)
+    session = make_session(test_db, test_user, 3)
+    error = RuntimeError("rate limited")
+    error.status_code = 429
+    gateway = FakeGateway(fail_first=error)
+    service = make_service(test_db, gateway)
+
+    results = asyncio.run(service.analyze_sessions([session.id], test_user.id))
+
+    assert results["analyzed"] == 1
+    assert gateway.calls == 2
+
+
+def test_failed_sessions_are_not_persisted(test_db, test_user):
+    session = make_session(test_db, test_user, 3)
+    gateway = FakeGateway(fail_first=RuntimeError("bad request"))
+    service = make_service(test_db, gateway)
+
+    results = asyncio.run(service.analyze_sessions([session.id], test_user.id))
+
+    assert results["failed"] == 1
+    assert results["failed_ids"] == [session.id]
+    assert test_db.query(ChatQARecord).count() == 0
+
+
+def test_interrupted_task_retries_with_remaining_limit(monkeypatch):
+    calls = []
+
+    class InterruptedService:
+        """Fails after one chunk on the first run, finishes on the retry."""
+
+        def __init__(self, db):
+            pass
+
+        def is_available(self):
+            return True
+
+        async def batch_analyze(self, reviewer_id, limit, min_messages, exclude_ids, on_progress):
+            calls.append({"limit": limit, "exclude_ids": exclude_ids})
+            if len(calls) == 1:
+                on_progress({"analyzed": 3, "failed": 1, "failed_ids": [42]})
+                raise RuntimeError("worker lost")
+            return {"analyzed": limit, "failed": 0, "sessions": []}
+
+    monkeypatch.setattr(ai_qa_module, "AIQAService", InterruptedService)
+    monkeypatch.setattr(database, "SessionLocal", lambda: SimpleNamespace(close=lambda: None))
+    states = []
+    monkeypatch.setattr(run_ai_qa_batch, "update_state", lambda **kwargs: states.append(kwargs["meta"]))
+
+    # Enqueued positionally, as the admin route does
+    result = run_ai_qa_batch.apply(args=(7, 10, 3)).get()
+
+    assert calls == [
+        {"limit": 10, "exclude_ids": []},
+        {"limit": 6, "exclude_ids": [42]},
+    ]
+    # Totals carry over the sessions finished before the retry
+    assert states[0] == {"reviewer_id": 7, "limit": 10, "analyzed": 3, "failed": 1}
+    assert (result["analyzed"], result["failed"]) == (9, 1)
@@ -1,8 +1,14 @@
 """Tests for bulk operation endpoints."""
 
+import gzip
+import json
+
 import pytest
 from datetime import datetime
 
+from models import Meeting
+from services.export_service import ExportService
+
 
 class TestBulkOperations:
     """Test bulk operation endpoints."""
@@ -72,6 +78,49 @@ class TestBulkOperations:
         assert response.status_code == 200
         assert "text/csv" in response.headers.get("content-type", "")
 
+    def test_bulk_export_ndjson(self, client, auth_headers, completed_meeting, test_meeting):
+        """Test bulk export as NDJSON with one meeting per line."""
+        response = client.post(
+            "/api/v1/bulk/meetings/export",
+            json={"format": "ndjson"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        assert "application/x-ndjson" in response.headers.get("content-type", "")
+
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [m["id"] for m in lines] == sorted([completed_meeting.id, test_meeting.id], reverse=True)
+        assert "conversations" in lines[0]
+
+    def test_bulk_export_gzip(self, client, auth_headers, completed_meeting):
+        """Test gzip-compressed bulk export."""
+        response = client.post(
+            "/api/v1/bulk/meetings/export",
+            json={"format": "json", "gzip": True},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        assert response.headers.get("content-type") == "application/gzip"
+        assert ".json.gz" in response.headers.get("content-disposition", "")
+
+        data = json.loads(gzip.decompress(response.content))
+        assert data["count"] == 1
+        assert data["meetings"][0]["id"] == completed_meeting.id
+
+    def test_bulk_export_spans_batches(self, test_db, test_user):
+        """Test keyset pagination returns every meeting exactly once across batches."""
+        for i in range(7):
+            test_db.add(Meeting(user_id=test_user.id, title=f"Meeting {i}", status="ended"))
+        test_db.commit()
+
+        service = ExportService(test_db)
+        ids = [m.id for m in service.iter_meetings(test_user.id, batch_size=3)]
+        assert len(ids) == 7
+        assert ids == sorted(set(ids), reverse=True)
+
+        limited = [m.id for m in service.iter_meetings(test_user.id, limit=4, batch_size=3)]
+        assert limited == ids[:4]
+
     def test_bulk_update_task_status_invalid(self, client, auth_headers):
         """Test bulk update with invalid status."""
         response = client.post(
@@ -0,0 +1,153 @@
+"""Tests for the precomputed business hours calendar."""
+
+import random
+import time as timer
+from datetime import datetime, timedelta, time
+
+import pytest
+
+from services.business_hours_service import BusinessHoursConfig, BusinessHoursService
+
+
+def stepwise_business_hours(service, start, end):
+    """The day-by-day walk the calendar replaces."""
+    if end <= start:
+        return 0.0
+    start_local = service._to_local(start)
+    end_local = service._to_local(end)
+    total_minutes = 0.0
+    current = start_local
+    while current < end_local:
+        if service.is_working_day(current):
+            day_start = service._get_business_start(current)
+            day_end = service._get_business_end(current)
+            effective_start = max(current, day_start)
+            effective_end = min(end_local, day_end)
+            if effective_start < effective_end:
+                if effective_start.time() >= service.config.start_time and \
+                   effective_end.time() <= service.config.end_time:
+                    total_minutes += (effective_end - effective_start).total_seconds() / 60
+        current = (current + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    return total_minutes / 60.0
+
+
+def stepwise_add_business_hours(service, start, hours):
+    """The day-by-day deadline search the calendar replaces."""
+    if hours <= 0:
+        return start
+    config = service.config
+    remaining_minutes = hours * 60
+    current_local = service._to_local(service.get_next_business_hour(start))
+    while remaining_minutes > 0:
+        if service.is_working_day(current_local):
+            minutes_left_today = (service._get_business_end(current_local) - current_local).total_seconds() / 60
+            if minutes_left_today > 0:
+                if remaining_minutes <= minutes_left_today:
+                    result = current_local + timedelta(minutes=remaining_minutes)
+                    return service._to_utc(result).replace(tzinfo=None)
+                remaining_minutes -= minutes_left_today
+        next_day = current_local.date() + timedelta(days=1)
+        current_local = config.tz.localize(datetime.combine(next_day, config.start_time))
+        while not service.is_working_day(current_local):
+            next_day += timedelta(days=1)
+            current_local = config.tz.localize(datetime.combine(next_day, config.start_time))
+    return service._to_utc(current_local).replace(tzinfo=None)
+
+
+# Zones without daylight saving: the old walk is off by an hour on
+# transition days, so the comparison would only show its bug
+CONFIGS = [
+    BusinessHoursConfig(),
+    BusinessHoursConfig(
+        start_hour=8, start_minute=30, end_hour=18, working_days=[0, 1, 2, 3, 4, 5],
+        holidays=["2026-01-01", "2026-04-03", "2026-12-25", "2026-12-26", "not-a-date"],
+        timezone="Asia/Kolkata",
+    ),
+    BusinessHoursConfig(
+        start_hour=7, end_hour=15, end_minute=45, working_days=[6, 0, 1, 2, 3],
+        holidays=["2026-05-05"], timezone="Asia/Tokyo",
+    ),
+]
+
+
+def random_instant(rng):
+    base = datetime(2025, 12, 1)
+    instant = base + timedelta(minutes=rng.randrange(0, 500 * 24 * 60))
+    # Land exactly on an opening or closing time now and then
+    if rng.random() < 0.2:
+        instant = instant.replace(hour=rng.choice([0, 3, 9, 12, 17]), minute=rng.choice([0, 30, 45]))
+    return instant
+
+
+@pytest.mark.parametrize("config", CONFIGS)
+def test_calendar_matches_stepwise_durations(config):
+    service = BusinessHoursService(config)
+    rng = random.Random(39)
+
+    for _ in range(400):
+        start = random_instant(rng)
+        end = start + timedelta(minutes=rng.randrange(0, 30 * 24 * 60))
+        if rng.random() < 0.1:
+            start, end = end, start
+        assert service.calculate_business_hours(start, end) == pytest.approx(
+            stepwise_business_hours(service, start, end), abs=1e-6
+        )
+
+
+@pytest.mark.parametrize("config", CONFIGS)
+def test_calendar_matches_stepwise_deadlines(config):
+    service = BusinessHoursService(config)
+    rng = random.Random(39)
+
+    for _ in range(400):
+        start = random_instant(rng)
+        hours = rng.choice([0, 0.5, 1, 4, 8, 8.25, 24, 40, 72, rng.uniform(0, 200)])
+        expected = stepwise_add_business_hours(service, start, hours)
+        deadline = service.add_business_hours(start, hours)
+        assert abs((deadline - expected).total_seconds()) < 1e-3
+        if hours:
+            assert service.calculate_business_hours(start, deadline) == pytest.approx(hours, abs=1e-6)
+
+
+def test_deadline_spans_weekend_and_holiday():
+    service = BusinessHoursService(BusinessHoursConfig(holidays=["2026-10-19"]))
+
+    # Friday 16:00 + 2h: one hour Friday, Monday is a holiday, one hour Tuesday
+    assert service.add_business_hours(datetime(2026, 10, 16, 16), 2) == datetime(2026, 10, 20, 10)
+    # A deadline that uses up a whole day lands on its close, not the next open
+    assert service.add_business_hours(datetime(2026, 10, 20, 9), 8) == datetime(2026, 10, 20, 17)
+
+
+def test_calendar_without_working_time_raises():
+    service = BusinessHoursService(BusinessHoursConfig(working_days=[]))
+
+    assert service.calculate_business_hours(datetime(2026, 1, 1), datetime(2026, 2, 1)) == 0.0
+    with pytest.raises(ValueError):
+        service.add_business_hours(datetime(2026, 1, 1), 1)
+
+
+@pytest.mark.slow
+def test_benchmark_sla_deadlines_for_10k_tickets():
+    config = CONFIGS[1]
+    service = BusinessHoursService(config)
+    rng = random.Random(10_000)
+    tickets = [
+        (random_instant(rng), rng.choice([60, 240, 480, 1440, 2880]))
+        for _ in range(10_000)
+    ]
+
+    began = timer.perf_counter()
+    for created, sla_minutes in tickets:
+        due = service.get_sla_deadline(created, sla_minutes)
+        service.calculate_business_hours(created, due)
+    calendar_seconds = timer.perf_counter() - began
+
+    sample = tickets[:500]
+    began = timer.perf_counter()
+    for created, sla_minutes in sample:
+        due = stepwise_add_business_hours(service, created, sla_minutes / 60.0)
+        stepwise_business_hours(service, created, due)
+    stepwise_seconds = (timer.perf_counter() - began) * len(tickets) / len(sample)
+
+    print(f"10k tickets: calendar {calendar_seconds:.3f}s, stepwise ~{stepwise_seconds:.3f}s")
+    assert calendar_seconds < stepwise_seconds
@@ -0,0 +1,306 @@
+"""Tests for calendar token caching, delta sync and the event cache."""
+
+import asyncio
+from datetime import datetime, timedelta
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+import pytest
+
+import services.calendar_integration as calendar_integration
+import services.calendar_sync as calendar_sync_module
+from models import CachedCalendarEvent, CalendarSyncState
+from services.calendar_integration import token_cache
+from services.calendar_sync import CalendarSyncService, FULL_SYNC_INTERVAL
+from services.meeting_detector import MeetingDetector
+
+NOW = datetime(2026, 3, 10, 9, 0, 0)
+
+
+def google_event(event_id, title, start_hour, link=None, **extra):
+    item = {
+        "id": event_id,
+        "status": "confirmed",
+        "summary": title,
+        "start": {"dateTime": f"2026-03-10T{start_hour:02d}:00:00Z"},
+        "end": {"dateTime": f"2026-03-10T{start_hour:02d}:30:00Z"},
+        "attendees": [{"email": "jane.doe@example.com"}],
+    }
+    if link:
+        item["hangoutLink"] = link
+    item.update(extra)
+    return item
+
+
+def graph_event(event_id, title, start_hour):
+    return {
+        "id": event_id,
+        "subject": title,
+        "start": {"dateTime": f"2026-03-10T{start_hour:02d}:00:00.0000000", "timeZone": "UTC"},
+        "end": {"dateTime": f"2026-03-10T{start_hour:02d}:45:00.0000000", "timeZone": "UTC"},
+        "attendees": [{"emailAddress": {"address": "sam@example.com"}}],
+        "onlineMeeting": {"joinUrl": f"https://teams.microsoft.com/l/{event_id}"},
+    }
+
+
+class FakeProviders:
+    """Token endpoints plus scripted Google and Graph event responses."""
+
+    def __init__(self):
+        self.requests = []
+        self.google_pages = []
+        self.graph_pages = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.delay = 0.0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            host = request.url.host
+            if host in ("oauth2.googleapis.com", "login.microsoftonline.com"):
+                return httpx.Response(200, json={"access_token": f"token-{host}", "expires_in": 3600})
+            pages = self.google_pages if host == "www.googleapis.com" else self.graph_pages
+            status, body = pages.pop(0)
+            return httpx.Response(status, json=body)
+        finally:
+            self.in_flight -= 1
+
+    def event_requests(self, host):
+        return [r for r in self.requests if r.url.host == host]
+
+    def token_requests(self):
+        return [r for r in self.requests if r.url.path.endswith("/token")]
+
+
+@pytest.fixture
+def providers(monkeypatch):
+    monkeypatch.setattr(calendar_integration, "GOOGLE_CLIENT_ID", "google-id")
+    monkeypatch.setattr(calendar_integration, "GOOGLE_CLIENT_SECRET", "google-secret")
+    monkeypatch.setattr(calendar_integration, "MICROSOFT_CLIENT_ID", "ms-id")
+    monkeypatch.setattr(calendar_integration, "MICROSOFT_CLIENT_SECRET", "ms-secret")
+    token_cache.clear()
+    yield FakeProviders()
+    token_cache.clear()
+
+
+@pytest.fixture
+def clock():
+    current = {"now": NOW}
+    return current
+
+
+def make_service(providers, clock):
+    return CalendarSyncService(transport=httpx.MockTransport(providers), clock=lambda: clock["now"])
+
+
+def cached_titles(db, user_id):
+    rows = db.query(CachedCalendarEvent).filter(CachedCalendarEvent.user_id == user_id)
+    return sorted(row.title for row in rows)
+
+
+class TestGoogleDeltaSync:
+    """Test full and incremental Google sync into the cache."""
+
+    def test_full_then_incremental_sync(self, test_db, test_user, providers, clock):
+        """Test that the sync token is stored and changes are applied."""
+        test_user.google_refresh_token = "google-refresh"
+        test_db.commit()
+        providers.google_pages = [
+            (200, {"items": [google_event("a", "Standup", 10)], "nextPageToken": "p2"}),
+            (200, {"items": [google_event("b", "Review", 11)], "nextSyncToken": "sync-1"}),
+            (200, {"items": [
+                google_event("a", "Standup (moved)", 12),
+                {"id": "b", "status": "cancelled"},
+            ], "nextSyncToken": "sync-2"}),
+        ]
+        service = make_service(providers, clock)
+
+        stats = asyncio.run(service.sync_user(test_db, test_user))
+        assert stats["google"]["full"] is True
+        assert stats["google"]["requests"] == 2
+        assert cached_titles(test_db, test_user.id) == ["Review", "Standup"]
+
+        first = parse_qs(urlsplit(str(providers.event_requests("www.googleapis.com")[0].url)).query)
+        assert "timeMin" in first and "syncToken" not in first
+
+        clock["now"] = NOW + timedelta(minutes=5)
+        stats = asyncio.run(service.sync_user(test_db, test_user))
+        assert stats["google"]["full"] is False
+        assert cached_titles(test_db, test_user.id) == ["Standup (moved)"]
+
+        delta = parse_qs(urlsplit(str(providers.event_requests("www.googleapis.com")[2].url)).query)
+        assert delta["syncToken"] == ["sync-1"]
+        assert "timeMin" not in delta
+
+        state = test_db.query(CalendarSyncState).filter_by(user_id=test_user.id, provider="google").one()
+        assert state.sync_token == "sync-2"
+
+        # The access token was refreshed once for all three requests
+        assert len(providers.token_requests()) == 1
+
+    def test_expired_sync_token_triggers_full_resync(self, test_db, test_user, providers, clock):
+        """Test that a 410 Gone drops the cache and resyncs from scratch."""
+        test_user.google_refresh_token = "google-refresh"
+        test_db.commit()
+        providers.google_pages = [
+            (200, {"items": [google_event("a", "Old", 10)], "nextSyncToken": "sync-1"}),
+            (410, {"error": {"code": 410, "message": "Sync token is no longer valid"}}),
+            (200, {"items": [google_event("c", "Fresh", 14)], "nextSyncToken": "sync-2"}),
+        ]
+        service = make_service(providers, clock)
+
+        asyncio.run(service.sync_user(test_db, test_user))
+        stats = asyncio.run(service.sync_user(test_db, test_user))
+
+        assert stats["google"]["full"] is True
+        assert cached_titles(test_db, test_user.id) == ["Fresh"]
+
+    def test_full_sync_runs_daily_to_move_the_window(self, test_db, test_user, providers, clock):
+        """Test that a sync after FULL_SYNC_INTERVAL is a full one."""
+        test_user.google_refresh_token = "google-refresh"
+        test_db.commit()
+        providers.google_pages = [
+            (200, {"items": [], "nextSyncToken": "sync-1"}),
+            (200, {"items": [], "nextSyncToken": "sync-2"}),
+        ]
+        service = make_service(providers, clock)
+
+        asyncio.run(service.sync_user(test_db, test_user))
+        clock["now"] = NOW + FULL_SYNC_INTERVAL
+        stats = asyncio.run(service.sync_user(test_db, test_user))
+
+        assert stats["google"]["full"] is True
+
+    def test_events_after_the_window_are_not_cached(self, test_db, test_user, providers, clock):
+        """Test that the full sync asks for timeMax and later delta events are dropped."""
+        test_user.google_refresh_token = "google-refresh"
+        test_db.commit()
+        far = {"start": {"dateTime": "2026-06-01T10:00:00Z"}, "end": {"dateTime": "2026-06-01T11:00:00Z"}}
+        providers.google_pages = [
+            (200, {"items": [google_event("a", "Standup", 10)], "nextSyncToken": "sync-1"}),
+            (200, {"items": [google_event("a", "Standup (next quarter)", 10, **far),
+                             google_event("c", "Offsite", 10, **far)], "nextSyncToken": "sync-2"}),
+        ]
+        service = make_service(providers, clock)
+
+        asyncio.run(service.sync_user(test_db, test_user))
+        first = parse_qs(urlsplit(str(providers.event_requests("www.googleapis.com")[0].url)).query)
+        assert first["timeMax"] == ["2026-04-09T09:00:00Z"]
+
+        asyncio.run(service.sync_user(test_db, test_user))
+        assert cached_titles(test_db, test_user.id) == []
+
+    def test_page_cap_keeps_sync_token_and_backs_off(self, test_db, test_user, providers, clock, monkeypatch):
+        """Test that a sync stopped at MAX_PAGES is not retried on every read."""
+        monkeypatch.setattr(calendar_sync_module, "MAX_PAGES", 2)
+        test_user.google_refresh_token = "google-refresh"
+        test_db.commit()
+        providers.google_pages = [
+            (200, {"items": [google_event("a", "Standup", 10)], "nextSyncToken": "sync-1"}),
+            (200, {"items": [google_event("b", "Review", 11)], "nextPageToken": "p2"}),
+            (200, {"items": [google_event("c", "Retro", 12)], "nextPageToken": "p3"}),
+        ]
+        service = make_service(providers, clock)
+
+        asyncio.run(service.sync_user(test_db, test_user))
+        clock["now"] = NOW + timedelta(minutes=5)
+        asyncio.run(service.sync_user(test_db, test_user))
+
+        state = test_db.query(CalendarSyncState).filter_by(user_id=test_user.id, provider="google").one()
+        assert state.sync_token == "sync-1"
+        assert state.retry_after == clock["now"] + calendar_sync_module.PAGE_CAP_BACKOFF
+        assert cached_titles(test_db, test_user.id) == ["Retro", "Review", "Standup"]
+
+        clock["now"] += timedelta(minutes=10)
+        assert asyncio.run(service.refresh_if_stale(test_db, test_user)) is False
+        assert len(providers.event_requests("www.googleapis.com")) == 3
+
+
+class TestMicrosoftDeltaSync:
+    """Test Graph calendarView delta paging and removals."""
+
+    def test_delta_link_paging_and_removals(self, test_db, test_user, providers, clock):
+        """Test that next links are followed and the delta link is reused."""
+        test_user.microsoft_refresh_token = "ms-refresh"
+        test_db.commit()
+        delta_link = "https://graph.microsoft.com/v1.0/me/calendarView/delta?$deltatoken=d1"
+        providers.graph_pages = [
+            (200, {"value": [graph_event("x", "Planning", 13)],
+                   "@odata.nextLink": "https://graph.microsoft.com/v1.0/me/calendarView/delta?$skiptoken=s1"}),
+            (200, {"value": [graph_event("y", "1:1", 15)], "@odata.deltaLink": delta_link}),
+            (200, {"value": [{"id": "x", "@removed": {"reason": "deleted"}}],
+                   "@odata.deltaLink": delta_link + "2"}),
+        ]
+        service = make_service(providers, clock)
+
+        asyncio.run(service.sync_user(test_db, test_user))
+        assert cached_titles(test_db, test_user.id) == ["1:1", "Planning"]
+
+        asyncio.run(service.sync_user(test_db, test_user))
+        assert cached_titles(test_db, test_user.id) == ["1:1"]
+
+        requests = providers.event_requests("graph.microsoft.com")
+        assert "startDateTime" in str(requests[0].url)
+        assert str(requests[2].url) == delta_link
+        assert 'outlook.timezone="UTC"' in requests[0].headers["Prefer"]
+
+        event = test_db.query(CachedCalendarEvent).filter_by(event_id="y").one()
+        assert event.start_time == datetime(2026, 3, 10, 15, 0)
+
+
+class TestAggregation:
+    """Test concurrent fan-out and cached reads."""
+
+    def test_providers_are_fetched_concurrently(self, test_db, test_user, providers, clock):
+        """Test that Google and Microsoft requests overlap."""
+        test_user.google_refresh_token = "google-refresh"
+        test_user.microsoft_refresh_token = "ms-refresh"
+        test_db.commit()
+        providers.delay = 0.05
+        providers.google_pages = [(200, {"items": [google_event("a", "Standup", 10)], "nextSyncToken": "g"})]
+        providers.graph_pages = [(200, {"value": [graph_event("x", "Planning", 13)], "@odata.deltaLink": "https://graph.microsoft.com/d"})]
+        service = make_service(providers, clock)
+
+        stats = asyncio.run(service.sync_user(test_db, test_user))
+
+        assert set(stats) == {"google", "microsoft"}
+        assert providers.max_in_flight == 2
+        assert cached_titles(test_db, test_user.id) == ["Planning", "Standup"]
+
+    def test_fresh_cache_is_read_without_provider_calls(self, test_db, test_user, providers, clock):
+        """Test that reads within STALE_AFTER_SECONDS do not sync."""
+        test_user.google_refresh_token = "google-refresh"
+        test_db.commit()
+        providers.google_pages = [(200, {"items": [google_event("a", "Standup", 10)], "nextSyncToken": "g"})]
+        service = make_service(providers, clock)
+
+        first = asyncio.run(service.get_upcoming_events(test_db, test_user, NOW, NOW + timedelta(days=1)))
+        clock["now"] = NOW + timedelta(seconds=30)
+        second = asyncio.run(service.get_upcoming_events(test_db, test_user, NOW, NOW + timedelta(days=1)))
+
+        assert [e.title for e in first] == [e.title for e in second] == ["Standup"]
+        assert len(providers.event_requests("www.googleapis.com")) == 1
+
+    def test_meeting_detector_reads_cached_calendar(self, test_db, test_user, providers, clock, monkeypatch):
+        """Test that the desktop meeting list includes cached calendar meetings."""
+        test_user.google_refresh_token = "google-refresh"
+        test_db.commit()
+        providers.google_pages = [(200, {"items": [
+            google_event("a", "Standup", 10, link="https://meet.google.com/abc-defg-hij"),
+            google_event("b", "Focus time", 11, attendees=[]),
+        ], "nextSyncToken": "g"})]
+        service = make_service(providers, clock)
+        monkeypatch.setattr(calendar_sync_module, "calendar_sync", service)
+
+        meetings = asyncio.run(MeetingDetector(test_db).get_all_upcoming_meetings(
+            test_user.id, NOW, NOW + timedelta(days=1)
+        ))
+
+        assert [m["topic"] for m in meetings] == ["Standup"]
+        assert meetings[0]["platform"] == "google_meet"
+        assert meetings[0]["duration"] == 30
@@ -0,0 +1,76 @@
+"""Tests for the in-memory support chat queue."""
+
+import uuid
+from datetime import datetime, timedelta
+
+from models import ChatSession, SupportTeam, TeamMember
+from services.chat_queue import ChatQueueSnapshot, session_responses
+from services.chat_websocket_manager import ChatConnectionManager
+
+
+def make_chat(db, user, status="waiting", team=None, agent=None, minutes_ago=0):
+    session = ChatSession(
+        session_token=uuid.uuid4().hex,
+        user_id=user.id,
+        status=status,
+        team_id=team.id if team else None,
+        agent_id=agent.id if agent else None,
+        started_at=datetime.utcnow() - timedelta(minutes=minutes_ago),
+    )
+    db.add(session)
+    db.commit()
+    return session
+
+
+def test_session_responses_join_names(test_db, test_user):
+    team = SupportTeam(name="Billing", slug="billing")
+    test_db.add(team)
+    test_db.flush()
+    agent = TeamMember(user_id=test_user.id, team_id=team.id)
+    test_db.add(agent)
+    test_db.commit()
+    chat = make_chat(test_db, test_user, status="active", team=team, agent=agent)
+
+    [response] = session_responses(test_db, ChatSession.id == chat.id)
+
+    assert response.user_name == test_user.full_name
+    assert response.agent_name == test_user.full_name
+    assert response.team_name == "Billing"
+
+
+def test_queue_is_served_from_memory_until_changed(test_db, test_user):
+    older = make_chat(test_db, test_user, minutes_ago=5)
+    newer = make_chat(test_db, test_user, status="active", minutes_ago=1)
+    make_chat(test_db, test_user, status="ended")
+
+    manager = ChatConnectionManager()
+    queue = ChatQueueSnapshot(max_age_seconds=3600)
+    manager.add_queue_listener(queue.invalidate)
+
+    page, total = queue.page(test_db)
+    assert [s.id for s in page] == [older.id, newer.id]
+    assert total == 2
+
+    # Writes are not seen until a queue event arrives
+    older.status = "ended"
+    test_db.commit()
+    queue.page(test_db)
+    queue.page(test_db, offset=1, limit=1)
+    assert queue.loads == 1
+
+    manager.queue_changed(older.id)
+    page, total = queue.page(test_db)
+    assert [s.id for s in page] == [newer.id]
+    assert queue.loads == 2
+
+
+def test_queue_reloads_once_too_old(test_db, test_user):
+    make_chat(test_db, test_user)
+    queue = ChatQueueSnapshot(max_age_seconds=0)
+
+    queue.page(test_db)
+    make_chat(test_db, test_user)
+    _, total = queue.page(test_db)
+
+    assert total == 2
+    assert queue.loads == 2
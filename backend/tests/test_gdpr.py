@@ -0,0 +1,144 @@
+"""Tests for GDPR data export jobs."""
+
+import io
+import os
+import json
+import time
+import zipfile
+from datetime import datetime, timedelta
+
+import pytest
+
+import config
+import services.gdpr_export as gdpr_export
+from models import DataExportJob
+from services.gdpr_export import build_export_archive, expire_export_jobs, JOB_COMPLETED, JOB_EXPIRED
+from workers.tasks.export_tasks import cleanup_export_files
+
+
+@pytest.fixture
+def export_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(gdpr_export, "EXPORT_DIR", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def completed_export(test_db, test_user, completed_meeting, export_dir) -> DataExportJob:
+    job = DataExportJob(user_id=test_user.id, status="pending")
+    test_db.add(job)
+    test_db.commit()
+    build_export_archive(test_db, job, batch_size=2)
+    return job
+
+
+class TestDataExportArchive:
+    """Test archive generation."""
+
+    def test_archive_contains_jsonl_per_table(self, test_db, completed_export, completed_meeting):
+        """Test that each table is written as JSON lines and secrets are excluded."""
+        assert completed_export.status == JOB_COMPLETED
+        assert completed_export.progress == 100
+        assert completed_export.expires_at > datetime.utcnow()
+
+        with zipfile.ZipFile(completed_export.file_path) as archive:
+            manifest = json.loads(archive.read("manifest.json"))
+            profile = [json.loads(line) for line in archive.read("profile.jsonl").splitlines()]
+            conversations = [json.loads(line) for line in archive.read("conversations.jsonl").splitlines()]
+
+        assert "hashed_password" not in profile[0]
+        assert profile[0]["email"] == "test@example.com"
+        assert len(conversations) == len(completed_meeting.conversations)
+        assert manifest["row_counts"]["conversations"] == len(conversations)
+        assert completed_export.rows_exported == sum(manifest["row_counts"].values())
+
+    def test_expired_archives_are_removed(self, test_db, completed_export):
+        """Test that the cleanup removes archives past their expiry."""
+        path = completed_export.file_path
+        completed_export.expires_at = datetime.utcnow() - timedelta(minutes=1)
+        test_db.commit()
+
+        assert expire_export_jobs(test_db) == 1
+        test_db.refresh(completed_export)
+        assert completed_export.status == JOB_EXPIRED
+        assert not os.path.exists(path)
+
+    def test_bulk_export_cleanup_leaves_archives_alone(self, test_db, test_user, completed_export, export_dir,
+                                                       monkeypatch):
+        """Test that a 2-day-old archive outlives the 24h bulk export file cleanup."""
+        monkeypatch.setattr(config, "EXPORT_DIR", str(export_dir))
+        two_days_ago = time.time() - 2 * 86400
+        bulk_file = export_dir / str(test_user.id) / "job-1.ndjson"
+        bulk_file.parent.mkdir()
+        bulk_file.write_text("{}")
+        for path in (completed_export.file_path, bulk_file):
+            os.utime(path, (two_days_ago, two_days_ago))
+
+        assert cleanup_export_files()["removed"] == 1
+        assert expire_export_jobs(test_db) == 0
+
+        assert os.path.exists(completed_export.file_path)
+        assert not bulk_file.exists()
+        test_db.refresh(completed_export)
+        assert completed_export.status == JOB_COMPLETED
+
+
+class TestDataExportRoutes:
+    """Test export job endpoints."""
+
+    def test_export_status(self, client, auth_headers, completed_export):
+        """Test polling a completed export job."""
+        response = client.get(f"/api/v1/gdpr/export/{completed_export.id}", headers=auth_headers)
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["status"] == "completed"
+        assert data["progress"] == 100
+        assert data["download_url"].endswith(f"/gdpr/export/{completed_export.id}/download")
+
+    def test_download_supports_range(self, client, auth_headers, completed_export):
+        """Test full and partial downloads of the archive."""
+        url = f"/api/v1/gdpr/export/{completed_export.id}/download"
+        full = client.get(url, headers=auth_headers)
+        assert full.status_code == 200
+        assert full.headers["content-type"] == "application/zip"
+        assert zipfile.is_zipfile(io.BytesIO(full.content))
+
+        partial = client.get(url, headers={**auth_headers, "Range": "bytes=0-99"})
+        assert partial.status_code == 206
+        assert partial.content == full.content[:100]
+
+    def test_latest_export_download(self, client, auth_headers, completed_export):
+        """Test the legacy download endpoint serves the latest archive."""
+        response = client.get("/api/v1/gdpr/export/data", headers=auth_headers)
+        assert response.status_code == 200
+        assert zipfile.is_zipfile(io.BytesIO(response.content))
+
+    def test_no_export_ready(self, client, auth_headers):
+        """Test the legacy download endpoint without a completed export."""
+        response = client.get("/api/v1/gdpr/export/data", headers=auth_headers)
+        assert response.status_code == 404
+
+    def test_other_users_export_not_visible(self, client, premium_auth_headers, completed_export):
+        """Test that users cannot access each other's exports."""
+        response = client.get(f"/api/v1/gdpr/export/{completed_export.id}/download", headers=premium_auth_headers)
+        assert response.status_code == 404
+
+    def test_lost_export_job_is_replaced(self, client, auth_headers, test_db, test_user, monkeypatch):
+        """Test that only recent in-progress jobs are reused."""
+        from workers.tasks.gdpr_tasks import build_data_export
+
+        queued = []
+        monkeypatch.setattr(build_data_export, "delay", queued.append)
+        lost = DataExportJob(user_id=test_user.id, status="running",
+                             started_at=datetime.utcnow() - gdpr_export.STALE_JOB_AFTER - timedelta(minutes=1))
+        test_db.add(lost)
+        test_db.commit()
+
+        first = client.post("/api/v1/gdpr/export", headers=auth_headers).json()
+        second = client.post("/api/v1/gdpr/export", headers=auth_headers).json()
+
+        test_db.refresh(lost)
+        assert lost.status == "failed"
+        assert first["job_id"] != lost.id
+        assert second["job_id"] == first["job_id"]
+        assert queued == [first["job_id"]]
@@ -0,0 +1,142 @@
+"""Tests for the shared LLM gateway."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import services.llm_gateway as gateway_module
+from services.llm_gateway import LLMGateway, estimate_cost
+
+
+class FakeMessages:
+    """Stands in for AsyncAnthropic.messages."""
+
+    def __init__(self, delay=0.01):
+        self.calls = []
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        usage = SimpleNamespace(
+            input_tokens=100, output_tokens=20,
+            cache_creation_input_tokens=0, cache_read_input_tokens=900,
+        )
+        return SimpleNamespace(content=[SimpleNamespace(text=f"answer {len(self.calls)}")], usage=usage)
+
+
+class DictCache:
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ttl_seconds=None):
+        self.data[key] = value
+        return True
+
+
+@pytest.fixture
+def fake_cache(monkeypatch):
+    store = DictCache()
+    monkeypatch.setattr(gateway_module, "cache", store)
+    return store
+
+
+def make_gateway(**kwargs):
+    messages = FakeMessages()
+    gateway = LLMGateway(client_factory=lambda: SimpleNamespace(messages=messages), **kwargs)
+    return gateway, messages
+
+
+def test_shared_context_is_sent_as_cached_prefix(fake_cache):
+    gateway, messages = make_gateway()
+
+    result = asyncio.run(gateway.complete(
+        "List the risks.", call_site="test.risks", model="claude-sonnet-test",
+        shared_context="Meeting Transcript: ...", cache_ttl=None,
+    ))
+
+    content = messages.calls[0]["messages"][0]["content"]
+    assert content[0] == {
+        "type": "text", "text": "Meeting Transcript: ...", "cache_control": {"type": "ephemeral"},
+    }
+    assert content[1] == {"type": "text", "text": "List the risks."}
+    assert result.text == "answer 1"
+    assert result.cache_read_tokens == 900
+
+
+def test_identical_requests_are_memoized(fake_cache):
+    gateway, messages = make_gateway()
+
+    first = asyncio.run(gateway.complete("Summarize.", call_site="test.summary", model="m"))
+    second = asyncio.run(gateway.complete("Summarize.", call_site="test.summary", model="m"))
+    different = asyncio.run(gateway.complete("Summarize briefly.", call_site="test.summary", model="m"))
+
+    assert len(messages.calls) == 2
+    assert second.cached and second.text == first.text
+    assert different.text != first.text
+    assert gateway.stats()["test.summary"]["cache_hits"] == 1
+
+
+def test_concurrent_identical_requests_share_one_call(fake_cache):
+    gateway, messages = make_gateway()
+
+    async def run():
+        return await asyncio.gather(*(
+            gateway.complete("Same prompt", call_site="test.dedup", cache_ttl=None) for _ in range(5)
+        ))
+
+    results = asyncio.run(run())
+
+    assert len(messages.calls) == 1
+    assert {r.text for r in results} == {"answer 1"}
+
+
+def test_per_user_and_global_concurrency_limits(fake_cache):
+    gateway, messages = make_gateway(max_concurrency=4, max_concurrency_per_user=2)
+
+    async def run(user_id, count):
+        await asyncio.gather(*(
+            gateway.complete(f"prompt {user_id}-{i}", call_site="test.limits", user_id=user_id, cache_ttl=None)
+            for i in range(count)
+        ))
+
+    asyncio.run(run(1, 6))
+    assert messages.peak == 2
+
+    messages.peak = 0
+
+    async def run_many_users():
+        await asyncio.gather(*(run(user_id, 2) for user_id in range(10)))
+
+    asyncio.run(run_many_users())
+    assert messages.peak == 4
+
+
+def test_errors_propagate_and_are_counted(fake_cache):
+    async def failing_create(**kwargs):
+        raise RuntimeError("overloaded")
+
+    gateway = LLMGateway(client_factory=lambda: SimpleNamespace(messages=SimpleNamespace(create=failing_create)))
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(gateway.complete("x", call_site="test.errors", cache_ttl=None))
+    assert gateway.stats()["test.errors"]["errors"] == 1
+
+
+def test_cost_uses_model_family_pricing():
+    sonnet = estimate_cost("claude-sonnet-4-20250514", 1_000_000, 0)
+    haiku = estimate_cost("claude-3-haiku-20240307", 1_000_000, 0)
+    cached = estimate_cost("claude-sonnet-4-20250514", 0, 0, cache_read_tokens=1_000_000)
+
+    assert sonnet == pytest.approx(3.0)
+    assert haiku < sonnet
+    assert cached == pytest.approx(sonnet / 10)
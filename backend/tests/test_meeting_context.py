@@ -0,0 +1,118 @@
+"""Tests for versioned meeting context snapshots."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+import services.meeting_context as meeting_context
+from models import Conversation, ActionItem
+from services.meeting_context import (
+    MeetingSnapshot,
+    build_meeting_snapshot,
+    get_meeting_snapshot,
+    meeting_context_version,
+    register_meeting_context_invalidation,
+)
+
+
+class DictCache:
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ttl_seconds=None):
+        self.data[key] = value
+        return True
+
+    def incr(self, key, ttl_seconds=None):
+        self.data[key] = self.data.get(key, 0) + 1
+        return self.data[key]
+
+
+@pytest.fixture
+def fake_cache(monkeypatch):
+    store = DictCache()
+    monkeypatch.setattr(meeting_context, "cache", store)
+    return store
+
+
+@pytest.fixture
+def meeting_with_content(test_db, test_meeting, test_user):
+    start = datetime.utcnow()
+    # Inserted out of order to check the transcript is sorted by time
+    for i in (2, 0, 1):
+        test_db.add(Conversation(
+            meeting_id=test_meeting.id,
+            speaker="other",
+            heard_text=f"point {i}",
+            response_text="noted" if i == 1 else None,
+            timestamp=start + timedelta(minutes=i),
+        ))
+    test_db.add(ActionItem(
+        meeting_id=test_meeting.id,
+        user_id=test_user.id,
+        assignee="User",
+        description="Send the deck",
+        priority="high",
+        status="pending",
+    ))
+    test_db.commit()
+    return test_meeting
+
+
+def test_snapshot_contains_context_and_ordered_transcript(test_db, meeting_with_content):
+    snapshot = build_meeting_snapshot(test_db, meeting_with_content.id)
+
+    assert snapshot.context["title"] == "Test Meeting"
+    assert snapshot.context["action_items"][0]["description"] == "Send the deck"
+    lines = snapshot.transcript.split("\n")
+    assert [line.split(": ", 1)[1] for line in lines] == ["point 0", "point 1", "noted", "point 2"]
+
+
+def test_snapshot_blob_round_trip(test_db, meeting_with_content):
+    snapshot = build_meeting_snapshot(test_db, meeting_with_content.id, version=3)
+
+    restored = MeetingSnapshot.from_blob(snapshot.to_blob())
+
+    assert restored == snapshot
+    assert restored.transcript == snapshot.transcript
+    assert MeetingSnapshot.from_blob("not a blob") is None
+
+
+def test_cached_snapshot_is_reused(test_db, meeting_with_content, fake_cache, monkeypatch):
+    first = get_meeting_snapshot(test_db, meeting_with_content.id)
+
+    def fail_build(*args, **kwargs):
+        raise AssertionError("snapshot should come from the cache")
+
+    monkeypatch.setattr(meeting_context, "build_meeting_snapshot", fail_build)
+    second = get_meeting_snapshot(test_db, meeting_with_content.id)
+
+    assert second == first
+
+
+def test_writes_invalidate_snapshot(test_db, meeting_with_content, fake_cache):
+    register_meeting_context_invalidation()
+    before = get_meeting_snapshot(test_db, meeting_with_content.id)
+    version = meeting_context_version(meeting_with_content.id)
+
+    test_db.add(Conversation(meeting_id=meeting_with_content.id, speaker="user", heard_text="late addition"))
+    test_db.commit()
+
+    assert meeting_context_version(meeting_with_content.id) == version + 1
+    after = get_meeting_snapshot(test_db, meeting_with_content.id)
+    assert "late addition" in after.transcript
+    assert "late addition" not in before.transcript
+
+
+def test_rolled_back_writes_do_not_invalidate(test_db, meeting_with_content, fake_cache):
+    register_meeting_context_invalidation()
+    version = meeting_context_version(meeting_with_content.id)
+
+    test_db.add(Conversation(meeting_id=meeting_with_content.id, speaker="user", heard_text="discarded"))
+    test_db.flush()
+    test_db.rollback()
+
+    assert meeting_context_version(meeting_with_content.id) == version
@@ -0,0 +1,84 @@
+"""Tests for Novah keyword matching and knowledge base search."""
+
+from models import KnowledgeBaseArticle
+from services.knowledge_base_index import KnowledgeBaseIndex, tokenize
+from services.novah_service import NovahService, KeywordMatcher
+
+
+def naive_first(groups, text):
+    """The keyword loop the matcher replaces."""
+    for label, keywords in groups.items():
+        for keyword in keywords:
+            if keyword in text:
+                return label
+    return None
+
+
+def test_matcher_agrees_with_keyword_loop():
+    service = NovahService()
+    messages = [
+        "I want to talk to billing about an invoice",
+        "the app is broken and I need a refund",
+        "how do i reset my password",
+        "can I get a demo for my enterprise team?",
+        "technical question about pricing",
+        "hello there",
+        "my subscription fee was charged twice",
+        "",
+    ]
+    for message in messages:
+        text = message.lower()
+        assert service.detect_category(message) == (naive_first(service.CATEGORY_MAPPINGS, text) or "general")
+        assert service.detect_transfer_category(message) == naive_first(service.TRANSFER_CATEGORY_KEYWORDS, text)
+        assert service.wants_to_transfer(message) == any(k in text for k in service.TRANSFER_KEYWORDS)
+        topics = {t: d["keywords"] for t, d in service.DIRECT_ANSWERS.items()}
+        expected = naive_first(topics, text)
+        assert service.get_direct_answer(message) == (service.DIRECT_ANSWERS[expected]["response"] if expected else None)
+
+
+def test_matcher_finds_keywords_overlapping_an_earlier_match():
+    matcher = KeywordMatcher({"first": ["issue"], "second": ["tissue box"]})
+
+    # "tissue box" starts first, but "issue" inside it has higher priority
+    assert matcher.first("a tissue box") == "first"
+    assert KeywordMatcher({"empty": []}).first("anything") is None
+
+
+def add_article(db, title, content, summary=None, tags=None, published=True):
+    article = KnowledgeBaseArticle(
+        title=title, content=content, summary=summary,
+        category="faq", tags=tags or [], is_published=published,
+    )
+    db.add(article)
+    db.commit()
+    return article
+
+
+def test_bm25_ranks_title_matches_first(test_db):
+    body = add_article(test_db, "Account settings", "You can cancel your subscription from billing settings.")
+    title = add_article(test_db, "How to cancel your subscription", "Open settings and choose cancel.")
+    add_article(test_db, "Audio setup", "Choose the right microphone.")
+    add_article(test_db, "Cancelling drafts", "Drafts are hidden.", published=False)
+
+    index = KnowledgeBaseIndex(refresh_seconds=0)
+    results = index.search(test_db, "cancelling my subscription")
+
+    assert [a.id for a in results] == [title.id, body.id]
+    assert index.search(test_db, "the and for") == []
+
+
+def test_index_rebuilds_when_articles_change(test_db):
+    index = KnowledgeBaseIndex(refresh_seconds=0)
+    assert index.search(test_db, "webex") == []
+
+    article = add_article(test_db, "Webex integration", "Connect ReadIn AI to Webex meetings.", tags=["integrations"])
+    assert [a.id for a in index.search(test_db, "webex")] == [article.id]
+    assert [a.id for a in index.search(test_db, "integration")] == [article.id]
+
+    article.is_published = False
+    test_db.commit()
+    assert index.search(test_db, "webex") == []
+
+
+def test_tokenize_stems_and_drops_stopwords():
+    assert tokenize("How do I cancel my Subscriptions?") == ["cancel", "subscription"]
@@ -0,0 +1,197 @@
+"""Tests for bulk status pulls from project management tools.
+
+Provider responses are recorded fixtures under tests/fixtures/pm_status,
+served by the pm_api fixture so the tests run offline.
+"""
+
+import asyncio
+import json
+
+from sqlalchemy import event
+
+from integrations.project_management.asana import AsanaIntegration
+from integrations.project_management.base import TaskStatus
+from integrations.project_management.jira import JiraIntegration
+from integrations.project_management.linear import LinearIntegration
+from integrations.project_management.monday import MondayIntegration
+from integrations.project_management.notion import NotionIntegration
+import services.pm_sync_service as pm_sync_module
+from models import ActionItemSync
+from services.pm_sync_service import PMSyncService
+
+JIRA_API = "/ex/jira/cloud-1/rest/api/3"
+LINEAR_IDS = [f"7b1a0c6e-1f0a-4c53-9d57-2f4c1f3f9a0{n}" for n in (1, 2, 3)]
+
+
+def statuses(integration, external_ids):
+    async def run():
+        try:
+            return await integration.get_statuses(external_ids)
+        finally:
+            await integration.close()
+    return asyncio.run(run())
+
+
+class TestProviderBulkStatuses:
+    """Test each provider's bulk status lookup against recorded responses."""
+
+    def test_jira_single_jql_search(self, test_db, pm_api):
+        """Test that Jira issues are looked up with one JQL search."""
+        pm_api.routes[("POST", f"{JIRA_API}/search/jql")] = [(200, "pm_status/jira_search_jql")]
+        jira = JiraIntegration(test_db, access_token="t", cloud_id="cloud-1")
+
+        result = statuses(jira, ["10001", "10002", "10003"])
+
+        assert result == {
+            "10001": TaskStatus.COMPLETED,
+            "10002": TaskStatus.IN_PROGRESS,
+            "10003": TaskStatus.PENDING,
+        }
+        assert len(pm_api.requests) == 1
+        body = json.loads(pm_api.requests[0].content)
+        assert body["jql"] == "issuekey in (10001, 10002, 10003)"
+        assert body["fields"] == ["status"]
+
+    def test_jira_rejected_search_falls_back_with_limited_concurrency(self, test_db, pm_api, monkeypatch):
+        """Test that a batch with a deleted issue is fetched issue by issue."""
+        monkeypatch.setattr(JiraIntegration, "STATUS_FETCH_CONCURRENCY", 2)
+        pm_api.routes[("POST", f"{JIRA_API}/search/jql")] = [(400, "pm_status/jira_search_jql_missing_issue")]
+        for issue_id in ("10001", "10002", "10003", "10004"):
+            pm_api.routes[("GET", f"{JIRA_API}/issue/{issue_id}")] = [(200, "pm_status/jira_issue")]
+        pm_api.delay = 0.01
+        jira = JiraIntegration(test_db, access_token="t", cloud_id="cloud-1")
+
+        result = statuses(jira, ["10001", "10002", "10003", "10004", "10009"])
+
+        assert set(result) == {"10001", "10002", "10003", "10004"}
+        assert len(pm_api.requests) == 6
+        assert pm_api.max_in_flight == 2
+
+    def test_linear_graphql_filter(self, test_db, pm_api):
+        """Test that Linear issues are looked up with one GraphQL query."""
+        pm_api.routes[("POST", "/graphql")] = [(200, "pm_status/linear_issue_states")]
+        linear = LinearIntegration(test_db, access_token="t")
+
+        result = statuses(linear, LINEAR_IDS)
+
+        assert list(result.values()) == [TaskStatus.COMPLETED, TaskStatus.CANCELLED, TaskStatus.PENDING]
+        assert len(pm_api.requests) == 1
+        assert json.loads(pm_api.requests[0].content)["variables"] == {"ids": LINEAR_IDS, "first": 3}
+
+    def test_asana_batch_api(self, test_db, pm_api):
+        """Test that Asana tasks are read ten per Batch API request."""
+        pm_api.routes[("POST", "/api/1.0/batch")] = [
+            (200, "pm_status/asana_batch_1"), (200, "pm_status/asana_batch_2"),
+        ]
+        asana = AsanaIntegration(test_db, access_token="t")
+        gids = [f"12000000000001{n:02d}" for n in range(1, 12)]
+
+        result = statuses(asana, gids)
+
+        assert len(pm_api.requests) == 2
+        actions = json.loads(pm_api.requests[0].content)["data"]["actions"]
+        assert [a["relative_path"] for a in actions] == [f"/tasks/{gid}" for gid in gids[:10]]
+        assert result["1200000000000101"] == TaskStatus.COMPLETED
+        assert result["1200000000000102"] == TaskStatus.IN_PROGRESS
+        assert result["1200000000000111"] == TaskStatus.COMPLETED
+        assert "1200000000000103" not in result
+        assert len(result) == 10
+
+    def test_notion_database_query_with_page_fallback(self, test_db, pm_api):
+        """Test that Notion pages come from the database query, the rest one by one."""
+        database_id = "5c4f3b2a-9e8d-4c7b-a6f5-e4d3c2b1a090"
+        archived_id = "9f1e2d3c-4b5a-4697-8877-665544332203"
+        pm_api.routes[("POST", f"/v1/databases/{database_id}/query")] = [
+            (200, "pm_status/notion_database_query_1"), (200, "pm_status/notion_database_query_2"),
+        ]
+        pm_api.routes[("GET", f"/v1/pages/{archived_id}")] = [(200, "pm_status/notion_page_archived")]
+        notion = NotionIntegration(test_db, access_token="t", database_id=database_id)
+        notion.DIRECT_LOOKUP_LIMIT = 1  # Walk the database even for these few pages
+
+        result = statuses(notion, [
+            "9f1e2d3c4b5a46978877665544332201",
+            "9f1e2d3c-4b5a-4697-8877-665544332202",
+            archived_id,
+        ])
+
+        assert result == {
+            "9f1e2d3c4b5a46978877665544332201": TaskStatus.COMPLETED,
+            "9f1e2d3c-4b5a-4697-8877-665544332202": TaskStatus.IN_PROGRESS,
+            archived_id: TaskStatus.CANCELLED,
+        }
+        assert len(pm_api.requests) == 3
+        assert json.loads(pm_api.requests[1].content)["start_cursor"] == "9f1e2d3c-4b5a-4697-8877-6655443322ff"
+
+    def test_notion_few_pages_are_fetched_directly(self, test_db, pm_api):
+        """Test that a page or two are looked up without walking the database."""
+        archived_id = "9f1e2d3c-4b5a-4697-8877-665544332203"
+        pm_api.routes[("GET", f"/v1/pages/{archived_id}")] = [(200, "pm_status/notion_page_archived")]
+        notion = NotionIntegration(test_db, access_token="t", database_id="5c4f3b2a-9e8d-4c7b-a6f5-e4d3c2b1a090")
+
+        result = statuses(notion, [archived_id])
+
+        assert result == {archived_id: TaskStatus.CANCELLED}
+        assert [request.method for request in pm_api.requests] == ["GET"]
+
+    def test_monday_items_query(self, test_db, pm_api):
+        """Test that Monday.com items are looked up with one items query."""
+        pm_api.routes[("POST", "/v2")] = [(200, "pm_status/monday_items")]
+        monday = MondayIntegration(test_db, access_token="t")
+
+        result = statuses(monday, ["1623400001", "1623400002"])
+
+        assert result == {"1623400001": TaskStatus.COMPLETED, "1623400002": TaskStatus.CANCELLED}
+        assert len(pm_api.requests) == 1
+
+
+class TestSyncFromExternal:
+    """Test that PMSyncService pulls statuses in bulk and updates in bulk."""
+
+    def test_updates_changed_items(self, test_db, test_user, pm_api, link_pm_items):
+        """Test that changed statuses are applied and reported."""
+        pm_api.routes[("POST", f"{JIRA_API}/search/jql")] = [(200, "pm_status/jira_search_jql")]
+        _, items = link_pm_items("jira", ["10001", "10002", "10003"])
+
+        updated = asyncio.run(PMSyncService(test_db).sync_from_external(test_user.id, "jira"))
+
+        assert {u["action_item_id"]: u["new_status"] for u in updated} == {
+            items[0].id: "completed",
+            items[1].id: "in_progress",
+        }
+        test_db.expire_all()
+        assert [item.status for item in items] == ["completed", "in_progress", "pending"]
+        assert items[0].completed_at is not None
+        syncs = test_db.query(ActionItemSync).order_by(ActionItemSync.id).all()
+        assert [s.last_external_status for s in syncs] == ["completed", "in_progress", "pending"]
+        assert len(pm_api.requests) == 1
+
+    def test_query_count_does_not_grow_with_items(self, test_db, test_user, pm_api, link_pm_items):
+        """Test that local rows are loaded and updated with a fixed number of queries."""
+        pm_api.routes[("POST", "/graphql")] = [(200, "pm_status/linear_issue_states")]
+        link_pm_items("linear", LINEAR_IDS + [f"unchanged-{n}" for n in range(20)])
+
+        statements = []
+        event.listen(test_db.get_bind(), "before_cursor_execute",
+                     lambda conn, cursor, sql, *args: statements.append(sql))
+        updated = asyncio.run(PMSyncService(test_db).sync_from_external(test_user.id, "linear"))
+
+        assert len(updated) == 2
+        item_selects = [s for s in statements if s.startswith("SELECT") and "FROM action_items" in s]
+        updates = [s for s in statements if s.startswith("UPDATE")]
+        assert len(item_selects) == 1
+        # One UPDATE per new item status, one per external status, one for the connection
+        assert len(updates) == 2 + 3 + 1
+
+    def test_invalidates_meeting_snapshots_after_commit(self, test_db, test_user, pm_api, link_pm_items, monkeypatch):
+        """Test that meetings whose items changed get their cached snapshot dropped."""
+        pm_api.routes[("POST", f"{JIRA_API}/search/jql")] = [(200, "pm_status/jira_search_jql")]
+        _, items = link_pm_items("jira", ["10001", "10002", "10003"])
+        invalidated = []
+        monkeypatch.setattr(
+            pm_sync_module, "invalidate_meeting_context",
+            lambda meeting_id: invalidated.append((meeting_id, test_db.in_transaction())),
+        )
+
+        asyncio.run(PMSyncService(test_db).sync_from_external(test_user.id, "jira"))
+
+        assert invalidated == [(items[0].meeting_id, False)]
@@ -0,0 +1,355 @@
+"""Tests for inbound project management webhooks.
+
+Webhook payloads are recorded fixtures under tests/fixtures/pm_webhooks;
+status lookups they trigger are served by the pm_api fixture.
+"""
+
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta
+from urllib.parse import parse_qsl, urlsplit
+
+from jose import jwt
+
+from integrations.project_management.asana import AsanaIntegration
+from integrations.project_management.base import webhook_signature
+from integrations.project_management.jira import JiraIntegration
+from integrations.project_management.linear import LinearIntegration
+from integrations.project_management.monday import MondayIntegration
+from integrations.project_management.notion import NotionIntegration
+import services.pm_sync_service as pm_sync_module
+from models import ActionItem, PMWebhookEvent, StaffRole
+from routes.project_management import register_project_webhook
+from services.pm_sync_service import PMSyncService
+from tests.conftest import create_test_user, recorded
+
+LINEAR_ISSUE = "7b1a0c6e-1f0a-4c53-9d57-2f4c1f3f9a01"
+
+
+def post_webhook(client, provider, payload, headers=None, params=None, sign=None):
+    """POST a webhook; ``sign`` builds signature headers from the raw body."""
+    body = json.dumps(payload).encode() if payload is not None else b""
+    headers = {"Content-Type": "application/json", **(headers or {})}
+    if sign:
+        headers.update(sign(body))
+    return client.post(
+        f"/api/v1/integrations/pm/{provider}/webhook",
+        content=body, headers=headers, params=params,
+    )
+
+
+def item_status(db, item):
+    db.expire_all()
+    return db.query(ActionItem).filter(ActionItem.id == item.id).one().status
+
+
+def linear_payload():
+    payload = recorded("pm_webhooks/linear_issue_update")
+    payload["webhookTimestamp"] = int(time.time() * 1000)
+    return payload
+
+
+class TestLinearWebhook:
+    """Test signature checks, dedup and status mapping for Linear."""
+
+    def test_update_applies_once(self, client, test_db, pm_api, link_pm_items, monkeypatch):
+        """Test that a signed update applies and its redelivery is skipped."""
+        monkeypatch.setattr(LinearIntegration, "WEBHOOK_SECRET", "linear-secret")
+        _, items = link_pm_items("linear", [LINEAR_ISSUE])
+        payload = linear_payload()
+        invalidated = []
+        monkeypatch.setattr(pm_sync_module, "invalidate_meeting_context", invalidated.append)
+
+        def sign(body):
+            return {
+                "Linear-Signature": webhook_signature("linear-secret", body),
+                "Linear-Delivery": "delivery-1",
+            }
+
+        first = post_webhook(client, "linear", payload, sign=sign)
+        second = post_webhook(client, "linear", payload, sign=sign)
+
+        assert first.status_code == 200 and first.json()["updated"] == 1
+        assert second.status_code == 200 and second.json()["updated"] == 0
+        assert item_status(test_db, items[0]) == "completed"
+        assert test_db.query(PMWebhookEvent).count() == 1
+        assert invalidated == [items[0].meeting_id]
+        # The new state came in the payload: no call back to Linear
+        assert pm_api.requests == []
+
+    def test_rejects_bad_signature_and_replays(self, client, test_db, link_pm_items, monkeypatch):
+        """Test that forged and stale deliveries are rejected."""
+        monkeypatch.setattr(LinearIntegration, "WEBHOOK_SECRET", "linear-secret")
+        _, items = link_pm_items("linear", [LINEAR_ISSUE])
+
+        forged = post_webhook(client, "linear", linear_payload(),
+                              sign=lambda body: {"Linear-Signature": webhook_signature("wrong", body)})
+        stale = post_webhook(client, "linear", recorded("pm_webhooks/linear_issue_update"),
+                             sign=lambda body: {"Linear-Signature": webhook_signature("linear-secret", body)})
+
+        assert forged.status_code == 401
+        assert stale.status_code == 401
+        assert item_status(test_db, items[0]) == "pending"
+
+    def test_not_configured(self, client, monkeypatch):
+        """Test that webhooks are refused without a signing secret."""
+        monkeypatch.setattr(LinearIntegration, "WEBHOOK_SECRET", "")
+
+        response = post_webhook(client, "linear", linear_payload())
+
+        assert response.status_code == 503
+
+
+class TestJiraWebhook:
+    """Test Jira issue events."""
+
+    def test_issue_updated(self, client, test_db, pm_api, link_pm_items):
+        """Test that the status category is mapped through map_status_from_external."""
+        connection, items = link_pm_items("jira", ["10001", "10002"], webhook_secret="jira-secret")
+
+        response = post_webhook(
+            client, "jira", recorded("pm_webhooks/jira_issue_updated"),
+            headers={"X-Atlassian-Webhook-Identifier": "1773237731418-1"},
+            params={"connection_id": connection.id},
+            sign=lambda body: {"X-Hub-Signature": "sha256=" + webhook_signature("jira-secret", body)},
+        )
+
+        assert response.status_code == 200
+        assert item_status(test_db, items[0]) == "pending"
+        assert item_status(test_db, items[1]) == "completed"
+        assert pm_api.requests == []
+
+    def test_same_issue_id_on_two_sites(self, client, test_db, link_pm_items):
+        """Test that an event only reaches the connection whose URL and secret it used."""
+        ours, our_items = link_pm_items("jira", ["10002"], webhook_secret="site-1-secret")
+        other_user = create_test_user(test_db, email="other@example.com")
+        theirs, their_items = link_pm_items("jira", ["10002"], user=other_user,
+                                            workspace_id="cloud-2", webhook_secret="site-2-secret")
+
+        delivered = post_webhook(
+            client, "jira", recorded("pm_webhooks/jira_issue_updated"),
+            headers={"X-Atlassian-Webhook-Identifier": "1773237731418-1"},
+            params={"connection_id": ours.id},
+            sign=lambda body: {"X-Hub-Signature": "sha256=" + webhook_signature("site-1-secret", body)},
+        )
+        # Site 1's secret does not sign events for site 2's receiver
+        forged = post_webhook(
+            client, "jira", recorded("pm_webhooks/jira_issue_updated"),
+            headers={"X-Atlassian-Webhook-Identifier": "1773237731418-2"},
+            params={"connection_id": theirs.id},
+            sign=lambda body: {"X-Hub-Signature": "sha256=" + webhook_signature("site-1-secret", body)},
+        )
+
+        assert delivered.status_code == 200
+        assert forged.status_code == 401
+        assert item_status(test_db, our_items[0]) == "completed"
+        assert item_status(test_db, their_items[0]) == "pending"
+
+    def test_webhook_secret_for_connection(self, client, test_db, link_pm_items, auth_headers):
+        """Test that the receiver URL and a new secret are handed out per connection."""
+        connection, _ = link_pm_items("jira", ["10001"])
+
+        response = client.post("/api/v1/integrations/pm/jira/webhook-secret", headers=auth_headers)
+        unknown = post_webhook(client, "jira", recorded("pm_webhooks/jira_issue_updated"))
+
+        assert response.status_code == 200
+        test_db.refresh(connection)
+        assert response.json()["secret"] == connection.webhook_secret
+        assert response.json()["url"].endswith(f"/jira/webhook?connection_id={connection.id}")
+        assert unknown.status_code == 404
+
+
+class TestAsanaWebhook:
+    """Test the Asana handshake and task events."""
+
+    def test_registration_handshake_stores_secret(self, client, test_db, link_pm_items, monkeypatch):
+        """Test that the handshake Asana sends during registration is accepted once."""
+        connection, _ = link_pm_items("asana", ["1200000000000111"])
+        handshakes = []
+
+        async def create_webhook(self, target_url):
+            # Asana calls the receiver before answering the create request
+            params = dict(parse_qsl(urlsplit(target_url).query))
+            handshakes.append(post_webhook(client, "asana", None, headers={"X-Hook-Secret": "hook-secret"},
+                                           params=params))
+            handshakes.append(post_webhook(client, "asana", None, headers={"X-Hook-Secret": "other"},
+                                           params=params))
+            return "1209000000000001"
+
+        monkeypatch.setattr(AsanaIntegration, "create_webhook", create_webhook)
+        asyncio.run(register_project_webhook("asana", connection, test_db))
+
+        assert handshakes[0].status_code == 200
+        assert handshakes[0].headers["X-Hook-Secret"] == "hook-secret"
+        assert handshakes[1].status_code == 403
+        test_db.refresh(connection)
+        assert connection.webhook_secret == "hook-secret"
+        assert connection.webhook_id == "1209000000000001"
+        assert connection.webhook_handshake_nonce is None
+
+    def test_handshake_without_pending_registration(self, client, test_db, link_pm_items):
+        """Test that a handshake is refused unless it carries the pending nonce."""
+        connection, _ = link_pm_items("asana", ["1200000000000111"])
+
+        unsolicited = post_webhook(client, "asana", None, headers={"X-Hook-Secret": "forged"},
+                                   params={"connection_id": connection.id})
+        connection.webhook_handshake_nonce = "nonce-1"
+        test_db.commit()
+        guessed = post_webhook(client, "asana", None, headers={"X-Hook-Secret": "forged"},
+                               params={"connection_id": connection.id, "handshake": "nonce-2"})
+
+        assert unsolicited.status_code == 403
+        assert guessed.status_code == 403
+        test_db.refresh(connection)
+        assert connection.webhook_secret is None
+
+    def test_task_events_fetch_status(self, client, test_db, pm_api, link_pm_items):
+        """Test that changed tasks are looked up with one Batch API request."""
+        connection, items = link_pm_items("asana", ["1200000000000111"], webhook_secret="hook-secret")
+        pm_api.routes[("POST", "/api/1.0/batch")] = [(200, "pm_status/asana_batch_2")]
+
+        response = post_webhook(
+            client, "asana", recorded("pm_webhooks/asana_task_events"),
+            params={"connection_id": connection.id},
+            sign=lambda body: {"X-Hook-Signature": webhook_signature("hook-secret", body)},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["events"] == 1  # The story event is ignored
+        assert item_status(test_db, items[0]) == "completed"
+        assert len(pm_api.requests) == 1
+
+    def test_failed_lookup_is_redelivered(self, client, test_db, pm_api, link_pm_items, monkeypatch):
+        """Test that events whose lookup failed answer 503 and apply on redelivery."""
+        connection, items = link_pm_items("asana", ["1200000000000111"], webhook_secret="hook-secret")
+        pm_api.routes[("POST", "/api/1.0/batch")] = [(200, "pm_status/asana_batch_2")]
+
+        async def unavailable(self, external_ids):
+            raise RuntimeError("Asana unavailable")
+
+        def deliver():
+            return post_webhook(
+                client, "asana", recorded("pm_webhooks/asana_task_events"),
+                params={"connection_id": connection.id},
+                sign=lambda body: {"X-Hook-Signature": webhook_signature("hook-secret", body)},
+            )
+
+        with monkeypatch.context() as patch:
+            patch.setattr(AsanaIntegration, "get_statuses", unavailable)
+            failed = deliver()
+        assert failed.status_code == 503
+        assert test_db.query(PMWebhookEvent).count() == 0
+
+        redelivered = deliver()
+        assert redelivered.status_code == 200
+        assert item_status(test_db, items[0]) == "completed"
+
+    def test_unknown_connection_is_gone(self, client):
+        """Test that Asana is told to drop webhooks of removed connections."""
+        response = post_webhook(client, "asana", recorded("pm_webhooks/asana_task_events"),
+                                params={"connection_id": 999})
+
+        assert response.status_code == 410
+
+
+class TestMondayWebhook:
+    """Test the monday.com challenge and JWT-signed events."""
+
+    def _sign(self, secret):
+        token = jwt.encode({"accountId": 1234567, "exp": int(time.time()) + 60}, secret, algorithm="HS256")
+        return lambda body: {"Authorization": token}
+
+    def test_challenge(self, client):
+        """Test that the URL verification challenge is echoed."""
+        challenge = {"challenge": "3eZbrw1aBm2rZgRNFdxV2595E9CY3gmdALWMmHkvFXO7tYXAYM8P"}
+
+        response = post_webhook(client, "monday", challenge)
+
+        assert response.json() == challenge
+
+    def test_status_change(self, client, test_db, pm_api, link_pm_items, monkeypatch):
+        """Test that the label in the event is applied without an API call."""
+        monkeypatch.setattr(MondayIntegration, "WEBHOOK_SECRET", "monday-secret")
+        _, items = link_pm_items("monday", ["1623400001"])
+
+        response = post_webhook(client, "monday", recorded("pm_webhooks/monday_status_change"),
+                                sign=self._sign("monday-secret"))
+
+        assert response.status_code == 200
+        assert item_status(test_db, items[0]) == "completed"
+        assert pm_api.requests == []
+
+    def test_priority_column_and_bad_token(self, client, test_db, link_pm_items, monkeypatch):
+        """Test that priority changes are ignored and bad tokens rejected."""
+        monkeypatch.setattr(MondayIntegration, "WEBHOOK_SECRET", "monday-secret")
+        _, items = link_pm_items("monday", ["1623400001"])
+        payload = recorded("pm_webhooks/monday_status_change")
+        payload["event"]["columnTitle"] = "Priority"
+
+        ignored = post_webhook(client, "monday", payload, sign=self._sign("monday-secret"))
+        forged = post_webhook(client, "monday", recorded("pm_webhooks/monday_status_change"),
+                              sign=self._sign("wrong"))
+
+        assert ignored.json()["events"] == 0
+        assert forged.status_code == 401
+        assert item_status(test_db, items[0]) == "pending"
+
+
+class TestNotionWebhook:
+    """Test Notion subscription verification and page events."""
+
+    def test_verification_request(self, client, test_db, test_user, auth_headers, caplog):
+        """Test that the verification token is kept for a super admin, not logged."""
+        caplog.set_level("INFO")
+        token = "secret_tMrlL1qK5vuQAh1b6cZGhFChZTSYJlce98V0pYn7yBl"
+        response = post_webhook(client, "notion", {"verification_token": token})
+
+        assert response.status_code == 200
+        assert "verification request received" in caplog.text
+        assert token not in caplog.text
+
+        read_url = "/api/v1/integrations/pm/notion/webhook-verification"
+        assert client.post(read_url, headers=auth_headers).status_code == 403
+
+        test_user.is_staff = True
+        test_user.staff_role = StaffRole.SUPER_ADMIN
+        test_db.commit()
+        first = client.post(read_url, headers=auth_headers)
+        second = client.post(read_url, headers=auth_headers)
+
+        assert first.status_code == 200
+        assert first.json()["verification_token"] == token
+        assert second.status_code == 404
+
+    def test_page_event_fetches_status(self, client, test_db, pm_api, link_pm_items, monkeypatch):
+        """Test that the page named by the event is looked up."""
+        monkeypatch.setattr(NotionIntegration, "WEBHOOK_SECRET", "notion-secret")
+        page_id = "9f1e2d3c-4b5a-4697-8877-665544332203"
+        _, items = link_pm_items("notion", [page_id], project_id=None)
+        pm_api.routes[("GET", f"/v1/pages/{page_id}")] = [(200, "pm_status/notion_page_archived")]
+
+        response = post_webhook(
+            client, "notion", recorded("pm_webhooks/notion_page_properties_updated"),
+            sign=lambda body: {"X-Notion-Signature": "sha256=" + webhook_signature("notion-secret", body)},
+        )
+
+        assert response.status_code == 200
+        assert item_status(test_db, items[0]) == "cancelled"
+        assert len(pm_api.requests) == 1
+
+
+class TestWebhookEventRetention:
+    """Test pruning of webhook dedup records."""
+
+    def test_prune_keeps_recent_events(self, test_db):
+        """Test that only records past the retention window are deleted."""
+        test_db.add(PMWebhookEvent(provider="linear", event_id="old",
+                                   received_at=datetime.utcnow() - timedelta(days=8)))
+        test_db.add(PMWebhookEvent(provider="linear", event_id="new"))
+        test_db.commit()
+
+        deleted = PMSyncService(test_db).prune_webhook_events()
+
+        assert deleted == 1
+        assert [e.event_id for e in test_db.query(PMWebhookEvent).all()] == ["new"]
@@ -130,40 +130,37 @@ class TestRecommendationService:
         language = service._get_user_language(1)
         assert language == "en"
 
-    def test_get_meeting_transcript_empty(self, mock_db):
+    def test_get_meeting_transcript_empty(self, mock_db, mock_meeting):
         """Test transcript generation with no conversations."""
-        mock_db.query.return_value.filter.return_value.order_by.return_value.all.return_value = []
+        mock_meeting.conversations = []
+        mock_db.query.return_value.options.return_value.filter.return_value.first.return_value = mock_meeting
         service = RecommendationService(mock_db)
         transcript = service._get_meeting_transcript(1)
         assert transcript == ""
 
-    def test_get_meeting_transcript_with_conversations(self, mock_db, mock_conversation):
+    def test_get_meeting_transcript_with_conversations(self, mock_db, mock_meeting, mock_conversation):
         """Test transcript generation with conversations."""
-        mock_db.query.return_value.filter.return_value.order_by.return_value.all.return_value = [mock_conversation]
+        mock_meeting.conversations = [mock_conversation]
+        mock_db.query.return_value.options.return_value.filter.return_value.first.return_value = mock_meeting
         service = RecommendationService(mock_db)
         transcript = service._get_meeting_transcript(1)
         assert "Let's discuss the project timeline" in transcript
 
     def test_get_meeting_context_not_found(self, mock_db):
         """Test meeting context when meeting not found."""
-        mock_db.query.return_value.filter.return_value.first.return_value = None
+        mock_db.query.return_value.options.return_value.filter.return_value.first.return_value = None
         service = RecommendationService(mock_db)
         context = service._get_meeting_context(1)
         assert context == {}
 
     def test_get_meeting_context_with_data(self, mock_db, mock_meeting, mock_summary):
         """Test meeting context with data."""
-        # Setup mocks
-        def mock_query(model):
-            mock = MagicMock()
-            if model.__name__ == "Meeting":
-                mock.filter.return_value.first.return_value = mock_meeting
-            elif model.__name__ == "MeetingSummary":
-                mock.filter.return_value.first.return_value = mock_summary
-            else:
-                mock.filter.return_value.all.return_value = []
-            return mock
-        mock_db.query.side_effect = mock_query
+        # Setup mocks (the snapshot eager-loads related rows with the meeting)
+        mock_meeting.summary = mock_summary
+        mock_meeting.action_items = []
+        mock_meeting.commitments = []
+        mock_meeting.conversations = []
+        mock_db.query.return_value.options.return_value.filter.return_value.first.return_value = mock_meeting
 
         service = RecommendationService(mock_db)
         context = service._get_meeting_context(1)
@@ -175,7 +172,7 @@ class TestRecommendationService:
     @pytest.mark.asyncio
     async def test_get_next_steps_no_meeting(self, mock_db):
         """Test next steps when meeting not found."""
-        mock_db.query.return_value.filter.return_value.first.return_value = None
+        mock_db.query.return_value.options.return_value.filter.return_value.first.return_value = None
         service = RecommendationService(mock_db)
         steps = await service.get_next_steps(999)
         assert steps == []
@@ -217,7 +214,7 @@ class TestRecommendationService:
     @pytest.mark.asyncio
     async def test_detect_risks_no_meeting(self, mock_db):
         """Test risk detection when meeting not found."""
-        mock_db.query.return_value.filter.return_value.first.return_value = None
+        mock_db.query.return_value.options.return_value.filter.return_value.first.return_value = None
         service = RecommendationService(mock_db)
         risks = await service.detect_risks(999)
         assert risks == []
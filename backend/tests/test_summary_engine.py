@@ -0,0 +1,200 @@
+"""Tests for hierarchical meeting summarization."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+import services.summary_engine as summary_engine
+from models import Conversation, MeetingRollingSummary
+from services.rolling_summary import RollingSummarizer, meetings_pending_fold
+from services.summary_engine import SectionSummarizer, split_transcript, estimate_tokens
+from services.summary_generator import SummaryGenerator
+
+
+class FakeGateway:
+    """Stands in for the LLM gateway, recording prompts."""
+
+    def __init__(self):
+        self.prompts = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def complete(self, prompt, *, call_site, model=None, max_tokens=1024, cache_ttl=None, **kwargs):
+        self.prompts.append(prompt)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        notes = {"summary": f"notes {len(self.prompts)}", "action_items": [], "topics_discussed": []}
+        return SimpleNamespace(text=f"```json\n{json.dumps(notes)}\n```")
+
+
+class DictCache:
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ttl_seconds=None):
+        self.data[key] = value
+        return True
+
+
+@pytest.fixture
+def fake_cache(monkeypatch):
+    store = DictCache()
+    monkeypatch.setattr(summary_engine, "cache", store)
+    return store
+
+
+def make_summarizer(concurrency=4):
+    gateway = FakeGateway()
+    return SectionSummarizer(client=gateway, model="test-model", concurrency=concurrency), gateway
+
+
+def make_lines(count):
+    return [f"[10:{i % 60:02d}] Speaker {i % 3}: discussing item number {i} of the roadmap in detail" for i in range(count)]
+
+
+def test_split_covers_all_lines_within_bounds():
+    lines = make_lines(600)
+    sections = split_transcript(lines, target_tokens=400)
+
+    assert [line for s in sections for line in s.lines] == lines
+    assert len(sections) > 1
+    for section in sections:
+        assert estimate_tokens(section.text) <= 400 * summary_engine.SECTION_MAX_RATIO + 30
+
+
+def test_split_is_stable_after_edit():
+    lines = make_lines(600)
+    before = split_transcript(lines, target_tokens=400)
+
+    edited = list(lines)
+    edited[5] = edited[5] + " (corrected)"
+    after = split_transcript(edited, target_tokens=400)
+
+    before_hashes = {s.content_hash for s in before}
+    changed = [s for s in after if s.content_hash not in before_hashes]
+    assert len(changed) == 1
+    assert "(corrected)" in changed[0].text
+
+
+def test_sections_are_cached_by_content(fake_cache):
+    lines = make_lines(600)
+    sections = split_transcript(lines, target_tokens=400)
+
+    summarizer, messages = make_summarizer()
+    first = asyncio.run(summarizer.summarize_sections(sections, "team_meeting", "en"))
+    assert len(first) == len(sections)
+    assert summarizer.cache_misses == len(sections)
+
+    edited = list(lines)
+    edited[5] = edited[5] + " (corrected)"
+    summarizer, messages = make_summarizer()
+    asyncio.run(summarizer.summarize_sections(split_transcript(edited, target_tokens=400), "team_meeting", "en"))
+    assert summarizer.cache_misses == 1
+    assert len(messages.prompts) == 1
+
+
+def test_sections_run_concurrently_within_limit(fake_cache):
+    sections = split_transcript(make_lines(600), target_tokens=200)
+    summarizer, messages = make_summarizer(concurrency=3)
+
+    asyncio.run(summarizer.summarize_sections(sections, None, "en"))
+
+    assert len(sections) > 3
+    assert messages.peak == 3
+
+
+def test_condense_merges_until_notes_fit(fake_cache):
+    notes = [{"summary": "x" * 400, "action_items": [{"description": f"task {i}"}]} for i in range(20)]
+    summarizer, messages = make_summarizer()
+
+    condensed = asyncio.run(summarizer.condense(notes, "general", "en", max_tokens=500))
+
+    assert estimate_tokens(summarizer.render_notes(condensed)) <= 500
+    assert len(condensed) < len(notes)
+    assert messages.prompts
+
+
+def test_condense_transcript_raises_when_a_section_fails(fake_cache, test_db):
+    lines = make_lines(600)
+    summarizer, messages = make_summarizer()
+    complete = messages.complete
+
+    async def fail_second_section(prompt, **kwargs):
+        if "(part 2)" in prompt:
+            raise RuntimeError("upstream timeout")
+        return await complete(prompt, **kwargs)
+
+    messages.complete = fail_second_section
+    generator = SummaryGenerator(test_db)
+
+    with pytest.raises(RuntimeError, match="1 transcript section"):
+        asyncio.run(generator._condense_transcript(lines, "team_meeting", "en", summarizer))
+    assert summarizer.failures == 1
+
+
+def add_conversations(db, meeting, count, start=0):
+    for i in range(start, start + count):
+        db.add(Conversation(
+            meeting_id=meeting.id,
+            speaker="other",
+            heard_text=f"We agreed to ship milestone {i} after reviewing the rollout plan together",
+        ))
+    db.commit()
+
+
+def test_rolling_fold_waits_for_enough_content(fake_cache, test_db, test_meeting):
+    add_conversations(test_db, test_meeting, 2)
+    summarizer, messages = make_summarizer()
+    rolling = RollingSummarizer(test_db, summarizer)
+
+    assert meetings_pending_fold(test_db, min_tokens=100) == []
+    assert asyncio.run(rolling.fold(test_meeting, min_tokens=100)) == 0
+    assert messages.prompts == []
+
+    add_conversations(test_db, test_meeting, 20, start=2)
+    assert meetings_pending_fold(test_db, min_tokens=100) == [test_meeting.id]
+    assert asyncio.run(rolling.fold(test_meeting, min_tokens=100)) == 22
+    assert meetings_pending_fold(test_db, min_tokens=100) == []
+
+    state = test_db.query(MeetingRollingSummary).filter_by(meeting_id=test_meeting.id).one()
+    test_db.refresh(state)
+    assert len(state.batches) == 1
+    assert state.last_conversation_id == max(c.id for c in test_meeting.conversations)
+
+
+def test_rolling_final_notes_reuse_unchanged_batches(fake_cache, test_db, test_meeting):
+    summarizer, _ = make_summarizer()
+    rolling = RollingSummarizer(test_db, summarizer)
+    add_conversations(test_db, test_meeting, 20)
+    asyncio.run(rolling.fold(test_meeting, min_tokens=100))
+    add_conversations(test_db, test_meeting, 20, start=20)
+    asyncio.run(rolling.fold(test_meeting, min_tokens=100))
+    add_conversations(test_db, test_meeting, 3, start=40)  # unfolded tail
+
+    conversations = test_db.query(Conversation).filter_by(meeting_id=test_meeting.id).all()
+    conversations[25].heard_text += " (corrected)"
+    test_db.commit()
+
+    fake_cache.data.clear()
+    summarizer, messages = make_summarizer()
+    notes = asyncio.run(RollingSummarizer(test_db, summarizer).final_notes(test_meeting, conversations))
+
+    assert len(notes) == 3
+    # Only the edited second batch and the tail are summarized again
+    assert len(messages.prompts) == 2
+    assert any("(corrected)" in prompt for prompt in messages.prompts)
+
+
+def test_rolling_final_notes_none_without_folds(test_db, test_meeting):
+    add_conversations(test_db, test_meeting, 3)
+    summarizer, _ = make_summarizer()
+    conversations = test_db.query(Conversation).filter_by(meeting_id=test_meeting.id).all()
+
+    assert asyncio.run(RollingSummarizer(test_db, summarizer).final_notes(test_meeting, conversations)) is None
@@ -0,0 +1,59 @@
+"""Tests for ticket number allocation."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from database import Base
+from models import SupportTicket, TicketNumberCounter
+from services.ticket_numbers import TicketNumberAllocator
+from services.ticket_service import TicketService
+
+
+def add_ticket(db, number):
+    ticket = SupportTicket(
+        ticket_number=number, user_id=1, category="general",
+        subject="Help", description="Something broke",
+    )
+    db.add(ticket)
+    db.commit()
+    return ticket
+
+
+def test_counter_continues_after_existing_tickets(test_db):
+    add_ticket(test_db, "TKT-2026-00041")
+    add_ticket(test_db, "TKT-2025-00900")
+    allocator = TicketNumberAllocator(backend="row")
+
+    assert allocator.allocate(test_db, 2026) == "TKT-2026-00042"
+    assert allocator.allocate(test_db, 2026) == "TKT-2026-00043"
+    assert allocator.allocate(test_db, 2027) == "TKT-2027-00001"
+    test_db.commit()
+
+    assert test_db.get(TicketNumberCounter, 2026).last_value == 43
+
+
+def test_concurrent_creates_get_unique_numbers(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'tickets.db'}",
+        connect_args={"check_same_thread": False, "timeout": 60},
+    )
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine, autoflush=False)
+
+    def create(_):
+        db = SessionLocal()
+        try:
+            # The same transaction shape as TicketService.create_ticket
+            return add_ticket(db, TicketService(db).generate_ticket_number()).ticket_number
+        finally:
+            db.close()
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        numbers = list(pool.map(create, range(2000)))
+
+    assert len(set(numbers)) == 2000
+    suffixes = sorted(int(number.rsplit("-", 1)[1]) for number in numbers)
+    assert suffixes == list(range(1, 2001))
+    engine.dispose()
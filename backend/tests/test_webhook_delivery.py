@@ -0,0 +1,209 @@
+"""Tests for the outbound webhook delivery engine."""
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+
+from models import Webhook, WebhookDelivery, ZapierSubscription
+from services.webhook_delivery import (
+    WebhookDeliveryEngine, DeliveryTarget, CircuitBreaker,
+    STATUS_PENDING, STATUS_RETRYING, STATUS_SUCCESS, STATUS_FAILED,
+)
+from services.webhook_signing import verify_webhook_signature, SIGNATURE_HEADER, TIMESTAMP_HEADER
+
+
+def make_engine(handler):
+    return WebhookDeliveryEngine(transport=httpx.MockTransport(handler))
+
+
+@pytest.fixture
+def user_webhook(test_db, test_user) -> Webhook:
+    webhook = Webhook(
+        user_id=test_user.id,
+        name="Test Hook",
+        url="https://hooks.example.com/readin",
+        secret="whsec_test",
+        events=["meeting.ended"],
+        max_retries=2,
+        retry_delay_seconds=10,
+    )
+    test_db.add(webhook)
+    test_db.commit()
+    test_db.refresh(webhook)
+    return webhook
+
+
+@pytest.fixture
+def zapier_subscription(test_db, test_user) -> ZapierSubscription:
+    subscription = ZapierSubscription(
+        user_id=test_user.id,
+        trigger_type="meeting_ended",
+        target_url="https://hooks.zapier.com/hooks/standard/1/abc",
+        is_active=True,
+        consecutive_failures=0,
+    )
+    test_db.add(subscription)
+    test_db.commit()
+    test_db.refresh(subscription)
+    return subscription
+
+
+class TestWebhookDeliveryEngine:
+    """Test delivery, signing and retry scheduling."""
+
+    def test_enqueue_creates_pending_rows(self, test_db, user_webhook):
+        """Test that enqueue persists one pending row per target."""
+        engine = make_engine(lambda request: httpx.Response(200))
+        ids = engine.enqueue(test_db, [DeliveryTarget.for_webhook(user_webhook)], "meeting.ended", {"id": 1})
+
+        delivery = test_db.query(WebhookDelivery).get(ids[0])
+        assert delivery.status == STATUS_PENDING
+        assert delivery.attempt_count == 0
+        assert delivery.max_attempts == 3
+        assert delivery.target_url == user_webhook.url
+
+    def test_delivery_is_signed_over_sent_body(self, test_db, user_webhook):
+        """Test that the signature verifies against the exact request body."""
+        captured = {}
+
+        def handler(request):
+            captured["body"] = request.content.decode()
+            captured["headers"] = request.headers
+            return httpx.Response(200, text="ok")
+
+        engine = make_engine(handler)
+        payload = {"event": "meeting.ended", "data": {"id": 7, "title": "Sync"}}
+        ids = engine.enqueue(test_db, [DeliveryTarget.for_webhook(user_webhook)], "meeting.ended", payload)
+
+        stats = asyncio.run(engine.deliver(test_db, ids))
+        assert stats["delivered"] == 1
+
+        valid, error = verify_webhook_signature(
+            captured["body"],
+            captured["headers"][SIGNATURE_HEADER],
+            captured["headers"][TIMESTAMP_HEADER],
+            user_webhook.secret,
+        )
+        assert valid, error
+        assert json.loads(captured["body"]) == payload
+
+        test_db.refresh(user_webhook)
+        delivery = test_db.query(WebhookDelivery).get(ids[0])
+        assert delivery.status == STATUS_SUCCESS
+        assert delivery.response_time_ms is not None
+        assert user_webhook.successful_deliveries == 1
+
+    def test_server_error_schedules_retry_then_fails(self, test_db, user_webhook):
+        """Test exponential retry until max attempts are exhausted."""
+        engine = make_engine(lambda request: httpx.Response(503))
+        ids = engine.enqueue(test_db, [DeliveryTarget.for_webhook(user_webhook)], "meeting.ended", {"id": 1})
+
+        asyncio.run(engine.deliver(test_db, ids))
+        delivery = test_db.query(WebhookDelivery).get(ids[0])
+        assert delivery.status == STATUS_RETRYING
+        assert delivery.next_retry_at > datetime.utcnow()
+
+        for _ in range(2):
+            delivery.next_retry_at = datetime.utcnow() - timedelta(seconds=1)
+            test_db.commit()
+            assert engine.due_delivery_ids(test_db) == ids
+            asyncio.run(engine.deliver(test_db, ids, due_only=True))
+            test_db.refresh(delivery)
+
+        assert delivery.status == STATUS_FAILED
+        assert delivery.attempt_count == 3
+        assert engine.due_delivery_ids(test_db) == []
+
+    def test_claim_prevents_double_send(self, test_db, user_webhook):
+        """Test that a delivery already claimed is not sent again."""
+        calls = []
+        engine = make_engine(lambda request: calls.append(request) or httpx.Response(200))
+        ids = engine.enqueue(test_db, [DeliveryTarget.for_webhook(user_webhook)], "meeting.ended", {"id": 1})
+
+        asyncio.run(engine.deliver(test_db, ids))
+        stats = asyncio.run(engine.deliver(test_db, ids))
+        assert len(calls) == 1
+        assert stats["skipped"] == 1
+
+    def test_zapier_gone_deactivates_subscription(self, test_db, zapier_subscription):
+        """Test that 410 Gone deactivates the Zapier subscription without retrying."""
+        engine = make_engine(lambda request: httpx.Response(410))
+        ids = engine.enqueue(test_db, [DeliveryTarget.for_zapier(zapier_subscription)], "meeting_ended", {"id": 1})
+
+        asyncio.run(engine.deliver(test_db, ids))
+        test_db.refresh(zapier_subscription)
+        delivery = test_db.query(WebhookDelivery).get(ids[0])
+        assert zapier_subscription.is_active is False
+        assert delivery.status == STATUS_FAILED
+
+    def test_concurrent_batch(self, test_db, user_webhook):
+        """Test that a batch is sent concurrently rather than sequentially."""
+        in_flight = {"current": 0, "peak": 0}
+
+        async def handler(request):
+            in_flight["current"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["current"])
+            await asyncio.sleep(0.05)
+            in_flight["current"] -= 1
+            return httpx.Response(200)
+
+        engine = make_engine(handler)
+        targets = [DeliveryTarget.for_webhook(user_webhook) for _ in range(8)]
+        ids = engine.enqueue(test_db, targets, "meeting.ended", {"id": 1})
+
+        stats = asyncio.run(engine.deliver(test_db, ids))
+        assert stats["delivered"] == 8
+        assert in_flight["peak"] == engine.max_concurrency_per_host
+
+
+class TestCircuitBreaker:
+    """Test the per-endpoint circuit breaker."""
+
+    def test_opens_after_threshold_and_probes(self):
+        breaker = CircuitBreaker(threshold=2, reset_seconds=0)
+        breaker.record_failure()
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.is_open
+
+        # One half-open probe at a time
+        assert breaker.allow()
+        assert not breaker.allow()
+        breaker.record_success()
+        assert not breaker.is_open
+
+    def test_rejected_probe_releases_half_open_breaker(self, test_db, user_webhook):
+        """Test that a probe answered with a non-retryable 4xx frees the probe slot."""
+        engine = make_engine(lambda request: httpx.Response(400))
+        breaker = engine._breaker_for(user_webhook.url)
+        breaker.reset_seconds = 0
+        for _ in range(breaker.threshold):
+            breaker.record_failure()
+
+        ids = engine.enqueue(test_db, [DeliveryTarget.for_webhook(user_webhook)], "meeting.ended", {"id": 1})
+        asyncio.run(engine.deliver(test_db, ids))
+
+        assert breaker.allow()
+
+    def test_open_circuit_defers_without_using_attempts(self, test_db, zapier_subscription):
+        """Test that deliveries held back by an open circuit keep their attempts."""
+        calls = []
+        engine = make_engine(lambda request: calls.append(request) or httpx.Response(200))
+        breaker = engine._breaker_for(zapier_subscription.target_url)
+        for _ in range(breaker.threshold):
+            breaker.record_failure()
+
+        ids = engine.enqueue(test_db, [DeliveryTarget.for_zapier(zapier_subscription)], "meeting_ended", {"id": 1})
+        stats = asyncio.run(engine.deliver(test_db, ids))
+
+        test_db.refresh(zapier_subscription)
+        delivery = test_db.query(WebhookDelivery).get(ids[0])
+        assert calls == []
+        assert stats["retrying"] == 1
+        assert delivery.status == STATUS_RETRYING
+        assert delivery.attempt_count == 0
+        assert delivery.next_retry_at > datetime.utcnow() + timedelta(seconds=breaker.reset_seconds - 5)
+        assert zapier_subscription.consecutive_failures == 0
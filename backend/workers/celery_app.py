@@ -4,6 +4,7 @@ Celery application configuration for background task processing.
 
 import os
 from celery import Celery
+from celery.signals import worker_init
 
 # Redis URL for broker and backend
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
@@ -20,6 +21,12 @@ celery_app = Celery(
         "workers.tasks.email_tasks",
         "workers.tasks.analytics_tasks",
         "workers.tasks.subscription_tasks",
+        "workers.tasks.webhook_tasks",
+        "workers.tasks.export_tasks",
+        "workers.tasks.gdpr_tasks",
+        "workers.tasks.qa_tasks",
+        "workers.tasks.calendar_tasks",
+        "workers.tasks.pm_sync_tasks",
     ]
 )
 
@@ -78,6 +85,34 @@ celery_app.conf.update(
             "task": "workers.tasks.subscription_tasks.sync_subscription_status",
             "schedule": 14400.0,  # Every 4 hours
         },
+        # Rolling in-meeting summaries
+        "update-rolling-summaries": {
+            "task": "workers.tasks.summary_generation.update_rolling_summaries",
+            "schedule": 60.0,  # Every minute
+        },
+        # Outbound webhook retries
+        "retry-webhook-deliveries": {
+            "task": "workers.tasks.webhook_tasks.retry_webhook_deliveries",
+            "schedule": 30.0,  # Every 30 seconds
+        },
+        # Calendar event cache
+        "sync-calendars": {
+            "task": "workers.tasks.calendar_tasks.sync_calendars",
+            "schedule": 300.0,  # Every 5 minutes
+        },
+        # PM status reconciliation (webhooks apply changes as they happen)
+        "reconcile-pm-statuses": {
+            "task": "workers.tasks.pm_sync_tasks.reconcile_pm_statuses",
+            "schedule": 21600.0,  # Every 6 hours
+        },
+        "cleanup-export-files": {
+            "task": "workers.tasks.export_tasks.cleanup_export_files",
+            "schedule": 3600.0,  # Hourly
+        },
+        "cleanup-expired-data-exports": {
+            "task": "workers.tasks.gdpr_tasks.cleanup_expired_data_exports",
+            "schedule": 3600.0,  # Hourly
+        },
     },
 )
 
@@ -88,3 +123,10 @@ if CELERY_RESULT_BACKEND.startswith("redis"):
         result_backend=CELERY_RESULT_BACKEND,
         result_extended=True,
     )
+
+
+@worker_init.connect
+def register_database_hooks(**kwargs):
+    """Install session hooks that tasks rely on, before the pool forks."""
+    from services.meeting_context import register_meeting_context_invalidation
+    register_meeting_context_invalidation()
@@ -1,13 +1,26 @@
 """Background tasks package."""
 
-from .summary_generation import generate_meeting_summary
+from .summary_generation import generate_meeting_summary, fold_rolling_summary, update_rolling_summaries
 from .email_tasks import send_email, send_summary_email
 from .analytics_tasks import cleanup_old_data, generate_daily_analytics
+from .webhook_tasks import deliver_webhooks, retry_webhook_deliveries
+from .export_tasks import export_meetings_file, cleanup_export_files
+from .gdpr_tasks import build_data_export, cleanup_expired_data_exports
+from .qa_tasks import run_ai_qa_batch
 
 __all__ = [
     "generate_meeting_summary",
+    "fold_rolling_summary",
+    "update_rolling_summaries",
     "send_email",
     "send_summary_email",
     "cleanup_old_data",
     "generate_daily_analytics",
+    "deliver_webhooks",
+    "retry_webhook_deliveries",
+    "export_meetings_file",
+    "cleanup_export_files",
+    "build_data_export",
+    "cleanup_expired_data_exports",
+    "run_ai_qa_batch",
 ]
@@ -0,0 +1,60 @@
+"""
+Calendar event cache sync tasks.
+"""
+
+import logging
+
+from workers.celery_app import celery_app
+from workers.tasks.email_tasks import run_async
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task
+def sync_calendars() -> dict:
+    """
+    Delta-sync the event cache of every user with a connected calendar.
+
+    Keeps the cache warm for briefings, which only read it. Users synced
+    recently by a meeting detection request are skipped.
+    """
+    try:
+        from sqlalchemy import or_
+        from database import SessionLocal
+        from models import CalendarIntegration, User
+        from services.calendar_sync import calendar_sync
+
+        db = SessionLocal()
+        try:
+            users = db.query(User).filter(or_(
+                User.google_refresh_token.isnot(None),
+                User.microsoft_refresh_token.isnot(None),
+                User.id.in_(
+                    db.query(CalendarIntegration.user_id).filter(
+                        CalendarIntegration.is_active == True,
+                        CalendarIntegration.refresh_token.isnot(None),
+                    )
+                ),
+            )).all()
+
+            async def sync_all():
+                synced = 0
+                for user in users:
+                    try:
+                        if await calendar_sync.refresh_if_stale(db, user):
+                            synced += 1
+                    except Exception as e:
+                        db.rollback()
+                        logger.error(f"Calendar sync failed for user {user.id}: {e}")
+                await calendar_sync.close()
+                return synced
+
+            synced = run_async(sync_all())
+            logger.info(f"Calendar sync: {synced} of {len(users)} users synced")
+            return {"success": True, "users": len(users), "synced": synced}
+        finally:
+            db.close()
+
+    except Exception as e:
+        logger.error(f"Calendar sync task failed: {e}")
+        return {"success": False, "error": str(e)}
@@ -0,0 +1,140 @@
+"""
+Bulk export tasks.
+"""
+
+import os
+import logging
+import time
+from typing import List, Optional
+
+from workers.celery_app import celery_app
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_EVERY = 100  # Report progress every N meetings
+
+
+def export_file_dir(user_id: int) -> str:
+    """Directory holding a user's finished export files."""
+    from config import EXPORT_DIR
+    return os.path.join(EXPORT_DIR, str(user_id))
+
+
+def find_export_file(user_id: int, job_id: str) -> Optional[str]:
+    """Path of a finished export file, or None if it does not exist."""
+    directory = export_file_dir(user_id)
+    if not os.path.isdir(directory):
+        return None
+    for name in os.listdir(directory):
+        if name.startswith(f"{job_id}.") and not name.endswith(".part"):
+            return os.path.join(directory, name)
+    return None
+
+
+@celery_app.task(bind=True, max_retries=1)
+def export_meetings_file(
+    self,
+    user_id: int,
+    format: str,
+    meeting_ids: Optional[List[int]] = None,
+    limit: Optional[int] = None,
+    include_conversations: bool = True,
+    include_action_items: bool = True,
+    compress: bool = False,
+) -> dict:
+    """
+    Write a bulk meeting export to a downloadable file.
+
+    The export is streamed to disk batch by batch, so worker memory does
+    not depend on the number of meetings.
+    """
+    try:
+        from database import SessionLocal
+        from services.export_service import ExportService, ExportFormat, gzip_stream
+
+        export_format = ExportFormat(format)
+        directory = export_file_dir(user_id)
+        os.makedirs(directory, exist_ok=True)
+
+        filename, _ = ExportService.bulk_export_filename(export_format, compress)
+        extension = filename.split(".", 1)[1]
+        path = os.path.join(directory, f"{self.request.id}.{extension}")
+        partial_path = f"{path}.part"
+
+        db = SessionLocal()
+        exported = 0
+        try:
+            service = ExportService(db)
+
+            def tracked_meeting_data():
+                nonlocal exported
+                for data in service.iter_meeting_data(
+                    user_id,
+                    meeting_ids=meeting_ids,
+                    limit=limit,
+                    include_conversations=include_conversations,
+                    include_action_items=include_action_items,
+                ):
+                    yield data
+                    exported += 1
+                    if exported % PROGRESS_EVERY == 0:
+                        self.update_state(
+                            state="PROGRESS",
+                            meta={"user_id": user_id, "exported": exported},
+                        )
+
+            chunks = service.render_bulk_export(tracked_meeting_data(), export_format)
+            if compress:
+                chunks = gzip_stream(chunks)
+
+            with open(partial_path, "wb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+            os.replace(partial_path, path)
+
+        finally:
+            db.close()
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+
+        logger.info(f"Bulk export {self.request.id} for user {user_id}: {exported} meetings")
+        return {
+            "success": True,
+            "user_id": user_id,
+            "exported": exported,
+            "filename": filename,
+            "size_bytes": os.path.getsize(path),
+        }
+
+    except Exception as e:
+        logger.error(f"Bulk export failed for user {user_id}: {e}")
+        raise self.retry(exc=e, countdown=60)
+
+
+@celery_app.task
+def cleanup_export_files() -> dict:
+    """
+    Delete export files older than EXPORT_FILE_TTL_HOURS.
+
+    GDPR archives are kept for GDPR_EXPORT_TTL_DAYS and removed by
+    cleanup_expired_data_exports, so their directory is skipped.
+    """
+    from config import EXPORT_DIR, EXPORT_FILE_TTL_HOURS
+    from services.gdpr_export import ARCHIVE_SUBDIR
+
+    cutoff = time.time() - EXPORT_FILE_TTL_HOURS * 3600
+    removed = 0
+    if os.path.isdir(EXPORT_DIR):
+        for root, dirs, files in os.walk(EXPORT_DIR):
+            if root == EXPORT_DIR and ARCHIVE_SUBDIR in dirs:
+                dirs.remove(ARCHIVE_SUBDIR)
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    if os.path.getmtime(path) < cutoff:
+                        os.remove(path)
+                        removed += 1
+                except OSError as e:
+                    logger.warning(f"Could not remove export file {path}: {e}")
+
+    return {"success": True, "removed": removed}
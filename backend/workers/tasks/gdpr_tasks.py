@@ -0,0 +1,69 @@
+"""
+GDPR data export tasks.
+"""
+
+import logging
+
+from workers.celery_app import celery_app
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(bind=True, max_retries=2)
+def build_data_export(self, job_id: int) -> dict:
+    """
+    Build the data export archive for a DataExportJob.
+    """
+    try:
+        from database import SessionLocal
+        from models import DataExportJob
+        from services.gdpr_export import build_export_archive, JOB_PENDING, JOB_RUNNING, JOB_FAILED
+
+        db = SessionLocal()
+        try:
+            job = db.query(DataExportJob).filter(DataExportJob.id == job_id).first()
+            if not job or job.status not in (JOB_PENDING, JOB_RUNNING):
+                return {"success": False, "error": "Job not found or already finished"}
+
+            try:
+                build_export_archive(db, job)
+            except Exception as e:
+                db.rollback()
+                if self.request.retries >= self.max_retries:
+                    job.status = JOB_FAILED
+                    job.error_message = str(e)[:500]
+                    db.commit()
+                raise
+
+            return {
+                "success": True,
+                "job_id": job.id,
+                "rows_exported": job.rows_exported,
+                "size_bytes": job.file_size_bytes,
+            }
+        finally:
+            db.close()
+
+    except Exception as e:
+        logger.error(f"Data export {job_id} failed: {e}")
+        raise self.retry(exc=e, countdown=120 * (self.request.retries + 1))
+
+
+@celery_app.task
+def cleanup_expired_data_exports() -> dict:
+    """Delete expired data export archives."""
+    try:
+        from database import SessionLocal
+        from services.gdpr_export import expire_export_jobs
+
+        db = SessionLocal()
+        try:
+            expired = expire_export_jobs(db)
+            logger.info(f"Expired {expired} data export(s)")
+            return {"success": True, "expired": expired}
+        finally:
+            db.close()
+
+    except Exception as e:
+        logger.error(f"Data export cleanup failed: {e}")
+        return {"success": False, "error": str(e)}
@@ -0,0 +1,62 @@
+"""
+Project management status reconciliation tasks.
+"""
+
+import logging
+
+from workers.celery_app import celery_app
+from workers.tasks.email_tasks import run_async
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task
+def reconcile_pm_statuses() -> dict:
+    """
+    Pull the status of every synced task from each connected PM tool.
+
+    Webhooks apply status changes as they happen; this slow sweep only
+    catches what they missed (deliveries lost while the API was down,
+    providers without a webhook configured). Also prunes old webhook
+    dedup records.
+    """
+    try:
+        from database import SessionLocal
+        from models import ActionItemSync, ProjectManagementConnection
+        from services.pm_sync_service import PMSyncService
+
+        db = SessionLocal()
+        try:
+            service = PMSyncService(db)
+            connections = db.query(ProjectManagementConnection).filter(
+                ProjectManagementConnection.is_active == True,
+                ProjectManagementConnection.id.in_(
+                    db.query(ActionItemSync.connection_id).distinct()
+                ),
+            ).all()
+
+            async def reconcile_all():
+                updated = 0
+                for connection in connections:
+                    try:
+                        items = await service.sync_from_external(connection.user_id, connection.provider)
+                        updated += len(items)
+                    except Exception as e:
+                        db.rollback()
+                        logger.error(f"PM reconciliation failed for connection {connection.id}: {e}")
+                return updated
+
+            updated = run_async(reconcile_all())
+            pruned = service.prune_webhook_events()
+
+            logger.info(
+                f"PM reconciliation: {updated} items updated across {len(connections)} connections, "
+                f"{pruned} webhook records pruned"
+            )
+            return {"success": True, "connections": len(connections), "updated": updated, "pruned": pruned}
+        finally:
+            db.close()
+
+    except Exception as e:
+        logger.error(f"PM reconciliation task failed: {e}")
+        return {"success": False, "error": str(e)}
@@ -0,0 +1,100 @@
+"""
+Chat QA tasks.
+"""
+
+import logging
+from typing import List, Optional
+
+from workers.celery_app import celery_app
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(bind=True, max_retries=3)
+def run_ai_qa_batch(
+    self,
+    reviewer_id: int,
+    limit: int = 100,
+    min_messages: int = 3,
+    exclude_ids: Optional[List[int]] = None,
+    analyzed_before: int = 0,
+) -> dict:
+    """
+    Run AI QA over unreviewed chat sessions.
+
+    Records are committed chunk by chunk. A retry is queued with the
+    remaining limit and the sessions that already failed, so it resumes
+    where the interrupted run stopped instead of starting over. Counts in
+    progress and in the result include the sessions done before a retry.
+    """
+    failed_before = list(exclude_ids or [])
+    progress = {"analyzed": analyzed_before, "failed": len(failed_before), "failed_ids": failed_before}
+    total = limit + analyzed_before + len(failed_before)
+
+    def report(results: dict) -> None:
+        progress["analyzed"] = analyzed_before + results["analyzed"]
+        progress["failed"] = len(failed_before) + results["failed"]
+        progress["failed_ids"] = failed_before + results["failed_ids"]
+        self.update_state(
+            state="PROGRESS",
+            meta={
+                "reviewer_id": reviewer_id,
+                "limit": total,
+                "analyzed": progress["analyzed"],
+                "failed": progress["failed"],
+            },
+        )
+
+    try:
+        from database import SessionLocal
+        from services.ai_qa_service import AIQAService
+        from workers.tasks.summary_generation import run_async
+
+        db = SessionLocal()
+        try:
+            service = AIQAService(db)
+            if not service.is_available():
+                return {"success": False, "error": "AI QA service not available"}
+
+            results = run_async(service.batch_analyze(
+                reviewer_id=reviewer_id,
+                limit=limit,
+                min_messages=min_messages,
+                exclude_ids=failed_before,
+                on_progress=report,
+            ))
+        finally:
+            db.close()
+
+        analyzed = analyzed_before + results["analyzed"]
+        failed = len(failed_before) + results["failed"]
+        logger.info(
+            f"AI QA batch for reviewer {reviewer_id}: "
+            f"{analyzed} analyzed, {failed} failed"
+        )
+        return {
+            "success": True,
+            "reviewer_id": reviewer_id,
+            "analyzed": analyzed,
+            "failed": failed,
+            "sessions": results["sessions"],
+        }
+
+    except Exception as e:
+        logger.error(f"AI QA batch for reviewer {reviewer_id} failed: {e}")
+        remaining = total - progress["analyzed"] - progress["failed"]
+        if remaining <= 0:
+            raise
+        raise self.retry(
+            exc=e,
+            countdown=60 * (self.request.retries + 1),
+            # Replace the original positional args too, or they clash with these
+            args=(),
+            kwargs={
+                "reviewer_id": reviewer_id,
+                "limit": remaining,
+                "min_messages": min_messages,
+                "exclude_ids": progress["failed_ids"],
+                "analyzed_before": progress["analyzed"],
+            },
+        )
@@ -9,7 +9,6 @@ from datetime import datetime
 from typing import Optional, List, Dict, Any
 import logging
 
-import anthropic
 
 from workers.celery_app import celery_app
 
@@ -57,19 +56,21 @@ async def extract_action_items_with_ai(transcript: str) -> List[Dict[str, Any]]:
     Returns:
         List of action item dictionaries with keys: assignee, task, due_date, priority
     """
-    client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+    from services.llm_gateway import llm_gateway
+
     model = os.getenv("SUMMARY_GENERATION_MODEL", "claude-sonnet-4-20250514")
 
     prompt = ACTION_ITEM_EXTRACTION_PROMPT.format(transcript=transcript)
 
     try:
-        response = client.messages.create(
+        response = await llm_gateway.complete(
+            prompt,
+            call_site="summaries.extract_action_items",
             model=model,
             max_tokens=1024,
-            messages=[{"role": "user", "content": prompt}],
         )
 
-        content = response.content[0].text
+        content = response.text
 
         # Handle JSON wrapped in code blocks
         if "```json" in content:
@@ -318,3 +319,58 @@ def extract_action_items(
     except Exception as e:
         logger.error(f"Failed to extract action items for meeting {meeting_id}: {e}")
         raise self.retry(exc=e, countdown=30)
+
+
+@celery_app.task(bind=True, max_retries=2)
+def fold_rolling_summary(self, meeting_id: int) -> dict:
+    """
+    Fold a meeting's new conversations into its rolling summary.
+
+    Runs while the meeting is active so that the summary generated when it
+    ends only has to reduce the accumulated notes.
+    """
+    try:
+        from database import SessionLocal
+        from models import Meeting, User
+        from services.rolling_summary import RollingSummarizer
+
+        db = SessionLocal()
+
+        try:
+            meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
+            if not meeting or meeting.status != "active":
+                return {"success": False, "error": "Meeting not active"}
+
+            user = db.query(User).filter(User.id == meeting.user_id).first()
+            language = getattr(user, 'preferred_language', 'en') or 'en'
+
+            folded = run_async(RollingSummarizer(db).fold(meeting, language))
+            if folded:
+                logger.info(f"Folded {folded} conversations into rolling summary for meeting {meeting_id}")
+
+            return {"success": True, "meeting_id": meeting_id, "folded": folded}
+
+        finally:
+            db.close()
+
+    except Exception as e:
+        logger.error(f"Failed to fold rolling summary for meeting {meeting_id}: {e}")
+        raise self.retry(exc=e, countdown=30)
+
+
+@celery_app.task
+def update_rolling_summaries() -> dict:
+    """Queue rolling summary folds for active meetings with enough new transcript."""
+    from database import SessionLocal
+    from services.rolling_summary import meetings_pending_fold
+
+    db = SessionLocal()
+    try:
+        meeting_ids = meetings_pending_fold(db)
+    finally:
+        db.close()
+
+    for meeting_id in meeting_ids:
+        fold_rolling_summary.delay(meeting_id)
+
+    return {"queued": len(meeting_ids)}
@@ -0,0 +1,66 @@
+"""
+Outbound webhook delivery tasks.
+"""
+
+import logging
+from typing import List
+
+from workers.celery_app import celery_app
+from workers.tasks.email_tasks import run_async
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(bind=True, max_retries=2)
+def deliver_webhooks(self, delivery_ids: List[int]) -> dict:
+    """
+    Send a batch of queued webhook deliveries concurrently.
+
+    Failed attempts are rescheduled on the delivery rows themselves and
+    picked up by retry_webhook_deliveries, so this task only retries when
+    the batch could not be processed at all.
+    """
+    try:
+        from database import SessionLocal
+        from services.webhook_delivery import webhook_engine
+
+        db = SessionLocal()
+        try:
+            stats = run_async(webhook_engine.deliver(db, delivery_ids))
+            logger.info(f"Webhook batch delivered: {stats}")
+            return {"success": True, **stats}
+        finally:
+            db.close()
+
+    except Exception as e:
+        logger.error(f"Webhook delivery task failed: {e}")
+        raise self.retry(exc=e, countdown=30 * (self.request.retries + 1))
+
+
+@celery_app.task
+def retry_webhook_deliveries() -> dict:
+    """
+    Send deliveries whose retry time has passed.
+
+    Also recovers pending rows that were never dispatched (broker outage)
+    and rows whose worker died mid-delivery.
+    """
+    try:
+        from database import SessionLocal
+        from services.webhook_delivery import webhook_engine
+
+        db = SessionLocal()
+        try:
+            delivery_ids = webhook_engine.due_delivery_ids(db)
+            if not delivery_ids:
+                return {"success": True, "due": 0}
+
+            stats = run_async(webhook_engine.deliver(db, delivery_ids, due_only=True))
+            logger.info(f"Webhook retry sweep: {stats}")
+            return {"success": True, "due": len(delivery_ids), **stats}
+        finally:
+            db.close()
+
+    except Exception as e:
+        logger.error(f"Webhook retry sweep failed: {e}")
+        return {"success": False, "error": str(e)}
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Streaming render benchmark for the overlay response area.
+
+Streams a synthetic AI response into the old QLabel-in-a-scroll-area setup
+and into StreamingTextView on an offscreen Qt platform, then reports per
+response how many times each re-laid out its text, how many paint events
+it took and how much UI-thread time rendering cost.
+
+    python benchmark_overlay.py [--tokens 600] [--interval-ms 4]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+def make_tokens(count):
+    """Deltas shaped like a streamed answer: short words, some line breaks."""
+    words = ("So the short answer is that we shipped the integration last quarter "
+             "and adoption has been steady across enterprise accounts").split()
+    tokens = []
+    for i in range(count):
+        token = words[i % len(words)] + " "
+        if i % 40 == 39:
+            token += "\n\n"
+        tokens.append(token)
+    return tokens
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tokens", type=int, default=600, help="Deltas per response")
+    parser.add_argument("--interval-ms", type=float, default=4.0, help="Time between deltas")
+    parser.add_argument("--responses", type=int, default=3, help="Responses to average over")
+    args = parser.parse_args()
+
+    from PyQt6.QtCore import QObject, QEvent, Qt
+    from PyQt6.QtWidgets import QApplication, QLabel, QScrollArea
+    from src.ui.streaming_text_view import StreamingTextView
+
+    app = QApplication(sys.argv)
+
+    class EventCounter(QObject):
+        def __init__(self):
+            super().__init__()
+            self.paints = 0
+            self.layouts = 0
+
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Type.Paint:
+                self.paints += 1
+            elif event.type() == QEvent.Type.LayoutRequest:
+                self.layouts += 1
+            return False
+
+    def run(name, widget, paint_target, layout_target, append, reset):
+        counter = EventCounter()
+        paint_target.installEventFilter(counter)
+        layout_target.installEventFilter(counter)
+        widget.resize(380, 260)
+        widget.show()
+        app.processEvents()
+
+        busy = 0.0
+        for _ in range(args.responses):
+            reset()
+            app.processEvents()
+            counter.paints = counter.layouts = 0
+            for token in make_tokens(args.tokens):
+                began = time.perf_counter()
+                append(token)
+                app.processEvents()
+                busy += time.perf_counter() - began
+                time.sleep(args.interval_ms / 1000)
+            # Let the last frame land
+            time.sleep(0.05)
+            began = time.perf_counter()
+            app.processEvents()
+            busy += time.perf_counter() - began
+
+        widget.hide()
+        print(f"{name:<22} layouts/response: {counter.layouts:>6}  "
+              f"paints/response: {counter.paints:>6}  "
+              f"UI-thread ms/response: {busy * 1000 / args.responses:>8.1f}")
+
+    # The previous overlay: whole text re-set on every delta
+    scroll_area = QScrollArea()
+    scroll_area.setWidgetResizable(True)
+    label = QLabel()
+    label.setWordWrap(True)
+    label.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
+    scroll_area.setWidget(label)
+    state = {"text": ""}
+
+    def label_append(token):
+        state["text"] += token
+        label.setText(state["text"])
+
+    def reset_label():
+        state["text"] = ""
+        label.setText("")
+
+    print(f"Streaming {args.tokens} deltas every {args.interval_ms}ms, "
+          f"{args.responses} responses, platform {app.platformName()}")
+    run("QLabel.setText", scroll_area, label, label, label_append, reset_label)
+
+    view = StreamingTextView()
+
+    def reset_view():
+        view.setText("")
+        view.flushes = 0
+
+    run("StreamingTextView", view, view.viewport(), view, view.append_text, reset_view)
+    print(f"{'':<22} document edits/response: {view.flushes}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Cold-start regression benchmark for the desktop app.
+
+Launches `main.py --profile-startup --quit-after-startup` a few times and
+reads the startup profile of each run. Exits with status 1 if the median
+time from process start to the tray icon being shown exceeds the budget,
+so it can gate releases and CI runs on a machine with a display.
+
+    python benchmark_startup.py [--runs 5] [--budget 2.5] [--offscreen]
+
+The first run is usually the slowest (cold OS file cache); it is reported
+separately but counts towards the median like the others.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+# Seconds from process start to tray visible
+DEFAULT_BUDGET = 2.5
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def profile_once(report_path, env, timeout):
+    """Run the app up to its first event loop turn; returns the report."""
+    subprocess.run(
+        [sys.executable, os.path.join(ROOT, "main.py"),
+         f"--profile-startup={report_path}", "--quit-after-startup"],
+        cwd=ROOT, env=env, timeout=timeout, check=True,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    with open(report_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5, help="App launches to take the median of")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET,
+                        help="Allowed seconds from process start to tray visible")
+    parser.add_argument("--offscreen", action="store_true", help="Use Qt's offscreen platform")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Seconds before a launch is killed")
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    if args.offscreen:
+        env["QT_QPA_PLATFORM"] = "offscreen"
+
+    reports = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for run in range(args.runs):
+            report = profile_once(os.path.join(tmp, f"startup_{run}.json"), env, args.timeout)
+            tray = report["marks"].get("tray visible")
+            if tray is None:
+                print(f"run {run + 1}: no 'tray visible' mark in the startup profile")
+                return 1
+            reports.append(report)
+            print(f"run {run + 1}: tray visible after {tray * 1000:7.1f} ms")
+
+    times = [report["marks"]["tray visible"] for report in reports]
+    median = statistics.median(times)
+    typical = reports[times.index(min(times, key=lambda t: abs(t - median)))]
+
+    print("\nSlowest phases of a typical run:")
+    for phase in sorted(typical["phases"], key=lambda p: p["seconds"], reverse=True)[:8]:
+        packages = ", ".join(phase["packages"][:6])
+        print(f"  {phase['name']:<34} {phase['seconds'] * 1000:7.1f} ms  {packages}")
+
+    print(f"\nCold run {times[0] * 1000:.1f} ms, median {median * 1000:.1f} ms, "
+          f"budget {args.budget * 1000:.0f} ms")
+    if median > args.budget:
+        print("FAIL: cold start to tray visible is over budget")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
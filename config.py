@@ -164,6 +164,7 @@ else:  # Linux
     ]
 
 PROCESS_CHECK_INTERVAL = 2.0  # Seconds between process checks
+PROCESS_RESYNC_INTERVAL = 60.0  # Seconds between full process-table resyncs
 
 # UI Configuration
 OVERLAY_WIDTH = 450
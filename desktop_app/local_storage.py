@@ -6,6 +6,7 @@ SQLite-based local database for:
 - Storing user preferences
 - Managing pending sync operations
 - Conflict tracking and resolution data
+- Full-text search of cached meetings and conversations
 """
 
 import json
@@ -20,10 +21,30 @@ from dataclasses import dataclass, field, asdict
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from src.services.local_search import (
+    SearchResult, SearchSource, create_search_index, fts5_available,
+    rebuild_search_index, search as search_index,
+)
 
 logger = logging.getLogger(__name__)
 
+# Full-text indexed tables, searched by LocalStorage.search()
+SEARCH_SOURCES = (
+    SearchSource(
+        kind="meeting", table="meetings", key="local_id",
+        columns=("title", "summary_text", "key_points", "meeting_type"),
+        weights=(4.0, 1.0, 1.0, 0.5),
+        meeting_column="local_id", timestamp_column="started_at",
+    ),
+    SearchSource(
+        kind="conversation", table="conversations", key="local_id",
+        columns=("heard_text", "response_text", "speaker"), weights=(1.0, 0.75, 2.0),
+        meeting_column="meeting_local_id", timestamp_column="timestamp",
+    ),
+)
+
 
 class CachePolicy(Enum):
     """Cache expiration policies."""
@@ -109,7 +130,7 @@ class LocalStorage:
     """
 
     # Schema version for migrations
-    SCHEMA_VERSION = 2
+    SCHEMA_VERSION = 3
 
     # Default settings
     DEFAULT_CACHE_SIZE_MB = 200
@@ -146,6 +167,7 @@ class LocalStorage:
         self._lock = threading.RLock()
         self._local_conn = threading.local()
         self._session_start = datetime.now()
+        self._search_enabled = False
 
         # Initialize database
         self._init_database()
@@ -165,6 +187,8 @@ class LocalStorage:
             self._local_conn.conn.execute("PRAGMA foreign_keys = ON")
             self._local_conn.conn.execute("PRAGMA journal_mode = WAL")
             self._local_conn.conn.execute("PRAGMA synchronous = NORMAL")
+            # INSERT OR REPLACE must fire the delete triggers of the search index
+            self._local_conn.conn.execute("PRAGMA recursive_triggers = ON")
         return self._local_conn.conn
 
     @contextmanager
@@ -377,6 +401,20 @@ class LocalStorage:
 
             conn.commit()
 
+            self._init_search_index(conn)
+
+    def _init_search_index(self, conn: sqlite3.Connection, rebuild: bool = False):
+        """Create the full-text indexes, backfilling any that are new."""
+        self._search_enabled = fts5_available(conn)
+        if not self._search_enabled:
+            logger.warning("SQLite has no FTS5; local search falls back to LIKE scans")
+            return
+
+        for source in SEARCH_SOURCES:
+            if create_search_index(conn, source) or rebuild:
+                rebuild_search_index(conn, source)
+        conn.commit()
+
     def _migrate_schema(self, cursor, from_version: int):
         """Migrate database schema."""
         logger.info(f"Migrating schema from version {from_version} to {self.SCHEMA_VERSION}")
@@ -392,6 +430,9 @@ class LocalStorage:
             except sqlite3.OperationalError:
                 pass  # Column already exists
 
+        # Version 3 adds the full-text indexes, created and backfilled by
+        # _init_search_index once the tables exist
+
     # ==================== Cache Operations ====================
 
     def cache_set(
@@ -1365,6 +1406,34 @@ class LocalStorage:
                 VALUES (?, ?, ?, ?)
             """, (entity_type, local_id, remote_id, datetime.now()))
 
+    # ==================== Search ====================
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        kinds: Optional[Sequence[str]] = None,
+        meeting_local_id: Optional[str] = None
+    ) -> List[SearchResult]:
+        """
+        Full-text search of cached meetings and conversations.
+
+        Args:
+            query: Free text; every word must match, the last as a prefix
+            limit: Maximum number of results
+            kinds: Restrict to "meeting" and/or "conversation"
+            meeting_local_id: Only search within this meeting
+
+        Returns:
+            Ranked results with highlighted snippets, best first
+        """
+        sources = [s for s in SEARCH_SOURCES if kinds is None or s.kind in kinds]
+        with self._lock:
+            return search_index(
+                self._get_connection(), sources, query, limit,
+                meeting_local_id=meeting_local_id, use_fts=self._search_enabled,
+            )
+
     # ==================== Utility Methods ====================
 
     def _compute_checksum(self, data: str) -> str:
@@ -1424,8 +1493,13 @@ class LocalStorage:
             # Clear expired cache
             self.cache_cleanup_expired()
 
-            # Vacuum
+        with self._lock:
+            # VACUUM cannot run inside a transaction, and may renumber the
+            # rowids the search indexes point at
+            conn = self._get_connection()
             conn.execute("VACUUM")
+            if self._search_enabled:
+                self._init_search_index(conn, rebuild=True)
 
     def get_status(self) -> Dict[str, Any]:
         """Get storage status."""
@@ -1461,7 +1535,8 @@ class LocalStorage:
                 "pending_syncs": pending_syncs,
                 "unresolved_conflicts": unresolved_conflicts,
                 "cache_entries": cache_entries,
-                "schema_version": self.SCHEMA_VERSION
+                "schema_version": self.SCHEMA_VERSION,
+                "full_text_search": self._search_enabled
             }
 
     def close(self):
@@ -1,8 +1,10 @@
 """Voice command handler for ReadIn AI Desktop App.
 
 Provides wake word detection and voice command execution for hands-free control.
-Uses speech_recognition library for command detection and integrates with the
-hotkey manager for seamless control alongside keyboard shortcuts.
+Commands are spotted offline on the main audio capture stream (see
+src.keyword_spotter), so no second microphone is opened and no audio leaves
+the machine. Integrates with the hotkey manager for seamless control
+alongside keyboard shortcuts.
 
 Features:
 - Wake word detection ("Hey ReadIn" or "ReadIn")
@@ -12,20 +14,13 @@ Features:
 """
 
 import threading
-import queue
-import time
-import re
 from typing import Callable, Dict, Optional, List, Any, Tuple
 from enum import Enum
 from dataclasses import dataclass
 
-# Check for speech_recognition availability
-try:
-    import speech_recognition as sr
-    SPEECH_RECOGNITION_AVAILABLE = True
-except ImportError:
-    SPEECH_RECOGNITION_AVAILABLE = False
-    sr = None
+import numpy as np
+
+from src.keyword_spotter import KEYWORD_MODEL, KeywordSpotter, is_keyword_spotting_available
 
 # Try to get logger from src, fall back to logging module
 try:
@@ -40,9 +35,9 @@ def is_voice_commands_available() -> bool:
     """Check if voice commands are available on this system.
 
     Returns:
-        True if speech_recognition library is installed
+        True if the local keyword spotting model can be run
     """
-    return SPEECH_RECOGNITION_AVAILABLE
+    return is_keyword_spotting_available()
 
 
 class VoiceCommandState(Enum):
@@ -59,15 +54,12 @@ class VoiceCommandConfig:
     """Configuration for voice command handler."""
     # Wake word settings
     wake_words: List[str] = None
-    wake_word_timeout: float = 5.0  # Seconds to listen for wake word before cycling
     command_timeout: float = 5.0  # Seconds to wait for command after wake word
     cooldown_period: float = 1.0  # Seconds between wake word detections
 
-    # Audio settings
-    device_index: Optional[int] = None  # None = default microphone
-    energy_threshold: int = 300  # Minimum audio energy threshold
-    pause_threshold: float = 0.8  # Seconds of silence before phrase is complete
-    dynamic_energy: bool = True  # Automatically adjust for ambient noise
+    # Recognition settings
+    model_name: str = KEYWORD_MODEL  # Whisper model used to spot commands
+    language: str = "en"
 
     # Feedback settings
     enable_tts_feedback: bool = False  # Speak confirmation of commands
@@ -102,8 +94,9 @@ class VoiceCommandHandler:
     - start listening / start: Toggle audio capture on
     - clear: Clear conversation context
 
-    The handler runs in a background thread and is designed to work
-    alongside the main audio capture without interference.
+    The handler listens on the main audio capture stream: pass it the
+    capture chunks with feed_audio(). Phrases are decoded in a background
+    thread and only confirmed commands are acted on.
     """
 
     # Command definitions with aliases
@@ -162,7 +155,6 @@ class VoiceCommandHandler:
         on_command_recognized: Optional[Callable[[str], None]] = None,
         on_state_changed: Optional[Callable[[VoiceCommandState], None]] = None,
         on_error: Optional[Callable[[str], None]] = None,
-        device_index: Optional[int] = None,
         config: Optional[VoiceCommandConfig] = None,
         hotkey_manager: Optional[Any] = None,
     ):
@@ -180,17 +172,14 @@ class VoiceCommandHandler:
             on_command_recognized: Callback with command name when any command is recognized
             on_state_changed: Callback when handler state changes
             on_error: Callback for error reporting
-            device_index: Microphone device index (None for default)
             config: VoiceCommandConfig object for advanced settings
             hotkey_manager: Optional HotkeyManager instance for integration
         """
-        if not SPEECH_RECOGNITION_AVAILABLE:
-            logger.warning("speech_recognition not available - voice commands disabled")
+        if not is_keyword_spotting_available():
+            logger.warning("faster_whisper not available - voice commands disabled")
 
         # Configuration
         self._config = config or VoiceCommandConfig()
-        if device_index is not None:
-            self._config.device_index = device_index
 
         # Callbacks
         self.on_summarize = on_summarize
@@ -213,12 +202,9 @@ class VoiceCommandHandler:
         self._running = False
         self._enabled = True
         self._lock = threading.Lock()
-        self._thread: Optional[threading.Thread] = None
-        self._last_wake_time = 0.0
 
-        # Speech recognition
-        self._recognizer: Optional["sr.Recognizer"] = None
-        self._microphone: Optional["sr.Microphone"] = None
+        # Keyword spotting on the capture stream
+        self._spotter: Optional[KeywordSpotter] = None
 
         # TTS feedback
         self._tts_engine = None
@@ -257,8 +243,8 @@ class VoiceCommandHandler:
                         logger.error(f"Error in state change callback: {e}")
 
     def is_available(self) -> bool:
-        """Check if voice commands are available (speech_recognition installed)."""
-        return SPEECH_RECOGNITION_AVAILABLE
+        """Check if voice commands are available (faster_whisper installed)."""
+        return is_keyword_spotting_available()
 
     def is_running(self) -> bool:
         """Check if the handler is currently running."""
@@ -283,17 +269,11 @@ class VoiceCommandHandler:
 
         logger.info(f"Voice commands {'enabled' if enabled else 'disabled'}")
 
-    def set_device(self, device_index: Optional[int]):
-        """Set the microphone device index.
-
-        Args:
-            device_index: Device index or None for default
-        """
-        self._config.device_index = device_index
-
     def set_config(self, config: VoiceCommandConfig):
         """Update the handler configuration.
 
+        Model and language changes apply the next time the handler starts.
+
         Args:
             config: New configuration to apply
         """
@@ -355,8 +335,8 @@ class VoiceCommandHandler:
 
     def start(self):
         """Start listening for voice commands."""
-        if not SPEECH_RECOGNITION_AVAILABLE:
-            logger.warning("Cannot start voice commands - speech_recognition not available")
+        if not is_keyword_spotting_available():
+            logger.warning("Cannot start voice commands - faster_whisper not available")
             return
 
         with self._lock:
@@ -368,8 +348,21 @@ class VoiceCommandHandler:
         if self._config.enable_tts_feedback:
             self._init_tts()
 
-        self._thread = threading.Thread(target=self._listen_loop, daemon=True)
-        self._thread.start()
+        if self._spotter is None:
+            self._spotter = KeywordSpotter(
+                wake_words=lambda: self._config.wake_words,
+                commands=lambda: self._command_lookup,
+                on_wake_word=self._on_wake_word,
+                on_command=self._execute_command,
+                on_command_timeout=self._on_command_timeout,
+                on_error=self._on_spotter_error,
+                model_name=self._config.model_name,
+                language=self._config.language,
+                command_timeout=self._config.command_timeout,
+                cooldown=self._config.cooldown_period,
+            )
+        self._spotter.start()
+        self._set_state(VoiceCommandState.LISTENING_FOR_WAKE_WORD)
         logger.info("Voice command handler started")
 
     def stop(self):
@@ -381,22 +374,24 @@ class VoiceCommandHandler:
 
         self._set_state(VoiceCommandState.IDLE)
 
-        if self._thread:
-            self._thread.join(timeout=2.0)
-            self._thread = None
+        if self._spotter:
+            self._spotter.stop()
 
         # Cleanup TTS
         self._cleanup_tts()
 
         logger.info("Voice command handler stopped")
 
-    def _init_recognizer(self):
-        """Initialize the speech recognizer."""
-        if self._recognizer is None:
-            self._recognizer = sr.Recognizer()
-            self._recognizer.dynamic_energy_threshold = self._config.dynamic_energy
-            self._recognizer.energy_threshold = self._config.energy_threshold
-            self._recognizer.pause_threshold = self._config.pause_threshold
+    def feed_audio(self, audio_chunk: np.ndarray):
+        """Receive a chunk of the main audio capture stream.
+
+        Called on the capture thread; only queues the chunk.
+
+        Args:
+            audio_chunk: Mono float32 audio at 16 kHz
+        """
+        if self._running and self._enabled and self._spotter:
+            self._spotter.feed(audio_chunk)
 
     def _init_tts(self):
         """Initialize text-to-speech engine for feedback."""
@@ -445,192 +440,27 @@ class VoiceCommandHandler:
         # Run in background thread to avoid blocking
         threading.Thread(target=speak, daemon=True).start()
 
-    def _listen_loop(self):
-        """Main listening loop for wake word and command detection."""
-        self._init_recognizer()
-
-        while self._running:
+    def _on_wake_word(self):
+        """Wake word heard without a command; wait for one."""
+        self._set_state(VoiceCommandState.LISTENING_FOR_COMMAND)
+        if self.on_wake_word_detected:
             try:
-                # Check if enabled
-                if not self._enabled:
-                    time.sleep(0.5)
-                    continue
-
-                # Listen for wake word
-                self._set_state(VoiceCommandState.LISTENING_FOR_WAKE_WORD)
-
-                with sr.Microphone(device_index=self._config.device_index) as source:
-                    # Adjust for ambient noise periodically
-                    self._recognizer.adjust_for_ambient_noise(source, duration=0.5)
-
-                    try:
-                        # Listen for audio
-                        audio = self._recognizer.listen(
-                            source,
-                            timeout=self._config.wake_word_timeout,
-                            phrase_time_limit=3.0
-                        )
-
-                        # Recognize speech
-                        text = self._recognize_speech(audio)
-
-                        if text:
-                            text_lower = text.lower().strip()
-                            logger.debug(f"Heard: {text_lower}")
-
-                            # Check for wake word
-                            if self._contains_wake_word(text_lower):
-                                # Check cooldown
-                                current_time = time.time()
-                                if current_time - self._last_wake_time < self._config.cooldown_period:
-                                    continue
-                                self._last_wake_time = current_time
-
-                                logger.info("Wake word detected!")
-                                if self.on_wake_word_detected:
-                                    self.on_wake_word_detected()
-
-                                # Extract command from same phrase if present
-                                command = self._extract_command_from_wake_phrase(text_lower)
-                                if command:
-                                    self._execute_command(command)
-                                else:
-                                    # Listen for command
-                                    self._listen_for_command(source)
-
-                    except sr.WaitTimeoutError:
-                        # No speech detected, continue listening
-                        continue
-                    except sr.UnknownValueError:
-                        # Could not understand audio, continue
-                        continue
-
-            except sr.RequestError as e:
-                logger.error(f"Speech recognition service error: {e}")
-                self._set_state(VoiceCommandState.ERROR)
-                if self.on_error:
-                    self.on_error(f"Speech recognition error: {e}")
-                time.sleep(2.0)  # Wait before retrying
-
+                self.on_wake_word_detected()
             except Exception as e:
-                logger.error(f"Error in voice command loop: {e}")
-                self._set_state(VoiceCommandState.ERROR)
-                if self.on_error:
-                    self.on_error(str(e))
-                time.sleep(1.0)
-
-    def _listen_for_command(self, source: "sr.Microphone"):
-        """Listen for a command after wake word is detected.
-
-        Args:
-            source: The microphone source to listen on
-        """
-        self._set_state(VoiceCommandState.LISTENING_FOR_COMMAND)
-
-        try:
-            audio = self._recognizer.listen(
-                source,
-                timeout=self._config.command_timeout,
-                phrase_time_limit=4.0
-            )
-
-            text = self._recognize_speech(audio)
-
-            if text:
-                text_lower = text.lower().strip()
-                logger.debug(f"Command phrase: {text_lower}")
-
-                command = self._match_command(text_lower)
-                if command:
-                    self._execute_command(command)
-                else:
-                    logger.debug(f"Unrecognized command: {text_lower}")
-
-        except sr.WaitTimeoutError:
-            logger.debug("No command received after wake word")
-        except sr.UnknownValueError:
-            logger.debug("Could not understand command")
-
-    def _recognize_speech(self, audio: "sr.AudioData") -> Optional[str]:
-        """Recognize speech from audio data.
-
-        Uses Google's free speech recognition API.
+                logger.error(f"Error in wake word callback: {e}")
 
-        Args:
-            audio: Audio data to recognize
-
-        Returns:
-            Recognized text or None if recognition failed
-        """
-        try:
-            # Use Google's free API (no key required)
-            text = self._recognizer.recognize_google(audio)
-            return text
-        except sr.UnknownValueError:
-            return None
-        except sr.RequestError as e:
-            logger.error(f"Could not request results from speech service: {e}")
-            raise
-
-    def _contains_wake_word(self, text: str) -> bool:
-        """Check if text contains the wake word.
-
-        Args:
-            text: Lowercase text to check
-
-        Returns:
-            True if wake word is present
-        """
-        for wake_word in self._config.wake_words:
-            if wake_word in text:
-                return True
-        return False
-
-    def _extract_command_from_wake_phrase(self, text: str) -> Optional[str]:
-        """Extract a command from a phrase containing the wake word.
-
-        Handles cases like "Hey ReadIn, summarize" where both wake word
-        and command are in the same phrase.
-
-        Args:
-            text: Lowercase text containing wake word
-
-        Returns:
-            Command name if found, None otherwise
-        """
-        # Find the wake word and get text after it
-        for wake_word in self._config.wake_words:
-            if wake_word in text:
-                # Get everything after the wake word
-                idx = text.find(wake_word) + len(wake_word)
-                remaining = text[idx:].strip()
-                # Remove common separators
-                remaining = re.sub(r'^[,.\s]+', '', remaining)
-
-                if remaining:
-                    return self._match_command(remaining)
+    def _on_command_timeout(self):
+        """No command followed the wake word."""
+        if self.is_running():
+            self._set_state(VoiceCommandState.LISTENING_FOR_WAKE_WORD)
 
-        return None
-
-    def _match_command(self, text: str) -> Optional[str]:
-        """Match text to a command.
-
-        Args:
-            text: Lowercase text to match
-
-        Returns:
-            Command name if matched, None otherwise
-        """
-        # Direct lookup
-        if text in self._command_lookup:
-            return self._command_lookup[text]
-
-        # Check if text starts with or contains any command alias
-        for alias, command in self._command_lookup.items():
-            if text.startswith(alias) or alias in text:
-                return command
-
-        return None
+    def _on_spotter_error(self, message: str):
+        """The spotter could not start."""
+        with self._lock:
+            self._running = False
+        self._set_state(VoiceCommandState.ERROR)
+        if self.on_error:
+            self.on_error(message)
 
     def _execute_command(self, command: str):
         """Execute a recognized command.
@@ -677,24 +507,8 @@ class VoiceCommandHandler:
                 if self.on_error:
                     self.on_error(f"Command error: {e}")
 
-    @staticmethod
-    def list_microphones() -> List[Dict[str, Any]]:
-        """List available microphone devices.
-
-        Returns:
-            List of dicts with 'index' and 'name' keys
-        """
-        if not SPEECH_RECOGNITION_AVAILABLE:
-            return []
-
-        try:
-            mics = []
-            for i, name in enumerate(sr.Microphone.list_microphone_names()):
-                mics.append({"index": i, "name": name})
-            return mics
-        except Exception as e:
-            logger.error(f"Error listing microphones: {e}")
-            return []
+        if self.is_running():
+            self._set_state(VoiceCommandState.LISTENING_FOR_WAKE_WORD)
 
     def get_supported_commands(self) -> Dict[str, List[str]]:
         """Get dictionary of supported commands and their aliases.
@@ -751,11 +565,11 @@ class VoiceCommandHandler:
             Dict with status information
         """
         return {
-            "available": SPEECH_RECOGNITION_AVAILABLE,
+            "available": is_keyword_spotting_available(),
             "running": self.is_running(),
             "enabled": self.is_enabled,
             "state": self.state.value,
-            "device_index": self._config.device_index,
+            "model": self._config.model_name,
             "tts_enabled": self._config.enable_tts_feedback,
             "wake_words": self._config.wake_words,
             "commands": list(self.get_supported_commands().keys()),
@@ -838,7 +652,6 @@ class VoiceCommandManager:
         config = VoiceCommandConfig()
 
         if self._settings:
-            config.device_index = self._settings.get("voice_command_device_index")
             config.enable_tts_feedback = self._settings.get("voice_feedback_enabled", False)
             config.tts_rate = self._settings.get("voice_feedback_rate", 150)
             config.tts_volume = self._settings.get("voice_feedback_volume", 0.8)
@@ -861,7 +674,7 @@ class VoiceCommandManager:
             return False
 
         if not is_voice_commands_available():
-            logger.warning("Voice commands not available - speech_recognition not installed")
+            logger.warning("Voice commands not available - faster_whisper not installed")
             return False
 
         self._handler.start()
@@ -880,6 +693,11 @@ class VoiceCommandManager:
         """Check if voice commands are available."""
         return is_voice_commands_available()
 
+    def feed_audio(self, audio_chunk: np.ndarray):
+        """Pass a chunk of the main audio capture stream to the handler."""
+        if self._handler:
+            self._handler.feed_audio(audio_chunk)
+
     def get_handler(self) -> Optional[VoiceCommandHandler]:
         """Get the underlying handler instance."""
         return self._handler
@@ -12,7 +12,6 @@ const CONFIG = {
   DESKTOP_APP_WS_URL: 'ws://localhost:8765',
   DESKTOP_APP_HTTP_URL: 'http://localhost:8765',
   RECONNECT_INTERVAL: 5000,
-  AUDIO_SAMPLE_RATE: 16000,
   AUDIO_CHUNK_MS: 100,
 };
 
@@ -263,11 +262,16 @@ async function closeOffscreenDocument() {
 }
 
 /**
- * Handle audio data from offscreen document
+ * Handle a base64-encoded binary audio frame from the offscreen document
  */
-function handleAudioData(audioData) {
+function handleAudioFrame(frameBase64) {
   if (state.websocket && state.websocket.readyState === WebSocket.OPEN) {
-    state.websocket.send(audioData);
+    const binary = atob(frameBase64);
+    const bytes = new Uint8Array(binary.length);
+    for (let i = 0; i < binary.length; i++) {
+      bytes[i] = binary.charCodeAt(i);
+    }
+    state.websocket.send(bytes.buffer);
   }
 }
 
@@ -298,10 +302,10 @@ chrome.runtime.onMessage.addListener((message, sender, sendResponse) => {
       sendResponse({ success: true });
       break;
 
-    case 'AUDIO_DATA':
-      // Forward audio data from offscreen document to desktop app
+    case 'AUDIO_FRAME':
+      // Forward binary audio frame from offscreen document to desktop app
       if (message.target === 'background') {
-        handleAudioData(message.data);
+        handleAudioFrame(message.frame);
       }
       break;
 
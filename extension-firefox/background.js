@@ -230,16 +230,11 @@ async function stopCapture() {
 }
 
 /**
- * Handle audio data from content script
+ * Forward a binary audio frame from the content script
  */
-function handleAudioData(audioData) {
+function handleAudioFrame(frame) {
   if (state.websocket && state.websocket.readyState === WebSocket.OPEN) {
-    // Send as JSON with audio array
-    state.websocket.send(JSON.stringify({
-      type: 'AUDIO_DATA',
-      data: audioData.data,
-      sampleRate: audioData.sampleRate || 16000,
-    }));
+    state.websocket.send(frame);
   }
 }
 
@@ -270,9 +265,9 @@ browser.runtime.onMessage.addListener((message, sender, sendResponse) => {
       sendResponse({ success: true });
       break;
 
-    case 'AUDIO_DATA':
-      // Audio data from content script
-      handleAudioData(message);
+    case 'AUDIO_FRAME':
+      // Binary audio frame from content script
+      handleAudioFrame(message.frame);
       break;
 
     case 'MEETING_DETECTED':
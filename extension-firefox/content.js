@@ -4,14 +4,51 @@
  * Injected into meeting pages to detect meetings and capture audio
  */
 
-const SAMPLE_RATE = 16000;
 const BUFFER_SIZE = 4096;
+const MAX_CHANNELS = 2;
+
+// Binary audio frame format shared with the desktop app's BrowserBridge
+// (little-endian): magic "RIAF" | version u8 | encoding u8 | channels u16 |
+// sampleRate u32 | sequence u32 | interleaved PCM payload
+const FRAME_MAGIC = [0x52, 0x49, 0x41, 0x46];
+const FRAME_VERSION = 1;
+const FRAME_HEADER_SIZE = 16;
+const ENCODING_INT16 = 1;
 
 // Audio capture state
 let mediaStream = null;
 let audioContext = null;
 let processor = null;
 let isCapturing = false;
+let frameSequence = 0;
+
+/**
+ * Encode channel buffers as a binary audio frame (int16 PCM, interleaved)
+ */
+function encodeAudioFrame(channelData, sampleRate, sequence) {
+  const channels = channelData.length;
+  const frameCount = channelData[0].length;
+  const buffer = new ArrayBuffer(FRAME_HEADER_SIZE + frameCount * channels * 2);
+  const view = new DataView(buffer);
+
+  FRAME_MAGIC.forEach((byte, i) => view.setUint8(i, byte));
+  view.setUint8(4, FRAME_VERSION);
+  view.setUint8(5, ENCODING_INT16);
+  view.setUint16(6, channels, true);
+  view.setUint32(8, sampleRate, true);
+  view.setUint32(12, sequence >>> 0, true);
+
+  let offset = FRAME_HEADER_SIZE;
+  for (let i = 0; i < frameCount; i++) {
+    for (let c = 0; c < channels; c++) {
+      // Clamp and convert to 16-bit integer
+      const s = Math.max(-1, Math.min(1, channelData[c][i]));
+      view.setInt16(offset, s < 0 ? s * 0x8000 : s * 0x7FFF, true);
+      offset += 2;
+    }
+  }
+  return buffer;
+}
 
 // Meeting detection configurations
 const MEETING_CONFIGS = {
@@ -145,7 +182,6 @@ async function startAudioCapture() {
       audio: {
         echoCancellation: false,
         noiseSuppression: false,
-        sampleRate: SAMPLE_RATE,
       }
     });
 
@@ -158,32 +194,31 @@ async function startAudioCapture() {
     // Stop video track (we only need audio)
     mediaStream.getVideoTracks().forEach(track => track.stop());
 
-    // Create audio context
-    audioContext = new AudioContext({ sampleRate: SAMPLE_RATE });
+    // Create audio context at the device's native rate; the desktop app
+    // resamples to 16kHz using the rate carried in each frame
+    audioContext = new AudioContext();
 
     // Create source from media stream
     const source = audioContext.createMediaStreamSource(new MediaStream(audioTracks));
+    const channels = Math.min(MAX_CHANNELS, audioTracks[0].getSettings().channelCount || 1);
 
     // Create script processor for audio data access
-    processor = audioContext.createScriptProcessor(BUFFER_SIZE, 1, 1);
+    processor = audioContext.createScriptProcessor(BUFFER_SIZE, channels, 1);
+    frameSequence = 0;
 
     processor.onaudioprocess = (event) => {
       if (!isCapturing) return;
 
-      const inputData = event.inputBuffer.getChannelData(0);
-
-      // Convert Float32Array to Int16Array for efficient transmission
-      const int16Data = new Int16Array(inputData.length);
-      for (let i = 0; i < inputData.length; i++) {
-        const s = Math.max(-1, Math.min(1, inputData[i]));
-        int16Data[i] = s < 0 ? s * 0x8000 : s * 0x7FFF;
+      const input = event.inputBuffer;
+      const channelData = [];
+      for (let c = 0; c < input.numberOfChannels; c++) {
+        channelData.push(input.getChannelData(c));
       }
 
-      // Send audio data to background script
+      // Send binary frame to background script (structured clone keeps the ArrayBuffer)
       browser.runtime.sendMessage({
-        type: 'AUDIO_DATA',
-        data: Array.from(int16Data),
-        sampleRate: SAMPLE_RATE,
+        type: 'AUDIO_FRAME',
+        frame: encodeAudioFrame(channelData, input.sampleRate, frameSequence++),
       });
     };
 
@@ -4,13 +4,62 @@
  * Handles audio capture from tab and sends to background script
  */
 
-const SAMPLE_RATE = 16000;
 const BUFFER_SIZE = 4096;
+const MAX_CHANNELS = 2;
+
+// Binary audio frame format shared with the desktop app's BrowserBridge
+// (little-endian): magic "RIAF" | version u8 | encoding u8 | channels u16 |
+// sampleRate u32 | sequence u32 | interleaved PCM payload
+const FRAME_MAGIC = [0x52, 0x49, 0x41, 0x46];
+const FRAME_VERSION = 1;
+const FRAME_HEADER_SIZE = 16;
+const ENCODING_INT16 = 1;
 
 let mediaStream = null;
 let audioContext = null;
 let processor = null;
 let isCapturing = false;
+let frameSequence = 0;
+
+/**
+ * Encode channel buffers as a binary audio frame (int16 PCM, interleaved)
+ */
+function encodeAudioFrame(channelData, sampleRate, sequence) {
+  const channels = channelData.length;
+  const frameCount = channelData[0].length;
+  const buffer = new ArrayBuffer(FRAME_HEADER_SIZE + frameCount * channels * 2);
+  const view = new DataView(buffer);
+
+  FRAME_MAGIC.forEach((byte, i) => view.setUint8(i, byte));
+  view.setUint8(4, FRAME_VERSION);
+  view.setUint8(5, ENCODING_INT16);
+  view.setUint16(6, channels, true);
+  view.setUint32(8, sampleRate, true);
+  view.setUint32(12, sequence >>> 0, true);
+
+  let offset = FRAME_HEADER_SIZE;
+  for (let i = 0; i < frameCount; i++) {
+    for (let c = 0; c < channels; c++) {
+      // Clamp and convert to 16-bit integer
+      const s = Math.max(-1, Math.min(1, channelData[c][i]));
+      view.setInt16(offset, s < 0 ? s * 0x8000 : s * 0x7FFF, true);
+      offset += 2;
+    }
+  }
+  return buffer;
+}
+
+/**
+ * Base64-encode a frame (runtime messaging only carries JSON-serializable data)
+ */
+function toBase64(buffer) {
+  const bytes = new Uint8Array(buffer);
+  let binary = '';
+  for (let i = 0; i < bytes.length; i += 0x8000) {
+    binary += String.fromCharCode.apply(null, bytes.subarray(i, i + 0x8000));
+  }
+  return btoa(binary);
+}
 
 /**
  * Start capturing audio from the stream
@@ -33,34 +82,34 @@ async function startCapture(streamId) {
       video: false,
     });
 
-    // Create audio context
-    audioContext = new AudioContext({ sampleRate: SAMPLE_RATE });
+    // Create audio context at the device's native rate; the desktop app
+    // resamples to 16kHz using the rate carried in each frame
+    audioContext = new AudioContext();
 
     // Create source from media stream
     const source = audioContext.createMediaStreamSource(mediaStream);
+    const trackSettings = mediaStream.getAudioTracks()[0].getSettings();
+    const channels = Math.min(MAX_CHANNELS, trackSettings.channelCount || 1);
 
     // Create script processor for audio data access
-    processor = audioContext.createScriptProcessor(BUFFER_SIZE, 1, 1);
+    processor = audioContext.createScriptProcessor(BUFFER_SIZE, channels, 1);
+    frameSequence = 0;
 
     processor.onaudioprocess = (event) => {
       if (!isCapturing) return;
 
-      const inputData = event.inputBuffer.getChannelData(0);
-
-      // Convert Float32Array to Int16Array for efficient transmission
-      const int16Data = new Int16Array(inputData.length);
-      for (let i = 0; i < inputData.length; i++) {
-        // Clamp and convert to 16-bit integer
-        const s = Math.max(-1, Math.min(1, inputData[i]));
-        int16Data[i] = s < 0 ? s * 0x8000 : s * 0x7FFF;
+      const input = event.inputBuffer;
+      const channelData = [];
+      for (let c = 0; c < input.numberOfChannels; c++) {
+        channelData.push(input.getChannelData(c));
       }
 
-      // Send audio data to background script
+      // Send binary frame to background script
+      const frame = encodeAudioFrame(channelData, input.sampleRate, frameSequence++);
       chrome.runtime.sendMessage({
-        type: 'AUDIO_DATA',
+        type: 'AUDIO_FRAME',
         target: 'background',
-        data: Array.from(int16Data),
-        sampleRate: SAMPLE_RATE,
+        frame: toBase64(frame),
       });
     };
 
@@ -5,14 +5,17 @@ from typing import Callable, Optional, List, Dict, Any, TYPE_CHECKING
 from collections import deque
 from datetime import datetime
 
-from anthropic import Anthropic
-
 from config import ANTHROPIC_API_KEY, RESPONSE_MODEL, DEFAULT_CONTEXT_WINDOW, MAX_CONTEXT_WINDOW
 from ai_personas import get_persona_prompt, AI_PERSONAS
 
 if TYPE_CHECKING:
+    from anthropic import Anthropic
     from context_provider import ContextProvider
 
+# Keep the pre-opened API connection alive between questions (httpx's
+# default drops idle connections after 5 seconds)
+CONNECTION_KEEPALIVE_SECONDS = 120.0
+
 
 class AIAssistant:
     """Generates instant talking points using Claude API."""
@@ -25,7 +28,8 @@ class AIAssistant:
         system_prompt: Optional[str] = None,
         context_size: int = DEFAULT_CONTEXT_WINDOW,
         model: str = RESPONSE_MODEL,
-        context_provider: Optional["ContextProvider"] = None
+        context_provider: Optional["ContextProvider"] = None,
+        on_response_started: Optional[Callable[[str], None]] = None
     ):
         """
         Initialize AI assistant.
@@ -38,18 +42,24 @@ class AIAssistant:
             context_size: Number of exchanges to keep in context
             model: Claude model to use
             context_provider: Optional context provider for personalization
+            on_response_started: Optional callback with heard_text when a
+                generation starts, after any generation it replaces has
+                delivered its last chunk
         """
         self.on_response = on_response
         self.on_streaming_chunk = on_streaming_chunk
         self.on_error = on_error
-        self._client: Optional[Anthropic] = None
+        self.on_response_started = on_response_started
+        self._client: Optional["Anthropic"] = None
+        self._client_lock = threading.Lock()
         self._context_size = min(max(context_size, 1), MAX_CONTEXT_WINDOW)
         self._context: deque = deque(maxlen=self._context_size)
         self._lock = threading.Lock()
         self._model = model
         self._custom_system_prompt = system_prompt
         self._is_generating = False
-        self._generating_lock = threading.Lock()  # Thread safety for generation flag
+        self._generating_lock = threading.RLock()  # Thread safety for generation flag (held around callbacks)
+        self._cancel_event: Optional[threading.Event] = None  # Set to cancel the running generation
         self._context_provider = context_provider
         self._meeting_type = "general"
         self._persona_key = "professional"  # Default persona
@@ -193,13 +203,70 @@ Remember: The person will SPEAK these naturally - you're just giving them the ke
         """
         self._model = model
 
-    def _get_client(self) -> Anthropic:
+    def _get_client(self) -> "Anthropic":
         """Get or create Anthropic client."""
-        if self._client is None:
-            if not ANTHROPIC_API_KEY:
-                raise ValueError("ANTHROPIC_API_KEY not set in config or environment")
-            self._client = Anthropic(api_key=ANTHROPIC_API_KEY)
-        return self._client
+        with self._client_lock:
+            if self._client is None:
+                if not ANTHROPIC_API_KEY:
+                    raise ValueError("ANTHROPIC_API_KEY not set in config or environment")
+                # Imported on first use: the SDK (with httpx and pydantic)
+                # takes a noticeable share of startup
+                from anthropic import Anthropic
+                self._client = Anthropic(api_key=ANTHROPIC_API_KEY, http_client=self._make_http_client())
+            return self._client
+
+    @staticmethod
+    def _make_http_client():
+        """HTTP client that keeps idle connections open longer, if supported."""
+        try:
+            import httpx
+            from anthropic import DefaultHttpxClient
+        except ImportError:
+            return None
+        return DefaultHttpxClient(
+            limits=httpx.Limits(
+                max_connections=10,
+                max_keepalive_connections=2,
+                keepalive_expiry=CONNECTION_KEEPALIVE_SECONDS,
+            )
+        )
+
+    def connect(self) -> bool:
+        """Create the API client ahead of the first question.
+
+        Returns:
+            False if no API key is configured
+        """
+        try:
+            self._get_client()
+            return True
+        except ValueError:
+            return False
+
+    def is_connected(self) -> bool:
+        """Check if the API client has been created."""
+        return self._client is not None
+
+    def warm_up(self):
+        """Open the API connection (DNS, TCP and TLS) before it is needed.
+
+        Any response will do, so errors are ignored; the pooled connection
+        is reused by the first real request.
+        """
+        try:
+            self._get_client().with_options(max_retries=0, timeout=10.0).models.list(limit=1)
+        except Exception:
+            pass
+
+    def disconnect(self):
+        """Close the API client and its pooled connections."""
+        with self._client_lock:
+            client, self._client = self._client, None
+        if client is not None:
+            try:
+                client.close()
+            except Exception:
+                pass
 
     def _build_messages(self, heard_text: str) -> list:
         """Build message history for Claude."""
@@ -225,15 +292,23 @@ Remember: The person will SPEAK these naturally - you're just giving them the ke
         return messages
 
     def generate_response(self, heard_text: str):
-        """Generate a response to what was heard (runs in background thread)."""
-        # Thread-safe check and set for concurrent generation prevention
+        """Generate a response to what was heard (runs in background thread).
+
+        A generation already running is cancelled and replaced: its stream
+        is closed and it delivers no further chunks, response or error.
+        """
         with self._generating_lock:
-            if self._is_generating:
-                return  # Prevent concurrent generations
+            if self._cancel_event is not None:
+                self._cancel_event.set()
+            cancel = threading.Event()
+            self._cancel_event = cancel
             self._is_generating = True
 
         def _generate():
             try:
+                if not self._deliver(cancel, self.on_response_started, heard_text):
+                    return
+
                 client = self._get_client()
 
                 messages = self._build_messages(heard_text)
@@ -249,7 +324,8 @@ Remember: The person will SPEAK these naturally - you're just giving them the ke
                     ) as stream:
                         for text in stream.text_stream:
                             full_response += text
-                            self.on_streaming_chunk(text)
+                            if not self._deliver(cancel, self.on_streaming_chunk, text):
+                                break  # Replaced; leaving the block closes the stream
 
                     response = full_response
                 else:
@@ -262,29 +338,59 @@ Remember: The person will SPEAK these naturally - you're just giving them the ke
                     )
                     response = result.content[0].text
 
-                # Store in context
-                with self._lock:
-                    self._context.append({
-                        'heard': heard_text,
-                        'response': response,
-                        'timestamp': datetime.now().isoformat()
-                    })
-
-                self.on_response(heard_text, response)
+                self._deliver(cancel, self._complete, heard_text, response)
 
             except Exception as e:
-                error_msg = f"AI Error: {str(e)}"
-                print(error_msg)
-                if self.on_error:
-                    self.on_error(str(e))
-                self.on_response(heard_text, error_msg)
+                self._deliver(cancel, self._fail, heard_text, e)
             finally:
                 with self._generating_lock:
-                    self._is_generating = False
+                    if self._cancel_event is cancel:
+                        self._cancel_event = None
+                        self._is_generating = False
 
         thread = threading.Thread(target=_generate, daemon=True)
         thread.start()
 
+    def cancel_response(self):
+        """Cancel the running generation, if any, without replacing it."""
+        with self._generating_lock:
+            if self._cancel_event is not None:
+                self._cancel_event.set()
+                self._cancel_event = None
+            self._is_generating = False
+
+    def _deliver(self, cancel: threading.Event, callback: Optional[Callable], *args) -> bool:
+        """Run a callback for a generation unless it has been cancelled.
+
+        Checking and calling under the generation lock means a replaced
+        generation cannot deliver anything once generate_response returns.
+        Callbacks should only hand off (e.g. emit a signal).
+        """
+        with self._generating_lock:
+            if cancel.is_set():
+                return False
+            if callback:
+                callback(*args)
+            return True
+
+    def _complete(self, heard_text: str, response: str):
+        """Store a finished exchange and report it."""
+        with self._lock:
+            self._context.append({
+                'heard': heard_text,
+                'response': response,
+                'timestamp': datetime.now().isoformat()
+            })
+        self.on_response(heard_text, response)
+
+    def _fail(self, heard_text: str, error: Exception):
+        """Report a failed generation."""
+        error_msg = f"AI Error: {str(error)}"
+        print(error_msg)
+        if self.on_error:
+            self.on_error(str(error))
+        self.on_response(heard_text, error_msg)
+
     def clear_context(self):
         """Clear conversation context (call when session ends)."""
         with self._lock:
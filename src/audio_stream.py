@@ -0,0 +1,157 @@
+"""Streaming audio helpers shared by capture sources.
+
+Provides a stateful polyphase resampler that can be fed arbitrarily sized
+blocks without clicks at block boundaries, and a preallocated ring buffer that
+re-chunks a continuous stream into the fixed-size chunks the transcriber
+expects.
+"""
+
+import logging
+import threading
+from math import gcd
+from typing import Callable, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class PolyphaseResampler:
+    """Stateful rational-ratio resampler (up/down polyphase FIR).
+
+    Unlike scipy.signal.resample_poly, which treats every call as an isolated
+    signal, this keeps the filter history and output phase between calls so a
+    stream split into small frames resamples exactly like one long buffer.
+    """
+
+    def __init__(self, source_rate: int, target_rate: int, kaiser_beta: float = 5.0):
+        if source_rate <= 0 or target_rate <= 0:
+            raise ValueError("Sample rates must be positive")
+
+        self.source_rate = source_rate
+        self.target_rate = target_rate
+
+        divisor = gcd(source_rate, target_rate)
+        self._up = target_rate // divisor
+        self._down = source_rate // divisor
+
+        # Windowed-sinc low-pass at the tighter of the two Nyquist limits,
+        # designed at the upsampled rate (same sizing as resample_poly)
+        max_rate = max(self._up, self._down)
+        half_len = 10 * max_rate
+        num_taps = 2 * half_len + 1
+        cutoff = 0.5 / max_rate
+        n = np.arange(num_taps) - half_len
+        taps = 2 * cutoff * np.sinc(2 * cutoff * n) * np.kaiser(num_taps, kaiser_beta)
+        taps *= self._up / taps.sum()
+
+        # Polyphase decomposition: row p holds taps[p], taps[p + up], ...
+        self._taps_per_phase = -(-num_taps // self._up)
+        padded = np.zeros(self._taps_per_phase * self._up)
+        padded[:num_taps] = taps
+        self._phases = padded.reshape(self._taps_per_phase, self._up).T.astype(np.float32)
+
+        self.reset()
+
+    @property
+    def is_passthrough(self) -> bool:
+        return self._up == self._down
+
+    def reset(self):
+        """Discard filter history (e.g. after a stream discontinuity)."""
+        self._history = np.zeros(self._taps_per_phase, dtype=np.float32)
+        self._input_count = 0
+        self._output_count = 0
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """Resample a block of mono float32 samples."""
+        samples = np.asarray(samples, dtype=np.float32)
+        if self.is_passthrough or len(samples) == 0:
+            return samples
+
+        buffer = np.concatenate([self._history, samples])
+        self._input_count += len(samples)
+        buffer_start = self._input_count - len(buffer)
+
+        # Output n needs input index floor(n * down / up); emit every output
+        # whose newest input sample has arrived
+        last_output = (self._input_count * self._up - 1) // self._down
+        output_index = np.arange(self._output_count, last_output + 1, dtype=np.int64)
+        if len(output_index) == 0:
+            self._history = buffer[-self._taps_per_phase:]
+            return np.zeros(0, dtype=np.float32)
+
+        position = output_index * self._down
+        newest_input = position // self._up - buffer_start
+        phase = position % self._up
+
+        gather = newest_input[:, None] - np.arange(self._taps_per_phase)[None, :]
+        output = np.einsum("ij,ij->i", buffer[gather], self._phases[phase]).astype(np.float32)
+
+        self._output_count = last_output + 1
+        self._history = buffer[-self._taps_per_phase:]
+        return output
+
+
+class AudioRingBuffer:
+    """Preallocated ring buffer that emits fixed-size chunks.
+
+    Writers push arbitrarily sized blocks; whenever `chunk_samples` are
+    available a chunk is handed to `on_chunk`. When the consumer falls behind
+    by more than the capacity, the oldest audio is overwritten.
+    """
+
+    def __init__(self, chunk_samples: int, on_chunk: Callable[[np.ndarray], None],
+                 capacity_samples: Optional[int] = None):
+        self.chunk_samples = chunk_samples
+        self.on_chunk = on_chunk
+        self._capacity = max(capacity_samples or 4 * chunk_samples, chunk_samples)
+        self._buffer = np.zeros(self._capacity, dtype=np.float32)
+        self._read = 0
+        self._size = 0
+        self._overwritten = 0
+        self._lock = threading.Lock()
+
+    @property
+    def overwritten_samples(self) -> int:
+        return self._overwritten
+
+    def clear(self):
+        with self._lock:
+            self._read = 0
+            self._size = 0
+
+    def write(self, samples: np.ndarray):
+        """Append samples and emit any complete chunks."""
+        samples = np.asarray(samples, dtype=np.float32)
+        chunks = []
+        with self._lock:
+            if len(samples) > self._capacity:
+                self._overwritten += len(samples) - self._capacity
+                samples = samples[-self._capacity:]
+
+            overflow = self._size + len(samples) - self._capacity
+            if overflow > 0:
+                self._read = (self._read + overflow) % self._capacity
+                self._size -= overflow
+                self._overwritten += overflow
+
+            write_pos = (self._read + self._size) % self._capacity
+            first = min(len(samples), self._capacity - write_pos)
+            self._buffer[write_pos:write_pos + first] = samples[:first]
+            self._buffer[:len(samples) - first] = samples[first:]
+            self._size += len(samples)
+
+            while self._size >= self.chunk_samples:
+                end = self._read + self.chunk_samples
+                if end <= self._capacity:
+                    chunk = self._buffer[self._read:end].copy()
+                else:
+                    chunk = np.concatenate([self._buffer[self._read:], self._buffer[:end - self._capacity]])
+                self._read = end % self._capacity
+                self._size -= self.chunk_samples
+                chunks.append(chunk)
+
+        # Deliver outside the lock so a slow consumer cannot block writers
+        for chunk in chunks:
+            self.on_chunk(chunk)
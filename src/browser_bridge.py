@@ -3,6 +3,11 @@ Browser Extension Bridge for ReadIn AI
 
 WebSocket server that receives audio data from the browser extension
 and forwards it to the transcription pipeline.
+
+Audio arrives as versioned binary frames (see `parse_audio_frame`) carrying
+the capture sample rate, channel count and a sequence number. Frames are
+downmixed, resampled to AUDIO_SAMPLE_RATE with a stateful polyphase resampler
+and written into a ring buffer that emits transcription-sized chunks.
 """
 
 import asyncio
@@ -17,6 +22,9 @@ from collections import defaultdict
 from typing import Callable, Dict, Optional, Set
 import numpy as np
 
+from config import AUDIO_SAMPLE_RATE, AUDIO_CHUNK_DURATION
+from audio_stream import AudioRingBuffer, PolyphaseResampler
+
 try:
     import websockets
     from websockets.server import serve
@@ -35,6 +43,75 @@ MAX_CONNECTIONS = 5  # Maximum concurrent connections
 AUTH_TIMEOUT_SECONDS = 5  # Time allowed for authentication
 MAX_MESSAGES_PER_SECOND = 100  # Rate limit per client
 AUTH_TOKEN_LENGTH = 32  # Length of authentication token in bytes
+MAX_SOURCE_SAMPLE_RATE = 192000
+MAX_CHANNELS = 8
+
+# Binary audio frame format (little-endian):
+#   magic "RIAF" | version u8 | encoding u8 | channels u16 | sample_rate u32 | sequence u32 | PCM payload
+# Payload is interleaved samples; encoding 1 = int16, 2 = float32.
+FRAME_MAGIC = b"RIAF"
+FRAME_VERSION = 1
+FRAME_HEADER = struct.Struct("<4sBBHII")
+ENCODING_INT16 = 1
+ENCODING_FLOAT32 = 2
+
+
+class AudioFrame:
+    """A decoded binary audio frame."""
+
+    __slots__ = ("sample_rate", "channels", "sequence", "samples")
+
+    def __init__(self, sample_rate: int, channels: int, sequence: Optional[int], samples: np.ndarray):
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.sequence = sequence
+        self.samples = samples  # mono float32
+
+
+def parse_audio_frame(data: bytes) -> AudioFrame:
+    """Decode a binary audio frame into mono float32 samples.
+
+    Messages without the frame magic are treated as legacy raw int16 PCM at
+    16 kHz, as sent by older extension versions.
+
+    Raises:
+        ValueError: If the frame header or payload is malformed.
+    """
+    if not data.startswith(FRAME_MAGIC):
+        if len(data) % 2:
+            raise ValueError("Legacy audio payload is not int16 aligned")
+        samples = np.frombuffer(data, dtype="<i2").astype(np.float32) / 32768.0
+        return AudioFrame(AUDIO_SAMPLE_RATE, 1, None, samples)
+
+    if len(data) < FRAME_HEADER.size:
+        raise ValueError("Audio frame shorter than header")
+
+    _, version, encoding, channels, sample_rate, sequence = FRAME_HEADER.unpack_from(data)
+    if version != FRAME_VERSION:
+        raise ValueError(f"Unsupported audio frame version {version}")
+    if not 1 <= channels <= MAX_CHANNELS:
+        raise ValueError(f"Invalid channel count {channels}")
+    if not 0 < sample_rate <= MAX_SOURCE_SAMPLE_RATE:
+        raise ValueError(f"Invalid sample rate {sample_rate}")
+
+    payload = memoryview(data)[FRAME_HEADER.size:]
+    if encoding == ENCODING_INT16:
+        dtype, scale = "<i2", 1.0 / 32768.0
+    elif encoding == ENCODING_FLOAT32:
+        dtype, scale = "<f4", 1.0
+    else:
+        raise ValueError(f"Unsupported audio encoding {encoding}")
+
+    item_size = np.dtype(dtype).itemsize
+    if len(payload) % (item_size * channels):
+        raise ValueError("Audio payload is not aligned to whole frames")
+
+    samples = np.frombuffer(payload, dtype=dtype).astype(np.float32)
+    if scale != 1.0:
+        samples *= scale
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1)
+    return AudioFrame(sample_rate, channels, sequence, samples)
 
 
 class RateLimiter:
@@ -130,6 +207,16 @@ class BrowserBridge:
         # Track pending authentication
         self._pending_auth: Dict[str, asyncio.Task] = {}
 
+        # Audio pipeline: resampler per source rate, ring buffer of 16kHz audio
+        self._resampler: Optional[PolyphaseResampler] = None
+        self._ring_buffer = AudioRingBuffer(
+            chunk_samples=int(AUDIO_SAMPLE_RATE * AUDIO_CHUNK_DURATION),
+            on_chunk=self._emit_audio_chunk,
+        )
+        self._expected_sequence: Optional[int] = None
+        self._frames_received = 0
+        self._frames_dropped = 0
+
     def _get_default_token_path(self) -> str:
         """Get the default path for storing the auth token."""
         # Use platform-appropriate user data directory
@@ -222,6 +309,23 @@ class BrowserBridge:
         """Check if extension is currently capturing audio."""
         return self._is_capturing
 
+    def get_audio_stats(self) -> Dict[str, int]:
+        """Get frame counters for the current capture."""
+        return {
+            'frames_received': self._frames_received,
+            'frames_dropped': self._frames_dropped,
+            'samples_overwritten': self._ring_buffer.overwritten_samples,
+            'source_sample_rate': self._resampler.source_rate if self._resampler else 0,
+        }
+
+    def _reset_audio_stream(self):
+        """Reset resampler, sequence tracking and buffered audio for a new capture."""
+        self._resampler = None
+        self._ring_buffer.clear()
+        self._expected_sequence = None
+        self._frames_received = 0
+        self._frames_dropped = 0
+
     def request_start_capture(self):
         """Request the extension to start capturing audio."""
         loop = self._loop  # Capture reference to avoid race conditions
@@ -480,13 +584,15 @@ class BrowserBridge:
             logger.info(f"Extension handshake from {client_id}: {source} v{version}")
             await websocket.send(json.dumps({
                 'type': 'handshake_ack',
-                'version': '1.0.0'
+                'version': '1.0.0',
+                'audioFrameVersion': FRAME_VERSION,
             }))
 
         elif msg_type == 'capture_started':
             meeting_name = data.get('meetingName', 'Unknown')
             url = data.get('url', '')
             logger.info(f"Extension started capture: {meeting_name} at {url}")
+            self._reset_audio_stream()
             self._is_capturing = True
             if self.on_capture_started:
                 self.on_capture_started()
@@ -494,7 +600,10 @@ class BrowserBridge:
                 self.on_meeting_detected(data.get('meetingName'), data.get('url', ''))
 
         elif msg_type == 'capture_stopped':
-            logger.info("Extension stopped capture")
+            logger.info(
+                f"Extension stopped capture ({self._frames_received} frames, "
+                f"{self._frames_dropped} dropped)"
+            )
             self._is_capturing = False
             if self.on_capture_stopped:
                 self.on_capture_stopped()
@@ -513,7 +622,7 @@ class BrowserBridge:
                 self._handle_audio_array(data['data'], data.get('sampleRate', 16000))
 
     def _handle_audio_data(self, audio_bytes: bytes):
-        """Handle binary audio data from the extension."""
+        """Handle a binary audio frame from the extension."""
         if not self.on_audio_chunk:
             return
 
@@ -523,19 +632,16 @@ class BrowserBridge:
             return
 
         try:
-            # Audio is sent as Int16 PCM, convert to float32
-            int16_array = np.frombuffer(audio_bytes, dtype=np.int16)
-            float_array = int16_array.astype(np.float32) / 32768.0
-            self.on_audio_chunk(float_array)
+            frame = parse_audio_frame(audio_bytes)
         except ValueError as e:
             logger.error(f"Invalid audio data format: {e}")
-        except MemoryError as e:
-            logger.error(f"Memory error processing audio data: {e}")
-        except Exception as e:
-            logger.error(f"Error processing audio data: {e}")
+            return
+
+        self._track_sequence(frame.sequence)
+        self._ingest_audio(frame.samples, frame.sample_rate)
 
     def _handle_audio_array(self, audio_data: list, sample_rate: int):
-        """Handle audio data sent as JSON array."""
+        """Handle audio data sent as JSON array (legacy fallback)."""
         if not self.on_audio_chunk:
             return
 
@@ -549,17 +655,54 @@ class BrowserBridge:
             logger.warning(f"Audio array too large ({len(audio_data)} elements), ignoring")
             return
 
+        if not isinstance(sample_rate, int) or not 0 < sample_rate <= MAX_SOURCE_SAMPLE_RATE:
+            logger.warning(f"Invalid audio sample rate {sample_rate!r}, ignoring")
+            return
+
         try:
             # Convert list of Int16 values to numpy float32 array
             int16_array = np.array(audio_data, dtype=np.int16)
             float_array = int16_array.astype(np.float32) / 32768.0
-            self.on_audio_chunk(float_array)
-        except ValueError as e:
+        except (ValueError, OverflowError) as e:
             logger.error(f"Invalid audio array data: {e}")
+            return
+
+        self._ingest_audio(float_array, sample_rate)
+
+    def _track_sequence(self, sequence: Optional[int]):
+        """Detect dropped frames from gaps in the frame sequence numbers."""
+        self._frames_received += 1
+        if sequence is None:
+            return
+
+        expected = self._expected_sequence
+        if expected is not None and sequence != expected:
+            gap = (sequence - expected) & 0xFFFFFFFF
+            if gap < 0x80000000:
+                self._frames_dropped += gap
+                logger.warning(f"Dropped {gap} audio frame(s) (expected #{expected}, got #{sequence})")
+            else:
+                # Sequence went backwards - extension restarted its counter
+                logger.debug(f"Audio frame sequence reset ({expected} -> {sequence})")
+        self._expected_sequence = (sequence + 1) & 0xFFFFFFFF
+
+    def _ingest_audio(self, samples: np.ndarray, sample_rate: int):
+        """Resample to the transcription rate and feed the ring buffer."""
+        try:
+            if self._resampler is None or self._resampler.source_rate != sample_rate:
+                if self._resampler is not None:
+                    logger.info(f"Browser audio sample rate changed to {sample_rate} Hz")
+                self._resampler = PolyphaseResampler(sample_rate, AUDIO_SAMPLE_RATE)
+            self._ring_buffer.write(self._resampler.process(samples))
         except MemoryError as e:
-            logger.error(f"Memory error processing audio array: {e}")
+            logger.error(f"Memory error processing audio data: {e}")
         except Exception as e:
-            logger.error(f"Error processing audio array: {e}")
+            logger.error(f"Error processing audio data: {e}")
+
+    def _emit_audio_chunk(self, chunk: np.ndarray):
+        """Deliver a transcription-sized chunk to the audio callback."""
+        if self.on_audio_chunk:
+            self.on_audio_chunk(chunk)
 
 
 # Simple test
@@ -589,7 +732,6 @@ if __name__ == "__main__":
     try:
         print("Browser bridge running. Press Ctrl+C to stop.")
         while True:
-            import time
             time.sleep(1)
     except KeyboardInterrupt:
         bridge.stop()
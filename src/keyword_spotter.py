@@ -0,0 +1,410 @@
+"""Offline wake word and command spotting on the shared capture stream.
+
+Voice commands used to open a second microphone stream and send every
+phrase to a remote recognizer just to look for the wake word. The spotter
+instead receives the chunks AudioCapture already produces, skips them
+with a cheap adaptive energy gate unless they contain speech, and runs a
+small Whisper model (tiny.en by default) on the rest. Decoding is primed
+with the wake word and command phrases, and its output is matched against
+that small grammar only.
+
+A command is acted on only when it is confirmed: the decode is confident
+enough, the wake word was heard (in the same phrase, or just before), and
+the command phrase starts right after it.
+"""
+
+import importlib.util
+import math
+import os
+import queue
+import re
+import threading
+import time
+from difflib import SequenceMatcher
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from config import AUDIO_SAMPLE_RATE
+from src.logger import get_logger
+
+logger = get_logger("keyword_spotter")
+
+
+# Small English model; runs next to the meeting transcriber
+KEYWORD_MODEL = os.getenv("READIN_KEYWORD_MODEL", "tiny.en")
+KEYWORD_CPU_THREADS = 2
+
+# Audio kept from the previous chunk so a phrase split across chunks is heard
+WINDOW_OVERLAP_SECONDS = 1.5
+
+# Energy gate: speech is this much louder than the tracked noise floor
+GATE_FRAME_SECONDS = 0.03
+GATE_SPEECH_RATIO = 3.0
+GATE_MIN_RMS = 0.005  # Same floor as the transcriber's silence check
+GATE_NOISE_ADAPT = 0.05
+MIN_SPEECH_SECONDS = 0.3
+
+# Confirmation thresholds (Whisper's own fallback uses -1.0 and 0.6)
+MIN_AVG_LOGPROB = -0.8
+MAX_NO_SPEECH_PROB = 0.6
+WAKE_MATCH_RATIO = 0.8
+COMMAND_MATCH_RATIO = 0.85
+# The command must start within this many words after the wake word
+MAX_COMMAND_OFFSET = 2
+
+WAKE_PROMPT = "Hey ReadIn"
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def is_keyword_spotting_available() -> bool:
+    """Whether the local recognizer (faster-whisper) is installed."""
+    return importlib.util.find_spec("faster_whisper") is not None
+
+
+def normalize(text: str) -> List[str]:
+    """Lowercase words without punctuation ("Hey, ReadIn!" -> [hey, readin])."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+class SpeechGate:
+    """Adaptive energy gate that skips chunks without speech.
+
+    The noise floor follows the quiet frames of the stream, so there is no
+    separate calibration step.
+    """
+
+    def __init__(self, sample_rate: int = AUDIO_SAMPLE_RATE):
+        self.frame_size = max(1, int(sample_rate * GATE_FRAME_SECONDS))
+        self.noise_floor = GATE_MIN_RMS / GATE_SPEECH_RATIO
+
+    def speech_seconds(self, audio: np.ndarray) -> float:
+        """Seconds of audio in the chunk loud enough to be speech."""
+        usable = len(audio) - len(audio) % self.frame_size
+        if usable <= 0:
+            return 0.0
+        frames = audio[:usable].reshape(-1, self.frame_size)
+        rms = np.sqrt(np.mean(frames ** 2, axis=1))
+
+        threshold = max(GATE_MIN_RMS, self.noise_floor * GATE_SPEECH_RATIO)
+        speech = rms > threshold
+        quiet = rms[~speech]
+        if quiet.size:
+            self.noise_floor += GATE_NOISE_ADAPT * (float(np.median(quiet)) - self.noise_floor)
+        return float(np.count_nonzero(speech)) * GATE_FRAME_SECONDS
+
+
+class PhraseMatcher:
+    """Matches decoded text against the wake words and command aliases."""
+
+    def __init__(
+        self,
+        wake_words: Callable[[], Sequence[str]],
+        commands: Callable[[], Dict[str, str]]
+    ):
+        """
+        Args:
+            wake_words: Current wake word phrases
+            commands: Current alias -> command name lookup
+        """
+        self._wake_words = wake_words
+        self._commands = commands
+
+    def find_wake_word(self, tokens: List[str]) -> Optional[int]:
+        """Index just past the first wake word in tokens, if any.
+
+        The greeting ("hey", "ok") must match exactly and the name fuzzily
+        ("reading", "redin", "read in"); a wake word without a greeting only
+        matches exactly, so everyday words do not wake it.
+        """
+        for start in range(len(tokens)):
+            best_end, best_ratio = None, 0.0
+            for wake in self._wake_words():
+                wake_tokens = normalize(wake)
+                if not wake_tokens:
+                    continue
+                if len(wake_tokens) == 1 or wake_tokens[0] != tokens[start]:
+                    if tokens[start:start + len(wake_tokens)] == wake_tokens:
+                        return start + len(wake_tokens)
+                    continue
+                name = "".join(wake_tokens[1:])
+                for length in range(1, len(wake_tokens) + 1):
+                    end = start + 1 + length
+                    if end > len(tokens):
+                        break
+                    ratio = SequenceMatcher(None, "".join(tokens[start + 1:end]), name).ratio()
+                    if ratio >= WAKE_MATCH_RATIO and ratio > best_ratio:
+                        best_end, best_ratio = end, ratio
+            if best_end is not None:
+                return best_end
+        return None
+
+    def match_command(self, tokens: List[str]) -> Optional[str]:
+        """Command whose alias starts within the first words of tokens."""
+        best: Optional[Tuple[int, float, str]] = None  # (alias length, ratio, command)
+        for alias, command in self._commands().items():
+            alias_tokens = normalize(alias)
+            if not alias_tokens:
+                continue
+            target = " ".join(alias_tokens)
+            for start in range(min(len(tokens), MAX_COMMAND_OFFSET + 1)):
+                candidate = " ".join(tokens[start:start + len(alias_tokens)])
+                if candidate == target:
+                    ratio = 1.0
+                elif len(target) >= 5:
+                    ratio = SequenceMatcher(None, candidate, target).ratio()
+                    if ratio < COMMAND_MATCH_RATIO:
+                        continue
+                else:
+                    continue
+                # Prefer the longest alias: "stop listening please" over "stop"
+                key = (len(alias_tokens), ratio, command)
+                if best is None or key[:2] > best[:2]:
+                    best = key
+        return best[2] if best else None
+
+
+class KeywordSpotter:
+    """Spots the wake word and commands in audio chunks, offline.
+
+    Feed it the capture stream with feed(); decoding runs on a worker
+    thread so the capture thread never waits on the model.
+    """
+
+    def __init__(
+        self,
+        wake_words: Callable[[], Sequence[str]],
+        commands: Callable[[], Dict[str, str]],
+        on_wake_word: Callable[[], None],
+        on_command: Callable[[str], None],
+        on_command_timeout: Optional[Callable[[], None]] = None,
+        on_error: Optional[Callable[[str], None]] = None,
+        model_name: str = KEYWORD_MODEL,
+        language: str = "en",
+        command_timeout: float = 5.0,
+        cooldown: float = 1.0,
+        model=None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            wake_words: Current wake word phrases
+            commands: Current alias -> command name lookup
+            on_wake_word: Called when a wake word alone is heard
+            on_command: Called with the command name once confirmed
+            on_command_timeout: Called when no command followed the wake word
+            on_error: Called if the model cannot be loaded
+            model_name: faster-whisper model used for spotting
+            language: Language of the wake word and commands
+            command_timeout: Seconds to wait for a command after the wake word
+            cooldown: Minimum seconds between wake word notifications
+            model: Preloaded WhisperModel (loaded on the worker if None)
+            clock: Monotonic clock (for tests)
+        """
+        self.matcher = PhraseMatcher(wake_words, commands)
+        self._commands = commands
+        self.on_wake_word = on_wake_word
+        self.on_command = on_command
+        self.on_command_timeout = on_command_timeout
+        self.on_error = on_error
+        self.model_name = model_name
+        self.language = language
+        self.command_timeout = command_timeout
+        self.cooldown = cooldown
+        self._model = model
+        self._clock = clock
+
+        self._gate = SpeechGate()
+        self._overlap_samples = int(AUDIO_SAMPLE_RATE * WINDOW_OVERLAP_SECONDS)
+        self._tail = np.zeros(0, dtype=np.float32)
+        self._awaiting_command_until: Optional[float] = None
+        self._last_wake = -math.inf
+
+        self._queue: queue.Queue = queue.Queue(maxsize=4)
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    # ==================== Lifecycle ====================
+
+    def start(self):
+        """Start the decoding worker."""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the worker; the model stays loaded for a restart."""
+        self._running = False
+        if self._thread:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        self._reset()
+
+    def unload(self):
+        """Free the spotting model."""
+        self._model = None
+
+    def feed(self, audio: np.ndarray):
+        """Queue a capture chunk; drops the oldest if decoding falls behind."""
+        if not self._running:
+            return
+        try:
+            self._queue.put_nowait(audio)
+        except queue.Full:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._queue.put_nowait(audio)
+            except queue.Full:
+                pass
+
+    def _run(self):
+        try:
+            self._load_model()
+        except Exception as e:
+            logger.error(f"Could not load keyword model {self.model_name}: {e}")
+            self._running = False
+            if self.on_error:
+                self.on_error(f"Could not load voice command model: {e}")
+            return
+
+        while self._running:
+            try:
+                audio = self._queue.get(timeout=0.5)
+            except queue.Empty:
+                self.check_timeout()
+                continue
+            try:
+                self.process(audio)
+            except Exception as e:
+                logger.error(f"Keyword spotting error: {e}")
+
+    def _load_model(self):
+        if self._model is None:
+            from faster_whisper import WhisperModel
+            started = time.perf_counter()
+            self._model = WhisperModel(
+                self.model_name,
+                device="cpu",
+                compute_type="int8",
+                cpu_threads=KEYWORD_CPU_THREADS,
+            )
+            logger.info(f"Keyword model {self.model_name} loaded in {time.perf_counter() - started:.1f}s")
+
+    def _reset(self):
+        self._tail = np.zeros(0, dtype=np.float32)
+        self._awaiting_command_until = None
+        while not self._queue.empty():
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+    # ==================== Spotting ====================
+
+    def process(self, audio: np.ndarray) -> Optional[str]:
+        """Spot keywords in one chunk.
+
+        Returns:
+            The confirmed command, if one was acted on
+        """
+        audio = audio.astype(np.float32, copy=False)
+        window = np.concatenate([self._tail, audio]) if self._tail.size else audio
+        self._tail = audio[-self._overlap_samples:]
+
+        if self._gate.speech_seconds(audio) < MIN_SPEECH_SECONDS:
+            self.check_timeout()
+            return None
+
+        text, avg_logprob, no_speech_prob = self.decode(window)
+        return self.interpret(text, avg_logprob, no_speech_prob)
+
+    def decode(self, audio: np.ndarray) -> Tuple[str, float, float]:
+        """Constrained Whisper pass over a window of speech.
+
+        Returns:
+            (text, mean avg_logprob, mean no_speech_prob)
+        """
+        self._load_model()
+        segments, _ = self._model.transcribe(
+            audio,
+            language=self.language,
+            beam_size=1,
+            best_of=1,
+            temperature=0.0,
+            without_timestamps=True,
+            condition_on_previous_text=False,
+            initial_prompt=self._prompt(),
+            vad_filter=True,
+        )
+        segments = list(segments)
+        if not segments:
+            return "", -math.inf, 1.0
+        text = " ".join(segment.text.strip() for segment in segments)
+        avg_logprob = sum(s.avg_logprob for s in segments) / len(segments)
+        no_speech_prob = sum(s.no_speech_prob for s in segments) / len(segments)
+        return text, avg_logprob, no_speech_prob
+
+    def _prompt(self) -> str:
+        """Wake word and command phrases that bias decoding to the grammar."""
+        examples = {}
+        for alias, command in self._commands().items():
+            examples.setdefault(command, alias)
+        return " ".join(f"{WAKE_PROMPT}, {alias}." for alias in examples.values())
+
+    def interpret(self, text: str, avg_logprob: float, no_speech_prob: float) -> Optional[str]:
+        """Match a decoded phrase; acts on it only if confirmed.
+
+        Returns:
+            The confirmed command, if one was acted on
+        """
+        if not text:
+            return None
+        if avg_logprob < MIN_AVG_LOGPROB or no_speech_prob > MAX_NO_SPEECH_PROB:
+            logger.debug(f"Ignoring low-confidence phrase {text!r} "
+                         f"(logprob {avg_logprob:.2f}, no speech {no_speech_prob:.2f})")
+            return None
+
+        now = self._clock()
+        tokens = normalize(text)
+        wake_end = self.matcher.find_wake_word(tokens)
+
+        if wake_end is not None:
+            command = self.matcher.match_command(tokens[wake_end:])
+            if command:
+                return self._confirm(command, text)
+            if self._awaiting_command_until is None and now - self._last_wake >= self.cooldown:
+                logger.info("Wake word detected")
+                self._last_wake = now
+                self.on_wake_word()
+            self._awaiting_command_until = now + self.command_timeout
+            return None
+
+        if self._awaiting_command_until is not None and now <= self._awaiting_command_until:
+            command = self.matcher.match_command(tokens)
+            if command:
+                return self._confirm(command, text)
+            logger.debug(f"Not a command: {text!r}")
+        self.check_timeout()
+        return None
+
+    def _confirm(self, command: str, text: str) -> str:
+        logger.info(f"Voice command confirmed: {command} ({text!r})")
+        self._awaiting_command_until = None
+        # The overlap would hear the same words again in the next window
+        self._tail = np.zeros(0, dtype=np.float32)
+        self.on_command(command)
+        return command
+
+    def check_timeout(self):
+        """End the wait for a command once it has timed out."""
+        if self._awaiting_command_until is not None and self._clock() > self._awaiting_command_until:
+            self._awaiting_command_until = None
+            logger.debug("No command after wake word")
+            if self.on_command_timeout:
+                self.on_command_timeout()
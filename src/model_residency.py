@@ -0,0 +1,342 @@
+"""Keeps the meeting models loaded and warm, within a RAM budget.
+
+Whisper, the pyannote diarization pipeline and the Claude API connection
+used to be set up on first use: the first question of every meeting paid
+for model loading, first-inference setup and a TLS handshake. The
+residency manager loads and warms them in the background (at startup or
+when a meeting is detected), unloads the least recently used ones to stay
+within the RAM budget, and unloads them after a stretch of idleness
+outside meetings. It also times meeting start to first answer.
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from src.logger import get_logger
+
+logger = get_logger("model_residency")
+
+
+# Memory the resident models may use together, and idle time before unloading
+MODEL_RAM_BUDGET_MB = int(os.getenv("READIN_MODEL_RAM_BUDGET_MB", "2048"))
+MODEL_IDLE_UNLOAD_SECONDS = float(os.getenv("READIN_MODEL_IDLE_UNLOAD_SECONDS", "600"))
+SWEEP_INTERVAL_SECONDS = 30.0
+
+# Resident size estimates (MB) until a load has been measured
+WHISPER_SIZE_MB = {
+    "tiny": 150, "base": 250, "small": 600, "medium": 1500,
+    "large": 3200, "distil": 900, "turbo": 1700,
+}
+DIARIZATION_SIZE_MB = 900
+
+
+def estimate_whisper_mb(model_name: str) -> float:
+    """Estimated resident size of a faster-whisper model."""
+    name = model_name.lower()
+    for key, size in WHISPER_SIZE_MB.items():
+        if key in name:
+            return size
+    return WHISPER_SIZE_MB["small"]
+
+
+def _rss_mb() -> Optional[float]:
+    """Resident memory of this process in MB, if psutil is available."""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    except Exception:
+        return None
+
+
+@dataclass
+class ResidentModel:
+    """A model (or connection) the manager keeps loaded."""
+    name: str
+    load: Callable[[], bool]
+    unload: Callable[[], None]
+    is_loaded: Callable[[], bool]
+    warm: Optional[Callable[[], None]] = None
+    enabled: Callable[[], bool] = lambda: True
+    size_mb: float = 0.0  # Estimate, replaced by the measured size after a load
+    last_used: float = 0.0
+    load_seconds: Optional[float] = None
+    warm_seconds: Optional[float] = None
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+
+class ModelResidencyManager:
+    """Preloads, warms and unloads models within a RAM budget."""
+
+    def __init__(
+        self,
+        ram_budget_mb: float = MODEL_RAM_BUDGET_MB,
+        idle_unload_seconds: float = MODEL_IDLE_UNLOAD_SECONDS,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """Initialize the manager.
+
+        Args:
+            ram_budget_mb: Memory all resident models may use together
+            idle_unload_seconds: Idle time outside meetings before unloading
+            clock: Monotonic clock (for tests)
+        """
+        self.ram_budget_mb = ram_budget_mb
+        self.idle_unload_seconds = idle_unload_seconds
+        self._clock = clock
+        self._models: Dict[str, ResidentModel] = {}
+        self._lock = threading.Lock()
+        self._active = False
+        self._preload_thread: Optional[threading.Thread] = None
+        self._sweeper: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+        # Meeting start to first answer
+        self._meeting_started_at: Optional[float] = None
+        self._question_at: Optional[float] = None
+        self._warm_at_start: Dict[str, bool] = {}
+        self._awaiting_first_answer = False
+        self.last_metrics: Dict[str, object] = {}
+
+    def register(
+        self,
+        name: str,
+        load: Callable[[], bool],
+        unload: Callable[[], None],
+        is_loaded: Callable[[], bool],
+        warm: Optional[Callable[[], None]] = None,
+        size_mb: float = 0.0,
+        enabled: Optional[Callable[[], bool]] = None
+    ):
+        """Register a model. Models preload in registration order.
+
+        Args:
+            name: Model name for logs and metrics
+            load: Loads the model; returns True on success
+            unload: Frees the model
+            is_loaded: Whether the model is currently loaded
+            warm: Optional dummy inference or connection pre-open
+            size_mb: Estimated resident size (0 for negligible)
+            enabled: Optional check; disabled models are never preloaded
+        """
+        with self._lock:
+            self._models[name] = ResidentModel(
+                name=name, load=load, unload=unload, is_loaded=is_loaded,
+                warm=warm, size_mb=size_mb, enabled=enabled or (lambda: True),
+            )
+
+    def set_limits(self, ram_budget_mb: Optional[float] = None, idle_unload_seconds: Optional[float] = None):
+        """Change the RAM budget or idle timeout."""
+        if ram_budget_mb is not None:
+            self.ram_budget_mb = ram_budget_mb
+        if idle_unload_seconds is not None:
+            self.idle_unload_seconds = idle_unload_seconds
+
+    # ==================== Loading ====================
+
+    def preload(self, reason: str = "") -> None:
+        """Load and warm all enabled models in a background thread."""
+        with self._lock:
+            if self._preload_thread and self._preload_thread.is_alive():
+                return
+            self._preload_thread = threading.Thread(
+                target=self._preload_all, args=(reason,), daemon=True
+            )
+            self._preload_thread.start()
+
+    def _preload_all(self, reason: str):
+        began = self._clock()
+        for name in list(self._models):
+            if self._stop_event.is_set():
+                return
+            self.ensure_loaded(name)
+        logger.info(f"Models ready ({reason or 'preload'}) in {self._clock() - began:.1f}s")
+
+    def ensure_loaded(self, name: str, warm: bool = True) -> bool:
+        """Load (and warm) a model now if it is not loaded yet.
+
+        Returns:
+            True if the model is loaded
+        """
+        model = self._models.get(name)
+        if model is None or not model.enabled():
+            return False
+
+        with model.lock:
+            if model.is_loaded():
+                model.last_used = self._clock()
+                return True
+            if not self._make_room(model):
+                logger.info(f"Not preloading {name}: {model.size_mb:.0f}MB does not fit the "
+                            f"{self.ram_budget_mb:.0f}MB model budget")
+                return False
+
+            rss_before = _rss_mb()
+            started = self._clock()
+            try:
+                loaded = model.load()
+            except Exception as e:
+                logger.warning(f"Failed to load {name}: {e}")
+                loaded = False
+            model.load_seconds = self._clock() - started
+            if not loaded:
+                return False
+
+            rss_after = _rss_mb()
+            if rss_before is not None and rss_after is not None and rss_after > rss_before:
+                model.size_mb = rss_after - rss_before
+
+            if warm and model.warm:
+                started = self._clock()
+                try:
+                    model.warm()
+                except Exception as e:
+                    logger.debug(f"Warm-up of {name} failed: {e}")
+                model.warm_seconds = self._clock() - started
+
+            model.last_used = self._clock()
+            logger.info(
+                f"Loaded {name} in {model.load_seconds:.1f}s"
+                + (f", warmed in {model.warm_seconds:.1f}s" if model.warm_seconds is not None else "")
+                + (f", ~{model.size_mb:.0f}MB" if model.size_mb else "")
+            )
+            return True
+
+    def _make_room(self, model: ResidentModel) -> bool:
+        """Unload least recently used models until this one fits the budget."""
+        if model.size_mb <= 0:
+            return True
+
+        others = [m for m in self._models.values() if m is not model and m.is_loaded()]
+        used = sum(m.size_mb for m in others)
+        if used + model.size_mb <= self.ram_budget_mb:
+            return True
+        if self._active:
+            # Everything loaded is in use by the meeting
+            return False
+
+        for victim in sorted(others, key=lambda m: m.last_used):
+            if victim.size_mb <= 0:
+                continue
+            self._unload(victim, "to stay within the model budget")
+            used -= victim.size_mb
+            if used + model.size_mb <= self.ram_budget_mb:
+                return True
+        return used + model.size_mb <= self.ram_budget_mb
+
+    def _unload(self, model: ResidentModel, why: str):
+        try:
+            model.unload()
+            logger.info(f"Unloaded {model.name} {why}")
+        except Exception as e:
+            logger.warning(f"Failed to unload {model.name}: {e}")
+
+    # ==================== Residency ====================
+
+    def touch(self, name: str):
+        """Mark a model as just used."""
+        model = self._models.get(name)
+        if model:
+            model.last_used = self._clock()
+
+    def set_active(self, active: bool):
+        """Meetings keep every model resident; idle time counts from the end."""
+        self._active = active
+        now = self._clock()
+        for model in self._models.values():
+            if model.is_loaded():
+                model.last_used = now
+
+    def sweep(self) -> List[str]:
+        """Unload models idle for longer than the timeout (outside meetings)."""
+        if self._active:
+            return []
+        unloaded = []
+        now = self._clock()
+        for model in list(self._models.values()):
+            if model.is_loaded() and now - model.last_used >= self.idle_unload_seconds:
+                with model.lock:
+                    if model.is_loaded() and not self._active:
+                        self._unload(model, f"after {self.idle_unload_seconds / 60:.0f} idle minutes")
+                        unloaded.append(model.name)
+        return unloaded
+
+    def start(self):
+        """Start the background idle sweeper."""
+        if self._sweeper and self._sweeper.is_alive():
+            return
+        self._stop_event.clear()
+        self._sweeper = threading.Thread(target=self._sweep_loop, daemon=True)
+        self._sweeper.start()
+
+    def _sweep_loop(self):
+        while not self._stop_event.wait(SWEEP_INTERVAL_SECONDS):
+            try:
+                self.sweep()
+            except Exception as e:
+                logger.error(f"Model sweep error: {e}")
+
+    def stop(self):
+        """Stop background work (models stay loaded)."""
+        self._stop_event.set()
+        if self._sweeper:
+            self._sweeper.join(timeout=2.0)
+            self._sweeper = None
+
+    def status(self) -> Dict[str, Dict[str, object]]:
+        """Load state, size and timings of every model."""
+        return {
+            name: {
+                "loaded": model.is_loaded(),
+                "size_mb": round(model.size_mb),
+                "load_seconds": model.load_seconds,
+                "warm_seconds": model.warm_seconds,
+            }
+            for name, model in self._models.items()
+        }
+
+    # ==================== Time to first answer ====================
+
+    def meeting_started(self):
+        """Start timing a meeting's first answer."""
+        self._meeting_started_at = self._clock()
+        self._question_at = None
+        self._awaiting_first_answer = True
+        self._warm_at_start = {
+            name: model.is_loaded() for name, model in self._models.items() if model.enabled()
+        }
+
+    def question_asked(self):
+        """A turn was sent for answering."""
+        if self._awaiting_first_answer and self._question_at is None:
+            self._question_at = self._clock()
+
+    def answer_started(self) -> Optional[Dict[str, object]]:
+        """The first text of an answer arrived; records the meeting's first.
+
+        Returns:
+            The metrics for the meeting's first answer, else None
+        """
+        if not self._awaiting_first_answer:
+            return None
+        self._awaiting_first_answer = False
+
+        now = self._clock()
+        metrics: Dict[str, object] = {
+            "meeting_to_first_answer": now - self._meeting_started_at,
+            "question_to_first_answer": now - self._question_at if self._question_at else None,
+            "warm_at_start": dict(self._warm_at_start),
+        }
+        self.last_metrics = metrics
+        question_part = (
+            f", {metrics['question_to_first_answer']:.2f}s after the question"
+            if metrics["question_to_first_answer"] is not None else ""
+        )
+        cold = [name for name, warm in self._warm_at_start.items() if not warm]
+        logger.info(
+            f"First answer {metrics['meeting_to_first_answer']:.1f}s after meeting start"
+            f"{question_part} (cold at start: {', '.join(cold) or 'none'})"
+        )
+        return metrics
@@ -1,13 +1,27 @@
-"""Process monitor for detecting Teams/Zoom launches."""
+"""Process monitor for detecting Teams/Zoom launches.
 
+Instead of walking the whole process table every few seconds, the monitor keeps
+an incremental view of running PIDs and only inspects processes that are new
+since the previous scan. On Linux it subscribes to the netlink proc connector
+when the process has the privileges to do so, which turns detection into a
+blocking wait on exec/exit events; otherwise it lists /proc (or psutil.pids()
+elsewhere) and diffs the PID set.
+"""
+
+import errno
 import logging
+import os
+import select
+import socket
+import struct
+import sys
 import threading
 import time
-from typing import Callable, Optional, List, Set
+from typing import Callable, Dict, Iterable, Optional, List, Set, Tuple
 
 import psutil
 
-from config import MONITORED_PROCESSES, PROCESS_CHECK_INTERVAL
+from config import MONITORED_PROCESSES, PROCESS_CHECK_INTERVAL, PROCESS_RESYNC_INTERVAL
 from settings_manager import settings
 
 logger = logging.getLogger(__name__)
@@ -122,145 +136,431 @@ PROCESS_TO_APP = {
 }
 
 
+# Exact-match lookup set, built once instead of scanning a list per process
+MONITORED_PROCESS_SET = frozenset(MONITORED_PROCESSES)
+
+IS_LINUX = sys.platform.startswith("linux")
+
+# /proc/<pid>/comm is truncated to TASK_COMM_LEN - 1 characters
+_COMM_MAX_LEN = 15
+
+
+def _list_pids() -> Set[int]:
+    """Return the set of currently running PIDs."""
+    if IS_LINUX:
+        try:
+            return {int(entry.name) for entry in os.scandir("/proc") if entry.name.isdigit()}
+        except OSError:
+            pass
+    return set(psutil.pids())
+
+
+def _process_name(pid: int) -> Optional[str]:
+    """Return the executable name for a PID, or None if it cannot be read."""
+    if IS_LINUX:
+        try:
+            with open(f"/proc/{pid}/comm", "rb") as f:
+                name = f.read().decode("utf-8", "replace").rstrip("\n")
+            if len(name) < _COMM_MAX_LEN:
+                return name
+            # Possibly truncated - let psutil resolve the full name from cmdline
+        except OSError:
+            return None
+    try:
+        return psutil.Process(pid).name()
+    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess, OSError):
+        return None
+
+
+class PrivacyFilter:
+    """Caches Privacy Mode decisions per process name.
+
+    Decisions are invalidated through settings callbacks rather than re-reading
+    the excluded apps list for every process on every scan.
+    """
+
+    WATCHED_KEYS = ("privacy_mode_enabled", "excluded_apps")
+
+    def __init__(self, on_invalidated: Optional[Callable[[], None]] = None):
+        self._lock = threading.Lock()
+        self._decisions: Dict[Tuple[str, str], bool] = {}
+        self._on_invalidated = on_invalidated
+        for key in self.WATCHED_KEYS:
+            settings.on_change(key, self._invalidate)
+
+    def _invalidate(self, key, new_value, old_value):
+        with self._lock:
+            self._decisions.clear()
+        if self._on_invalidated:
+            self._on_invalidated()
+
+    def close(self):
+        """Unregister settings callbacks."""
+        for key in self.WATCHED_KEYS:
+            settings.remove_callback(key, self._invalidate)
+
+    def is_allowed(self, app_name: str, proc_name: str) -> bool:
+        """Check whether an app may be monitored under the current Privacy Mode settings."""
+        cache_key = (app_name, proc_name)
+        with self._lock:
+            decision = self._decisions.get(cache_key)
+        if decision is None:
+            decision = not self._should_skip(app_name, proc_name)
+            with self._lock:
+                self._decisions[cache_key] = decision
+        return decision
+
+    @staticmethod
+    def _should_skip(app_name: str, proc_name: str) -> bool:
+        if not settings.get('privacy_mode_enabled', True):
+            return False
+
+        # Use privacy handler for centralized privacy mode checking if available
+        try:
+            from privacy_mode import get_privacy_handler
+            privacy_handler = get_privacy_handler()
+        except ImportError:
+            privacy_handler = None
+
+        if privacy_handler:
+            if privacy_handler.should_skip_app(app_name, proc_name):
+                logger.debug(f"Privacy Mode: Skipping {app_name} (excluded)")
+                return True
+            return False
+
+        # Fallback to direct settings check
+        excluded_apps_lower = {app.lower() for app in settings.get('excluded_apps', [])}
+        return proc_name.lower() in excluded_apps_lower or app_name.lower() in excluded_apps_lower
+
+
+class ProcessTable:
+    """Incremental view of running meeting processes.
+
+    Only PIDs that were not present in the previous scan have their name read;
+    PIDs that disappear are dropped. A periodic resync rebuilds the view from
+    scratch to recover from PID reuse or missed connector events.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._known_pids: Set[int] = set()
+        self._meeting_pids: Dict[int, str] = {}
+        self.inspected_count = 0
+
+    def resync(self):
+        """Rebuild the table from a full process listing."""
+        with self._lock:
+            self._known_pids.clear()
+            self._meeting_pids.clear()
+        self.scan()
+
+    def scan(self):
+        """Diff the current PID set against the known one and inspect new PIDs."""
+        pids = _list_pids()
+        with self._lock:
+            new_pids = pids - self._known_pids
+            gone_pids = self._known_pids - pids
+        self.apply(new_pids, gone_pids)
+        with self._lock:
+            self._known_pids = pids
+
+    def apply(self, new_pids: Iterable[int], gone_pids: Iterable[int]):
+        """Apply started and exited PIDs (from a scan diff or connector events)."""
+        matches = {}
+        for pid in new_pids:
+            proc_name = _process_name(pid)
+            self.inspected_count += 1
+            if proc_name and proc_name in MONITORED_PROCESS_SET:
+                matches[pid] = proc_name
+
+        with self._lock:
+            for pid in gone_pids:
+                self._known_pids.discard(pid)
+                self._meeting_pids.pop(pid, None)
+            for pid in new_pids:
+                self._known_pids.add(pid)
+                # An exec replaces the image of an existing PID
+                if pid not in matches:
+                    self._meeting_pids.pop(pid, None)
+            self._meeting_pids.update(matches)
+
+    def meeting_processes(self) -> List[str]:
+        """Return the process names of tracked meeting processes."""
+        with self._lock:
+            return list(set(self._meeting_pids.values()))
+
+
+class ProcConnector:
+    """Linux netlink proc connector subscription for exec/exit events.
+
+    Joining the proc connector multicast group requires CAP_NET_ADMIN, so
+    `open()` returns False for unprivileged processes and the monitor falls
+    back to /proc polling.
+    """
+
+    NETLINK_CONNECTOR = 11
+    CN_IDX_PROC = 1
+    CN_VAL_PROC = 1
+    NLMSG_DONE = 3
+    PROC_CN_MCAST_LISTEN = 1
+    PROC_CN_MCAST_IGNORE = 2
+    PROC_EVENT_EXEC = 0x00000002
+    PROC_EVENT_EXIT = 0x80000000
+
+    _NLMSGHDR = struct.Struct("=IHHII")
+    _CN_MSG = struct.Struct("=IIIIHH")
+    _PROC_EVENT = struct.Struct("=IIQ")
+    _PID_TGID = struct.Struct("=II")
+
+    def __init__(self):
+        self._sock: Optional[socket.socket] = None
+
+    def open(self) -> bool:
+        """Subscribe to process events. Returns False if the connector is unavailable."""
+        if not IS_LINUX or not hasattr(socket, "AF_NETLINK"):
+            return False
+        try:
+            sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, self.NETLINK_CONNECTOR)
+        except OSError as e:
+            logger.debug(f"Proc connector unavailable: {e}")
+            return False
+        try:
+            sock.bind((0, self.CN_IDX_PROC))
+            sock.send(self._control_message(self.PROC_CN_MCAST_LISTEN))
+        except OSError as e:
+            logger.debug(f"Proc connector unavailable: {e}")
+            sock.close()
+            return False
+        self._sock = sock
+        return True
+
+    def _control_message(self, op: int) -> bytes:
+        payload = struct.pack("=I", op)
+        cn_msg = self._CN_MSG.pack(self.CN_IDX_PROC, self.CN_VAL_PROC, 0, 0, len(payload), 0) + payload
+        header = self._NLMSGHDR.pack(self._NLMSGHDR.size + len(cn_msg), self.NLMSG_DONE, 0, 0, os.getpid())
+        return header + cn_msg
+
+    def fileno(self) -> int:
+        return self._sock.fileno()
+
+    def read_events(self) -> Tuple[Set[int], Set[int]]:
+        """Drain pending events and return (exec'd PIDs, exited PIDs).
+
+        Raises:
+            OSError: If the socket overflowed (ENOBUFS) and events were lost.
+        """
+        started: Set[int] = set()
+        exited: Set[int] = set()
+        while True:
+            try:
+                data = self._sock.recv(65536, socket.MSG_DONTWAIT)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset + self._NLMSGHDR.size <= len(data):
+                msg_len = self._NLMSGHDR.unpack_from(data, offset)[0]
+                if msg_len < self._NLMSGHDR.size:
+                    break
+                event_offset = offset + self._NLMSGHDR.size + self._CN_MSG.size
+                if event_offset + self._PROC_EVENT.size + self._PID_TGID.size <= len(data):
+                    what = self._PROC_EVENT.unpack_from(data, event_offset)[0]
+                    pid, tgid = self._PID_TGID.unpack_from(data, event_offset + self._PROC_EVENT.size)
+                    # Only thread group leaders correspond to processes
+                    if pid == tgid:
+                        if what == self.PROC_EVENT_EXEC:
+                            started.add(tgid)
+                            exited.discard(tgid)
+                        elif what == self.PROC_EVENT_EXIT:
+                            exited.add(tgid)
+                            started.discard(tgid)
+                offset += (msg_len + 3) & ~3
+        return started, exited
+
+    def close(self):
+        """Unsubscribe and close the socket."""
+        if self._sock is None:
+            return
+        try:
+            self._sock.send(self._control_message(self.PROC_CN_MCAST_IGNORE))
+        except OSError:
+            pass
+        self._sock.close()
+        self._sock = None
+
+
 class ProcessMonitor(threading.Thread):
     """Monitors for Teams/Zoom process launches and notifies via callback."""
 
     def __init__(self, on_meeting_detected: Callable[[str], None],
                  on_meeting_ended: Callable[[], None],
-                 on_multiple_detected: Callable[[List[str]], None] = None):
+                 on_multiple_detected: Callable[[List[str]], None] = None,
+                 use_proc_connector: bool = True):
         super().__init__(daemon=True)
         self.on_meeting_detected = on_meeting_detected
         self.on_meeting_ended = on_meeting_ended
         self.on_multiple_detected = on_multiple_detected
         self._running = False
+        self._stop_event = threading.Event()
         self._active_meeting_process: Optional[str] = None
         self._detected_apps: Set[str] = set()
+        self._waiting_for_selection = False
+        self._use_proc_connector = use_proc_connector
+        self._table = ProcessTable()
+        self._privacy_filter = PrivacyFilter(on_invalidated=self._wake)
+        # Self-pipe so stop() and settings changes interrupt a blocking select()
+        # (only created when the proc connector is in use)
+        self._wake_lock = threading.Lock()
+        self._wake_r: Optional[int] = None
+        self._wake_w: Optional[int] = None
+        self.wakeups = 0
+
+    def _wake(self):
+        """Interrupt a blocking connector wait so the loop re-evaluates immediately."""
+        with self._wake_lock:
+            if self._wake_w is None:
+                return
+            try:
+                os.write(self._wake_w, b"\0")
+            except OSError:
+                pass  # Pipe full - a wake-up is already pending
+
+    def _drain_wake_pipe(self):
+        try:
+            while os.read(self._wake_r, 512):
+                pass
+        except OSError:
+            pass
 
     def _find_all_meeting_processes(self) -> List[str]:
-        """Find all running meeting processes and return unique app names.
+        """Return unique app names of tracked meeting processes.
 
-        Respects Privacy Mode settings by filtering out excluded apps.
-        Uses the privacy_mode handler for centralized privacy management.
+        Respects Privacy Mode settings by filtering out excluded apps. Filtering
+        happens here rather than during scanning, so settings changes take
+        effect without rescanning the process table.
         """
         found_apps = set()
-
-        # Get privacy handler for centralized privacy mode checking
-        try:
-            from privacy_mode import get_privacy_handler
-            privacy_handler = get_privacy_handler()
-        except ImportError:
-            privacy_handler = None
-
-        # Fallback: Get excluded apps list from settings
-        excluded_apps = settings.get('excluded_apps', [])
-        excluded_apps_lower = [app.lower() for app in excluded_apps]
-        privacy_mode_enabled = settings.get('privacy_mode_enabled', True)
-
-        for proc in psutil.process_iter(['name']):
-            try:
-                proc_name = proc.info['name']
-                if proc_name and proc_name in MONITORED_PROCESSES:
-                    # Get friendly app name
-                    app_name = PROCESS_TO_APP.get(proc_name, proc_name)
-
-                    # Privacy Mode: Skip excluded apps
-                    if privacy_mode_enabled:
-                        # Use privacy handler if available
-                        if privacy_handler:
-                            if privacy_handler.should_skip_app(app_name, proc_name):
-                                logger.debug(f"Privacy Mode: Skipping {app_name} (excluded)")
-                                continue
-                        else:
-                            # Fallback to direct settings check
-                            if (proc_name.lower() in excluded_apps_lower or
-                                app_name.lower() in excluded_apps_lower):
-                                continue  # Skip monitoring this app
-
-                    found_apps.add(app_name)
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
+        for proc_name in self._table.meeting_processes():
+            # Get friendly app name
+            app_name = PROCESS_TO_APP.get(proc_name, proc_name)
+            if self._privacy_filter.is_allowed(app_name, proc_name):
+                found_apps.add(app_name)
         return list(found_apps)
 
-    def _find_meeting_process(self) -> Optional[str]:
-        """Check if any monitored process is running (returns first found).
-
-        Respects Privacy Mode settings by filtering out excluded apps.
-        Uses the privacy_mode handler for centralized privacy management.
-        """
-        # Get privacy handler for centralized privacy mode checking
+    def _evaluate(self):
+        """Compare running meeting apps with the current state and fire callbacks."""
+        running_apps = self._find_all_meeting_processes()
+
+        if running_apps and not self._active_meeting_process and not self._waiting_for_selection:
+            # Meeting app(s) detected
+            self._detected_apps = set(running_apps)
+
+            if len(running_apps) == 1:
+                # Only one app - use it directly
+                self._active_meeting_process = running_apps[0]
+                self.on_meeting_detected(running_apps[0])
+            elif self.on_multiple_detected:
+                # Multiple apps - let user choose (only trigger once)
+                self._waiting_for_selection = True
+                self.on_multiple_detected(running_apps)
+            else:
+                # No preference - just notify with all apps listed
+                apps_str = " & ".join(sorted(running_apps))
+                self._active_meeting_process = apps_str
+                self.on_meeting_detected(apps_str)
+
+        elif not running_apps and self._active_meeting_process:
+            # All meeting apps closed
+            self._active_meeting_process = None
+            self._detected_apps = set()
+            self._waiting_for_selection = False
+            self.on_meeting_ended()
+
+    def _run_with_connector(self, connector: ProcConnector):
+        """Block on proc connector events, resyncing periodically as a safety net."""
+        wake_r, wake_w = os.pipe()
+        os.set_blocking(wake_r, False)
+        os.set_blocking(wake_w, False)
+        with self._wake_lock:
+            self._wake_r, self._wake_w = wake_r, wake_w
         try:
-            from privacy_mode import get_privacy_handler
-            privacy_handler = get_privacy_handler()
-        except ImportError:
-            privacy_handler = None
+            self._connector_loop(connector)
+        finally:
+            with self._wake_lock:
+                self._wake_r = self._wake_w = None
+            os.close(wake_r)
+            os.close(wake_w)
+
+    def _connector_loop(self, connector: ProcConnector):
+        last_resync = time.monotonic()
+        while self._running:
+            readable, _, _ = select.select([connector, self._wake_r], [], [], PROCESS_RESYNC_INTERVAL)
+            if not self._running:
+                break
+            self.wakeups += 1
+
+            if self._wake_r in readable:
+                self._drain_wake_pipe()
+
+            if connector in readable:
+                try:
+                    started, exited = connector.read_events()
+                except OSError as e:
+                    if e.errno != errno.ENOBUFS:
+                        raise
+                    logger.debug("Proc connector overflowed, resyncing process table")
+                    self._table.resync()
+                    last_resync = time.monotonic()
+                else:
+                    self._table.apply(started, exited)
+            elif time.monotonic() - last_resync >= PROCESS_RESYNC_INTERVAL:
+                self._table.resync()
+                last_resync = time.monotonic()
 
-        # Fallback: Get excluded apps list from settings
-        excluded_apps = settings.get('excluded_apps', [])
-        excluded_apps_lower = [app.lower() for app in excluded_apps]
-        privacy_mode_enabled = settings.get('privacy_mode_enabled', True)
+            self._evaluate()
 
-        for proc in psutil.process_iter(['name']):
-            try:
-                proc_name = proc.info['name']
-                if proc_name and proc_name in MONITORED_PROCESSES:
-                    # Privacy Mode: Skip excluded apps
-                    if privacy_mode_enabled:
-                        app_name = PROCESS_TO_APP.get(proc_name, proc_name)
-                        # Use privacy handler if available
-                        if privacy_handler:
-                            if privacy_handler.should_skip_app(app_name, proc_name):
-                                logger.debug(f"Privacy Mode: Skipping {app_name} (excluded)")
-                                continue
-                        else:
-                            # Fallback to direct settings check
-                            if (proc_name.lower() in excluded_apps_lower or
-                                app_name.lower() in excluded_apps_lower):
-                                continue  # Skip monitoring this app
-
-                    return proc_name
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
-        return None
+    def _run_polling(self):
+        """Diff the PID set every PROCESS_CHECK_INTERVAL, resyncing periodically."""
+        last_resync = time.monotonic()
+        while self._running:
+            if time.monotonic() - last_resync >= PROCESS_RESYNC_INTERVAL:
+                self._table.resync()
+                last_resync = time.monotonic()
+            else:
+                self._table.scan()
+            self._evaluate()
+
+            self._stop_event.wait(PROCESS_CHECK_INTERVAL)
+            self.wakeups += 1
 
     def run(self):
         """Main monitoring loop."""
         self._running = True
         self._waiting_for_selection = False
 
-        while self._running:
-            # Find all running meeting apps
-            running_apps = self._find_all_meeting_processes()
-
-            if running_apps and not self._active_meeting_process and not self._waiting_for_selection:
-                # Meeting app(s) detected
-                self._detected_apps = set(running_apps)
-
-                if len(running_apps) == 1:
-                    # Only one app - use it directly
-                    self._active_meeting_process = running_apps[0]
-                    self.on_meeting_detected(running_apps[0])
-                elif self.on_multiple_detected:
-                    # Multiple apps - let user choose (only trigger once)
-                    self._waiting_for_selection = True
-                    self.on_multiple_detected(running_apps)
-                else:
-                    # No preference - just notify with all apps listed
-                    apps_str = " & ".join(sorted(running_apps))
-                    self._active_meeting_process = apps_str
-                    self.on_meeting_detected(apps_str)
+        # Subscribe before the initial scan so no process start falls in between
+        connector = ProcConnector() if self._use_proc_connector else None
+        if connector and not connector.open():
+            connector = None
 
-            elif not running_apps and self._active_meeting_process:
-                # All meeting apps closed
-                self._active_meeting_process = None
-                self._detected_apps = set()
-                self._waiting_for_selection = False
-                self.on_meeting_ended()
+        self._table.resync()
+        self._evaluate()
 
-            time.sleep(PROCESS_CHECK_INTERVAL)
+        try:
+            if connector:
+                logger.info("Process monitor using netlink proc connector")
+                self._run_with_connector(connector)
+            else:
+                self._run_polling()
+        finally:
+            if connector:
+                connector.close()
+            self._privacy_filter.close()
 
     def stop(self):
         """Stop the monitoring loop."""
         self._running = False
+        self._stop_event.set()
+        self._wake()
 
     def set_active_process(self, app_name: str):
         """Manually set the active meeting process (used when user selects from multiple)."""
@@ -269,6 +569,8 @@ class ProcessMonitor(threading.Thread):
 
     def get_running_apps(self) -> List[str]:
         """Get list of all currently running meeting apps."""
+        if not self._running:
+            self._table.scan()
         return self._find_all_meeting_processes()
 
     def is_meeting_active(self) -> bool:
@@ -278,3 +580,51 @@ class ProcessMonitor(threading.Thread):
     def get_active_process(self) -> Optional[str]:
         """Get the name of the currently active meeting process."""
         return self._active_meeting_process
+
+
+def _legacy_full_scan() -> List[str]:
+    """Full process-table walk as done before incremental tracking (benchmark baseline)."""
+    monitored = list(MONITORED_PROCESSES)
+    found = set()
+    for proc in psutil.process_iter(['name']):
+        try:
+            proc_name = proc.info['name']
+            if proc_name and proc_name in monitored:
+                found.add(PROCESS_TO_APP.get(proc_name, proc_name))
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return list(found)
+
+
+if __name__ == "__main__":
+    # Benchmark: CPU cost per check of a full process walk vs incremental tracking
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    start = time.process_time()
+    for _ in range(iterations):
+        _legacy_full_scan()
+    legacy_cpu = time.process_time() - start
+
+    table = ProcessTable()
+    table.resync()
+    table.inspected_count = 0
+    start = time.process_time()
+    for _ in range(iterations):
+        table.scan()
+    incremental_cpu = time.process_time() - start
+
+    print(f"Processes running:       {len(_list_pids())}")
+    print(f"Full scan:               {legacy_cpu / iterations * 1000:.3f} ms CPU/check")
+    print(f"Incremental scan:        {incremental_cpu / iterations * 1000:.3f} ms CPU/check "
+          f"({table.inspected_count} processes inspected over {iterations} checks)")
+    if incremental_cpu > 0:
+        print(f"Speedup:                 {legacy_cpu / incremental_cpu:.1f}x")
+
+    connector = ProcConnector()
+    if connector.open():
+        print("Proc connector:          available (event-driven, no polling wake-ups when idle)")
+        connector.close()
+    else:
+        print(f"Proc connector:          unavailable, polling every {PROCESS_CHECK_INTERVAL}s "
+              f"with a full resync every {PROCESS_RESYNC_INTERVAL}s")
@@ -11,34 +11,48 @@ Provides clean abstractions for:
 - Real-time translation
 """
 
-from .meeting_service import MeetingService
-from .audio_service import AudioService
-from .transcription_service import TranscriptionService
-from .ai_service import AIService
-from .sync_service import SyncService
-from .translation_service import TranslationService, TranslationResult, SUPPORTED_LANGUAGES
-from .speaker_diarization import (
-    SpeakerDiarizer,
-    SpeakerSegment,
-    DiarizationResult,
-    DiarizedTranscriber,
-)
-from .offline_storage import (
-    OfflineStorage,
-    SyncStatus,
-    EntityType,
-    OfflineItem,
-    PendingSync,
-    get_offline_storage,
-)
-from .sync_manager import (
-    SyncManager,
-    ConnectivityStatus,
-    ConflictResolution,
-    SyncResult,
-    SyncProgress,
-    get_sync_manager,
-)
+import importlib
+
+# Exports are imported on first access: importing one service (e.g. the
+# translation service at startup) must not load all the others and their
+# dependencies.
+_EXPORTS = {
+    "MeetingService": ".meeting_service",
+    "AudioService": ".audio_service",
+    "TranscriptionService": ".transcription_service",
+    "AIService": ".ai_service",
+    "SyncService": ".sync_service",
+    "TranslationService": ".translation_service",
+    "TranslationResult": ".translation_service",
+    "SUPPORTED_LANGUAGES": ".translation_service",
+    "SpeakerDiarizer": ".speaker_diarization",
+    "SpeakerSegment": ".speaker_diarization",
+    "DiarizationResult": ".speaker_diarization",
+    "DiarizedTranscriber": ".speaker_diarization",
+    "OfflineStorage": ".offline_storage",
+    "SyncStatus": ".offline_storage",
+    "EntityType": ".offline_storage",
+    "OfflineItem": ".offline_storage",
+    "PendingSync": ".offline_storage",
+    "get_offline_storage": ".offline_storage",
+    "SearchResult": ".local_search",
+    "SyncManager": ".sync_manager",
+    "ConnectivityStatus": ".sync_manager",
+    "ConflictResolution": ".sync_manager",
+    "SyncResult": ".sync_manager",
+    "SyncProgress": ".sync_manager",
+    "get_sync_manager": ".sync_manager",
+}
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "MeetingService",
@@ -57,6 +71,7 @@ __all__ = [
     "OfflineItem",
     "PendingSync",
     "get_offline_storage",
+    "SearchResult",
     "SyncManager",
     "ConnectivityStatus",
     "ConflictResolution",
@@ -0,0 +1,301 @@
+"""
+Full-text search over the desktop app's local SQLite history.
+
+Meetings, transcripts and conversations are indexed with SQLite FTS5 so
+history can be searched offline, without a round trip to the backend.
+Each searchable table gets an external-content FTS5 table (the text is
+not stored twice) kept in step by triggers, so every insert, update and
+delete - including cascades and retention cleanup - updates the index in
+the same transaction. Results are ranked with bm25 and come with a
+highlighted snippet.
+
+Shared by OfflineStorage and desktop_app.LocalStorage. Where the SQLite
+library was built without FTS5, search falls back to LIKE scans: slower,
+unranked, but the same API.
+"""
+
+import html
+import logging
+import re
+import sqlite3
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Snippet highlight markers; control characters never occur in transcripts
+HIGHLIGHT_START = "\x02"
+HIGHLIGHT_END = "\x03"
+SNIPPET_ELLIPSIS = "…"
+SNIPPET_TOKENS = 16
+
+# Stemming plus accent folding: "meetings" finds "meeting", "cafe" finds "café"
+FTS_TOKENIZER = "porter unicode61 remove_diacritics 2"
+# Prefix lengths with their own index, for search-as-you-type
+FTS_PREFIX_INDEXES = "2 3"
+# Shorter last words match exactly; a one-letter prefix matches most rows
+MIN_PREFIX_LENGTH = 2
+
+# Search terms used from a query; the rest are ignored
+MAX_QUERY_TERMS = 16
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+@dataclass(frozen=True)
+class SearchSource:
+    """A table whose text columns are indexed for search."""
+    kind: str                      # Result kind ("meeting", "transcript", ...)
+    table: str                     # Content table
+    key: str                       # Primary key column returned as local_id
+    columns: Tuple[str, ...]       # Indexed text columns, main text first
+    weights: Tuple[float, ...]     # bm25 weight of each column
+    meeting_column: str            # Column holding the meeting's local ID
+    timestamp_column: str
+
+    @property
+    def fts_table(self) -> str:
+        return f"{self.table}_fts"
+
+
+@dataclass
+class SearchResult:
+    """A ranked search hit."""
+    kind: str
+    local_id: str
+    meeting_local_id: Optional[str]
+    meeting_title: Optional[str]
+    text: str                      # Main text of the hit
+    snippet: str                   # Matching excerpt with highlight markers
+    score: float                   # bm25 score, lower is better
+    timestamp: Optional[str] = None
+
+    def snippet_html(self, color: str = "#fbbf24") -> str:
+        """The snippet as Qt rich text with the matches in bold."""
+        escaped = html.escape(self.snippet)
+        return (
+            escaped
+            .replace(HIGHLIGHT_START, f'<b style="color: {color};">')
+            .replace(HIGHLIGHT_END, "</b>")
+        )
+
+    @property
+    def plain_snippet(self) -> str:
+        return self.snippet.replace(HIGHLIGHT_START, "").replace(HIGHLIGHT_END, "")
+
+
+def fts5_available(conn: sqlite3.Connection) -> bool:
+    """Whether the SQLite library was compiled with FTS5."""
+    try:
+        row = conn.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')").fetchone()
+        if row and row[0]:
+            return True
+        # Builds can also load FTS5 as a built-in extension without the option
+        conn.execute("CREATE VIRTUAL TABLE temp._fts5_probe USING fts5(x)")
+        conn.execute("DROP TABLE temp._fts5_probe")
+        return True
+    except sqlite3.Error:
+        return False
+
+
+def create_search_index(conn: sqlite3.Connection, source: SearchSource) -> bool:
+    """Create the FTS5 table and triggers for a source if missing.
+
+    Returns:
+        True if the index was created and needs rebuild_search_index()
+    """
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+        (source.fts_table,)
+    ).fetchone()
+
+    fts, table = source.fts_table, source.table
+    columns = ", ".join(source.columns)
+    new_values = ", ".join(f"new.{c}" for c in source.columns)
+    old_values = ", ".join(f"old.{c}" for c in source.columns)
+
+    conn.executescript(f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(
+            {columns},
+            content='{table}',
+            content_rowid='rowid',
+            tokenize='{FTS_TOKENIZER}',
+            prefix='{FTS_PREFIX_INDEXES}'
+        );
+
+        CREATE TRIGGER IF NOT EXISTS {table}_fts_insert AFTER INSERT ON {table} BEGIN
+            INSERT INTO {fts} (rowid, {columns}) VALUES (new.rowid, {new_values});
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS {table}_fts_delete AFTER DELETE ON {table} BEGIN
+            INSERT INTO {fts} ({fts}, rowid, {columns}) VALUES ('delete', old.rowid, {old_values});
+        END;
+
+        -- Only text edits touch the index, not sync status updates
+        CREATE TRIGGER IF NOT EXISTS {table}_fts_update AFTER UPDATE OF {columns} ON {table} BEGIN
+            INSERT INTO {fts} ({fts}, rowid, {columns}) VALUES ('delete', old.rowid, {old_values});
+            INSERT INTO {fts} (rowid, {columns}) VALUES (new.rowid, {new_values});
+        END;
+    """)
+    return not exists
+
+
+def rebuild_search_index(conn: sqlite3.Connection, source: SearchSource):
+    """Re-index every row of a source (backfill, or after rowids changed)."""
+    conn.execute(f"INSERT INTO {source.fts_table} ({source.fts_table}) VALUES ('rebuild')")
+
+
+def build_match_query(text: str, prefix_last: bool = True) -> Optional[str]:
+    """Turn free text into a safe FTS5 MATCH expression.
+
+    Every word must match (implicit AND). Words are quoted so that FTS5
+    syntax in user input (quotes, NEAR, column filters, '-') is searched
+    for literally instead of raising. The last word also matches as a
+    prefix while it is still being typed, once it is MIN_PREFIX_LENGTH
+    characters long.
+
+    Returns:
+        The MATCH expression, or None if the text has no searchable words
+    """
+    terms = _WORD_RE.findall(text)[:MAX_QUERY_TERMS]
+    if not terms:
+        return None
+    quoted = [f'"{term}"' for term in terms]
+    if prefix_last and not text[-1:].isspace() and len(terms[-1]) >= MIN_PREFIX_LENGTH:
+        quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+def search(
+    conn: sqlite3.Connection,
+    sources: Sequence[SearchSource],
+    query: str,
+    limit: int = 20,
+    meeting_local_id: Optional[str] = None,
+    use_fts: bool = True
+) -> List[SearchResult]:
+    """Ranked search across sources.
+
+    Args:
+        conn: Connection to the database holding the sources
+        sources: Sources to search
+        query: Free text typed by the user
+        limit: Maximum number of results
+        meeting_local_id: Only search within this meeting
+        use_fts: False when FTS5 is unavailable (LIKE fallback)
+    """
+    if not sources:
+        return []
+    if not use_fts:
+        return _search_like(conn, sources, query, limit, meeting_local_id)
+
+    match = build_match_query(query)
+    if match is None:
+        return []
+
+    selects = []
+    params: list = []
+    for source in sources:
+        fts = source.fts_table
+        weights = ", ".join(str(w) for w in source.weights)
+        where = f"{fts} MATCH ?"
+        select_params = [HIGHLIGHT_START, HIGHLIGHT_END, SNIPPET_ELLIPSIS, match]
+        if meeting_local_id is not None:
+            where += f" AND c.{source.meeting_column} = ?"
+            select_params.append(meeting_local_id)
+        selects.append(f"""
+            SELECT '{source.kind}' AS kind,
+                   c.{source.key} AS local_id,
+                   c.{source.meeting_column} AS meeting_local_id,
+                   m.title AS meeting_title,
+                   c.{source.columns[0]} AS text,
+                   snippet({fts}, -1, ?, ?, ?, {SNIPPET_TOKENS}) AS snippet,
+                   bm25({fts}, {weights}) AS score,
+                   c.{source.timestamp_column} AS timestamp
+            FROM {fts}
+            JOIN {source.table} c ON c.rowid = {fts}.rowid
+            LEFT JOIN meetings m ON m.local_id = c.{source.meeting_column}
+            WHERE {where}
+        """)
+        params.extend(select_params)
+
+    sql = " UNION ALL ".join(selects) + " ORDER BY score LIMIT ?"
+    params.append(limit)
+    try:
+        rows = conn.execute(sql, params).fetchall()
+    except sqlite3.OperationalError as e:
+        logger.warning(f"Search failed for {query!r}: {e}")
+        return []
+    return [_result(row) for row in rows]
+
+
+def _result(row) -> SearchResult:
+    return SearchResult(
+        kind=row[0],
+        local_id=row[1],
+        meeting_local_id=row[2],
+        meeting_title=row[3],
+        text=row[4] or "",
+        snippet=row[5] or "",
+        score=row[6],
+        timestamp=str(row[7]) if row[7] is not None else None,
+    )
+
+
+def _search_like(
+    conn: sqlite3.Connection,
+    sources: Sequence[SearchSource],
+    query: str,
+    limit: int,
+    meeting_local_id: Optional[str]
+) -> List[SearchResult]:
+    """Unranked substring search for SQLite builds without FTS5."""
+    terms = _WORD_RE.findall(query)[:MAX_QUERY_TERMS]
+    if not terms:
+        return []
+
+    results: List[SearchResult] = []
+    for source in sources:
+        haystack = " || ' ' || ".join(f"COALESCE(c.{col}, '')" for col in source.columns)
+        where = " AND ".join(f"({haystack}) LIKE ?" for _ in terms)
+        params: list = [f"%{term}%" for term in terms]
+        if meeting_local_id is not None:
+            where += f" AND c.{source.meeting_column} = ?"
+            params.append(meeting_local_id)
+        params.append(limit)
+        rows = conn.execute(f"""
+            SELECT c.{source.key}, c.{source.meeting_column}, m.title,
+                   c.{source.columns[0]}, {haystack}, c.{source.timestamp_column}
+            FROM {source.table} c
+            LEFT JOIN meetings m ON m.local_id = c.{source.meeting_column}
+            WHERE {where}
+            ORDER BY c.{source.timestamp_column} DESC
+            LIMIT ?
+        """, params).fetchall()
+        for row in rows:
+            results.append(SearchResult(
+                kind=source.kind,
+                local_id=row[0],
+                meeting_local_id=row[1],
+                meeting_title=row[2],
+                text=row[3] or "",
+                snippet=_like_snippet(row[4] or "", terms),
+                score=0.0,
+                timestamp=str(row[5]) if row[5] is not None else None,
+            ))
+
+    results.sort(key=lambda r: r.timestamp or "", reverse=True)
+    return results[:limit]
+
+
+def _like_snippet(text: str, terms: Sequence[str]) -> str:
+    """Excerpt around the first matching term, matches highlighted."""
+    lowered = text.lower()
+    positions = [p for p in (lowered.find(t.lower()) for t in terms) if p >= 0]
+    start = max(0, min(positions, default=0) - 40)
+    excerpt = text[start:start + 160]
+    pattern = re.compile("|".join(re.escape(t) for t in terms), re.IGNORECASE)
+    excerpt = pattern.sub(lambda m: f"{HIGHLIGHT_START}{m.group(0)}{HIGHLIGHT_END}", excerpt)
+    prefix = SNIPPET_ELLIPSIS if start > 0 else ""
+    suffix = SNIPPET_ELLIPSIS if start + 160 < len(text) else ""
+    return f"{prefix}{excerpt}{suffix}"
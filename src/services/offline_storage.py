@@ -5,23 +5,78 @@ Provides SQLite-based local database for offline data persistence:
 - Store meetings, transcripts, action items locally
 - Queue pending syncs for when connectivity returns
 - Manage storage limits and cleanup
+
+The database runs in WAL mode. By default all writes go through a single
+writer thread that commits whatever has queued up in one transaction
+(group commit), so callers on the UI and transcription threads return
+without touching the disk. Space is reclaimed with incremental vacuum in
+small steps rather than a blocking VACUUM.
+
+Meetings, transcripts and conversations are full-text indexed (FTS5, see
+local_search) so history can be searched offline with search().
 """
 
+import atexit
 import json
 import logging
 import os
+import queue
 import sqlite3
 import threading
 import uuid
+from concurrent.futures import Future
 from contextlib import contextmanager
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from .local_search import (
+    SearchResult, SearchSource, create_search_index, fts5_available,
+    rebuild_search_index, search as search_index,
+)
 
 logger = logging.getLogger(__name__)
 
+# Connection tuning. In WAL mode synchronous=NORMAL only fsyncs at
+# checkpoints: a power cut can lose the last commits, never corrupt the file.
+CONNECTION_PRAGMAS = (
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -8192",  # 8 MB page cache per connection
+    "PRAGMA journal_size_limit = 16777216",  # Trim the WAL to 16 MB after checkpoints
+)
+BUSY_TIMEOUT_SECONDS = 5.0
+STATEMENT_CACHE_SIZE = 256  # Prepared statements kept per connection
+
+# Group commit: most operations committed in one transaction
+MAX_WRITE_BATCH = 500
+# Free pages returned to the file system per incremental vacuum step
+VACUUM_STEP_PAGES = 256
+
+WriteOp = Callable[[sqlite3.Connection], Any]
+
+# Full-text indexed tables, searched by OfflineStorage.search()
+SEARCH_SOURCES = (
+    SearchSource(
+        kind="meeting", table="meetings", key="local_id",
+        columns=("title", "meeting_type", "meeting_app"), weights=(4.0, 1.0, 1.0),
+        meeting_column="local_id", timestamp_column="started_at",
+    ),
+    SearchSource(
+        kind="transcript", table="transcripts", key="local_id",
+        columns=("text", "speaker_name"), weights=(1.0, 2.0),
+        meeting_column="meeting_local_id", timestamp_column="timestamp",
+    ),
+    SearchSource(
+        kind="conversation", table="conversations", key="local_id",
+        columns=("heard_text", "response_text", "speaker"), weights=(1.0, 0.75, 2.0),
+        meeting_column="meeting_local_id", timestamp_column="timestamp",
+    ),
+)
+
 
 class SyncStatus(Enum):
     """Synchronization status for offline items."""
@@ -76,6 +131,126 @@ class PendingSync:
     error: Optional[str] = None
 
 
+class _GroupCommitWriter:
+    """Single writer thread that commits queued operations in batches.
+
+    Each operation runs in its own savepoint, so a failing one is rolled
+    back and reported through its Future without affecting the others in
+    the batch. Futures resolve after the batch has been committed.
+    """
+
+    _STOP = object()
+
+    def __init__(self, connect: Callable[[], sqlite3.Connection]):
+        self._connect = connect
+        self._queue: "queue.Queue" = queue.Queue()
+        self._vacuum_requested = threading.Event()
+        self.batches = 0  # Commits made, for diagnostics
+        self._thread = threading.Thread(target=self._run, name="offline-storage-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, op: WriteOp) -> Future:
+        """Queue a write; never blocks."""
+        future: Future = Future()
+        self._queue.put((op, future))
+        return future
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until everything queued so far is committed."""
+        if not self._thread.is_alive():
+            return True
+        try:
+            self.submit(lambda conn: None).result(timeout)
+            return True
+        except Exception:
+            return False
+
+    def request_vacuum(self):
+        """Reclaim free pages once the queue is idle."""
+        self._vacuum_requested.set()
+        self._queue.put(None)  # Wake the writer
+
+    def close(self, timeout: Optional[float] = 10.0):
+        """Commit what is queued and stop the thread."""
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join(timeout)
+
+    def _run(self):
+        conn = self._connect()
+        try:
+            while True:
+                item = self._queue.get()
+                batch = []
+                stop = False
+                while True:
+                    if item is self._STOP:
+                        stop = True
+                    elif item is not None:
+                        batch.append(item)
+                    if stop or len(batch) >= MAX_WRITE_BATCH:
+                        break
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+
+                if batch:
+                    self._commit(conn, batch)
+                if stop:
+                    return
+                if self._vacuum_requested.is_set() and self._queue.empty():
+                    self._vacuum_step(conn)
+        finally:
+            conn.close()
+
+    def _commit(self, conn: sqlite3.Connection, batch: list):
+        results = []
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for op, future in batch:
+                conn.execute("SAVEPOINT write_op")
+                try:
+                    results.append((future, op(conn), None))
+                    conn.execute("RELEASE write_op")
+                except Exception as e:
+                    conn.execute("ROLLBACK TO write_op")
+                    conn.execute("RELEASE write_op")
+                    results.append((future, None, e))
+            conn.execute("COMMIT")
+            self.batches += 1
+        except Exception as e:
+            logger.error(f"Offline storage commit failed: {e}")
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        for future, result, error in results:
+            if error is not None:
+                logger.error(f"Offline storage write failed: {error}")
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    def _vacuum_step(self, conn: sqlite3.Connection):
+        """Free a few pages; repeats between batches until none are left."""
+        try:
+            free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            if free_pages:
+                # executescript runs the pragma to completion (execute stops
+                # after the first page)
+                conn.executescript(f"PRAGMA incremental_vacuum({VACUUM_STEP_PAGES});")
+            if free_pages <= VACUUM_STEP_PAGES:
+                self._vacuum_requested.clear()
+            else:
+                self._queue.put(None)  # Continue after any queued writes
+        except sqlite3.Error as e:
+            logger.warning(f"Incremental vacuum failed: {e}")
+            self._vacuum_requested.clear()
+
+
 class OfflineStorage:
     """
     SQLite-based offline storage for ReadIn AI.
@@ -84,7 +259,8 @@ class OfflineStorage:
     - Local database for meetings, transcripts, action items
     - Sync queue management
     - Storage limit enforcement
-    - Thread-safe operations
+    - Thread-safe operations; saves never block the caller in
+      write-behind mode
     """
 
     # Default settings
@@ -93,15 +269,22 @@ class OfflineStorage:
     MAX_SYNC_ATTEMPTS = 5
 
     # Schema version for migrations
-    SCHEMA_VERSION = 1
+    SCHEMA_VERSION = 2
 
-    def __init__(self, db_path: Optional[str] = None, max_storage_mb: int = None):
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        max_storage_mb: int = None,
+        write_behind: bool = True
+    ):
         """
         Initialize offline storage.
 
         Args:
             db_path: Path to SQLite database file (default: ~/.readin/offline.db)
             max_storage_mb: Maximum storage size in MB
+            write_behind: Queue writes for the group-commit writer thread.
+                When False each write commits on the caller's thread.
         """
         if db_path is None:
             base_dir = Path.home() / ".readin"
@@ -112,25 +295,67 @@ class OfflineStorage:
         self._max_storage_mb = max_storage_mb or self.DEFAULT_MAX_STORAGE_MB
         self._lock = threading.RLock()
         self._local_conn = threading.local()
+        self._search_enabled = False
 
         # Initialize database
         self._init_database()
 
+        self._writer: Optional[_GroupCommitWriter] = None
+        if write_behind:
+            self._writer = _GroupCommitWriter(lambda: self._connect(autocommit=True))
+
         logger.info(f"Offline storage initialized: {db_path}")
 
+    def _connect(self, autocommit: bool = False) -> sqlite3.Connection:
+        """Open a tuned connection to the database."""
+        conn = sqlite3.connect(
+            self._db_path,
+            timeout=BUSY_TIMEOUT_SECONDS,
+            check_same_thread=False,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            cached_statements=STATEMENT_CACHE_SIZE,
+            isolation_level=None if autocommit else "",
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
     def _get_connection(self) -> sqlite3.Connection:
         """Get thread-local database connection."""
         if not hasattr(self._local_conn, 'conn') or self._local_conn.conn is None:
-            self._local_conn.conn = sqlite3.connect(
-                self._db_path,
-                check_same_thread=False,
-                detect_types=sqlite3.PARSE_DECLTYPES
-            )
-            self._local_conn.conn.row_factory = sqlite3.Row
-            # Enable foreign keys
-            self._local_conn.conn.execute("PRAGMA foreign_keys = ON")
+            self._local_conn.conn = self._connect()
         return self._local_conn.conn
 
+    def _write(self, op: WriteOp) -> Future:
+        """Run a write operation against the database.
+
+        In write-behind mode the operation is queued for the writer thread
+        and the returned Future resolves once it is committed. Otherwise it
+        runs in its own transaction before returning.
+        """
+        if self._writer is not None:
+            return self._writer.submit(op)
+
+        future: Future = Future()
+        try:
+            with self._lock, self._transaction() as conn:
+                future.set_result(op(conn))
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        return future
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all queued writes are committed.
+
+        Only for background threads that need to read their own writes
+        (e.g. the sync loop); the UI should not wait on the disk.
+        """
+        if self._writer is None:
+            return True
+        return self._writer.flush(timeout)
+
     @contextmanager
     def _transaction(self):
         """Context manager for database transactions."""
@@ -145,6 +370,7 @@ class OfflineStorage:
     def _init_database(self):
         """Initialize database schema."""
         with self._lock:
+            vacuumed = self._configure_journal()
             conn = self._get_connection()
             cursor = conn.cursor()
 
@@ -296,6 +522,8 @@ class OfflineStorage:
                     ON sync_log(timestamp DESC);
             """)
 
+            self._init_search_index(conn, rowids_changed=vacuumed)
+
             # Update schema version
             cursor.execute("""
                 INSERT OR REPLACE INTO schema_version (version) VALUES (?)
@@ -303,10 +531,54 @@ class OfflineStorage:
 
             conn.commit()
 
+    def _configure_journal(self) -> bool:
+        """Switch the database file to WAL and incremental auto-vacuum.
+
+        Both settings are stored in the file. auto_vacuum only takes effect
+        on an existing database after a VACUUM, which runs once here, at
+        startup, rather than during cleanup.
+
+        Returns:
+            True if the database was vacuumed (which can renumber rowids)
+        """
+        vacuumed = False
+        conn = self._connect(autocommit=True)
+        try:
+            if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+                conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+                has_tables = conn.execute(
+                    "SELECT COUNT(*) FROM sqlite_master WHERE type = 'table'"
+                ).fetchone()[0]
+                if has_tables:
+                    logger.info("Converting offline database to incremental auto-vacuum")
+                    conn.execute("VACUUM")
+                    vacuumed = True
+            conn.execute("PRAGMA journal_mode = WAL")
+        finally:
+            conn.close()
+        return vacuumed
+
+    def _init_search_index(self, conn: sqlite3.Connection, rowids_changed: bool = False):
+        """Create the full-text indexes, backfilling any that are new.
+
+        The indexes refer to rows by rowid, which a VACUUM may renumber, so
+        they are rebuilt after one.
+        """
+        self._search_enabled = fts5_available(conn)
+        if not self._search_enabled:
+            logger.warning("SQLite has no FTS5; local search falls back to LIKE scans")
+            return
+
+        for source in SEARCH_SOURCES:
+            if create_search_index(conn, source) or rowids_changed:
+                rebuild_search_index(conn, source)
+                logger.info(f"Built search index for {source.table}")
+
     def _migrate_schema(self, from_version: int):
         """Migrate database schema from older version."""
-        # Future migrations would go here
         logger.info(f"Migrating schema from version {from_version} to {self.SCHEMA_VERSION}")
+        # Version 2 adds the full-text indexes; _init_search_index creates
+        # and backfills them for existing rows
 
     # ==================== Meeting Operations ====================
 
@@ -328,7 +600,7 @@ class OfflineStorage:
         now = datetime.now()
         started = started_at or now
 
-        with self._lock, self._transaction() as conn:
+        def write(conn: sqlite3.Connection):
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -345,6 +617,7 @@ class OfflineStorage:
             # Queue for sync if not already synced
             if remote_id is None:
                 self._queue_sync(
+                    conn,
                     EntityType.MEETING.value,
                     "create",
                     local_id,
@@ -358,6 +631,8 @@ class OfflineStorage:
                     priority=10  # High priority
                 )
 
+        self._write(write)
+
         logger.debug(f"Meeting saved locally: {local_id}")
         return local_id
 
@@ -370,7 +645,7 @@ class OfflineStorage:
         """
         now = datetime.now()
 
-        with self._lock, self._transaction() as conn:
+        def write(conn: sqlite3.Connection):
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -389,6 +664,7 @@ class OfflineStorage:
                 remote_id = row['remote_id'] if row else None
 
                 self._queue_sync(
+                    conn,
                     EntityType.MEETING.value,
                     "update",
                     local_id,
@@ -397,21 +673,23 @@ class OfflineStorage:
                     priority=8
                 )
                 return True
+            return False
 
-        return False
+        # Rare and the caller needs to know whether a row matched, so this
+        # waits for the writer instead of returning at once
+        return self._write(write).result()
 
     def get_meeting(self, local_id: str) -> Optional[Dict[str, Any]]:
         """Get meeting by local ID."""
-        with self._lock:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+        conn = self._get_connection()
+        cursor = conn.cursor()
 
-            cursor.execute("""
-                SELECT * FROM meetings WHERE local_id = ?
-            """, (local_id,))
+        cursor.execute("""
+            SELECT * FROM meetings WHERE local_id = ?
+        """, (local_id,))
 
-            row = cursor.fetchone()
-            return dict(row) if row else None
+        row = cursor.fetchone()
+        return dict(row) if row else None
 
     def get_meetings(
         self,
@@ -420,41 +698,39 @@ class OfflineStorage:
         include_ended: bool = True
     ) -> List[Dict[str, Any]]:
         """Get recent meetings."""
-        with self._lock:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+        conn = self._get_connection()
+        cursor = conn.cursor()
 
-            query = "SELECT * FROM meetings WHERE 1=1"
-            params = []
+        query = "SELECT * FROM meetings WHERE 1=1"
+        params = []
 
-            if meeting_type:
-                query += " AND meeting_type = ?"
-                params.append(meeting_type)
+        if meeting_type:
+            query += " AND meeting_type = ?"
+            params.append(meeting_type)
 
-            if not include_ended:
-                query += " AND ended_at IS NULL"
+        if not include_ended:
+            query += " AND ended_at IS NULL"
 
-            query += " ORDER BY started_at DESC LIMIT ?"
-            params.append(limit)
+        query += " ORDER BY started_at DESC LIMIT ?"
+        params.append(limit)
 
-            cursor.execute(query, params)
-            return [dict(row) for row in cursor.fetchall()]
+        cursor.execute(query, params)
+        return [dict(row) for row in cursor.fetchall()]
 
     def get_active_meeting(self) -> Optional[Dict[str, Any]]:
         """Get currently active meeting (not ended)."""
-        with self._lock:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+        conn = self._get_connection()
+        cursor = conn.cursor()
 
-            cursor.execute("""
-                SELECT * FROM meetings
-                WHERE ended_at IS NULL
-                ORDER BY started_at DESC
-                LIMIT 1
-            """)
+        cursor.execute("""
+            SELECT * FROM meetings
+            WHERE ended_at IS NULL
+            ORDER BY started_at DESC
+            LIMIT 1
+        """)
 
-            row = cursor.fetchone()
-            return dict(row) if row else None
+        row = cursor.fetchone()
+        return dict(row) if row else None
 
     # ==================== Transcript Operations ====================
 
@@ -471,7 +747,7 @@ class OfflineStorage:
         now = datetime.now()
         ts = timestamp or now
 
-        with self._lock, self._transaction() as conn:
+        def write(conn: sqlite3.Connection):
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -484,6 +760,8 @@ class OfflineStorage:
                 text, ts, now
             ))
 
+        self._write(write)
+
         return local_id
 
     def get_transcripts(
@@ -492,18 +770,17 @@ class OfflineStorage:
         limit: int = 100
     ) -> List[Dict[str, Any]]:
         """Get transcripts for a meeting."""
-        with self._lock:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+        conn = self._get_connection()
+        cursor = conn.cursor()
 
-            cursor.execute("""
-                SELECT * FROM transcripts
-                WHERE meeting_local_id = ?
-                ORDER BY timestamp ASC
-                LIMIT ?
-            """, (meeting_local_id, limit))
+        cursor.execute("""
+            SELECT * FROM transcripts
+            WHERE meeting_local_id = ?
+            ORDER BY timestamp ASC
+            LIMIT ?
+        """, (meeting_local_id, limit))
 
-            return [dict(row) for row in cursor.fetchall()]
+        return [dict(row) for row in cursor.fetchall()]
 
     # ==================== Conversation Operations ====================
 
@@ -520,7 +797,7 @@ class OfflineStorage:
         now = datetime.now()
         ts = timestamp or now
 
-        with self._lock, self._transaction() as conn:
+        def write(conn: sqlite3.Connection):
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -543,6 +820,7 @@ class OfflineStorage:
 
             # Queue for sync
             self._queue_sync(
+                conn,
                 EntityType.CONVERSATION.value,
                 "create",
                 local_id,
@@ -557,6 +835,8 @@ class OfflineStorage:
                 priority=5
             )
 
+        self._write(write)
+
         return local_id
 
     def get_conversations(
@@ -565,18 +845,17 @@ class OfflineStorage:
         limit: int = 100
     ) -> List[Dict[str, Any]]:
         """Get conversations for a meeting."""
-        with self._lock:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+        conn = self._get_connection()
+        cursor = conn.cursor()
 
-            cursor.execute("""
-                SELECT * FROM conversations
-                WHERE meeting_local_id = ?
-                ORDER BY timestamp ASC
-                LIMIT ?
-            """, (meeting_local_id, limit))
+        cursor.execute("""
+            SELECT * FROM conversations
+            WHERE meeting_local_id = ?
+            ORDER BY timestamp ASC
+            LIMIT ?
+        """, (meeting_local_id, limit))
 
-            return [dict(row) for row in cursor.fetchall()]
+        return [dict(row) for row in cursor.fetchall()]
 
     # ==================== Action Item Operations ====================
 
@@ -592,7 +871,7 @@ class OfflineStorage:
         local_id = str(uuid.uuid4())
         now = datetime.now()
 
-        with self._lock, self._transaction() as conn:
+        def write(conn: sqlite3.Connection):
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -606,6 +885,7 @@ class OfflineStorage:
             ))
 
             self._queue_sync(
+                conn,
                 EntityType.ACTION_ITEM.value,
                 "create",
                 local_id,
@@ -620,13 +900,20 @@ class OfflineStorage:
                 priority=6
             )
 
+        self._write(write)
+
         return local_id
 
     def complete_action_item(self, local_id: str) -> bool:
-        """Mark an action item as completed."""
+        """
+        Mark an action item as completed.
+
+        Returns:
+            True if the action item was found and updated
+        """
         now = datetime.now()
 
-        with self._lock, self._transaction() as conn:
+        def write(conn: sqlite3.Connection):
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -645,6 +932,7 @@ class OfflineStorage:
                 remote_id = row['remote_id'] if row else None
 
                 self._queue_sync(
+                    conn,
                     EntityType.ACTION_ITEM.value,
                     "update",
                     local_id,
@@ -653,8 +941,11 @@ class OfflineStorage:
                     priority=7
                 )
                 return True
+            return False
 
-        return False
+        # Rare and the caller needs to know whether a row matched, so this
+        # waits for the writer instead of returning at once
+        return self._write(write).result()
 
     def get_action_items(
         self,
@@ -663,30 +954,30 @@ class OfflineStorage:
         limit: int = 100
     ) -> List[Dict[str, Any]]:
         """Get action items."""
-        with self._lock:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+        conn = self._get_connection()
+        cursor = conn.cursor()
 
-            query = "SELECT * FROM action_items WHERE 1=1"
-            params = []
+        query = "SELECT * FROM action_items WHERE 1=1"
+        params = []
 
-            if not include_completed:
-                query += " AND completed = 0"
+        if not include_completed:
+            query += " AND completed = 0"
 
-            if meeting_local_id:
-                query += " AND meeting_local_id = ?"
-                params.append(meeting_local_id)
+        if meeting_local_id:
+            query += " AND meeting_local_id = ?"
+            params.append(meeting_local_id)
 
-            query += " ORDER BY due_date ASC NULLS LAST, created_at DESC LIMIT ?"
-            params.append(limit)
+        query += " ORDER BY due_date ASC NULLS LAST, created_at DESC LIMIT ?"
+        params.append(limit)
 
-            cursor.execute(query, params)
-            return [dict(row) for row in cursor.fetchall()]
+        cursor.execute(query, params)
+        return [dict(row) for row in cursor.fetchall()]
 
     # ==================== Sync Queue Operations ====================
 
     def _queue_sync(
         self,
+        conn: sqlite3.Connection,
         entity_type: str,
         operation: str,
         local_id: str,
@@ -694,11 +985,10 @@ class OfflineStorage:
         data: Dict[str, Any],
         priority: int = 0
     ):
-        """Add item to sync queue (internal method)."""
+        """Add item to sync queue within the caller's write (internal method)."""
         sync_id = str(uuid.uuid4())
         now = datetime.now()
 
-        conn = self._get_connection()
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -712,39 +1002,43 @@ class OfflineStorage:
         ))
 
     def get_pending_syncs(self, limit: int = 50) -> List[PendingSync]:
-        """Get pending sync items ordered by priority."""
-        with self._lock:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+        """Get pending sync items ordered by priority.
 
-            cursor.execute("""
-                SELECT * FROM pending_sync
-                WHERE attempts < ?
-                ORDER BY priority DESC, created_at ASC
-                LIMIT ?
-            """, (self.MAX_SYNC_ATTEMPTS, limit))
-
-            results = []
-            for row in cursor.fetchall():
-                results.append(PendingSync(
-                    id=row['id'],
-                    entity_type=row['entity_type'],
-                    operation=row['operation'],
-                    local_id=row['local_id'],
-                    remote_id=row['remote_id'],
-                    data=json.loads(row['data']),
-                    created_at=row['created_at'],
-                    priority=row['priority'],
-                    attempts=row['attempts'],
-                    last_attempt=row['last_attempt'],
-                    error=row['error']
-                ))
-
-            return results
+        Waits for queued writes first, so items saved or marked just now
+        are not missed or synced twice. Called from the sync thread.
+        """
+        self.flush()
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            SELECT * FROM pending_sync
+            WHERE attempts < ?
+            ORDER BY priority DESC, created_at ASC
+            LIMIT ?
+        """, (self.MAX_SYNC_ATTEMPTS, limit))
+
+        results = []
+        for row in cursor.fetchall():
+            results.append(PendingSync(
+                id=row['id'],
+                entity_type=row['entity_type'],
+                operation=row['operation'],
+                local_id=row['local_id'],
+                remote_id=row['remote_id'],
+                data=json.loads(row['data']),
+                created_at=row['created_at'],
+                priority=row['priority'],
+                attempts=row['attempts'],
+                last_attempt=row['last_attempt'],
+                error=row['error']
+            ))
+
+        return results
 
     def mark_sync_success(self, sync_id: str, remote_id: Optional[int] = None):
         """Mark a sync item as successfully synced."""
-        with self._lock, self._transaction() as conn:
+        def write(conn: sqlite3.Connection):
             cursor = conn.cursor()
 
             # Get sync item details
@@ -777,13 +1071,15 @@ class OfflineStorage:
                 cursor.execute("DELETE FROM pending_sync WHERE id = ?", (sync_id,))
 
                 # Log success
-                self._log_sync(entity_type, local_id, "sync_success", "completed")
+                self._log_sync(conn, entity_type, local_id, "sync_success", "completed")
+
+        self._write(write)
 
     def mark_sync_failure(self, sync_id: str, error: str):
         """Mark a sync item as failed."""
         now = datetime.now()
 
-        with self._lock, self._transaction() as conn:
+        def write(conn: sqlite3.Connection):
             cursor = conn.cursor()
 
             cursor.execute("""
@@ -801,25 +1097,27 @@ class OfflineStorage:
 
             if row:
                 self._log_sync(
+                    conn,
                     row['entity_type'],
                     row['local_id'],
                     "sync_failure",
                     f"Attempt {row['attempts']}: {error}"
                 )
 
+        self._write(write)
+
     def get_sync_queue_count(self) -> int:
         """Get number of pending sync items."""
-        with self._lock:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) as count FROM pending_sync")
-            return cursor.fetchone()['count']
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) as count FROM pending_sync")
+        return cursor.fetchone()['count']
 
     def clear_completed_syncs(self):
         """Clear successfully synced items older than retention period."""
         cutoff = datetime.now() - timedelta(days=self.DEFAULT_RETENTION_DAYS)
 
-        with self._lock, self._transaction() as conn:
+        def write(conn: sqlite3.Connection):
             cursor = conn.cursor()
 
             # Clear old sync logs
@@ -828,6 +1126,8 @@ class OfflineStorage:
                 (cutoff,)
             )
 
+        self._write(write)
+
     # ==================== ID Mapping ====================
 
     def update_remote_id(
@@ -847,7 +1147,7 @@ class OfflineStorage:
         if not table:
             return
 
-        with self._lock, self._transaction() as conn:
+        def write(conn: sqlite3.Connection):
             cursor = conn.cursor()
             cursor.execute(f"""
                 UPDATE {table}
@@ -855,6 +1155,8 @@ class OfflineStorage:
                 WHERE local_id = ?
             """, (remote_id, datetime.now(), local_id))
 
+        self._write(write)
+
     def get_local_id_for_remote(
         self,
         entity_type: str,
@@ -871,24 +1173,56 @@ class OfflineStorage:
         if not table:
             return None
 
-        with self._lock:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute(
-                f"SELECT local_id FROM {table} WHERE remote_id = ?",
-                (remote_id,)
-            )
-            row = cursor.fetchone()
-            return row['local_id'] if row else None
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        cursor.execute(
+            f"SELECT local_id FROM {table} WHERE remote_id = ?",
+            (remote_id,)
+        )
+        row = cursor.fetchone()
+        return row['local_id'] if row else None
+
+    # ==================== Search ====================
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        kinds: Optional[Sequence[str]] = None,
+        meeting_local_id: Optional[str] = None
+    ) -> List[SearchResult]:
+        """
+        Full-text search of local meeting history, best matches first.
+
+        Works offline. Writes still queued for the writer thread are not
+        visible yet; they usually are within a few milliseconds.
+
+        Args:
+            query: Free text; every word must match, the last as a prefix
+            limit: Maximum number of results
+            kinds: Restrict to "meeting", "transcript" and/or "conversation"
+            meeting_local_id: Only search within this meeting
+
+        Returns:
+            Ranked results with highlighted snippets
+        """
+        sources = [s for s in SEARCH_SOURCES if kinds is None or s.kind in kinds]
+        return search_index(
+            self._get_connection(), sources, query, limit,
+            meeting_local_id=meeting_local_id, use_fts=self._search_enabled,
+        )
 
     # ==================== Storage Management ====================
 
     def get_storage_size_mb(self) -> float:
-        """Get current database size in MB."""
-        try:
-            return os.path.getsize(self._db_path) / (1024 * 1024)
-        except OSError:
-            return 0.0
+        """Get current database size (including the WAL) in MB."""
+        size = 0
+        for path in (self._db_path, self._db_path + "-wal"):
+            try:
+                size += os.path.getsize(path)
+            except OSError:
+                pass
+        return size / (1024 * 1024)
 
     def is_storage_full(self) -> bool:
         """Check if storage limit is reached."""
@@ -905,7 +1239,7 @@ class OfflineStorage:
 
         cutoff = datetime.now() - timedelta(days=days)
 
-        with self._lock, self._transaction() as conn:
+        def write(conn: sqlite3.Connection):
             cursor = conn.cursor()
 
             # Delete old synced transcripts
@@ -930,24 +1264,33 @@ class OfflineStorage:
             """, (cutoff,))
             deleted_meetings = cursor.rowcount
 
-            # Vacuum to reclaim space
-            conn.execute("VACUUM")
-
             logger.info(
                 f"Cleanup complete: {deleted_meetings} meetings, "
                 f"{deleted_conversations} conversations, "
                 f"{deleted_transcripts} transcripts removed"
             )
 
+        self._write(write)
+        self._reclaim_space()
+
+    def _reclaim_space(self):
+        """Return free pages to the file system without a blocking VACUUM."""
+        if self._writer is not None:
+            # In steps, between batches of queued writes
+            self._writer.request_vacuum()
+            return
+        with self._lock:
+            self._get_connection().executescript("PRAGMA incremental_vacuum;")
+
     def _log_sync(
         self,
+        conn: sqlite3.Connection,
         entity_type: str,
         local_id: str,
         operation: str,
         details: str
     ):
         """Log sync operation for debugging."""
-        conn = self._get_connection()
         cursor = conn.cursor()
 
         cursor.execute("""
@@ -957,50 +1300,52 @@ class OfflineStorage:
 
     def get_sync_log(self, limit: int = 100) -> List[Dict[str, Any]]:
         """Get recent sync log entries."""
-        with self._lock:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+        conn = self._get_connection()
+        cursor = conn.cursor()
 
-            cursor.execute("""
-                SELECT * FROM sync_log
-                ORDER BY timestamp DESC
-                LIMIT ?
-            """, (limit,))
+        cursor.execute("""
+            SELECT * FROM sync_log
+            ORDER BY timestamp DESC
+            LIMIT ?
+        """, (limit,))
 
-            return [dict(row) for row in cursor.fetchall()]
+        return [dict(row) for row in cursor.fetchall()]
 
     def get_status(self) -> Dict[str, Any]:
         """Get offline storage status."""
-        with self._lock:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            # Count items by type
-            cursor.execute("SELECT COUNT(*) as count FROM meetings")
-            meeting_count = cursor.fetchone()['count']
-
-            cursor.execute("SELECT COUNT(*) as count FROM conversations")
-            conversation_count = cursor.fetchone()['count']
-
-            cursor.execute("SELECT COUNT(*) as count FROM action_items WHERE completed = 0")
-            pending_actions = cursor.fetchone()['count']
-
-            cursor.execute("SELECT COUNT(*) as count FROM pending_sync")
-            pending_syncs = cursor.fetchone()['count']
+        conn = self._get_connection()
+        cursor = conn.cursor()
 
-            return {
-                "database_path": self._db_path,
-                "storage_size_mb": round(self.get_storage_size_mb(), 2),
-                "max_storage_mb": self._max_storage_mb,
-                "meeting_count": meeting_count,
-                "conversation_count": conversation_count,
-                "pending_action_items": pending_actions,
-                "pending_syncs": pending_syncs,
-                "schema_version": self.SCHEMA_VERSION
-            }
+        # Count items by type
+        cursor.execute("SELECT COUNT(*) as count FROM meetings")
+        meeting_count = cursor.fetchone()['count']
+
+        cursor.execute("SELECT COUNT(*) as count FROM conversations")
+        conversation_count = cursor.fetchone()['count']
+
+        cursor.execute("SELECT COUNT(*) as count FROM action_items WHERE completed = 0")
+        pending_actions = cursor.fetchone()['count']
+
+        cursor.execute("SELECT COUNT(*) as count FROM pending_sync")
+        pending_syncs = cursor.fetchone()['count']
+
+        return {
+            "database_path": self._db_path,
+            "storage_size_mb": round(self.get_storage_size_mb(), 2),
+            "max_storage_mb": self._max_storage_mb,
+            "meeting_count": meeting_count,
+            "conversation_count": conversation_count,
+            "pending_action_items": pending_actions,
+            "pending_syncs": pending_syncs,
+            "schema_version": self.SCHEMA_VERSION,
+            "full_text_search": self._search_enabled
+        }
 
     def close(self):
-        """Close database connection."""
+        """Commit queued writes and close the database connection."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
         if hasattr(self._local_conn, 'conn') and self._local_conn.conn:
             self._local_conn.conn.close()
             self._local_conn.conn = None
@@ -1015,4 +1360,6 @@ def get_offline_storage() -> OfflineStorage:
     global _offline_storage
     if _offline_storage is None:
         _offline_storage = OfflineStorage()
+        # Commit writes still queued when the app exits
+        atexit.register(_offline_storage.close)
     return _offline_storage
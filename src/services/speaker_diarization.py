@@ -244,6 +244,23 @@ class SpeakerDiarizer:
                 self._notify_error(f"Failed to load diarization model: {e}")
                 return False
 
+    def warm_up(self):
+        """Run the pipeline once on two seconds of silence.
+
+        Keeps first-call setup (allocations, kernel selection) out of the
+        first real diarization of a meeting.
+        """
+        with self._loading_lock:
+            pipeline = self._pipeline
+        if pipeline is None:
+            return
+        try:
+            import torch
+            waveform = torch.zeros(1, self._sample_rate * 2)
+            pipeline({"waveform": waveform, "sample_rate": self._sample_rate})
+        except Exception as e:
+            logger.debug(f"Diarization warm-up skipped: {e}")
+
     def unload_model(self):
         """Unload the model to free memory."""
         with self._loading_lock:
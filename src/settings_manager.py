@@ -64,8 +64,7 @@ class SettingsManager:
         "_privacy_auto_detect": True,  # Internal: Auto-detect sensitive apps
 
         # Voice command settings
-        "voice_commands_enabled": False,  # Disabled by default - requires speech_recognition
-        "voice_command_device_index": None,  # None = use default microphone
+        "voice_commands_enabled": False,  # Disabled by default - requires faster-whisper
         "voice_command_tts_feedback": False,  # Speak confirmation of recognized commands
 
         # Speaker diarization settings
@@ -75,6 +74,11 @@ class SettingsManager:
         "diarization_interval": 30.0,  # Seconds between diarization updates
         "speaker_mapping": {},  # Persistent mapping of speaker IDs to custom names
 
+        # Model residency settings
+        "preload_models": True,  # Load and warm models at startup and on meeting detection
+        "model_ram_budget_mb": 2048,  # Memory Whisper and diarization may use together
+        "model_idle_unload_minutes": 10,  # Unload models after this long without a meeting
+
         # AI Persona settings
         "ai_persona": "professional",  # Default persona key
         "custom_persona_prompt": "",  # Custom persona prompt when ai_persona is "custom"
@@ -600,7 +604,8 @@ Emphasize strategic thinking and leadership perspective."""
         Returns:
             True if app was added, False if already in list
         """
-        excluded = self.get_excluded_apps()
+        # Copy so the change is detected and settings callbacks fire
+        excluded = list(self.get_excluded_apps())
         # Case-insensitive check for duplicates
         if app_name.lower() not in [app.lower() for app in excluded]:
             excluded.append(app_name)
@@ -617,7 +622,7 @@ Emphasize strategic thinking and leadership perspective."""
         Returns:
             True if app was removed, False if not found
         """
-        excluded = self.get_excluded_apps()
+        excluded = list(self.get_excluded_apps())
         # Case-insensitive removal
         for i, app in enumerate(excluded):
             if app.lower() == app_name.lower():
@@ -0,0 +1,140 @@
+"""Startup phase timing for `main.py --profile-startup`.
+
+Phases are timed from process creation, so the report covers interpreter
+startup, each import group and each subsystem's construction up to the
+moment the tray icon is shown. Every phase also records how many modules
+it imported and from which top-level packages, which is usually enough to
+spot an accidental eager import. For per-module detail run
+`python -X importtime main.py`.
+
+The module only needs the standard library so it can be imported before
+anything else; when profiling is off, a checkpoint is one function call.
+"""
+
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional, Set
+
+# Startup phases are reported at this precision
+_DIGITS = 4
+
+
+def _process_started_at() -> Optional[float]:
+    """Wall-clock creation time of this process, if it can be read."""
+    try:
+        import psutil
+        return psutil.Process(os.getpid()).create_time()
+    except Exception:
+        return None
+
+
+class StartupProfiler:
+    """Records per-phase startup timings and writes them to a JSON report.
+
+    Startup code calls checkpoint(name) after each step; the phase called
+    name covers everything since the previous checkpoint.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.report_path: Optional[str] = None
+        self._origin = 0.0  # perf_counter value at process creation
+        self._last = 0.0
+        self._modules_seen: Set[str] = set()
+        self._phases: List[Dict[str, Any]] = []
+        self._marks: Dict[str, float] = {}
+        self._written = False
+
+    def enable(self, report_path: Optional[str] = None):
+        """Start profiling; call as early as possible in the process.
+
+        Args:
+            report_path: Where to write the JSON report (default: the log
+                directory)
+        """
+        now_wall = time.time()
+        now = time.perf_counter()
+        started_at = _process_started_at()
+        interpreter = max(0.0, now_wall - started_at) if started_at else 0.0
+
+        self.enabled = True
+        self.report_path = report_path
+        self._origin = now - interpreter
+        self._last = 0.0
+        # Modules loaded before this point are interpreter bootstrap
+        self._modules_seen = set(sys.modules)
+        self.checkpoint("interpreter startup")
+
+    def elapsed(self) -> float:
+        """Seconds since the process was created."""
+        return time.perf_counter() - self._origin
+
+    def checkpoint(self, name: str):
+        """End the phase called name, which began at the previous checkpoint."""
+        if not self.enabled:
+            return
+        now = self.elapsed()
+        modules = set(sys.modules)
+        new_modules = modules - self._modules_seen
+        self._phases.append({
+            "name": name,
+            "start": round(self._last, _DIGITS),
+            "seconds": round(now - self._last, _DIGITS),
+            "new_modules": len(new_modules),
+            "packages": sorted({module.split(".")[0] for module in new_modules}),
+        })
+        self._modules_seen = modules
+        self._last = now
+
+    def mark(self, name: str):
+        """Record a milestone (e.g. "tray visible") at the current time."""
+        if self.enabled and name not in self._marks:
+            self._marks[name] = round(self.elapsed(), _DIGITS)
+
+    def report(self) -> Dict[str, Any]:
+        """The collected timings."""
+        return {
+            "python": sys.version.split()[0],
+            "platform": sys.platform,
+            "phases": self._phases,
+            "marks": self._marks,
+        }
+
+    def write_report(self) -> Optional[str]:
+        """Write the report (once) and log a summary.
+
+        Returns:
+            The report path, or None when profiling is off
+        """
+        if not self.enabled or self._written:
+            return None
+        self._written = True
+
+        from src.logger import get_logger, LOG_DIR
+        logger = get_logger("startup")
+
+        path = self.report_path or str(LOG_DIR / "startup_profile.json")
+        report = self.report()
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+        except OSError as e:
+            logger.error(f"Could not write startup profile: {e}")
+            return None
+
+        for phase in report["phases"]:
+            logger.info(
+                f"startup {phase['name']:<28} {phase['seconds'] * 1000:8.1f} ms"
+                f"  ({phase['new_modules']} modules)"
+            )
+        for name, at in report["marks"].items():
+            logger.info(f"startup {name} at {at * 1000:.1f} ms")
+        logger.info(f"Startup profile written to {path}")
+        return path
+
+
+# Process-wide profiler; enabled by main.py --profile-startup
+profiler = StartupProfiler()
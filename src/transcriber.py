@@ -6,7 +6,7 @@ from typing import Callable, Optional, List, Tuple
 
 import numpy as np
 
-from config import WHISPER_MODEL
+from config import WHISPER_MODEL, AUDIO_SAMPLE_RATE
 from src.logger import get_logger
 
 logger = get_logger("transcriber")
@@ -53,7 +53,8 @@ class Transcriber:
         on_transcription: Callable[[str], None],
         on_error: Optional[Callable[[str], None]] = None,
         language: str = "en",
-        model_name: str = WHISPER_MODEL
+        model_name: str = WHISPER_MODEL,
+        on_silence: Optional[Callable[[], None]] = None
     ):
         """Initialize the transcriber.
 
@@ -62,10 +63,14 @@ class Transcriber:
             on_error: Optional callback for errors
             language: Language code (e.g., 'en', 'es') or 'auto' for auto-detection
             model_name: Whisper model to use
+            on_silence: Optional callback when a chunk contains no speech
+                (marks the end of a turn)
         """
         self.on_transcription = on_transcription
         self.on_error = on_error
+        self.on_silence = on_silence
         self._model = None
+        self._model_lock = threading.Lock()
         self._model_name = model_name
         self._language = language if language != "auto" else None
         # Bounded queue to prevent unbounded memory growth
@@ -102,39 +107,40 @@ class Transcriber:
 
     def _load_model(self):
         """Load the Whisper model (lazy loading)."""
-        if self._model is None:
-            try:
-                from faster_whisper import WhisperModel
-                # Use CPU by default, can switch to CUDA if available
-                self._model = WhisperModel(
-                    self._model_name,
-                    device="cpu",
-                    compute_type="int8"  # Faster on CPU
-                )
-            except ImportError as e:
-                error_msg = f"Failed to import faster_whisper: {e}"
-                logger.error(error_msg)
-                if self.on_error:
-                    self.on_error(error_msg)
-                raise RuntimeError(error_msg) from e
-            except OSError as e:
-                error_msg = f"Failed to load Whisper model file: {e}"
-                logger.error(error_msg)
-                if self.on_error:
-                    self.on_error(error_msg)
-                raise RuntimeError(error_msg) from e
-            except ValueError as e:
-                error_msg = f"Invalid Whisper model configuration: {e}"
-                logger.error(error_msg)
-                if self.on_error:
-                    self.on_error(error_msg)
-                raise RuntimeError(error_msg) from e
-            except Exception as e:
-                error_msg = f"Failed to load Whisper model: {e}"
-                logger.error(error_msg)
-                if self.on_error:
-                    self.on_error(error_msg)
-                raise RuntimeError(error_msg) from e
+        with self._model_lock:
+            if self._model is None:
+                try:
+                    from faster_whisper import WhisperModel
+                    # Use CPU by default, can switch to CUDA if available
+                    self._model = WhisperModel(
+                        self._model_name,
+                        device="cpu",
+                        compute_type="int8"  # Faster on CPU
+                    )
+                except ImportError as e:
+                    error_msg = f"Failed to import faster_whisper: {e}"
+                    logger.error(error_msg)
+                    if self.on_error:
+                        self.on_error(error_msg)
+                    raise RuntimeError(error_msg) from e
+                except OSError as e:
+                    error_msg = f"Failed to load Whisper model file: {e}"
+                    logger.error(error_msg)
+                    if self.on_error:
+                        self.on_error(error_msg)
+                    raise RuntimeError(error_msg) from e
+                except ValueError as e:
+                    error_msg = f"Invalid Whisper model configuration: {e}"
+                    logger.error(error_msg)
+                    if self.on_error:
+                        self.on_error(error_msg)
+                    raise RuntimeError(error_msg) from e
+                except Exception as e:
+                    error_msg = f"Failed to load Whisper model: {e}"
+                    logger.error(error_msg)
+                    if self.on_error:
+                        self.on_error(error_msg)
+                    raise RuntimeError(error_msg) from e
 
     def _transcribe_loop(self):
         """Main transcription loop."""
@@ -152,6 +158,7 @@ class Transcriber:
                 # Use RMS instead of max for better silence detection
                 rms = np.sqrt(np.mean(audio_chunk ** 2))
                 if rms < 0.005:  # Very quiet threshold
+                    self._notify_silence()
                     continue
 
                 # Build transcription options
@@ -192,6 +199,9 @@ class Transcriber:
                 if text_parts:
                     full_text = " ".join(text_parts)
                     self.on_transcription(full_text)
+                else:
+                    # VAD found no speech in the chunk
+                    self._notify_silence()
 
             except queue.Empty:
                 continue
@@ -218,6 +228,14 @@ class Transcriber:
                 if self.on_error:
                     self.on_error(error_msg)
 
+    def _notify_silence(self):
+        """Report a chunk without speech."""
+        if self.on_silence:
+            try:
+                self.on_silence()
+            except Exception as e:
+                logger.error(f"Silence callback error: {e}")
+
     def _is_hallucination(self, text: str) -> bool:
         """Check if text is a common Whisper hallucination."""
         # Common hallucinations when there's no actual speech
@@ -274,14 +292,51 @@ class Transcriber:
         except queue.Empty:
             pass
 
+    def load_model(self) -> bool:
+        """Load the Whisper model now instead of on the first audio chunk.
+
+        Returns:
+            True if the model is loaded
+        """
+        try:
+            self._load_model()
+            return True
+        except RuntimeError:
+            return False
+
+    def is_model_loaded(self) -> bool:
+        """Check if the Whisper model is loaded."""
+        return self._model is not None
+
+    def warm_up(self):
+        """Run one inference on a second of silence.
+
+        The first transcribe call pays for allocating buffers and
+        initialising the decoder; doing it here keeps that cost out of the
+        first real chunk. VAD is off so the decoder actually runs.
+        """
+        model = self._model
+        if model is None:
+            return
+        segments, _ = model.transcribe(
+            np.zeros(AUDIO_SAMPLE_RATE, dtype=np.float32),
+            language=self._language or "en",
+            beam_size=1,
+            vad_filter=False,
+            without_timestamps=True,
+        )
+        # Segments are generated lazily
+        list(segments)
+
     def unload_model(self):
         """Unload the Whisper model to free memory."""
-        if self._model is not None:
-            del self._model
-            self._model = None
-            # Force garbage collection to release memory
-            import gc
-            gc.collect()
+        with self._model_lock:
+            if self._model is not None:
+                del self._model
+                self._model = None
+                # Force garbage collection to release memory
+                import gc
+                gc.collect()
 
     def __del__(self):
         """Cleanup resources on deletion."""
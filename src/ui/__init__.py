@@ -1,7 +1,22 @@
 """UI components for ReadIn AI."""
 
-from .speaker_manager_dialog import (
-    SpeakerManagerDialog,
-    SpeakerLabelWidget,
-    SpeakerColorManager
-)
+import importlib
+
+# Imported on first access so that loading one window (the overlay at
+# startup) does not load every dialog
+_EXPORTS = {
+    "SpeakerManagerDialog": ".speaker_manager_dialog",
+    "SpeakerLabelWidget": ".speaker_manager_dialog",
+    "SpeakerColorManager": ".speaker_manager_dialog",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -10,6 +10,8 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont
 
+from src.ui.local_search_box import LocalSearchBox
+
 
 class AddJobDialog(QDialog):
     """Dialog for adding a new job application."""
@@ -142,11 +144,13 @@ class JobTrackerView(QWidget):
     """Widget for tracking job applications and interviews."""
 
     application_selected = pyqtSignal(dict)
+    history_result_selected = pyqtSignal(object)  # SearchResult from local history
     refresh_requested = pyqtSignal()
 
-    def __init__(self, api_client, parent=None):
+    def __init__(self, api_client, local_storage=None, parent=None):
         super().__init__(parent)
         self.api = api_client
+        self.local_storage = local_storage
         self._applications: List[Dict] = []
         self.setup_ui()
 
@@ -207,6 +211,24 @@ class JobTrackerView(QWidget):
                 border-radius: 8px;
                 padding: 12px;
             }
+            QLineEdit {
+                background-color: #2d2d2d;
+                color: #ffffff;
+                border: 1px solid #4a4a4a;
+                border-radius: 6px;
+                padding: 8px;
+            }
+            QLineEdit:focus {
+                border-color: #fbbf24;
+            }
+            QListWidget {
+                background-color: #2d2d2d;
+                border: none;
+                border-radius: 8px;
+            }
+            QListWidget::item:hover {
+                background-color: #3d3d3d;
+            }
         """)
 
         layout = QVBoxLayout(self)
@@ -260,6 +282,17 @@ class JobTrackerView(QWidget):
 
         layout.addWidget(self.stats_frame)
 
+        # Search: filters the table and finds interviews in the local
+        # meeting history, without a round trip to the server
+        self.search_box = LocalSearchBox(
+            storage=self.local_storage,
+            placeholder="Search applications and interview history...",
+        )
+        self.search_box.results_list.setMaximumHeight(220)
+        self.search_box.query_changed.connect(self._apply_filter)
+        self.search_box.result_activated.connect(self.history_result_selected.emit)
+        layout.addWidget(self.search_box)
+
         # Applications table
         self.table = QTableWidget()
         self.table.setColumnCount(5)
@@ -329,8 +362,18 @@ class JobTrackerView(QWidget):
                     pass
             self.table.setItem(row, 4, QTableWidgetItem(updated))
 
+        self._apply_filter(self.search_box.query())
         self._update_stats()
 
+    def _apply_filter(self, query: str):
+        """Hide applications that do not contain every word of the query."""
+        terms = query.lower().split()
+        for row, app in enumerate(self._applications):
+            haystack = " ".join(
+                str(app.get(key) or "") for key in ("company", "position", "status", "notes")
+            ).lower().replace("_", " ")
+            self.table.setRowHidden(row, not all(term in haystack for term in terms))
+
     def _style_status_item(self, item: QTableWidgetItem, status: str):
         """Style a status table item based on status."""
         colors = {
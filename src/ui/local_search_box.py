@@ -0,0 +1,178 @@
+"""Search box over the local meeting history.
+
+Queries the offline full-text index as the user types (debounced), so it
+works without a network connection and answers in milliseconds. Shared by
+the transcript editor and the job tracker views.
+"""
+
+import html
+import time
+from typing import List, Optional, Sequence
+
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QLineEdit, QLabel, QListWidget, QListWidgetItem
+)
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+
+from src.logger import get_logger
+
+logger = get_logger("local_search")
+
+KIND_LABELS = {
+    "meeting": "Meeting",
+    "transcript": "Transcript",
+    "conversation": "Q&A",
+}
+
+
+class LocalSearchBox(QWidget):
+    """Search field with a ranked list of local results below it."""
+
+    query_changed = pyqtSignal(str)          # Debounced, stripped query
+    result_activated = pyqtSignal(object)    # SearchResult
+
+    DEBOUNCE_MS = 150
+    MAX_RESULTS = 50
+
+    def __init__(
+        self,
+        storage=None,
+        kinds: Optional[Sequence[str]] = None,
+        placeholder: str = "Search local history...",
+        highlight_color: str = "#fbbf24",
+        parent=None
+    ):
+        """
+        Args:
+            storage: Object with a search() method (default: offline storage)
+            kinds: Result kinds to search (default: all)
+            placeholder: Placeholder text of the search field
+            highlight_color: Color of the matched words in snippets
+        """
+        super().__init__(parent)
+        self._storage = storage
+        self._kinds = kinds
+        self._highlight_color = highlight_color
+        self._meeting_local_id: Optional[str] = None
+        self._results = []
+
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(self.DEBOUNCE_MS)
+        self._debounce.timeout.connect(self._run_search)
+
+        self._setup_ui(placeholder)
+
+    def _setup_ui(self, placeholder: str):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(4)
+
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText(placeholder)
+        self.search_input.setClearButtonEnabled(True)
+        self.search_input.textChanged.connect(lambda _: self._debounce.start())
+        self.search_input.returnPressed.connect(self._run_search)
+        layout.addWidget(self.search_input)
+
+        self.status_label = QLabel()
+        self.status_label.setStyleSheet("color: #6c7086; font-size: 10px;")
+        self.status_label.hide()
+        layout.addWidget(self.status_label)
+
+        self.results_list = QListWidget()
+        self.results_list.setWordWrap(True)
+        self.results_list.itemClicked.connect(self._on_item_activated)
+        self.results_list.hide()
+        layout.addWidget(self.results_list, 1)
+
+    # ==================== Public API ====================
+
+    def query(self) -> str:
+        """The current search text."""
+        return self.search_input.text().strip()
+
+    def set_scope(self, meeting_local_id: Optional[str]):
+        """Search within one meeting, or all history when None."""
+        self._meeting_local_id = meeting_local_id
+        if self.query():
+            self._run_search()
+
+    def clear(self):
+        """Clear the query and hide the results."""
+        self.search_input.clear()
+
+    def storage(self):
+        """The storage searched, opened on first use."""
+        if self._storage is None:
+            from services.offline_storage import get_offline_storage
+            self._storage = get_offline_storage()
+        return self._storage
+
+    # ==================== Searching ====================
+
+    def _run_search(self):
+        self._debounce.stop()
+        query = self.query()
+        self.query_changed.emit(query)
+
+        if not query:
+            self._show_results([], None)
+            return
+
+        started = time.perf_counter()
+        try:
+            results = self.storage().search(
+                query,
+                limit=self.MAX_RESULTS,
+                kinds=self._kinds,
+                meeting_local_id=self._meeting_local_id,
+            )
+        except Exception as e:
+            logger.error(f"Local search failed: {e}")
+            results = []
+        self._show_results(results, time.perf_counter() - started)
+
+    def _show_results(self, results: List, seconds: Optional[float]):
+        self._results = results
+        self.results_list.clear()
+
+        if seconds is None:
+            self.results_list.hide()
+            self.status_label.hide()
+            return
+
+        count = len(results)
+        self.status_label.setText(
+            f"{count} result{'s' if count != 1 else ''} in {seconds * 1000:.0f} ms"
+        )
+        self.status_label.show()
+        self.results_list.setVisible(count > 0)
+
+        for result in results:
+            item = QListWidgetItem()
+            item.setData(Qt.ItemDataRole.UserRole, result)
+            label = QLabel(self._result_html(result))
+            label.setWordWrap(True)
+            label.setTextFormat(Qt.TextFormat.RichText)
+            label.setContentsMargins(6, 4, 6, 4)
+            label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+            self.results_list.addItem(item)
+            self.results_list.setItemWidget(item, label)
+            item.setSizeHint(label.sizeHint())
+
+    def _result_html(self, result) -> str:
+        kind = KIND_LABELS.get(result.kind, result.kind.title())
+        context = result.meeting_title if result.kind != "meeting" else None
+        when = (result.timestamp or "")[:10]
+        header = " · ".join(part for part in (kind, context, when) if part)
+        return (
+            f'<span style="color: #6c7086; font-size: 10px;">{html.escape(header)}</span><br>'
+            f'{result.snippet_html(self._highlight_color)}'
+        )
+
+    def _on_item_activated(self, item: QListWidgetItem):
+        result = item.data(Qt.ItemDataRole.UserRole)
+        if result is not None:
+            self.result_activated.emit(result)
+
@@ -9,12 +9,13 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QFrame, QApplication, QSizeGrip,
-    QScrollArea, QMenu
+    QMenu
 )
 from PyQt6.QtCore import Qt, QPoint, pyqtSignal, QTimer
 from PyQt6.QtGui import QFont, QClipboard, QCursor, QAction
 
 from config import OVERLAY_WIDTH, OVERLAY_HEIGHT, OVERLAY_OPACITY, IS_WINDOWS
+from ui.streaming_text_view import StreamingTextView
 
 # Import theme support
 try:
@@ -39,6 +40,7 @@ class OverlayWindow(QWidget):
     update_heard_signal = pyqtSignal(str)
     update_response_signal = pyqtSignal(str)
     append_response_signal = pyqtSignal(str)
+    response_placeholder_signal = pyqtSignal(str)  # Status text replaced by the first streamed chunk
     update_speaker_signal = pyqtSignal(str, str)  # speaker_id, speaker_name
     update_translation_signal = pyqtSignal(str, str, bool)  # original, translated, show_original
     export_requested = pyqtSignal()
@@ -52,6 +54,7 @@ class OverlayWindow(QWidget):
         super().__init__()
         self._drag_position: QPoint = QPoint()
         self._current_response = ""
+        self._response_is_placeholder = True
         self._current_heard = ""
         self._current_speaker_id = ""
         self._current_speaker_name = ""
@@ -277,33 +280,10 @@ class OverlayWindow(QWidget):
         response_header.setStyleSheet("color: #a6e3a1; font-size: 10px; font-weight: bold; letter-spacing: 1px;")
         container_layout.addWidget(response_header)
 
-        # Scrollable response area for longer answers
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background: transparent;
-            }
-            QScrollBar:vertical {
-                background: #313244;
-                width: 8px;
-                border-radius: 4px;
-            }
-            QScrollBar::handle:vertical {
-                background: #585b70;
-                border-radius: 4px;
-                min-height: 20px;
-            }
-        """)
-
-        self.response_label = QLabel("Waiting for question...")
-        self.response_label.setWordWrap(True)
-        self.response_label.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
+        # Response area; streamed answers are repainted at most once per frame
+        self.response_view = StreamingTextView("Waiting for question...")
         self._apply_response_style(large=False)
-
-        scroll_area.setWidget(self.response_label)
-        container_layout.addWidget(scroll_area, 1)
+        container_layout.addWidget(self.response_view, 1)
 
         # Feature tip banner (dismissible) - shown when speaker diarization not installed
         self.feature_tip_container = QWidget()
@@ -377,33 +357,29 @@ class OverlayWindow(QWidget):
         self._position_window()
 
     def _apply_response_style(self, large: bool):
-        """Apply styling to response label based on size mode."""
-        if large:
-            self.response_label.setStyleSheet("""
-                QLabel {
-                    color: #a6e3a1;
-                    font-size: 18px;
-                    font-weight: 500;
-                    line-height: 1.5;
-                    background-color: #313244;
-                    padding: 12px 14px;
-                    border-radius: 8px;
-                    border-left: 3px solid #a6e3a1;
-                }
-            """)
-        else:
-            self.response_label.setStyleSheet("""
-                QLabel {
-                    color: #a6e3a1;
-                    font-size: 14px;
-                    font-weight: 500;
-                    line-height: 1.4;
-                    background-color: #313244;
-                    padding: 10px 12px;
-                    border-radius: 8px;
-                    border-left: 3px solid #a6e3a1;
-                }
-            """)
+        """Apply styling to the response view based on size mode."""
+        font_size, padding = (18, "12px 14px") if large else (14, "10px 12px")
+        self.response_view.setStyleSheet(f"""
+            QPlainTextEdit {{
+                color: #a6e3a1;
+                font-size: {font_size}px;
+                font-weight: 500;
+                background-color: #313244;
+                padding: {padding};
+                border-radius: 8px;
+                border-left: 3px solid #a6e3a1;
+            }}
+            QScrollBar:vertical {{
+                background: #313244;
+                width: 8px;
+                border-radius: 4px;
+            }}
+            QScrollBar::handle:vertical {{
+                background: #585b70;
+                border-radius: 4px;
+                min-height: 20px;
+            }}
+        """)
 
     def _toggle_size(self):
         """Toggle between normal and large text mode."""
@@ -467,6 +443,7 @@ class OverlayWindow(QWidget):
         self.update_heard_signal.connect(self._update_heard)
         self.update_response_signal.connect(self._update_response)
         self.append_response_signal.connect(self._append_response)
+        self.response_placeholder_signal.connect(self._show_response_placeholder)
         self.update_speaker_signal.connect(self._update_speaker)
         self.update_translation_signal.connect(self._update_translation)
 
@@ -561,14 +538,25 @@ class OverlayWindow(QWidget):
         self.update_translation_signal.emit(original, translated, show_original)
 
     def _update_response(self, text: str):
-        """Update the response label (full replacement)."""
+        """Update the response view (full replacement)."""
         self._current_response = text
-        self.response_label.setText(text)
+        self._response_is_placeholder = False
+        self.response_view.setText(text)
+
+    def _show_response_placeholder(self, text: str):
+        """Show status text ("Thinking...") in place of a response."""
+        self._current_response = ""
+        self._response_is_placeholder = True
+        self.response_view.setText(text)
 
     def _append_response(self, text: str):
-        """Append to response (for streaming)."""
+        """Append to response (for streaming); rendered on the next frame."""
+        if self._response_is_placeholder:
+            # The first chunk replaces the placeholder
+            self._update_response(text)
+            return
         self._current_response += text
-        self.response_label.setText(self._current_response)
+        self.response_view.append_text(text)
 
     def set_heard_text(self, text: str, speaker_id: str = "", speaker_name: str = ""):
         """Thread-safe method to update heard text with optional speaker info.
@@ -579,17 +567,24 @@ class OverlayWindow(QWidget):
             speaker_name: Custom display name for the speaker.
         """
         self.update_heard_signal.emit(text)
-        self._current_response = ""
-        self.update_response_signal.emit("Thinking...")
+        self.response_placeholder_signal.emit("Thinking...")
 
         # Update speaker info if provided
         if speaker_id:
             self.update_speaker_signal.emit(speaker_id, speaker_name or speaker_id)
 
+    def set_partial_heard_text(self, text: str):
+        """Thread-safe method to show heard text that is still being spoken."""
+        self.update_heard_signal.emit(text)
+
     def set_response_text(self, text: str):
         """Thread-safe method to set response text."""
         self.update_response_signal.emit(text)
 
+    def set_response_placeholder(self, text: str = "Thinking..."):
+        """Thread-safe method to show status text until the response streams in."""
+        self.response_placeholder_signal.emit(text)
+
     def append_response_text(self, text: str):
         """Thread-safe method to append to response (streaming)."""
         self.append_response_signal.emit(text)
@@ -632,8 +627,7 @@ class OverlayWindow(QWidget):
     def reset(self):
         """Reset to initial state."""
         self.update_heard_signal.emit("Listening...")
-        self.update_response_signal.emit("Waiting for question...")
-        self._current_response = ""
+        self.response_placeholder_signal.emit("Waiting for question...")
         self._current_speaker_id = ""
         self._current_speaker_name = ""
         self._current_translation = ""
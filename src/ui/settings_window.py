@@ -14,7 +14,7 @@ from PyQt6.QtWidgets import (
     QLabel, QComboBox, QSlider, QPushButton, QLineEdit,
     QTextEdit, QSpinBox, QCheckBox, QGroupBox, QFormLayout,
     QMessageBox, QFileDialog, QListWidget, QListWidgetItem,
-    QInputDialog, QFrame, QScrollArea, QSizePolicy
+    QInputDialog, QFrame, QScrollArea, QSizePolicy, QApplication
 )
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QKeySequence, QFont
@@ -82,11 +82,19 @@ class SettingsWindow(QDialog):
     shortcuts_changed = pyqtSignal(dict)
     # Signal emitted when specific settings change
     setting_changed = pyqtSignal(str, object)  # key, value
+    # Voice command test decoded off the UI thread: result dict or exception
+    voice_test_decoded = pyqtSignal(object)
+
+    # Minimum seconds recorded by the voice command test; rounded up to
+    # whole capture chunks
+    VOICE_TEST_SECONDS = 5.0
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.settings = SettingsManager()
         self._original_theme = self.settings.get("theme", "dark_gold")
+        self._voice_test_seconds = self.VOICE_TEST_SECONDS
+        self.voice_test_decoded.connect(self._show_voice_test_result)
         self.init_ui()
         self.load_settings()
 
@@ -786,8 +794,8 @@ class SettingsWindow(QDialog):
         # Availability warning
         if not voice_commands_available:
             warning_label = QLabel(
-                "Voice commands are not available. Please install speech_recognition:\n"
-                "pip install SpeechRecognition pyaudio"
+                "Voice commands are not available. Please install faster-whisper:\n"
+                "pip install faster-whisper"
             )
             warning_label.setWordWrap(True)
             warning_label.setStyleSheet("color: #f9e2af; font-size: 11px; margin-bottom: 10px;")
@@ -814,17 +822,15 @@ class SettingsWindow(QDialog):
         wake_words_label.setStyleSheet("color: #aaaaaa; font-size: 11px;")
         wake_word_layout.addRow("", wake_words_label)
 
-        # Microphone selection for voice commands
-        self.voice_cmd_device_combo = QComboBox()
-        self.voice_cmd_device_combo.setEnabled(voice_commands_available)
-        self._refresh_voice_command_devices()
-        wake_word_layout.addRow("Microphone:", self.voice_cmd_device_combo)
-
-        # Refresh button
-        refresh_voice_btn = QPushButton("Refresh Devices")
-        refresh_voice_btn.setEnabled(voice_commands_available)
-        refresh_voice_btn.clicked.connect(self._refresh_voice_command_devices)
-        wake_word_layout.addRow("", refresh_voice_btn)
+        # Commands are heard on the audio capture stream, not a separate microphone
+        device_note = QLabel(
+            "Voice commands listen on the audio device selected in the Audio tab, "
+            "while ReadIn AI is listening. They need microphone capture; system "
+            "audio (loopback) capture only hears the other participants."
+        )
+        device_note.setWordWrap(True)
+        device_note.setStyleSheet("color: #aaaaaa; font-size: 11px;")
+        wake_word_layout.addRow("Audio:", device_note)
 
         layout.addWidget(wake_word_group)
 
@@ -839,7 +845,6 @@ class SettingsWindow(QDialog):
             "  - 'Action items' / 'Tasks' - List action items from the meeting\n"
             "  - 'What did they say' - Repeat the last transcription\n"
             "  - 'Stop listening' / 'Pause' - Stop audio capture\n"
-            "  - 'Start listening' / 'Resume' - Start audio capture\n"
             "  - 'Clear' / 'Reset' - Clear conversation context"
         )
         commands_text.setWordWrap(True)
@@ -865,7 +870,7 @@ class SettingsWindow(QDialog):
         # Test voice commands button
         test_layout = QHBoxLayout()
         self.voice_cmd_test_btn = QPushButton("Test Voice Commands")
-        self.voice_cmd_test_btn.setToolTip("Test if your microphone can hear voice commands")
+        self.voice_cmd_test_btn.setToolTip("Test if your audio device can hear voice commands")
         self.voice_cmd_test_btn.setEnabled(voice_commands_available)
         self.voice_cmd_test_btn.clicked.connect(self._test_voice_commands)
         test_layout.addWidget(self.voice_cmd_test_btn)
@@ -880,7 +885,7 @@ class SettingsWindow(QDialog):
             "- Wait for a brief pause after the wake word\n"
             "- Use a headset microphone for best results\n"
             "- Voice commands work alongside keyboard shortcuts\n"
-            "- Commands are processed using Google's speech recognition"
+            "- Commands are recognized on this computer; no audio is sent online"
         )
         tips_text.setWordWrap(True)
         tips_text.setStyleSheet("color: #aaaaaa; font-size: 11px;")
@@ -891,109 +896,87 @@ class SettingsWindow(QDialog):
 
         return widget
 
-    def _refresh_voice_command_devices(self):
-        """Refresh the list of microphone devices for voice commands."""
-        self.voice_cmd_device_combo.clear()
-        self.voice_cmd_device_combo.addItem("Default Microphone", None)
-
-        try:
-            from voice_commands import VoiceCommandHandler
-            devices = VoiceCommandHandler.list_microphones()
-            for device in devices:
-                self.voice_cmd_device_combo.addItem(
-                    device.get('name', f"Device {device['index']}"),
-                    device['index']
-                )
-        except ImportError:
-            pass
-        except Exception as e:
-            import logging
-            logging.warning(f"Failed to list voice command devices: {e}")
-
     def _test_voice_commands(self):
-        """Test voice command recognition."""
+        """Test voice command recognition on the capture device."""
         try:
-            from voice_commands import is_voice_commands_available, VoiceCommandHandler
+            import math
+            import threading
+            import time
+            import numpy as np
+            from voice_commands import capture_hears_user, is_voice_commands_available
 
             if not is_voice_commands_available():
                 QMessageBox.warning(
                     self,
                     "Voice Commands Unavailable",
                     "Voice commands are not available.\n"
-                    "Please install speech_recognition: pip install SpeechRecognition pyaudio"
+                    "Please install faster-whisper: pip install faster-whisper"
                 )
                 return
 
-            # Get selected device
-            device_index = self.voice_cmd_device_combo.currentData()
+            # Record the way the app captures meeting audio, so the test hears
+            # what the commands would. Capture only hands over whole chunks,
+            # so listen for a whole number of them
+            chunks = []
+            device_index = self.settings.get("audio_device", -1)
+            try:
+                from src.audio_capture_enhanced import EnhancedAudioCapture, CaptureMode
+                capture = EnhancedAudioCapture(
+                    on_audio_chunk=chunks.append,
+                    device_index=device_index if device_index >= 0 else None,
+                    capture_mode=CaptureMode.SYSTEM_LOOPBACK,
+                )
+            except ImportError:
+                capture = AudioCapture(
+                    on_audio_chunk=chunks.append,
+                    device_index=device_index if device_index >= 0 else None,
+                )
+
+            if not capture_hears_user(capture):
+                QMessageBox.warning(
+                    self,
+                    "Voice Commands Unavailable",
+                    "Audio is captured from system audio (loopback), which hears the\n"
+                    "other participants but not your microphone, so voice commands\n"
+                    "cannot be recognized."
+                )
+                return
+            chunk_count = math.ceil(self.VOICE_TEST_SECONDS / capture.chunk_duration)
+            self._voice_test_seconds = chunk_count * capture.chunk_duration
 
             # Show listening dialog
             QMessageBox.information(
                 self,
                 "Voice Test",
-                "After clicking OK, speak into your microphone.\n"
+                "After clicking OK, speak so that your audio device hears you.\n"
                 "Say 'Hey ReadIn' followed by a command like 'summarize'.\n\n"
-                "The test will listen for 5 seconds."
+                f"The test will listen for {self._voice_test_seconds:.0f} seconds."
             )
 
-            # Create a simple test
-            import speech_recognition as sr
-            recognizer = sr.Recognizer()
-
+            QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
             try:
-                with sr.Microphone(device_index=device_index) as source:
-                    recognizer.adjust_for_ambient_noise(source, duration=0.5)
-                    audio = recognizer.listen(source, timeout=5.0, phrase_time_limit=5.0)
-                    text = recognizer.recognize_google(audio)
-
-                    # Check if wake word was detected
-                    text_lower = text.lower()
-                    wake_words = ["hey readin", "hey read in", "readin", "read in", "ok readin", "hi readin"]
-                    wake_word_found = any(w in text_lower for w in wake_words)
-
-                    if wake_word_found:
-                        QMessageBox.information(
-                            self,
-                            "Voice Test Successful",
-                            f"Heard: '{text}'\n\n"
-                            "Wake word detected! Voice commands are working correctly."
-                        )
-                    else:
-                        QMessageBox.information(
-                            self,
-                            "Voice Test Result",
-                            f"Heard: '{text}'\n\n"
-                            "No wake word detected. Try saying 'Hey ReadIn' clearly."
-                        )
-
-            except sr.WaitTimeoutError:
-                QMessageBox.warning(
-                    self,
-                    "Voice Test",
-                    "No speech detected within 5 seconds.\n"
-                    "Please ensure your microphone is working and speak clearly."
-                )
-            except sr.UnknownValueError:
-                QMessageBox.warning(
-                    self,
-                    "Voice Test",
-                    "Could not understand the audio.\n"
-                    "Please speak more clearly and reduce background noise."
-                )
-            except sr.RequestError as e:
-                QMessageBox.warning(
-                    self,
-                    "Voice Test Error",
-                    f"Speech recognition service error:\n{e}\n\n"
-                    "Please check your internet connection."
-                )
+                capture.start()
+                # A little slack for the last chunk to come through
+                deadline = time.monotonic() + self._voice_test_seconds + 1.0
+                while len(chunks) < chunk_count and time.monotonic() < deadline:
+                    QApplication.processEvents()
+                    time.sleep(0.05)
+                capture.stop()
+            finally:
+                QApplication.restoreOverrideCursor()
+
+            audio = np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.float32)
+            self.voice_cmd_test_btn.setEnabled(False)
+            self.voice_cmd_test_btn.setText("Recognizing...")
+            # Loading the model and decoding take seconds; keep the UI responsive
+            threading.Thread(target=self._decode_voice_test, args=(audio,), daemon=True).start()
 
         except ImportError:
             QMessageBox.warning(
                 self,
                 "Voice Commands Unavailable",
                 "Voice commands are not available.\n"
-                "Please install speech_recognition: pip install SpeechRecognition pyaudio"
+                "Please install faster-whisper: pip install faster-whisper"
             )
         except Exception as e:
             QMessageBox.warning(
@@ -1002,6 +985,77 @@ class SettingsWindow(QDialog):
                 f"Error testing voice commands: {e}"
             )
 
+    def _decode_voice_test(self, audio):
+        """Decode the recorded test audio; runs on a worker thread."""
+        try:
+            from voice_commands import VoiceCommandHandler
+            from src.keyword_spotter import KeywordSpotter, normalize
+
+            handler = VoiceCommandHandler()
+            lookup = {
+                alias: command
+                for command, aliases in handler.get_supported_commands().items()
+                for alias in aliases
+            }
+            spotter = KeywordSpotter(
+                wake_words=handler.get_wake_words,
+                commands=lambda: lookup,
+                on_wake_word=lambda: None,
+                on_command=lambda command: None,
+            )
+            text = spotter.decode(audio)[0] if audio.size else ""
+            tokens = normalize(text)
+            wake_end = spotter.matcher.find_wake_word(tokens) if text else None
+            command = spotter.matcher.match_command(tokens[wake_end:]) if wake_end is not None else None
+            self.voice_test_decoded.emit({"text": text, "wake_word": wake_end is not None, "command": command})
+        except Exception as e:
+            self.voice_test_decoded.emit(e)
+
+    def _show_voice_test_result(self, result):
+        """Report the voice command test outcome on the UI thread."""
+        self.voice_cmd_test_btn.setText("Test Voice Commands")
+        self.voice_cmd_test_btn.setEnabled(True)
+
+        if isinstance(result, Exception):
+            QMessageBox.warning(
+                self,
+                "Voice Test Error",
+                f"Error testing voice commands: {result}"
+            )
+            return
+
+        text = result["text"]
+        command = result["command"]
+        if not text:
+            QMessageBox.warning(
+                self,
+                "Voice Test",
+                f"No speech detected within {self._voice_test_seconds:.0f} seconds.\n"
+                "Please ensure your audio device is working and speak clearly."
+            )
+        elif command:
+            QMessageBox.information(
+                self,
+                "Voice Test Successful",
+                f"Heard: '{text}'\n\n"
+                f"Recognized the '{command.replace('_', ' ')}' command. "
+                "Voice commands are working correctly."
+            )
+        elif result["wake_word"]:
+            QMessageBox.information(
+                self,
+                "Voice Test Result",
+                f"Heard: '{text}'\n\n"
+                "Wake word detected, but no command followed it."
+            )
+        else:
+            QMessageBox.information(
+                self,
+                "Voice Test Result",
+                f"Heard: '{text}'\n\n"
+                "No wake word detected. Try saying 'Hey ReadIn' clearly."
+            )
+
     def create_voice_feedback_tab(self) -> QWidget:
         """Create the Voice Feedback settings tab."""
         widget = QWidget()
@@ -2244,12 +2298,6 @@ class SettingsWindow(QDialog):
         self.voice_commands_check.setChecked(
             self.settings.get("voice_commands_enabled", False)
         )
-        # Load voice command microphone device
-        voice_cmd_device = self.settings.get("voice_command_device_index")
-        for i in range(self.voice_cmd_device_combo.count()):
-            if self.voice_cmd_device_combo.itemData(i) == voice_cmd_device:
-                self.voice_cmd_device_combo.setCurrentIndex(i)
-                break
         self.voice_cmd_tts_check.setChecked(
             self.settings.get("voice_command_tts_feedback", False)
         )
@@ -2465,12 +2513,6 @@ class SettingsWindow(QDialog):
         if old_voice_commands_enabled != new_voice_commands_enabled:
             self.setting_changed.emit("voice_commands_enabled", new_voice_commands_enabled)
 
-        old_voice_cmd_device = self.settings.get("voice_command_device_index")
-        new_voice_cmd_device = self.voice_cmd_device_combo.currentData()
-        self.settings.set("voice_command_device_index", new_voice_cmd_device)
-        if old_voice_cmd_device != new_voice_cmd_device:
-            self.setting_changed.emit("voice_command_device_index", new_voice_cmd_device)
-
         old_voice_cmd_tts = self.settings.get("voice_command_tts_feedback")
         new_voice_cmd_tts = self.voice_cmd_tts_check.isChecked()
         self.settings.set("voice_command_tts_feedback", new_voice_cmd_tts)
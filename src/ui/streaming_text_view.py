@@ -0,0 +1,87 @@
+"""Read-only text view for streamed AI responses."""
+
+from PyQt6.QtWidgets import QPlainTextEdit, QFrame
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QGuiApplication, QTextCursor
+
+# Repaint interval when the screen does not report a refresh rate (~60 Hz)
+DEFAULT_FRAME_MS = 16
+
+
+class StreamingTextView(QPlainTextEdit):
+    """Text view that renders streamed text at most once per display frame.
+
+    Deltas arriving between frames are buffered and appended to the end of
+    the document in one edit, so only the last paragraph is laid out again.
+    A QLabel re-lays out its whole text on every setText, which makes a
+    streamed response quadratic in its length.
+    """
+
+    def __init__(self, text: str = "", parent=None):
+        super().__init__(parent)
+        self.setReadOnly(True)
+        self.setFrameShape(QFrame.Shape.NoFrame)
+        self.setLineWrapMode(QPlainTextEdit.LineWrapMode.WidgetWidth)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        self.setUndoRedoEnabled(False)
+
+        self._pending = []
+        self.flushes = 0  # Document edits made by streaming, for benchmarks
+
+        self._frame_timer = QTimer(self)
+        self._frame_timer.setSingleShot(True)
+        self._frame_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._frame_timer.setInterval(self._frame_interval_ms())
+        self._frame_timer.timeout.connect(self.flush)
+
+        if text:
+            self.setPlainText(text)
+
+    @staticmethod
+    def _frame_interval_ms() -> int:
+        """Milliseconds per frame of the primary screen."""
+        screen = QGuiApplication.primaryScreen()
+        rate = screen.refreshRate() if screen else 0
+        if rate and rate > 0:
+            return max(1, int(1000 / rate))
+        return DEFAULT_FRAME_MS
+
+    def setText(self, text: str):
+        """Replace the whole text, dropping any buffered deltas."""
+        self._pending.clear()
+        self._frame_timer.stop()
+        self.setPlainText(text)
+
+    def text(self) -> str:
+        """Full text, including deltas not yet rendered."""
+        return self.toPlainText() + "".join(self._pending)
+
+    def append_text(self, text: str):
+        """Queue a streamed delta; it is rendered on the next frame."""
+        if not text:
+            return
+        self._pending.append(text)
+        if not self._frame_timer.isActive():
+            self._frame_timer.start()
+
+    def flush(self):
+        """Append buffered deltas to the document now."""
+        self._frame_timer.stop()
+        if not self._pending:
+            return
+
+        chunk = "".join(self._pending)
+        self._pending.clear()
+
+        # Follow the end of the answer unless the user scrolled up to read
+        scroll_bar = self.verticalScrollBar()
+        follow = scroll_bar.value() >= scroll_bar.maximum() - 2
+
+        cursor = QTextCursor(self.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(chunk)
+        self.flushes += 1
+
+        if follow:
+            scroll_bar.setValue(scroll_bar.maximum())
@@ -17,6 +17,8 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime
 import logging
 
+from src.ui.local_search_box import LocalSearchBox
+
 logger = logging.getLogger(__name__)
 
 
@@ -159,16 +161,19 @@ class TranscriptEditorDialog(QDialog):
         meeting_id: int,
         meeting_title: Optional[str] = None,
         api_client=None,
+        local_storage=None,
         parent=None
     ):
         super().__init__(parent)
         self.meeting_id = meeting_id
         self.meeting_title = meeting_title or f"Meeting {meeting_id}"
         self.api_client = api_client
+        self.local_storage = local_storage
         self.transcripts: List[Dict[str, Any]] = []
         self.transcript_items: Dict[int, TranscriptItem] = {}
         self.current_editing_id: Optional[int] = None
         self._setup_ui()
+        self._scope_search_to_meeting()
         self._load_transcripts()
 
     def _setup_ui(self):
@@ -215,6 +220,24 @@ class TranscriptEditorDialog(QDialog):
             QTextEdit:focus {
                 border-color: #89b4fa;
             }
+            QLineEdit {
+                background-color: #313244;
+                border: 1px solid #45475a;
+                border-radius: 6px;
+                padding: 6px 8px;
+                color: #cdd6f4;
+            }
+            QLineEdit:focus {
+                border-color: #89b4fa;
+            }
+            QListWidget {
+                background-color: #1e1e2e;
+                border: 1px solid #45475a;
+                border-radius: 6px;
+            }
+            QListWidget::item:hover {
+                background-color: #313244;
+            }
         """)
 
         layout = QVBoxLayout(self)
@@ -267,6 +290,17 @@ class TranscriptEditorDialog(QDialog):
         list_header.setStyleSheet("font-weight: bold; color: #a6adc8; font-size: 12px;")
         left_layout.addWidget(list_header)
 
+        # Local full-text search; results replace the list while searching
+        self.search_box = LocalSearchBox(
+            storage=self.local_storage,
+            kinds=("transcript", "conversation"),
+            placeholder="Search transcripts (works offline)...",
+            highlight_color="#f9e2af",
+        )
+        self.search_box.query_changed.connect(self._on_search_query_changed)
+        self.search_box.result_activated.connect(self._on_search_result)
+        left_layout.addWidget(self.search_box)
+
         # Scroll area for transcript items
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
@@ -393,6 +427,45 @@ class TranscriptEditorDialog(QDialog):
 
         layout.addLayout(bottom_layout)
 
+    def _scope_search_to_meeting(self):
+        """Limit search to this meeting if it is in offline storage."""
+        try:
+            storage = self.search_box.storage()
+            local_id = storage.get_local_id_for_remote("meeting", self.meeting_id)
+        except Exception as e:
+            logger.debug(f"Offline storage unavailable for search: {e}")
+            return
+        # Meetings never stored locally are searched across all history
+        self.search_box.set_scope(local_id)
+
+    def _on_search_query_changed(self, query: str):
+        """Show search results instead of the transcript list while searching."""
+        self.scroll_area.setVisible(not query)
+
+    def _on_search_result(self, result):
+        """Jump to the transcript entry of a search result."""
+        for transcript in self.transcripts:
+            texts = (
+                transcript.get("heard_text"),
+                transcript.get("edited_text"),
+                transcript.get("original_text"),
+            )
+            if result.text in texts:
+                self.search_box.clear()
+                self.scroll_area.show()
+                transcript_id = transcript.get("id")
+                item = self.transcript_items.get(transcript_id)
+                if item is not None:
+                    self.scroll_area.ensureWidgetVisible(item)
+                    self._on_edit_requested(transcript_id, item.current_text)
+                return
+
+        # Not among the loaded transcripts (offline, or another meeting): show it read-only
+        self.current_editing_id = None
+        self.editor.setPlainText(result.text)
+        self.save_btn.setEnabled(False)
+        self.revert_btn.setEnabled(False)
+
     def _load_transcripts(self):
         """Load transcripts from the API."""
         self.loading_label.show()
@@ -552,6 +625,7 @@ class TranscriptEditorDialog(QDialog):
         meeting_id: int,
         meeting_title: Optional[str] = None,
         api_client=None,
+        local_storage=None,
         parent=None
     ) -> bool:
         """
@@ -561,6 +635,7 @@ class TranscriptEditorDialog(QDialog):
             meeting_id: ID of the meeting whose transcripts to edit.
             meeting_title: Title of the meeting for display.
             api_client: API client instance for making requests.
+            local_storage: Offline storage to search (default: the global one).
             parent: Parent widget.
 
         Returns:
@@ -570,6 +645,7 @@ class TranscriptEditorDialog(QDialog):
             meeting_id=meeting_id,
             meeting_title=meeting_title,
             api_client=api_client,
+            local_storage=local_storage,
             parent=parent
         )
 
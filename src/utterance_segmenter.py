@@ -0,0 +1,153 @@
+"""Merges transcript chunks into conversational turns before answering them."""
+
+import re
+import threading
+from typing import Callable, List, Optional, Tuple
+
+from src.logger import get_logger
+
+logger = get_logger("utterance_segmenter")
+
+
+# Close a turn after this many chunks without a pause (~3s of audio each)
+MAX_TURN_CHUNKS = 6
+
+# Sentence openings that make a statement-shaped sentence a question or prompt
+QUESTION_STARTERS = (
+    "what", "what's", "how", "how's", "why", "when", "where", "who", "whose",
+    "which", "can", "could", "would", "will", "should", "shall", "do", "does",
+    "did", "is", "are", "was", "were", "have", "has", "tell me", "walk me",
+    "walk us", "describe", "explain", "talk about", "give me", "share",
+)
+
+_SENTENCE_END = re.compile(r"[.!?]+[\"')\]]*\s*$")
+_LAST_SENTENCE = re.compile(r"(?:^|[.!?]\s+)([^.!?]+[.!?]*)\s*$")
+_QUESTION_START = re.compile(
+    # Spoken fillers ("So, tell me...", "Okay and what...") don't count
+    r"(?:(?:so|and|but|okay|ok|well|now|alright|right|um|uh)\b[,\s]*)*"
+    r"(?:%s)\b" % "|".join(re.escape(starter) for starter in QUESTION_STARTERS)
+)
+
+
+def looks_like_question(text: str) -> bool:
+    """Whether a turn reads as a finished question or prompt.
+
+    True when it ends with a question mark, or when its last sentence is
+    finished and opens like a question ("Tell me about your last role.").
+    """
+    text = text.strip()
+    if not text:
+        return False
+    if text.endswith("?"):
+        return True
+    if not _SENTENCE_END.search(text):
+        return False
+
+    match = _LAST_SENTENCE.search(text)
+    sentence = (match.group(1) if match else text).strip().lower()
+    return _QUESTION_START.match(sentence) is not None
+
+
+class UtteranceSegmenter:
+    """Groups transcript chunks into turns and decides when to answer.
+
+    The transcriber delivers text a few seconds at a time, so a question is
+    often split across chunks. Chunks are merged into the current turn until
+    the transcriber reports silence, the speaker changes or the turn gets
+    too long; the turn is then handed to on_turn once. A turn that already
+    reads as a complete question is handed over straight away, and handed
+    over again, in full, if it keeps growing. The receiver is expected to
+    replace the answer it started rather than start a second one.
+    """
+
+    def __init__(
+        self,
+        on_turn: Callable[[str, str, str], None],
+        max_turn_chunks: int = MAX_TURN_CHUNKS
+    ):
+        """Initialize the segmenter.
+
+        Args:
+            on_turn: Callback with (text, speaker_id, speaker_name) whenever a
+                turn should be answered, possibly again for a grown turn
+            max_turn_chunks: Chunks after which a turn is closed even
+                without a pause
+        """
+        self.on_turn = on_turn
+        self._max_turn_chunks = max(1, max_turn_chunks)
+        self._lock = threading.Lock()
+        self._parts: List[str] = []
+        self._speaker_id = ""
+        self._speaker_name = ""
+        # Number of parts the last on_turn call covered
+        self._answered_parts = 0
+
+    def add_text(self, text: str, speaker_id: str = "", speaker_name: str = "") -> str:
+        """Add a transcribed chunk.
+
+        Args:
+            text: Transcribed text
+            speaker_id: Speaker identifier from diarization, if any
+            speaker_name: Display name for the speaker
+
+        Returns:
+            The current turn's text including this chunk
+        """
+        text = text.strip()
+        if not text:
+            return self.current_text()
+
+        pending = []
+        with self._lock:
+            if self._parts and speaker_id != self._speaker_id:
+                pending.append(self._close())
+
+            self._parts.append(text)
+            self._speaker_id = speaker_id
+            self._speaker_name = speaker_name
+            turn = " ".join(self._parts)
+
+            if len(self._parts) >= self._max_turn_chunks:
+                pending.append(self._close())
+            elif self._answered_parts or looks_like_question(turn):
+                # Answer a finished question now; re-answer a turn that grew
+                self._answered_parts = len(self._parts)
+                pending.append((turn, speaker_id, speaker_name))
+
+        self._emit(pending)
+        return turn
+
+    def add_silence(self):
+        """The transcriber heard no speech: the current turn is over."""
+        with self._lock:
+            pending = [self._close()]
+        self._emit(pending)
+
+    def current_text(self) -> str:
+        """Text of the turn being collected."""
+        with self._lock:
+            return " ".join(self._parts)
+
+    def reset(self):
+        """Drop the current turn without answering it."""
+        with self._lock:
+            self._parts = []
+            self._answered_parts = 0
+
+    def _close(self) -> Optional[Tuple[str, str, str]]:
+        """End the current turn; returns it if it still needs an answer."""
+        turn = None
+        if self._parts and self._answered_parts < len(self._parts):
+            turn = (" ".join(self._parts), self._speaker_id, self._speaker_name)
+        self._parts = []
+        self._answered_parts = 0
+        return turn
+
+    def _emit(self, pending: List[Optional[Tuple[str, str, str]]]):
+        for turn in pending:
+            if turn is None:
+                continue
+            try:
+                self.on_turn(*turn)
+            except Exception as e:
+                logger.error(f"Turn callback error: {e}")
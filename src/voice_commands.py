@@ -1,22 +1,19 @@
 """Voice command handler for ReadIn AI.
 
 Provides wake word detection and voice command execution for hands-free control.
-Uses speech_recognition library for command detection.
+Commands are spotted offline on the main audio capture stream (see
+keyword_spotter); no second microphone and no network recognizer. That
+stream must record the microphone: a loopback-only capture hears the other
+participants, not the user (see capture_hears_user).
 """
 
 import threading
-import queue
-import time
-from typing import Callable, Dict, Optional, List, Any
+from typing import Callable, Dict, Optional, List
 from enum import Enum
 
-try:
-    import speech_recognition as sr
-    SPEECH_RECOGNITION_AVAILABLE = True
-except ImportError:
-    SPEECH_RECOGNITION_AVAILABLE = False
-    sr = None
+import numpy as np
 
+from src.keyword_spotter import KeywordSpotter, is_keyword_spotting_available
 from src.logger import get_logger
 
 logger = get_logger("voice_commands")
@@ -39,12 +36,13 @@ class VoiceCommandHandler:
     - summarize: Summarize recent conversation
     - repeat: Repeat the last AI response
     - action items: List recent action items
-    - stop listening / stop: Toggle audio capture off
-    - start listening / start: Toggle audio capture on
+    - stop listening / stop: Turn audio capture off
     - clear: Clear conversation context
 
-    The handler runs in a background thread and is designed to work
-    alongside the main audio capture without interference.
+    The handler listens on the main audio capture stream: pass it the
+    capture chunks with feed_audio(). Only confirmed commands are acted on.
+    Once capture is stopped nothing is heard, so there is no voice command
+    to start it again; use the tray or the hotkey.
     """
 
     # Wake word variants (case-insensitive matching)
@@ -64,12 +62,10 @@ class VoiceCommandHandler:
         "repeat": ["repeat", "say again", "what was that", "repeat that", "again"],
         "action_items": ["action items", "action item", "actions", "to do", "todo", "to-do", "tasks"],
         "stop": ["stop listening", "stop", "pause", "mute", "stop listening please"],
-        "start": ["start listening", "start", "resume", "unmute", "listen", "start listening please"],
         "clear": ["clear", "clear context", "reset", "start over", "new conversation"],
     }
 
     # Timeout settings
-    WAKE_WORD_TIMEOUT = 5.0  # Seconds to listen for wake word before cycling
     COMMAND_TIMEOUT = 5.0  # Seconds to wait for command after wake word
     COOLDOWN_PERIOD = 1.0  # Seconds between wake word detections
 
@@ -79,13 +75,11 @@ class VoiceCommandHandler:
         on_repeat: Optional[Callable[[], None]] = None,
         on_action_items: Optional[Callable[[], None]] = None,
         on_stop_listening: Optional[Callable[[], None]] = None,
-        on_start_listening: Optional[Callable[[], None]] = None,
         on_clear: Optional[Callable[[], None]] = None,
         on_wake_word_detected: Optional[Callable[[], None]] = None,
         on_command_recognized: Optional[Callable[[str], None]] = None,
         on_state_changed: Optional[Callable[[VoiceCommandState], None]] = None,
         on_error: Optional[Callable[[str], None]] = None,
-        device_index: Optional[int] = None,
     ):
         """Initialize the voice command handler.
 
@@ -94,23 +88,20 @@ class VoiceCommandHandler:
             on_repeat: Callback when "repeat" command is recognized
             on_action_items: Callback when "action items" command is recognized
             on_stop_listening: Callback when "stop listening" command is recognized
-            on_start_listening: Callback when "start listening" command is recognized
             on_clear: Callback when "clear" command is recognized
             on_wake_word_detected: Callback when wake word is detected
             on_command_recognized: Callback with command name when any command is recognized
             on_state_changed: Callback when handler state changes
             on_error: Callback for error reporting
-            device_index: Microphone device index (None for default)
         """
-        if not SPEECH_RECOGNITION_AVAILABLE:
-            logger.warning("speech_recognition not available - voice commands disabled")
+        if not is_keyword_spotting_available():
+            logger.warning("faster_whisper not available - voice commands disabled")
 
         # Callbacks
         self.on_summarize = on_summarize
         self.on_repeat = on_repeat
         self.on_action_items = on_action_items
         self.on_stop_listening = on_stop_listening
-        self.on_start_listening = on_start_listening
         self.on_clear = on_clear
         self.on_wake_word_detected = on_wake_word_detected
         self.on_command_recognized = on_command_recognized
@@ -120,14 +111,10 @@ class VoiceCommandHandler:
         # State
         self._state = VoiceCommandState.IDLE
         self._running = False
-        self._device_index = device_index
         self._lock = threading.Lock()
-        self._thread: Optional[threading.Thread] = None
-        self._last_wake_time = 0.0
 
-        # Speech recognition
-        self._recognizer: Optional["sr.Recognizer"] = None
-        self._microphone: Optional["sr.Microphone"] = None
+        # Offline wake word and command spotting, created on start()
+        self._spotter: Optional[KeywordSpotter] = None
 
         # Build command lookup for fast matching
         self._command_lookup: Dict[str, str] = {}
@@ -153,26 +140,18 @@ class VoiceCommandHandler:
                         logger.error(f"Error in state change callback: {e}")
 
     def is_available(self) -> bool:
-        """Check if voice commands are available (speech_recognition installed)."""
-        return SPEECH_RECOGNITION_AVAILABLE
+        """Check if voice commands are available (faster_whisper installed)."""
+        return is_keyword_spotting_available()
 
     def is_running(self) -> bool:
         """Check if the handler is currently running."""
         with self._lock:
             return self._running
 
-    def set_device(self, device_index: Optional[int]):
-        """Set the microphone device index.
-
-        Args:
-            device_index: Device index or None for default
-        """
-        self._device_index = device_index
-
     def start(self):
         """Start listening for voice commands."""
-        if not SPEECH_RECOGNITION_AVAILABLE:
-            logger.warning("Cannot start voice commands - speech_recognition not available")
+        if not is_keyword_spotting_available():
+            logger.warning("Cannot start voice commands - faster_whisper not available")
             return
 
         with self._lock:
@@ -180,8 +159,19 @@ class VoiceCommandHandler:
                 return
             self._running = True
 
-        self._thread = threading.Thread(target=self._listen_loop, daemon=True)
-        self._thread.start()
+        if self._spotter is None:
+            self._spotter = KeywordSpotter(
+                wake_words=lambda: self.WAKE_WORDS,
+                commands=lambda: self._command_lookup,
+                on_wake_word=self._on_wake_word,
+                on_command=self._execute_command,
+                on_command_timeout=self._on_command_timeout,
+                on_error=self._on_spotter_error,
+                command_timeout=self.COMMAND_TIMEOUT,
+                cooldown=self.COOLDOWN_PERIOD,
+            )
+        self._spotter.start()
+        self._set_state(VoiceCommandState.LISTENING_FOR_WAKE_WORD)
         logger.info("Voice command handler started")
 
     def stop(self):
@@ -193,201 +183,40 @@ class VoiceCommandHandler:
 
         self._set_state(VoiceCommandState.IDLE)
 
-        if self._thread:
-            self._thread.join(timeout=2.0)
-            self._thread = None
+        if self._spotter:
+            self._spotter.stop()
 
         logger.info("Voice command handler stopped")
 
-    def _init_recognizer(self):
-        """Initialize the speech recognizer and microphone."""
-        if self._recognizer is None:
-            self._recognizer = sr.Recognizer()
-            # Adjust for ambient noise
-            self._recognizer.dynamic_energy_threshold = True
-            self._recognizer.energy_threshold = 300  # Minimum threshold
-            self._recognizer.pause_threshold = 0.8  # Seconds of silence before phrase is complete
+    def feed_audio(self, audio_chunk: np.ndarray):
+        """Receive a chunk of the main audio capture stream.
 
-    def _listen_loop(self):
-        """Main listening loop for wake word and command detection."""
-        self._init_recognizer()
+        Called on the capture thread; only queues the chunk.
+        """
+        if self._running and self._spotter:
+            self._spotter.feed(audio_chunk)
 
-        while self._running:
+    def _on_wake_word(self):
+        """Wake word heard without a command; wait for one."""
+        self._set_state(VoiceCommandState.LISTENING_FOR_COMMAND)
+        if self.on_wake_word_detected:
             try:
-                # Listen for wake word
-                self._set_state(VoiceCommandState.LISTENING_FOR_WAKE_WORD)
-
-                with sr.Microphone(device_index=self._device_index) as source:
-                    # Adjust for ambient noise periodically
-                    self._recognizer.adjust_for_ambient_noise(source, duration=0.5)
-
-                    try:
-                        # Listen for audio
-                        audio = self._recognizer.listen(
-                            source,
-                            timeout=self.WAKE_WORD_TIMEOUT,
-                            phrase_time_limit=3.0
-                        )
-
-                        # Recognize speech
-                        text = self._recognize_speech(audio)
-
-                        if text:
-                            text_lower = text.lower().strip()
-                            logger.debug(f"Heard: {text_lower}")
-
-                            # Check for wake word
-                            if self._contains_wake_word(text_lower):
-                                # Check cooldown
-                                current_time = time.time()
-                                if current_time - self._last_wake_time < self.COOLDOWN_PERIOD:
-                                    continue
-                                self._last_wake_time = current_time
-
-                                logger.info("Wake word detected!")
-                                if self.on_wake_word_detected:
-                                    self.on_wake_word_detected()
-
-                                # Extract command from same phrase if present
-                                command = self._extract_command_from_wake_phrase(text_lower)
-                                if command:
-                                    self._execute_command(command)
-                                else:
-                                    # Listen for command
-                                    self._listen_for_command(source)
-
-                    except sr.WaitTimeoutError:
-                        # No speech detected, continue listening
-                        continue
-                    except sr.UnknownValueError:
-                        # Could not understand audio, continue
-                        continue
-
-            except sr.RequestError as e:
-                logger.error(f"Speech recognition service error: {e}")
-                self._set_state(VoiceCommandState.ERROR)
-                if self.on_error:
-                    self.on_error(f"Speech recognition error: {e}")
-                time.sleep(2.0)  # Wait before retrying
-
+                self.on_wake_word_detected()
             except Exception as e:
-                logger.error(f"Error in voice command loop: {e}")
-                self._set_state(VoiceCommandState.ERROR)
-                if self.on_error:
-                    self.on_error(str(e))
-                time.sleep(1.0)
-
-    def _listen_for_command(self, source: "sr.Microphone"):
-        """Listen for a command after wake word is detected.
-
-        Args:
-            source: The microphone source to listen on
-        """
-        self._set_state(VoiceCommandState.LISTENING_FOR_COMMAND)
-
-        try:
-            audio = self._recognizer.listen(
-                source,
-                timeout=self.COMMAND_TIMEOUT,
-                phrase_time_limit=4.0
-            )
-
-            text = self._recognize_speech(audio)
-
-            if text:
-                text_lower = text.lower().strip()
-                logger.debug(f"Command phrase: {text_lower}")
-
-                command = self._match_command(text_lower)
-                if command:
-                    self._execute_command(command)
-                else:
-                    logger.debug(f"Unrecognized command: {text_lower}")
-
-        except sr.WaitTimeoutError:
-            logger.debug("No command received after wake word")
-        except sr.UnknownValueError:
-            logger.debug("Could not understand command")
-
-    def _recognize_speech(self, audio: "sr.AudioData") -> Optional[str]:
-        """Recognize speech from audio data.
-
-        Uses Google's free speech recognition API.
-
-        Args:
-            audio: Audio data to recognize
-
-        Returns:
-            Recognized text or None if recognition failed
-        """
-        try:
-            # Use Google's free API (no key required)
-            text = self._recognizer.recognize_google(audio)
-            return text
-        except sr.UnknownValueError:
-            return None
-        except sr.RequestError as e:
-            logger.error(f"Could not request results from speech service: {e}")
-            raise
-
-    def _contains_wake_word(self, text: str) -> bool:
-        """Check if text contains the wake word.
-
-        Args:
-            text: Lowercase text to check
-
-        Returns:
-            True if wake word is present
-        """
-        for wake_word in self.WAKE_WORDS:
-            if wake_word in text:
-                return True
-        return False
-
-    def _extract_command_from_wake_phrase(self, text: str) -> Optional[str]:
-        """Extract a command from a phrase containing the wake word.
-
-        Handles cases like "Hey ReadIn, summarize" where both wake word
-        and command are in the same phrase.
-
-        Args:
-            text: Lowercase text containing wake word
-
-        Returns:
-            Command name if found, None otherwise
-        """
-        # Find the wake word and get text after it
-        for wake_word in self.WAKE_WORDS:
-            if wake_word in text:
-                # Get everything after the wake word
-                idx = text.find(wake_word) + len(wake_word)
-                remaining = text[idx:].strip()
-                remaining = remaining.lstrip(',').strip()
-
-                if remaining:
-                    return self._match_command(remaining)
-
-        return None
+                logger.error(f"Error in wake word callback: {e}")
 
-    def _match_command(self, text: str) -> Optional[str]:
-        """Match text to a command.
+    def _on_command_timeout(self):
+        """No command followed the wake word."""
+        if self.is_running():
+            self._set_state(VoiceCommandState.LISTENING_FOR_WAKE_WORD)
 
-        Args:
-            text: Lowercase text to match
-
-        Returns:
-            Command name if matched, None otherwise
-        """
-        # Direct lookup
-        if text in self._command_lookup:
-            return self._command_lookup[text]
-
-        # Check if text starts with or contains any command alias
-        for alias, command in self._command_lookup.items():
-            if text.startswith(alias) or alias in text:
-                return command
-
-        return None
+    def _on_spotter_error(self, message: str):
+        """The spotter could not start."""
+        with self._lock:
+            self._running = False
+        self._set_state(VoiceCommandState.ERROR)
+        if self.on_error:
+            self.on_error(message)
 
     def _execute_command(self, command: str):
         """Execute a recognized command.
@@ -410,7 +239,6 @@ class VoiceCommandHandler:
             "repeat": self.on_repeat,
             "action_items": self.on_action_items,
             "stop": self.on_stop_listening,
-            "start": self.on_start_listening,
             "clear": self.on_clear,
         }
 
@@ -423,24 +251,8 @@ class VoiceCommandHandler:
                 if self.on_error:
                     self.on_error(f"Command error: {e}")
 
-    @staticmethod
-    def list_microphones() -> List[Dict[str, Any]]:
-        """List available microphone devices.
-
-        Returns:
-            List of dicts with 'index' and 'name' keys
-        """
-        if not SPEECH_RECOGNITION_AVAILABLE:
-            return []
-
-        try:
-            mics = []
-            for i, name in enumerate(sr.Microphone.list_microphone_names()):
-                mics.append({"index": i, "name": name})
-            return mics
-        except Exception as e:
-            logger.error(f"Error listing microphones: {e}")
-            return []
+        if self.is_running():
+            self._set_state(VoiceCommandState.LISTENING_FOR_WAKE_WORD)
 
     def get_supported_commands(self) -> Dict[str, List[str]]:
         """Get dictionary of supported commands and their aliases.
@@ -459,11 +271,22 @@ class VoiceCommandHandler:
         return self.WAKE_WORDS.copy()
 
 
+def capture_hears_user(capture) -> bool:
+    """Check whether an audio capture records the user's microphone.
+
+    Commands can only be heard on such a capture. Enhanced capture in
+    system loopback mode records what the user hears, so it is excluded;
+    the basic capture always records an input device.
+    """
+    mode = getattr(capture, "capture_mode", None)
+    return mode is None or mode.value != "loopback"
+
+
 # Convenience function for checking availability
 def is_voice_commands_available() -> bool:
     """Check if voice commands are available on this system.
 
     Returns:
-        True if speech_recognition library is installed
+        True if the local recognizer (faster_whisper) is installed
     """
-    return SPEECH_RECOGNITION_AVAILABLE
+    return is_keyword_spotting_available()